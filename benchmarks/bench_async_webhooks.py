@@ -0,0 +1,84 @@
+"""Benchmark fan-out of digests to many webhooks.
+
+A local HTTP/1.1 server stands in for the webhooks and answers each
+message after a fixed delay, like a remote webhook would. "pooled session"
+posts one digest after another, as ``Notifier`` does per channel;
+"async client" sends them concurrently through ``AsyncWebhookClient``.
+
+Run with:
+    PYTHONPATH=src python benchmarks/bench_async_webhooks.py
+"""
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from arxiv_agent.notification.async_webhook import AsyncDiscordNotifier, AsyncWebhookClient, send_digests
+from arxiv_agent.notification.discord import DiscordNotifier
+from arxiv_agent.notification.http_session import create_session
+from arxiv_agent.notification.rate_limiter import WebhookRateLimiter
+from arxiv_agent.summarization.models import Summary
+
+WEBHOOKS = 500
+LATENCY = 0.05
+SUMMARIES = [Summary(paper_id=f"2401.{i:05d}", title=f"Paper {i}", summary_text="x" * 300) for i in range(3)]
+
+
+class WebhookHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(LATENCY)
+        self.send_response(204)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class WebhookServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+def sequential(urls: list[str]) -> None:
+    session = create_session()
+    limiter = WebhookRateLimiter(max_requests_per_second=None)
+    for url in urls:
+        DiscordNotifier(session=session, rate_limiter=limiter, webhook_url=url).send(SUMMARIES)
+    session.close()
+
+
+async def concurrent(urls: list[str], max_concurrency: int) -> None:
+    limiter = WebhookRateLimiter(max_requests_per_second=None)
+    async with AsyncWebhookClient(max_concurrency, max_per_host=max_concurrency, rate_limiter=limiter) as client:
+        report = await send_digests([
+            (url, AsyncDiscordNotifier(client, webhook_url=url), SUMMARIES) for url in urls
+        ])
+    assert report.all_delivered
+
+
+def main() -> None:
+    server = WebhookServer(("127.0.0.1", 0), WebhookHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    urls = [f"http://127.0.0.1:{server.server_port}/webhooks/{i}" for i in range(WEBHOOKS)]
+
+    start = time.perf_counter()
+    sequential(urls[:50])
+    elapsed = (time.perf_counter() - start) * WEBHOOKS / 50
+    print(f"{'pooled session':>22}: {WEBHOOKS} webhooks in {elapsed:6.2f} s (extrapolated from 50)")
+
+    for max_concurrency in (10, 50, 100):
+        start = time.perf_counter()
+        asyncio.run(concurrent(urls, max_concurrency))
+        elapsed = time.perf_counter() - start
+        print(f"{f'async client ({max_concurrency})':>22}: {WEBHOOKS} webhooks in {elapsed:6.2f} s "
+              f"({WEBHOOKS / elapsed:6.1f} digests/s)")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Benchmark formatting one digest for many channels.
+
+Compares formatting every entry per channel, as notifiers without a
+dialect do, with the shared fragment cache.
+
+Run with:
+    PYTHONPATH=src python benchmarks/bench_fragment_cache.py
+"""
+import time
+
+from arxiv_agent.notification.discord import DiscordNotifier
+from arxiv_agent.notification.rendering import SHARED_FRAGMENT_CACHE
+from arxiv_agent.notification.slack import SlackNotifier
+from arxiv_agent.summarization.models import Summary
+
+CHANNELS = 50
+SUMMARIES = [
+    Summary(paper_id=f"2401.{i:05d}", title=f"Paper {i}", summary_text="要約 " * 400, related_ids=[f"2401.{i + 1:05d}"])
+    for i in range(100)
+]
+
+
+def main() -> None:
+    notifiers = [
+        (SlackNotifier if i % 2 else DiscordNotifier)(webhook_url=f"http://hooks.test/{i}") for i in range(CHANNELS)
+    ]
+
+    for name, cached in (("per channel", False), ("fragment cache", True)):
+        for notifier in notifiers:
+            # Without a dialect a notifier formats every entry itself.
+            notifier.dialect = type(notifier).dialect if cached else None
+        timings = []
+        for _ in range(5):
+            SHARED_FRAGMENT_CACHE.clear()
+            start = time.perf_counter()
+            for notifier in notifiers:
+                notifier.format_messages(SUMMARIES)
+            timings.append(time.perf_counter() - start)
+        elapsed = min(timings)
+        print(f"{name:>15}: {CHANNELS} channels x {len(SUMMARIES)} summaries in {elapsed * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark packing of digests into Discord messages.
+
+Compares the former concatenating splitter with ``chunk_messages``.
+
+Run with:
+    PYTHONPATH=src python benchmarks/bench_message_chunker.py
+"""
+import random
+import time
+from typing import Callable, List
+
+from arxiv_agent.notification.chunker import DISCORD_MESSAGE_LIMIT, chunk_messages
+
+HEADER = "📰 **本日のarXiv論文要約**\n\n"
+SEPARATOR = "\n---\n"
+WORDS = "model language training data attention agent reasoning retrieval evaluation results".split()
+
+
+def concatenating_split(entries: List[str]) -> List[str]:
+    """Reference copy of the splitter that rebuilt the message per entry."""
+    messages: List[str] = []
+    current = HEADER
+    for entry in entries:
+        candidate = current + SEPARATOR + entry if current != HEADER else current + entry
+        if len(candidate) > DISCORD_MESSAGE_LIMIT:
+            if current != HEADER:
+                messages.append(current)
+            current = entry
+        else:
+            current = candidate
+    if current:
+        messages.append(current)
+    return messages
+
+
+def chunked_split(entries: List[str]) -> List[str]:
+    return chunk_messages(entries, DISCORD_MESSAGE_LIMIT, header=HEADER, separator=SEPARATOR)
+
+
+def make_entries(count: int, words_per_entry: int = 60) -> List[str]:
+    rng = random.Random(0)
+    return [
+        f"**{i + 1}. Paper {i}**\nhttps://arxiv.org/abs/2401.{i:05d}\n" + " ".join(rng.choices(WORDS, k=words_per_entry))
+        for i in range(count)
+    ]
+
+
+def make_long_summary(sections: int = 2_000) -> str:
+    rng = random.Random(0)
+    return "\n".join(
+        f"{i % 6 + 1}. Section\n" + " ".join(rng.choices(WORDS, k=40)) for i in range(sections)
+    )
+
+
+def best_of(split: Callable[[List[str]], List[str]], entries: List[str]) -> float:
+    timings = []
+    for _ in range(3):
+        start = time.perf_counter()
+        split(entries)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    for count in (1_000, 10_000):
+        entries = make_entries(count)
+        for name, split in (("concatenating", concatenating_split), ("chunk_messages", chunked_split)):
+            elapsed = best_of(split, entries)
+            print(f"{count:>6} papers, {name:<14}: {elapsed * 1000:8.1f} ms")
+
+    summary = make_long_summary()
+    elapsed = best_of(chunked_split, [summary])
+    messages = chunked_split([summary])
+    print(
+        f"{len(summary):>8} char summary, chunk_messages: {elapsed * 1000:8.1f} ms "
+        f"({len(messages)} messages, longest {max(map(len, messages))} chars)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Benchmark relevance scoring throughput on synthetic abstracts.
+
+Run with:
+    PYTHONPATH=src python benchmarks/bench_relevance_ranker.py
+"""
+import random
+import time
+from datetime import datetime
+
+from arxiv_agent.collection.models import Paper
+from arxiv_agent.ranking import RelevanceRanker
+
+WORDS = (
+    "model language large training data transformer attention code quality "
+    "software architecture test driven development refactoring benchmark "
+    "agent reasoning retrieval evaluation neural network learning method "
+    "results show propose approach performance task dataset"
+).split()
+
+
+def make_papers(count: int, words_per_abstract: int = 180) -> list[Paper]:
+    rng = random.Random(0)
+    return [
+        Paper(
+            arxiv_id=f"2401.{i:05d}v1",
+            title=" ".join(rng.choices(WORDS, k=8)),
+            authors=["Author"],
+            abstract=" ".join(rng.choices(WORDS, k=words_per_abstract)) + ".",
+            published=datetime(2024, 1, 1),
+            categories=["cs.AI"],
+            pdf_url="",
+        )
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    ranker = RelevanceRanker(
+        keyword_weights={
+            "LLM": 2.0, "Large Language Model": 2.0, "Transformer": 0.5,
+            "Software Architecture": 1.5, "Test-Driven Development": 1.5, "Refactoring": 1.0,
+        },
+        exemplars=[" ".join(WORDS[:12])],
+    )
+    ranker.rank(make_papers(100), top_k=10)  # warm up NumPy
+    for count in (1_000, 10_000):
+        papers = make_papers(count)
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            ranker.rank(papers, top_k=10)
+            timings.append(time.perf_counter() - start)
+        elapsed = min(timings)
+        print(f"{count:>6} abstracts: {elapsed * 1000:8.1f} ms ({elapsed / count * 1e6:.1f} us/abstract)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark per-message webhook latency with and without a pooled session.
+
+A local HTTP/1.1 server stands in for the webhook. "requests.post" opens a
+new connection per message, as the notifiers did before; "pooled session"
+reuses keep-alive connections. Against real webhooks the gap is larger
+because each new connection also pays for DNS and a TLS handshake.
+
+Run with:
+    PYTHONPATH=src python benchmarks/bench_webhook_session.py
+"""
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from arxiv_agent.notification.http_session import create_session
+
+MESSAGES = 300
+PAYLOAD = {"content": "x" * 1800}
+
+
+class WebhookHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(204)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def measure(post, url: str) -> list[float]:
+    latencies = []
+    for _ in range(MESSAGES):
+        start = time.perf_counter()
+        post(url, json=PAYLOAD, timeout=10).raise_for_status()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), WebhookHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/webhook"
+
+    session = create_session()
+    results = {
+        "requests.post": measure(requests.post, url),
+        "pooled session": measure(session.post, url),
+    }
+    session.close()
+    server.shutdown()
+
+    for name, latencies in results.items():
+        ordered = sorted(latencies)
+        print(
+            f"{name:>15}: {MESSAGES} messages, "
+            f"median {statistics.median(ordered) * 1e3:6.3f} ms, "
+            f"p95 {ordered[int(len(ordered) * 0.95)] * 1e3:6.3f} ms, "
+            f"total {sum(ordered):6.3f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
 """arXiv API client."""
 import arxiv
 import logging
-from typing import List
+from typing import List, Optional
+from arxiv_agent.history.base_paper_history import BasePaperHistory
 from .models import Paper
 
 logger = logging.getLogger(__name__)
@@ -10,24 +11,39 @@ logger = logging.getLogger(__name__)
 class ArxivClient:
     """Client for fetching papers from arXiv API."""
 
-    def __init__(self, max_results: int):
+    def __init__(self, max_results: int, max_scan_results: Optional[int] = None):
         """
         Initialize arXiv client.
 
         Args:
             max_results: Maximum number of papers to fetch
+            max_scan_results: Maximum number of results to page through when
+                skipping processed papers (defaults to 10 x max_results)
         """
         if max_results <= 0:
             raise ValueError("max_results must be positive")
+        if max_scan_results is not None and max_scan_results < max_results:
+            raise ValueError("max_scan_results must be at least max_results")
         self.max_results = max_results
-
-    def search_papers(self, categories: List[str], keywords: List[str]) -> List[Paper]:
+        self.max_scan_results = max_scan_results or max_results * 10
+
+    def search_papers(
+        self,
+        categories: List[str],
+        keywords: List[str],
+        history: Optional[BasePaperHistory] = None,
+    ) -> List[Paper]:
         """
         Search papers matching categories and keywords.
 
+        When a history is given, results are paged lazily and processed papers
+        are skipped until max_results unseen papers are found or
+        max_scan_results results have been read.
+
         Args:
             categories: List of arXiv categories (e.g., ['cs.AI', 'cs.LG'])
             keywords: List of keywords to search for
+            history: History of processed papers to skip, if any
 
         Returns:
             List of Paper objects
@@ -45,26 +61,53 @@ class ArxivClient:
 
         search = arxiv.Search(
             query=query,
-            max_results=self.max_results,
+            max_results=self.max_results if history is None else self.max_scan_results,
             sort_by=arxiv.SortCriterion.SubmittedDate,
             sort_order=arxiv.SortOrder.Descending,
         )
 
+        if history is None:
+            papers = [self._to_paper(result) for result in search.results()]
+            logger.info(f"Found {len(papers)} papers")
+            return papers
+
         papers = []
+        batch = []
+        scanned = 0
         for result in search.results():
-            paper = Paper(
-                arxiv_id=result.entry_id.split('/')[-1],
-                title=result.title,
-                authors=[author.name for author in result.authors],
-                abstract=result.summary,
-                published=result.published,
-                categories=result.categories,
-                pdf_url=result.pdf_url,
-            )
-            papers.append(paper)
-
-        logger.info(f"Found {len(papers)} papers")
-        return papers
+            batch.append(self._to_paper(result))
+            scanned += 1
+            # Check the history once per batch of the papers still missing.
+            if len(batch) >= self.max_results - len(papers):
+                papers.extend(history.filter_unprocessed(batch))
+                batch = []
+                if len(papers) >= self.max_results:
+                    break
+        papers.extend(history.filter_unprocessed(batch))
+
+        logger.info(f"Found {len(papers)} unprocessed papers in {scanned} results")
+        return papers[:self.max_results]
+
+    @staticmethod
+    def _to_paper(result: arxiv.Result) -> Paper:
+        """
+        Convert an arXiv search result to a Paper.
+
+        Args:
+            result: arXiv search result
+
+        Returns:
+            Paper object
+        """
+        return Paper(
+            arxiv_id=result.entry_id.split('/')[-1],
+            title=result.title,
+            authors=[author.name for author in result.authors],
+            abstract=result.summary,
+            published=result.published,
+            categories=result.categories,
+            pdf_url=result.pdf_url,
+        )
 
     def _build_query(self, categories: List[str], keywords: List[str]) -> str:
         """
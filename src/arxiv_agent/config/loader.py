@@ -1,14 +1,35 @@
 """Configuration loader."""
+import re
 import yaml
 from pathlib import Path
+from typing import Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from arxiv_agent.history import supports_claims
+from arxiv_agent.scheduling import CronSchedule
 from .models import (
     Config,
     ArxivConfig,
+    DeadlineConfig,
+    DedupConfig,
     GeminiConfig,
+    HistoryConfig,
+    HttpConfig,
+    JournalConfig,
+    KeyPoolConfig,
     NotificationConfig,
     NotificationTarget,
+    OutboxConfig,
+    PipelineConfig,
+    QuotaConfig,
+    RankingConfig,
+    RateLimitConfig,
+    ServeConfig,
+    SummarizationConfig,
+    SummaryCacheConfig,
 )
 
+SUMMARIZATION_BACKENDS = ('gemini', 'extractive')
+
 
 def load_config(config_path: str) -> Config:
     """
@@ -38,6 +59,16 @@ def load_config(config_path: str) -> Config:
         arxiv=_load_arxiv_config(data.get('arxiv', {})),
         gemini=_load_gemini_config(data.get('gemini', {})),
         notification=_load_notification_config(data.get('notification', {})),
+        summarization=_load_summarization_config(data.get('summarization', {})),
+        journal=_load_journal_config(data.get('journal')),
+        ranking=_load_ranking_config(data.get('ranking')),
+        dedup=_load_dedup_config(data.get('dedup')),
+        summary_cache=_load_summary_cache_config(data.get('summary_cache')),
+        quota=_load_quota_config(data.get('quota')),
+        deadline=_load_deadline_config(data.get('deadline')),
+        history=_load_history_config(data.get('history_file'), data.get('history')),
+        pipeline=_load_pipeline_config(data.get('pipeline')),
+        serve=_load_serve_config(data.get('serve', {})),
     )
 
 
@@ -58,10 +89,17 @@ def _load_arxiv_config(data: dict) -> ArxivConfig:
     if not isinstance(max_results, int) or max_results <= 0:
         raise ValueError("arxiv.max_results must be a positive integer")
 
+    max_scan_results = data.get('max_scan_results')
+    if max_scan_results is not None and (
+        not isinstance(max_scan_results, int) or max_scan_results < max_results
+    ):
+        raise ValueError("arxiv.max_scan_results must be an integer of at least arxiv.max_results")
+
     return ArxivConfig(
         categories=categories,
         keywords=keywords,
         max_results=max_results,
+        max_scan_results=max_scan_results,
     )
 
 
@@ -86,11 +124,371 @@ def _load_gemini_config(data: dict) -> GeminiConfig:
     if not isinstance(max_tokens, int) or max_tokens <= 0:
         raise ValueError("gemini.max_tokens must be a positive integer")
 
+    section_retries = data.get('section_retries', 1)
+    if not isinstance(section_retries, int) or section_retries < 0:
+        raise ValueError("gemini.section_retries must be a non-negative integer")
+
     return GeminiConfig(
         prompt_template=prompt_template,
         model=model,
         temperature=float(temperature),
         max_tokens=max_tokens,
+        section_retries=section_retries,
+        key_pool=_load_key_pool_config(data.get('key_pool')),
+    )
+
+
+def _load_key_pool_config(data: Optional[dict]) -> Optional[KeyPoolConfig]:
+    """Load API key pool configuration section. Returns None when omitted."""
+    if data is None:
+        return None
+    if not isinstance(data, dict):
+        raise ValueError("gemini.key_pool config must be an object")
+
+    state_file = data.get('state_file')
+    if state_file is not None and (not isinstance(state_file, str) or not state_file.strip()):
+        raise ValueError("gemini.key_pool.state_file must be a non-empty string")
+
+    limits = {}
+    for name in ('requests_per_minute', 'requests_per_day'):
+        value = data.get(name)
+        if value is not None and (not isinstance(value, int) or value <= 0):
+            raise ValueError(f"gemini.key_pool.{name} must be a positive integer")
+        limits[name] = value
+
+    cooldown_seconds = data.get('cooldown_seconds', 60.0)
+    if not isinstance(cooldown_seconds, (int, float)) or cooldown_seconds <= 0:
+        raise ValueError("gemini.key_pool.cooldown_seconds must be a positive number")
+
+    return KeyPoolConfig(
+        state_file=state_file,
+        cooldown_seconds=float(cooldown_seconds),
+        **limits,
+    )
+
+
+def _load_summarization_config(data: dict) -> SummarizationConfig:
+    """Load summarization configuration section."""
+    if not isinstance(data, dict):
+        raise ValueError("summarization config must be an object")
+
+    backend = data.get('backend', 'gemini')
+    if backend not in SUMMARIZATION_BACKENDS:
+        raise ValueError(f"summarization.backend must be one of: {', '.join(SUMMARIZATION_BACKENDS)}")
+
+    max_sentences = data.get('max_sentences', 3)
+    if not isinstance(max_sentences, int) or max_sentences <= 0:
+        raise ValueError("summarization.max_sentences must be a positive integer")
+
+    return SummarizationConfig(
+        backend=backend,
+        fallback=bool(data.get('fallback', False)),
+        max_sentences=max_sentences,
+    )
+
+
+def _load_journal_config(data: Optional[dict]) -> Optional[JournalConfig]:
+    """Load journal configuration section. Returns None when omitted."""
+    if data is None:
+        return None
+    if not isinstance(data, dict):
+        raise ValueError("journal config must be an object")
+
+    file = data.get('file')
+    if not isinstance(file, str) or not file.strip():
+        raise ValueError("journal.file must be a non-empty string")
+
+    flush_batch_size = data.get('flush_batch_size', 16)
+    if not isinstance(flush_batch_size, int) or flush_batch_size <= 0:
+        raise ValueError("journal.flush_batch_size must be a positive integer")
+
+    flush_interval = data.get('flush_interval_seconds', 1.0)
+    if not isinstance(flush_interval, (int, float)) or flush_interval < 0:
+        raise ValueError("journal.flush_interval_seconds must be a non-negative number")
+
+    max_attempts = data.get('max_attempts', 5)
+    if not isinstance(max_attempts, int) or max_attempts <= 0:
+        raise ValueError("journal.max_attempts must be a positive integer")
+
+    retry_backoff = data.get('retry_backoff_seconds', 3600.0)
+    if not isinstance(retry_backoff, (int, float)) or retry_backoff < 0:
+        raise ValueError("journal.retry_backoff_seconds must be a non-negative number")
+
+    return JournalConfig(
+        file=file,
+        flush_batch_size=flush_batch_size,
+        flush_interval_seconds=float(flush_interval),
+        max_attempts=max_attempts,
+        retry_backoff_seconds=float(retry_backoff),
+    )
+
+
+def _load_pipeline_config(data: Optional[dict]) -> Optional[PipelineConfig]:
+    """Load staged pipeline configuration section. Returns None when omitted."""
+    if data is None:
+        return None
+    if not isinstance(data, dict):
+        raise ValueError("pipeline config must be an object")
+
+    summarize_workers = data.get('summarize_workers', 4)
+    if not isinstance(summarize_workers, int) or summarize_workers <= 0:
+        raise ValueError("pipeline.summarize_workers must be a positive integer")
+
+    queue_size = data.get('queue_size', 16)
+    if not isinstance(queue_size, int) or queue_size <= 0:
+        raise ValueError("pipeline.queue_size must be a positive integer")
+
+    return PipelineConfig(summarize_workers=summarize_workers, queue_size=queue_size)
+
+
+def _load_serve_config(data: dict) -> ServeConfig:
+    """Load serve mode configuration section."""
+    if not isinstance(data, dict):
+        raise ValueError("serve config must be an object")
+
+    timezone = data.get('timezone', 'America/New_York')
+    try:
+        ZoneInfo(timezone)
+    except (ZoneInfoNotFoundError, ValueError, TypeError):
+        raise ValueError(f"serve.timezone is not a valid timezone: {timezone}")
+
+    schedule = data.get('schedule', '15 20 * * 0-4')
+    if not isinstance(schedule, str):
+        raise ValueError("serve.schedule must be a cron expression")
+    try:
+        CronSchedule(schedule, timezone)
+    except ValueError as e:
+        raise ValueError(f"serve.schedule is invalid: {e}")
+
+    skip_without_announcement = data.get('skip_without_announcement', True)
+    if not isinstance(skip_without_announcement, bool):
+        raise ValueError("serve.skip_without_announcement must be a boolean")
+
+    return ServeConfig(
+        schedule=schedule,
+        timezone=timezone,
+        skip_without_announcement=skip_without_announcement,
+    )
+
+
+def _load_ranking_config(data: Optional[dict]) -> Optional[RankingConfig]:
+    """Load ranking configuration section. Returns None when omitted."""
+    if data is None:
+        return None
+    if not isinstance(data, dict):
+        raise ValueError("ranking config must be an object")
+
+    top_k = data.get('top_k')
+    if not isinstance(top_k, int) or top_k <= 0:
+        raise ValueError("ranking.top_k must be a positive integer")
+
+    keyword_weights = data.get('keyword_weights', {})
+    if not isinstance(keyword_weights, dict) or not all(
+        isinstance(weight, (int, float)) for weight in keyword_weights.values()
+    ):
+        raise ValueError("ranking.keyword_weights must map keywords to numbers")
+
+    exemplars = data.get('exemplars', [])
+    if not isinstance(exemplars, list) or not all(isinstance(e, str) for e in exemplars):
+        raise ValueError("ranking.exemplars must be a list of strings")
+
+    min_score = data.get('min_score', 0.0)
+    if not isinstance(min_score, (int, float)):
+        raise ValueError("ranking.min_score must be a number")
+
+    return RankingConfig(
+        top_k=top_k,
+        keyword_weights={str(k): float(v) for k, v in keyword_weights.items()},
+        exemplars=exemplars,
+        min_score=float(min_score),
+    )
+
+
+def _load_dedup_config(data: Optional[dict]) -> Optional[DedupConfig]:
+    """Load near-duplicate detection configuration section. Returns None when omitted."""
+    if data is None:
+        return None
+    if not isinstance(data, dict):
+        raise ValueError("dedup config must be an object")
+
+    index_dir = data.get('index_dir')
+    if not isinstance(index_dir, str) or not index_dir.strip():
+        raise ValueError("dedup.index_dir must be a non-empty string")
+
+    threshold = data.get('threshold', 0.8)
+    if not isinstance(threshold, (int, float)) or not (0 < threshold <= 1):
+        raise ValueError("dedup.threshold must be a number between 0 and 1")
+
+    num_perm = data.get('num_perm', 128)
+    bands = data.get('bands', 16)
+    if not isinstance(num_perm, int) or not isinstance(bands, int) or bands <= 0 or num_perm % bands != 0:
+        raise ValueError("dedup.num_perm must be a positive multiple of dedup.bands")
+
+    shingle_size = data.get('shingle_size', 3)
+    if not isinstance(shingle_size, int) or shingle_size <= 0:
+        raise ValueError("dedup.shingle_size must be a positive integer")
+
+    return DedupConfig(
+        index_dir=index_dir,
+        threshold=float(threshold),
+        num_perm=num_perm,
+        bands=bands,
+        shingle_size=shingle_size,
+    )
+
+
+def _load_summary_cache_config(data: Optional[dict]) -> Optional[SummaryCacheConfig]:
+    """Load summary cache configuration section. Returns None when omitted."""
+    if data is None:
+        return None
+    if not isinstance(data, dict):
+        raise ValueError("summary_cache config must be an object")
+
+    cache_dir = data.get('dir')
+    if not isinstance(cache_dir, str) or not cache_dir.strip():
+        raise ValueError("summary_cache.dir must be a non-empty string")
+
+    reuse_threshold = data.get('reuse_threshold', 0.95)
+    update_threshold = data.get('update_threshold', 0.8)
+    if (
+        not isinstance(reuse_threshold, (int, float))
+        or not isinstance(update_threshold, (int, float))
+        or not (0 < update_threshold <= reuse_threshold <= 1)
+    ):
+        raise ValueError(
+            "summary_cache thresholds must satisfy 0 < update_threshold <= reuse_threshold <= 1"
+        )
+
+    dimensions = data.get('dimensions', 1024)
+    if not isinstance(dimensions, int) or dimensions <= 0:
+        raise ValueError("summary_cache.dimensions must be a positive integer")
+
+    return SummaryCacheConfig(
+        dir=cache_dir,
+        reuse_threshold=float(reuse_threshold),
+        update_threshold=float(update_threshold),
+        dimensions=dimensions,
+    )
+
+
+def _load_quota_config(data: Optional[dict]) -> Optional[QuotaConfig]:
+    """Load daily quota planning configuration section. Returns None when omitted."""
+    if data is None:
+        return None
+    if not isinstance(data, dict):
+        raise ValueError("quota config must be an object")
+
+    ledger_file = data.get('ledger_file')
+    if not isinstance(ledger_file, str) or not ledger_file.strip():
+        raise ValueError("quota.ledger_file must be a non-empty string")
+
+    requests_per_day = data.get('requests_per_day')
+    if not isinstance(requests_per_day, int) or requests_per_day <= 0:
+        raise ValueError("quota.requests_per_day must be a positive integer")
+
+    tokens_per_day = data.get('tokens_per_day')
+    if tokens_per_day is not None and (not isinstance(tokens_per_day, int) or tokens_per_day <= 0):
+        raise ValueError("quota.tokens_per_day must be a positive integer")
+
+    runs_per_day = data.get('runs_per_day', 1)
+    if not isinstance(runs_per_day, int) or runs_per_day <= 0:
+        raise ValueError("quota.runs_per_day must be a positive integer")
+
+    headroom_requests = data.get('headroom_requests', 0)
+    if not isinstance(headroom_requests, int) or headroom_requests < 0:
+        raise ValueError("quota.headroom_requests must be a non-negative integer")
+
+    return QuotaConfig(
+        ledger_file=ledger_file,
+        requests_per_day=requests_per_day,
+        tokens_per_day=tokens_per_day,
+        runs_per_day=runs_per_day,
+        headroom_requests=headroom_requests,
+    )
+
+
+def _load_deadline_config(data: Optional[dict]) -> Optional[DeadlineConfig]:
+    """Load run deadline configuration section. Returns None when omitted."""
+    if data is None:
+        return None
+    if not isinstance(data, dict):
+        raise ValueError("deadline config must be an object")
+
+    at = data.get('at')
+    if isinstance(at, int) and not isinstance(at, bool) and 0 <= at < 24 * 60:
+        # YAML 1.1 reads unquoted times such as 10:30 as base-60 integers.
+        at = f"{at // 60:02d}:{at % 60:02d}"
+    if not isinstance(at, str) or not re.fullmatch(r'([01]\d|2[0-3]):[0-5]\d', at):
+        raise ValueError("deadline.at must be a time in HH:MM format")
+
+    timezone = data.get('timezone', 'UTC')
+    try:
+        ZoneInfo(timezone)
+    except (ZoneInfoNotFoundError, ValueError, TypeError):
+        raise ValueError(f"deadline.timezone is not a valid timezone: {timezone}")
+
+    seconds = {}
+    for name, default in (
+        ('safety_margin_seconds', 60.0),
+        ('summarize_estimate_seconds', 30.0),
+        ('notify_estimate_seconds', 10.0),
+    ):
+        value = data.get(name, default)
+        if not isinstance(value, (int, float)) or value < 0:
+            raise ValueError(f"deadline.{name} must be a non-negative number")
+        seconds[name] = float(value)
+
+    return DeadlineConfig(at=at, timezone=timezone, **seconds)
+
+
+def _load_history_config(history_file: Optional[str], data: Optional[dict]) -> Optional[HistoryConfig]:
+    """
+    Load processed paper history configuration. Returns None when omitted.
+
+    A top-level ``history_file`` is shorthand for ``history: {file: ...}``.
+    """
+    if history_file is not None:
+        if data is not None:
+            raise ValueError("history_file and history must not both be set")
+        data = {'file': history_file}
+    if data is None:
+        return None
+    if not isinstance(data, dict):
+        raise ValueError("history config must be an object")
+
+    file = data.get('file')
+    if not isinstance(file, str) or not file.strip():
+        raise ValueError("history.file must be a non-empty string")
+
+    bloom_rate = data.get('bloom_false_positive_rate')
+    if bloom_rate is not None and (not isinstance(bloom_rate, (int, float)) or not (0 < bloom_rate < 1)):
+        raise ValueError("history.bloom_false_positive_rate must be a number between 0 and 1")
+
+    bloom_capacity = data.get('bloom_capacity', 1_000_000)
+    if not isinstance(bloom_capacity, int) or bloom_capacity <= 0:
+        raise ValueError("history.bloom_capacity must be a positive integer")
+
+    lease_seconds = data.get('lease_seconds')
+    if lease_seconds is not None and (not isinstance(lease_seconds, (int, float)) or lease_seconds <= 0):
+        raise ValueError("history.lease_seconds must be a positive number")
+    if lease_seconds is not None and not supports_claims(file):
+        raise ValueError("history.lease_seconds requires a JSON or SQLite history file")
+
+    retention_months = data.get('retention_months')
+    if retention_months is not None and (not isinstance(retention_months, int) or retention_months <= 0):
+        raise ValueError("history.retention_months must be a positive integer")
+
+    archive_dir = data.get('archive_dir')
+    if archive_dir is not None and (not isinstance(archive_dir, str) or not archive_dir.strip()):
+        raise ValueError("history.archive_dir must be a non-empty string")
+
+    return HistoryConfig(
+        file=file,
+        bloom_false_positive_rate=None if bloom_rate is None else float(bloom_rate),
+        bloom_capacity=bloom_capacity,
+        lease_seconds=None if lease_seconds is None else float(lease_seconds),
+        retention_months=retention_months,
+        archive_dir=archive_dir,
     )
 
 
@@ -107,7 +505,95 @@ def _load_notification_config(data: dict) -> NotificationConfig:
     if not isinstance(discord_data, dict):
         raise ValueError("notification.discord must be an object")
 
+    channel_timeout = data.get('channel_timeout_seconds', 60.0)
+    if not isinstance(channel_timeout, (int, float)) or channel_timeout <= 0:
+        raise ValueError("notification.channel_timeout_seconds must be a positive number")
+
     return NotificationConfig(
         slack=NotificationTarget(enabled=bool(slack_data.get('enabled', False))),
         discord=NotificationTarget(enabled=bool(discord_data.get('enabled', False))),
+        http=_load_http_config(data.get('http', {})),
+        rate_limit=_load_rate_limit_config(data.get('rate_limit', {})),
+        channel_timeout_seconds=float(channel_timeout),
+        outbox=_load_outbox_config(data.get('outbox')),
+    )
+
+
+def _load_outbox_config(data: Optional[dict]) -> Optional[OutboxConfig]:
+    """Load notification outbox configuration section. Returns None when omitted."""
+    if data is None:
+        return None
+    if not isinstance(data, dict):
+        raise ValueError("notification.outbox must be an object")
+
+    file = data.get('file')
+    if not isinstance(file, str) or not file.strip():
+        raise ValueError("notification.outbox.file must be a non-empty string")
+
+    max_attempts = data.get('max_attempts', 10)
+    if not isinstance(max_attempts, int) or max_attempts <= 0:
+        raise ValueError("notification.outbox.max_attempts must be a positive integer")
+
+    retention_days = data.get('retention_days', 7.0)
+    if not isinstance(retention_days, (int, float)) or retention_days <= 0:
+        raise ValueError("notification.outbox.retention_days must be a positive number")
+
+    return OutboxConfig(file=file, max_attempts=max_attempts, retention_days=float(retention_days))
+
+
+def _load_http_config(data: dict) -> HttpConfig:
+    """Load pooled HTTP session configuration section."""
+    if not isinstance(data, dict):
+        raise ValueError("notification.http must be an object")
+
+    pool_size = data.get('pool_size', 10)
+    if not isinstance(pool_size, int) or pool_size <= 0:
+        raise ValueError("notification.http.pool_size must be a positive integer")
+
+    max_retries = data.get('max_retries', 2)
+    if not isinstance(max_retries, int) or max_retries < 0:
+        raise ValueError("notification.http.max_retries must be a non-negative integer")
+
+    backoff_factor = data.get('backoff_factor', 0.5)
+    if not isinstance(backoff_factor, (int, float)) or backoff_factor < 0:
+        raise ValueError("notification.http.backoff_factor must be a non-negative number")
+
+    timeout = data.get('timeout_seconds', 10.0)
+    if not isinstance(timeout, (int, float)) or timeout <= 0:
+        raise ValueError("notification.http.timeout_seconds must be a positive number")
+
+    return HttpConfig(
+        pool_size=pool_size,
+        max_retries=max_retries,
+        backoff_factor=float(backoff_factor),
+        timeout_seconds=float(timeout),
+    )
+
+
+def _load_rate_limit_config(data: dict) -> RateLimitConfig:
+    """Load webhook rate limit configuration section."""
+    if not isinstance(data, dict):
+        raise ValueError("notification.rate_limit must be an object")
+
+    max_retries = data.get('max_retries', 3)
+    if not isinstance(max_retries, int) or max_retries < 0:
+        raise ValueError("notification.rate_limit.max_retries must be a non-negative integer")
+
+    max_retry_after = data.get('max_retry_after_seconds', 60.0)
+    if not isinstance(max_retry_after, (int, float)) or max_retry_after <= 0:
+        raise ValueError("notification.rate_limit.max_retry_after_seconds must be a positive number")
+
+    jitter = data.get('jitter', 0.1)
+    if not isinstance(jitter, (int, float)) or jitter < 0:
+        raise ValueError("notification.rate_limit.jitter must be a non-negative number")
+
+    max_rps = data.get('max_requests_per_second', 10.0)
+    if max_rps is not None and (not isinstance(max_rps, (int, float)) or max_rps <= 0):
+        raise ValueError("notification.rate_limit.max_requests_per_second must be a positive number or null")
+
+    return RateLimitConfig(
+        max_retries=max_retries,
+        max_retry_after_seconds=float(max_retry_after),
+        jitter=float(jitter),
+        max_requests_per_second=float(max_rps) if max_rps is not None else None,
     )
@@ -1,6 +1,6 @@
 """Configuration data models."""
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 
 
 @dataclass
@@ -9,6 +9,75 @@ class ArxivConfig:
     categories: List[str]
     keywords: List[str]
     max_results: int
+    max_scan_results: Optional[int] = None
+
+
+@dataclass
+class HistoryConfig:
+    """Processed paper history configuration."""
+    file: str
+    bloom_false_positive_rate: Optional[float] = None
+    bloom_capacity: int = 1_000_000
+    lease_seconds: Optional[float] = None
+    retention_months: Optional[int] = None
+    archive_dir: Optional[str] = None
+
+
+@dataclass
+class RankingConfig:
+    """Relevance ranking configuration."""
+    top_k: int
+    keyword_weights: Dict[str, float] = field(default_factory=dict)
+    exemplars: List[str] = field(default_factory=list)
+    min_score: float = 0.0
+
+
+@dataclass
+class DeadlineConfig:
+    """Run deadline configuration."""
+    at: str
+    timezone: str = "UTC"
+    safety_margin_seconds: float = 60.0
+    summarize_estimate_seconds: float = 30.0
+    notify_estimate_seconds: float = 10.0
+
+
+@dataclass
+class QuotaConfig:
+    """Daily API quota planning configuration."""
+    ledger_file: str
+    requests_per_day: int
+    tokens_per_day: Optional[int] = None
+    runs_per_day: int = 1
+    headroom_requests: int = 0
+
+
+@dataclass
+class SummaryCacheConfig:
+    """Similarity-keyed summary cache configuration."""
+    dir: str
+    reuse_threshold: float = 0.95
+    update_threshold: float = 0.8
+    dimensions: int = 1024
+
+
+@dataclass
+class DedupConfig:
+    """Near-duplicate detection configuration."""
+    index_dir: str
+    threshold: float = 0.8
+    num_perm: int = 128
+    bands: int = 16
+    shingle_size: int = 3
+
+
+@dataclass
+class KeyPoolConfig:
+    """API key pool configuration. Keys themselves come from the environment."""
+    state_file: Optional[str] = None
+    requests_per_minute: Optional[int] = None
+    requests_per_day: Optional[int] = None
+    cooldown_seconds: float = 60.0
 
 
 @dataclass
@@ -18,6 +87,42 @@ class GeminiConfig:
     model: str
     temperature: float
     max_tokens: int
+    section_retries: int = 1
+    key_pool: Optional[KeyPoolConfig] = None
+
+
+@dataclass
+class SummarizationConfig:
+    """Summarization backend configuration."""
+    backend: str = "gemini"
+    fallback: bool = False
+    max_sentences: int = 3
+
+
+@dataclass
+class JournalConfig:
+    """Summarization work journal configuration."""
+    file: str
+    flush_batch_size: int = 16
+    flush_interval_seconds: float = 1.0
+    max_attempts: int = 5
+    retry_backoff_seconds: float = 3600.0
+
+
+@dataclass
+class PipelineConfig:
+    """Staged pipeline configuration."""
+    summarize_workers: int = 4
+    queue_size: int = 16
+
+
+@dataclass
+class ServeConfig:
+    """Resident serve mode configuration."""
+    # Shortly after arXiv's 20:00 US Eastern announcement, Sunday to Thursday.
+    schedule: str = "15 20 * * 0-4"
+    timezone: str = "America/New_York"
+    skip_without_announcement: bool = True
 
 
 @dataclass
@@ -26,11 +131,41 @@ class NotificationTarget:
     enabled: bool
 
 
+@dataclass
+class HttpConfig:
+    """Pooled HTTP session configuration shared by webhook notifiers."""
+    pool_size: int = 10
+    max_retries: int = 2
+    backoff_factor: float = 0.5
+    timeout_seconds: float = 10.0
+
+
+@dataclass
+class RateLimitConfig:
+    """Webhook rate limit handling shared by notification channels."""
+    max_retries: int = 3
+    max_retry_after_seconds: float = 60.0
+    jitter: float = 0.1
+    max_requests_per_second: Optional[float] = 10.0
+
+
+@dataclass
+class OutboxConfig:
+    """Durable notification outbox configuration."""
+    file: str
+    max_attempts: int = 10
+    retention_days: float = 7.0
+
+
 @dataclass
 class NotificationConfig:
     """Notification configuration."""
     slack: NotificationTarget
     discord: NotificationTarget
+    http: HttpConfig = field(default_factory=HttpConfig)
+    rate_limit: RateLimitConfig = field(default_factory=RateLimitConfig)
+    channel_timeout_seconds: float = 60.0
+    outbox: Optional[OutboxConfig] = None
 
 
 @dataclass
@@ -39,3 +174,13 @@ class Config:
     arxiv: ArxivConfig
     gemini: GeminiConfig
     notification: NotificationConfig
+    summarization: SummarizationConfig = field(default_factory=SummarizationConfig)
+    journal: Optional[JournalConfig] = None
+    ranking: Optional[RankingConfig] = None
+    dedup: Optional[DedupConfig] = None
+    summary_cache: Optional[SummaryCacheConfig] = None
+    quota: Optional[QuotaConfig] = None
+    deadline: Optional[DeadlineConfig] = None
+    history: Optional[HistoryConfig] = None
+    pipeline: Optional[PipelineConfig] = None
+    serve: ServeConfig = field(default_factory=ServeConfig)
@@ -0,0 +1,6 @@
+"""Near-duplicate detection module."""
+from arxiv_agent.dedup.lsh_index import LSHIndex
+from arxiv_agent.dedup.minhash import MinHasher
+from arxiv_agent.dedup.near_duplicate_detector import DuplicateCluster, NearDuplicateDetector
+
+__all__ = ["DuplicateCluster", "LSHIndex", "MinHasher", "NearDuplicateDetector"]
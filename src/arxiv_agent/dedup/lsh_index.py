@@ -0,0 +1,224 @@
+"""Persistent LSH index of MinHash signatures."""
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List, Tuple
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_BAND_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+
+class LSHIndex:
+    """
+    Locality-sensitive hashing index over MinHash signatures.
+
+    Signatures are split into ``bands`` bands; two papers become candidates
+    when any band is identical. On disk the index is a directory holding the
+    signatures as a raw ``uint32`` matrix and the paper IDs as text, both
+    append-only so each save writes only the rows inserted since the last one.
+
+    In memory, band keys of persisted rows are kept sorted per band for binary
+    search, while rows inserted during the current run are scanned linearly.
+    """
+
+    def __init__(self, index_dir: str, num_perm: int, bands: int) -> None:
+        """
+        Initialize LSH index and load persisted signatures.
+
+        Args:
+            index_dir: Directory storing the index files.
+            num_perm: Signature length.
+            bands: Number of LSH bands.
+
+        Raises:
+            ValueError: If num_perm is not divisible by bands.
+        """
+        if bands <= 0 or num_perm % bands != 0:
+            raise ValueError("num_perm must be a positive multiple of bands")
+
+        self._index_dir = Path(index_dir)
+        self._num_perm = num_perm
+        self._bands = bands
+        self._rows = num_perm // bands
+
+        self._ids: List[str] = []
+        self._row_of: Dict[str, int] = {}
+        self._signatures = np.zeros((0, num_perm), dtype=np.uint32)
+        self._pending: List[np.ndarray] = []
+        self._saved_count = 0
+        self._rebuild_sorted_keys()
+        self._load()
+
+    @property
+    def _signature_file(self) -> Path:
+        return self._index_dir / "signatures.u32"
+
+    @property
+    def _ids_file(self) -> Path:
+        return self._index_dir / "ids.txt"
+
+    @property
+    def _meta_file(self) -> Path:
+        return self._index_dir / "meta.json"
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, paper_id: str) -> bool:
+        return paper_id in self._row_of
+
+    def _load(self) -> None:
+        """
+        Load persisted signatures.
+
+        Starts empty when the index is missing, unreadable or was built with
+        different parameters. Rows left without an ID by a crash are dropped.
+        """
+        if not self._meta_file.exists():
+            logger.info(f"LSH index not found: {self._index_dir}. Starting with empty index.")
+            return
+
+        try:
+            meta = json.loads(self._meta_file.read_text(encoding="utf-8"))
+            if meta.get("num_perm") != self._num_perm:
+                logger.warning("LSH index was built with a different num_perm. Starting with empty index.")
+                return
+            signatures = np.fromfile(self._signature_file, dtype=np.uint32)
+            # The last segment is empty unless a crash left a partial line.
+            ids = self._ids_file.read_text(encoding="utf-8").split("\n")[:-1]
+        except (OSError, json.JSONDecodeError, ValueError) as e:
+            logger.error(f"Failed to read LSH index: {e}. Starting with empty index.")
+            return
+
+        count = min(len(signatures) // self._num_perm, len(ids))
+        if count * self._num_perm != len(signatures) or count != len(ids):
+            self._truncate(ids[:count], count)
+        self._signatures = signatures[:count * self._num_perm].reshape(count, self._num_perm)
+        self._ids = ids[:count]
+        self._row_of = {paper_id: row for row, paper_id in enumerate(self._ids)}
+        self._saved_count = count
+        self._rebuild_sorted_keys()
+        logger.info(f"Loaded {count} signatures from LSH index.")
+
+    def add(self, paper_id: str, signature: np.ndarray) -> None:
+        """
+        Insert a signature. Papers already in the index are ignored.
+
+        Args:
+            paper_id: arXiv paper ID.
+            signature: MinHash signature.
+        """
+        if paper_id in self._row_of:
+            return
+        self._row_of[paper_id] = len(self._ids)
+        self._ids.append(paper_id)
+        self._pending.append(np.asarray(signature, dtype=np.uint32))
+
+    def query(self, signature: np.ndarray) -> List[Tuple[str, float]]:
+        """
+        Find indexed papers sharing at least one band with a signature.
+
+        Args:
+            signature: MinHash signature.
+
+        Returns:
+            List of (paper ID, estimated Jaccard similarity) tuples.
+        """
+        keys = self._band_keys(signature[None, :])[0]
+        candidates = set()
+
+        for band in range(self._bands):
+            sorted_keys = self._sorted_keys[band]
+            lo = np.searchsorted(sorted_keys, keys[band], side="left")
+            hi = np.searchsorted(sorted_keys, keys[band], side="right")
+            candidates.update(self._sorted_rows[band, lo:hi].tolist())
+
+        if self._pending:
+            pending = np.vstack(self._pending)
+            matches = (self._band_keys(pending) == keys).any(axis=1)
+            candidates.update((np.flatnonzero(matches) + len(self._signatures)).tolist())
+
+        results = []
+        for row in sorted(candidates):
+            stored = self._signature_at(row)
+            results.append((self._ids[row], float(np.mean(stored == signature))))
+        return results
+
+    def save(self) -> None:
+        """
+        Append signatures inserted since the last save.
+
+        Logs error if save fails but does not raise exception to prevent
+        disrupting main application flow.
+        """
+        if self._pending:
+            self._signatures = np.vstack([self._signatures, *self._pending])
+            self._pending = []
+            self._rebuild_sorted_keys()
+
+        new_rows = len(self._ids) - self._saved_count
+        if new_rows == 0:
+            return
+
+        try:
+            self._index_dir.mkdir(parents=True, exist_ok=True)
+            if not self._meta_file.exists():
+                tmp_file = self._meta_file.with_name(self._meta_file.name + ".tmp")
+                tmp_file.write_text(
+                    json.dumps({"num_perm": self._num_perm, "dtype": "uint32"}),
+                    encoding="utf-8",
+                )
+                os.replace(tmp_file, self._meta_file)
+            # Signatures first: on a crash, rows without an ID are dropped on load.
+            with self._signature_file.open("ab") as f:
+                f.write(self._signatures[self._saved_count:].tobytes())
+            with self._ids_file.open("a", encoding="utf-8") as f:
+                f.write("".join(f"{paper_id}\n" for paper_id in self._ids[self._saved_count:]))
+            self._saved_count = len(self._ids)
+            logger.info(f"Saved {new_rows} new signatures to LSH index.")
+        except OSError as e:
+            logger.error(f"Failed to save LSH index: {e}")
+
+    def _truncate(self, ids: List[str], count: int) -> None:
+        """Drop rows left half-written by a crash so later appends stay aligned."""
+        logger.warning(f"Repairing LSH index truncated by an interrupted save ({count} rows kept).")
+        try:
+            with self._signature_file.open("r+b") as f:
+                f.truncate(count * self._num_perm * np.dtype(np.uint32).itemsize)
+            tmp_file = self._ids_file.with_name(self._ids_file.name + ".tmp")
+            tmp_file.write_text("".join(f"{paper_id}\n" for paper_id in ids), encoding="utf-8")
+            os.replace(tmp_file, self._ids_file)
+        except OSError as e:
+            logger.error(f"Failed to repair LSH index: {e}")
+
+    def _signature_at(self, row: int) -> np.ndarray:
+        """Get the signature stored at a row."""
+        if row < len(self._signatures):
+            return self._signatures[row]
+        return self._pending[row - len(self._signatures)]
+
+    def _band_keys(self, signatures: np.ndarray) -> np.ndarray:
+        """
+        Hash each band of each signature into a 64-bit key.
+
+        Args:
+            signatures: Array of shape (n, num_perm)
+
+        Returns:
+            Array of shape (n, bands)
+        """
+        banded = signatures.astype(np.uint64).reshape(len(signatures), self._bands, self._rows)
+        keys = np.zeros((len(signatures), self._bands), dtype=np.uint64)
+        for column in range(self._rows):
+            keys = keys * _BAND_MIX + banded[:, :, column]
+        return keys
+
+    def _rebuild_sorted_keys(self) -> None:
+        """Sort persisted rows by band key for binary search."""
+        keys = self._band_keys(self._signatures).T
+        order = np.argsort(keys, axis=1, kind="stable")
+        self._sorted_keys = np.take_along_axis(keys, order, axis=1)
+        self._sorted_rows = order
@@ -0,0 +1,96 @@
+"""MinHash signatures of paper abstracts."""
+import zlib
+from typing import List
+import numpy as np
+from arxiv_agent.utils.text import tokenize
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = np.uint64(0xFFFFFFFF)
+
+
+class MinHasher:
+    """
+    Computes MinHash signatures over word shingles.
+
+    Each permutation is a universal hash ``(a * x + b) mod p`` applied to the
+    CRC32 of every shingle; a signature keeps the minimum per permutation as a
+    fixed-width ``uint32`` so signatures can be stored compactly.
+    """
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 3, seed: int = 1):
+        """
+        Initialize MinHasher.
+
+        Args:
+            num_perm: Number of hash permutations (signature length)
+            shingle_size: Number of consecutive words per shingle
+            seed: Seed for the permutation coefficients
+
+        Raises:
+            ValueError: If num_perm or shingle_size is not positive
+        """
+        if num_perm <= 0:
+            raise ValueError("num_perm must be positive")
+        if shingle_size <= 0:
+            raise ValueError("shingle_size must be positive")
+
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = np.random.default_rng(seed)
+        # Coefficients below 2**29 keep a * x + b inside uint64 for 32-bit x.
+        self._a = rng.integers(1, 1 << 29, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, 1 << 29, size=num_perm, dtype=np.uint64)
+
+    def shingles(self, text: str) -> np.ndarray:
+        """
+        Hash the word shingles of a text.
+
+        Args:
+            text: Text to shingle
+
+        Returns:
+            Array of unique 32-bit shingle hashes (empty if text has no words)
+        """
+        tokens = tokenize(text, drop_stopwords=False)
+        if not tokens:
+            return np.zeros(0, dtype=np.uint64)
+
+        span = min(self.shingle_size, len(tokens))
+        hashes = {
+            zlib.crc32(" ".join(tokens[i:i + span]).encode("utf-8"))
+            for i in range(len(tokens) - span + 1)
+        }
+        return np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+
+    def signature(self, text: str) -> np.ndarray:
+        """
+        Compute the MinHash signature of a text.
+
+        Args:
+            text: Text to sign
+
+        Returns:
+            ``uint32`` array of length ``num_perm``; all values are the maximum
+            when the text has no words
+        """
+        shingles = self.shingles(text)
+        if shingles.size == 0:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint32)
+
+        permuted = (self._a[:, None] * shingles[None, :] + self._b[:, None]) % _MERSENNE_PRIME
+        return (permuted & _MAX_HASH).min(axis=1).astype(np.uint32)
+
+    def signatures(self, texts: List[str]) -> np.ndarray:
+        """
+        Compute signatures for several texts.
+
+        Args:
+            texts: Texts to sign
+
+        Returns:
+            ``uint32`` array of shape (len(texts), num_perm)
+        """
+        result = np.empty((len(texts), self.num_perm), dtype=np.uint32)
+        for i, text in enumerate(texts):
+            result[i] = self.signature(text)
+        return result
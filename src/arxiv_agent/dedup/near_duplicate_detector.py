@@ -0,0 +1,105 @@
+"""Near-duplicate detection across incoming papers."""
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List
+from arxiv_agent.collection.models import Paper
+from .lsh_index import LSHIndex
+from .minhash import MinHasher
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DuplicateCluster:
+    """Group of near-identical papers represented by one of them."""
+    representative: Paper
+    duplicates: List[Paper] = field(default_factory=list)
+    previous_ids: List[str] = field(default_factory=list)
+
+    @property
+    def seen_before(self) -> bool:
+        """Whether the cluster matches papers from previous runs."""
+        return bool(self.previous_ids)
+
+
+class NearDuplicateDetector:
+    """
+    Clusters papers with near-identical abstracts.
+
+    Papers are compared with MinHash/LSH against both the papers of the current
+    run and the persisted signatures of earlier runs. Within a run, the first
+    paper of each cluster (in input order, i.e. highest ranked first) is its
+    representative. Clusters matching an earlier run are flagged as seen.
+    """
+
+    def __init__(self, hasher: MinHasher, index: LSHIndex, threshold: float = 0.8):
+        """
+        Initialize near-duplicate detector.
+
+        Args:
+            hasher: MinHash signature generator
+            index: LSH index of previously seen signatures
+            threshold: Minimum estimated Jaccard similarity of duplicates (0-1)
+
+        Raises:
+            ValueError: If threshold is out of range
+        """
+        if not (0 < threshold <= 1):
+            raise ValueError("threshold must be between 0 and 1")
+
+        self.hasher = hasher
+        self.index = index
+        self.threshold = threshold
+
+    def cluster(self, papers: List[Paper]) -> List[DuplicateCluster]:
+        """
+        Group papers into near-duplicate clusters and index their signatures.
+
+        Args:
+            papers: Papers in priority order
+
+        Returns:
+            List of clusters in order of their representatives
+        """
+        signatures = self.hasher.signatures([paper.abstract for paper in papers])
+        clusters: List[DuplicateCluster] = []
+        cluster_of: Dict[str, DuplicateCluster] = {}
+
+        for paper, signature in zip(papers, signatures):
+            if not self.hasher.shingles(paper.abstract).size:
+                clusters.append(DuplicateCluster(representative=paper))
+                continue
+
+            matches = sorted(
+                (
+                    (similarity, paper_id)
+                    for paper_id, similarity in self.index.query(signature)
+                    if paper_id != paper.arxiv_id and similarity >= self.threshold
+                ),
+                reverse=True,
+            )
+            current = [paper_id for _, paper_id in matches if paper_id in cluster_of]
+            previous = [paper_id for _, paper_id in matches if paper_id not in cluster_of]
+
+            if current:
+                target = cluster_of[current[0]]
+                target.duplicates.append(paper)
+                target.previous_ids.extend(pid for pid in previous if pid not in target.previous_ids)
+            else:
+                target = DuplicateCluster(representative=paper, previous_ids=previous)
+                clusters.append(target)
+
+            cluster_of[paper.arxiv_id] = target
+            self.index.add(paper.arxiv_id, signature)
+
+        duplicates = sum(len(c.duplicates) for c in clusters)
+        seen = sum(1 for c in clusters if c.seen_before)
+        logger.info(
+            f"Found {len(clusters)} clusters in {len(papers)} papers "
+            f"({duplicates} near-duplicates, {seen} seen in earlier runs)"
+        )
+        return clusters
+
+    def save(self) -> None:
+        """Persist signatures indexed during this run."""
+        self.index.save()
@@ -1,4 +1,32 @@
 """Paper history management module."""
+from arxiv_agent.history.base_paper_history import BasePaperHistory
+from arxiv_agent.history.bloom_filter import BloomFilter
+from arxiv_agent.history.bloom_paper_history import BloomPaperHistory
+from arxiv_agent.history.factory import open_history, supports_claims
+from arxiv_agent.history.log_paper_history import LogPaperHistory
+from arxiv_agent.history.migrate import migrate_json_history
+from arxiv_agent.history.packed_paper_history import (
+    PackedPaperHistory,
+    decode_arxiv_id,
+    encode_arxiv_id,
+)
 from arxiv_agent.history.paper_history import PaperHistory
+from arxiv_agent.history.sharded_paper_history import ShardedPaperHistory, shard_of
+from arxiv_agent.history.sqlite_paper_history import SqlitePaperHistory
 
-__all__ = ["PaperHistory"]
+__all__ = [
+    "BasePaperHistory",
+    "BloomFilter",
+    "BloomPaperHistory",
+    "LogPaperHistory",
+    "PackedPaperHistory",
+    "PaperHistory",
+    "ShardedPaperHistory",
+    "SqlitePaperHistory",
+    "decode_arxiv_id",
+    "encode_arxiv_id",
+    "migrate_json_history",
+    "open_history",
+    "shard_of",
+    "supports_claims",
+]
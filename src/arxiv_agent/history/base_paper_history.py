@@ -0,0 +1,103 @@
+"""Base interface for processed paper history backends."""
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from arxiv_agent.collection.models import Paper
+
+
+class BasePaperHistory(ABC):
+    """Base class for paper history backends."""
+
+    @abstractmethod
+    def is_processed(self, paper_id: str) -> bool:
+        """
+        Check if a paper has been processed.
+
+        Args:
+            paper_id: arXiv paper ID to check.
+
+        Returns:
+            True if paper has been processed, False otherwise.
+        """
+        pass
+
+    def processed_among(self, paper_ids: list[str]) -> set[str]:
+        """
+        Find which of the given papers have been processed.
+
+        Backends override this with a batched lookup; the default checks
+        each ID in turn.
+
+        Args:
+            paper_ids: arXiv paper IDs to check.
+
+        Returns:
+            Set of the given IDs that have been processed.
+        """
+        return {paper_id for paper_id in paper_ids if self.is_processed(paper_id)}
+
+    def filter_unprocessed(self, papers: List[Paper]) -> List[Paper]:
+        """
+        Drop papers that have already been processed.
+
+        Args:
+            papers: Papers to filter.
+
+        Returns:
+            Unprocessed papers in their original order.
+        """
+        processed = self.processed_among([paper.arxiv_id for paper in papers])
+        return [paper for paper in papers if paper.arxiv_id not in processed]
+
+    @abstractmethod
+    def processed_ids(self) -> list[str]:
+        """
+        Get all processed paper IDs.
+
+        Returns:
+            Sorted list of processed paper IDs.
+        """
+        pass
+
+    @abstractmethod
+    def mark_processed(self, paper_ids: list[str]) -> None:
+        """
+        Mark papers as processed and persist them.
+
+        Args:
+            paper_ids: List of arXiv paper IDs to mark as processed.
+        """
+        pass
+
+    def claim(self, paper_ids: list[str], owner: str, lease_seconds: float, now: Optional[float] = None) -> list[str]:
+        """
+        Lease unprocessed papers to one worker.
+
+        Args:
+            paper_ids: arXiv paper IDs to claim.
+            owner: Identifier of the claiming worker.
+            lease_seconds: Lease duration in seconds.
+            now: Current UNIX time (defaults to time.time()).
+
+        Returns:
+            IDs claimed by the caller, in input order.
+
+        Raises:
+            NotImplementedError: If the backend does not support claims.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support claims")
+
+    def release(self, paper_ids: list[str], owner: str) -> None:
+        """
+        Give up leases without marking the papers as processed.
+
+        Args:
+            paper_ids: arXiv paper IDs to release.
+            owner: Identifier of the worker holding the leases.
+
+        Raises:
+            NotImplementedError: If the backend does not support claims.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support claims")
+
+    def close(self) -> None:
+        """Release resources held by the backend."""
@@ -0,0 +1,157 @@
+"""Memory-mapped Bloom filter for fast negative membership checks."""
+import fcntl
+import hashlib
+import logging
+import math
+import struct
+import threading
+from pathlib import Path
+from typing import Iterable, Optional
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"APBLOOM1"
+_HEADER = struct.Struct("<8sQIQ")
+_HEADER_SIZE = 32
+_BIT_VALUES = np.array([1, 2, 4, 8, 16, 32, 64, 128], dtype=np.uint8)
+
+
+class BloomFilter:
+    """
+    Bloom filter stored in a memory-mapped file.
+
+    The bit array is sized for ``capacity`` keys at the requested false
+    positive rate and lives in a file mapped with ``numpy.memmap``, so opening
+    the filter costs no parsing and pages are loaded on demand. Keys are hashed
+    once with BLAKE2b and expanded to ``num_hashes`` bit positions by double
+    hashing. Inserts are incremental; the rate degrades gracefully past
+    capacity and a warning is logged.
+
+    Inserts hold a thread lock and an exclusive lock on the filter file, so
+    several threads and processes may add keys without losing each other's
+    bits. Lookups do not lock.
+    """
+
+    def __init__(self, filter_file: str, capacity: int = 1_000_000, false_positive_rate: float = 0.001) -> None:
+        """
+        Open or create a Bloom filter.
+
+        An existing file keeps the size it was created with.
+
+        Args:
+            filter_file: Path to the filter file.
+            capacity: Expected number of keys when creating the filter.
+            false_positive_rate: Target false positive rate at capacity (0-1).
+
+        Raises:
+            ValueError: If capacity or false_positive_rate is out of range.
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not (0 < false_positive_rate < 1):
+            raise ValueError("false_positive_rate must be between 0 and 1")
+
+        self._filter_file = Path(filter_file)
+        self.created = not self._filter_file.exists()
+        if self.created:
+            num_bits = math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2)
+            num_bits = -(-num_bits // 8) * 8
+            num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+            self._create(num_bits, num_hashes, capacity)
+
+        with self._filter_file.open("rb") as f:
+            magic, num_bits, num_hashes, capacity = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != _MAGIC:
+            raise ValueError(f"not a Bloom filter file: {self._filter_file}")
+
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.capacity = capacity
+        self._bits: Optional[np.memmap] = np.memmap(
+            self._filter_file, dtype=np.uint8, mode="r+", offset=_HEADER_SIZE, shape=(num_bits // 8,)
+        )
+        self._warned = False
+        self._lock = threading.Lock()
+        # Set bits as last counted by this process; None until the first insert.
+        self._set_bits: Optional[int] = None
+
+    def _create(self, num_bits: int, num_hashes: int, capacity: int) -> None:
+        """Write the header and a zeroed bit array."""
+        self._filter_file.parent.mkdir(parents=True, exist_ok=True)
+        with self._filter_file.open("wb") as f:
+            f.write(_HEADER.pack(_MAGIC, num_bits, num_hashes, capacity).ljust(_HEADER_SIZE, b"\0"))
+            f.truncate(_HEADER_SIZE + num_bits // 8)
+        logger.info(f"Created Bloom filter with {num_bits} bits and {num_hashes} hashes.")
+
+    def _positions(self, keys: Iterable[str]) -> np.ndarray:
+        """
+        Compute the bit positions of keys.
+
+        Returns:
+            Array of shape (n, num_hashes)
+        """
+        digests = b"".join(hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest() for key in keys)
+        halves = np.frombuffer(digests, dtype="<u8").reshape(-1, 2)
+        steps = np.arange(self.num_hashes, dtype=np.uint64)
+        combined = halves[:, :1] + steps * (halves[:, 1:] | np.uint64(1))
+        return combined % np.uint64(self.num_bits)
+
+    def __contains__(self, key: str) -> bool:
+        return bool(self.contains_many([key])[0])
+
+    def contains_many(self, keys: list[str]) -> np.ndarray:
+        """
+        Check which keys may be in the filter.
+
+        Args:
+            keys: Keys to check.
+
+        Returns:
+            Boolean array; False means the key is definitely absent.
+        """
+        if not keys:
+            return np.zeros(0, dtype=bool)
+        positions = self._positions(keys)
+        bits = self._bits[positions >> np.uint64(3)] & _BIT_VALUES[positions & np.uint64(7)]
+        return (bits != 0).all(axis=1)
+
+    def add_many(self, keys: list[str]) -> None:
+        """
+        Insert keys.
+
+        Args:
+            keys: Keys to insert.
+        """
+        if not keys:
+            return
+        positions = np.unique(self._positions(keys))
+        offsets = positions >> np.uint64(3)
+        masks = _BIT_VALUES[positions & np.uint64(7)]
+        with self._lock, self._filter_file.open("rb") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                if self._set_bits is None:
+                    # Counted once; later inserts only add the bits they set.
+                    self._set_bits = int(np.unpackbits(self._bits).sum())
+                self._set_bits += int(np.count_nonzero((self._bits[offsets] & masks) == 0))
+                np.bitwise_or.at(self._bits, offsets, masks)
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        if not self._warned and self._set_bits > self.num_bits // 2:
+            self._warned = True
+            logger.warning("Bloom filter is over capacity; its false positive rate is rising.")
+
+    def fill_ratio(self) -> float:
+        """Get the fraction of bits set."""
+        return float(np.unpackbits(self._bits).mean())
+
+    def flush(self) -> None:
+        """Write modified pages to disk."""
+        if self._bits is not None:
+            self._bits.flush()
+
+    def close(self) -> None:
+        """Flush and unmap the filter."""
+        self.flush()
+        self._bits = None
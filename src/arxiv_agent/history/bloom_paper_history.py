@@ -0,0 +1,120 @@
+"""Paper history fronted by a Bloom filter."""
+import logging
+from typing import Optional
+from .base_paper_history import BasePaperHistory
+from .bloom_filter import BloomFilter
+
+logger = logging.getLogger(__name__)
+
+
+class BloomPaperHistory(BasePaperHistory):
+    """
+    Answers definite negatives from a Bloom filter before the backing store.
+
+    The store stays authoritative: only IDs the filter reports as possibly
+    present are looked up in it, so unseen papers (the common case) never
+    touch the store. Paired with ``SqlitePaperHistory`` this avoids loading
+    the full ID set into memory. A newly created filter is populated from the
+    store's existing IDs.
+    """
+
+    def __init__(self, store: BasePaperHistory, bloom: BloomFilter) -> None:
+        """
+        Initialize Bloom-filtered paper history.
+
+        Args:
+            store: Authoritative paper history.
+            bloom: Bloom filter of processed paper IDs.
+        """
+        self.store = store
+        self.bloom = bloom
+        if bloom.created:
+            paper_ids = store.processed_ids()
+            bloom.add_many(paper_ids)
+            bloom.flush()
+            logger.info(f"Populated Bloom filter with {len(paper_ids)} paper IDs.")
+
+    def is_processed(self, paper_id: str) -> bool:
+        """
+        Check if a paper has been processed.
+
+        Args:
+            paper_id: arXiv paper ID to check.
+
+        Returns:
+            True if paper has been processed, False otherwise.
+        """
+        if paper_id not in self.bloom:
+            return False
+        return self.store.is_processed(paper_id)
+
+    def processed_among(self, paper_ids: list[str]) -> set[str]:
+        """
+        Find which of the given papers have been processed.
+
+        Only IDs the filter reports as possibly present are looked up in the
+        store.
+
+        Args:
+            paper_ids: arXiv paper IDs to check.
+
+        Returns:
+            Set of the given IDs that have been processed.
+        """
+        maybe = self.bloom.contains_many(paper_ids)
+        candidates = [paper_id for paper_id, hit in zip(paper_ids, maybe.tolist()) if hit]
+        if not candidates:
+            return set()
+        return self.store.processed_among(candidates)
+
+    def processed_ids(self) -> list[str]:
+        """
+        Get all processed paper IDs from the store.
+
+        Returns:
+            Sorted list of processed paper IDs.
+        """
+        return self.store.processed_ids()
+
+    def mark_processed(self, paper_ids: list[str]) -> None:
+        """
+        Mark papers as processed in the store and the filter.
+
+        Args:
+            paper_ids: List of arXiv paper IDs to mark as processed.
+        """
+        if not paper_ids:
+            return
+        self.store.mark_processed(paper_ids)
+        self.bloom.add_many(paper_ids)
+        self.bloom.flush()
+
+    def claim(self, paper_ids: list[str], owner: str, lease_seconds: float, now: Optional[float] = None) -> list[str]:
+        """
+        Lease unprocessed papers to one worker through the store.
+
+        Args:
+            paper_ids: arXiv paper IDs to claim.
+            owner: Identifier of the claiming worker.
+            lease_seconds: Lease duration in seconds.
+            now: Current UNIX time (defaults to time.time()).
+
+        Returns:
+            IDs claimed by the caller, in input order.
+        """
+        return self.store.claim(paper_ids, owner, lease_seconds, now=now)
+
+    def release(self, paper_ids: list[str], owner: str) -> None:
+        """
+        Give up leases through the store.
+
+        Args:
+            paper_ids: arXiv paper IDs to release.
+            owner: Identifier of the worker holding the leases.
+        """
+        self.store.release(paper_ids, owner)
+
+    def close(self) -> None:
+        """Close the filter and the store."""
+        self.bloom.close()
+        self.store.close()
@@ -0,0 +1,79 @@
+"""Selection of the paper history backend."""
+from pathlib import Path
+from typing import Optional
+from .base_paper_history import BasePaperHistory
+from .bloom_filter import BloomFilter
+from .bloom_paper_history import BloomPaperHistory
+from .log_paper_history import LogPaperHistory
+from .packed_paper_history import PackedPaperHistory
+from .paper_history import PaperHistory
+from .sharded_paper_history import ShardedPaperHistory
+from .sqlite_paper_history import SqlitePaperHistory
+
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+LOG_SUFFIXES = (".log",)
+PACKED_SUFFIXES = (".i64",)
+
+
+def supports_claims(history_file: str) -> bool:
+    """
+    Check whether the backend of a history file supports claim leases.
+
+    Args:
+        history_file: Path to the history file.
+
+    Returns:
+        True for the JSON and SQLite backends, False otherwise.
+    """
+    suffix = Path(history_file).suffix.lower()
+    return bool(suffix) and suffix not in LOG_SUFFIXES + PACKED_SUFFIXES
+
+
+def open_history(
+    history_file: str,
+    bloom_false_positive_rate: Optional[float] = None,
+    bloom_capacity: int = 1_000_000,
+    retention_months: Optional[int] = None,
+    archive_dir: Optional[str] = None,
+) -> BasePaperHistory:
+    """
+    Open the history backend matching a file's extension.
+
+    Args:
+        history_file: Path to the history file. SQLite is used for
+            ``.db``, ``.sqlite`` and ``.sqlite3`` files, an append-only log
+            for ``.log`` files, a packed int64 array for ``.i64`` files,
+            monthly shards for paths without an extension (directories),
+            JSON otherwise.
+        bloom_false_positive_rate: When set, the backend is fronted by a
+            Bloom filter stored next to the history with a ``.bloom`` suffix.
+        bloom_capacity: Expected number of IDs when creating the filter.
+        retention_months: Months of monthly shards to keep; older shards are
+            expired on open. Only used by the sharded backend.
+        archive_dir: Directory receiving expired shards instead of deleting them.
+
+    Returns:
+        Paper history backend.
+    """
+    suffix = Path(history_file).suffix.lower()
+    if suffix in SQLITE_SUFFIXES:
+        history: BasePaperHistory = SqlitePaperHistory(history_file)
+    elif suffix in LOG_SUFFIXES:
+        history = LogPaperHistory(history_file)
+    elif suffix in PACKED_SUFFIXES:
+        history = PackedPaperHistory(history_file)
+    elif not suffix:
+        sharded = ShardedPaperHistory(history_file, retention_months=retention_months, archive_dir=archive_dir)
+        sharded.expire()
+        history = sharded
+    else:
+        history = PaperHistory(history_file)
+
+    if bloom_false_positive_rate is None:
+        return history
+    bloom = BloomFilter(
+        str(Path(history_file).with_suffix(".bloom")),
+        capacity=bloom_capacity,
+        false_positive_rate=bloom_false_positive_rate,
+    )
+    return BloomPaperHistory(history, bloom)
@@ -0,0 +1,342 @@
+"""Append-only log history of processed papers."""
+import fcntl
+import logging
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+from .base_paper_history import BasePaperHistory
+
+logger = logging.getLogger(__name__)
+
+
+class LogPaperHistory(BasePaperHistory):
+    """
+    Manages history of processed papers as a snapshot plus an append-only log.
+
+    ``mark_processed`` appends only IDs not seen before to a newline-delimited
+    log, so each mark costs I/O proportional to the new IDs. Startup replays
+    the sorted snapshot and then the log. When the log grows beyond
+    ``compaction_ratio`` times the snapshot size, the full ID set is written to
+    a new snapshot (in the background by default) and the log is emptied.
+    The snapshot is written without holding the lock, so lookups and marks
+    wait only for the final renames. Both files are replaced with an atomic
+    rename; a crash between the two renames only leaves duplicate entries,
+    never lost ones.
+
+    Several processes may share one log. Every operation holds an advisory
+    lock on a ``.lock`` file next to the log and first reads the entries other
+    processes appended since the last call. A compaction by another process
+    replaces the log file, which is detected by its inode and triggers a full
+    replay, so no process ever compacts away IDs it has not read.
+    """
+
+    def __init__(
+        self,
+        history_file: str,
+        compaction_ratio: float = 1.0,
+        min_compaction_bytes: int = 64 * 1024,
+        background: bool = True,
+    ) -> None:
+        """
+        Initialize log paper history and replay persisted IDs.
+
+        Args:
+            history_file: Path to the append-only log. The snapshot is stored
+                next to it with a ``.snapshot`` suffix.
+            compaction_ratio: Log to snapshot size ratio that triggers compaction.
+            min_compaction_bytes: Log size below which compaction never runs.
+            background: Whether compaction runs in a background thread.
+
+        Raises:
+            ValueError: If compaction_ratio is not positive.
+        """
+        if compaction_ratio <= 0:
+            raise ValueError("compaction_ratio must be positive")
+
+        self._log_file = Path(history_file)
+        self._snapshot_file = self._log_file.with_suffix(".snapshot")
+        self._lock_file = self._log_file.with_name(self._log_file.name + ".lock")
+        self._compaction_ratio = compaction_ratio
+        self._min_compaction_bytes = min_compaction_bytes
+        self._background = background
+        self._lock = threading.Lock()
+        self._compaction: Optional[threading.Thread] = None
+
+        self._processed_ids: set[str] = set()
+        self._snapshot_bytes = 0
+        self._log_bytes = 0
+        self._log_inode: Optional[int] = None
+        self._snapshot_stamp: Optional[Tuple[int, int]] = None
+        try:
+            with self._locked():
+                self._load_history()
+        except OSError as e:
+            logger.error(f"Failed to lock history log: {e}. Starting with empty history.")
+            return
+        logger.info(f"Loaded {len(self._processed_ids)} processed paper IDs from history log.")
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the exclusive advisory lock shared by all threads and processes."""
+        with self._lock:
+            self._log_file.parent.mkdir(parents=True, exist_ok=True)
+            with self._lock_file.open("a") as f:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _load_history(self) -> None:
+        """
+        Replay the snapshot and the whole log. Must be called with the lock held.
+
+        A partial last log line left by a crash is dropped so later appends
+        start on a fresh line.
+        """
+        try:
+            self._snapshot_stamp = self._stamp(self._snapshot_file)
+            if self._snapshot_stamp is not None:
+                snapshot = self._snapshot_file.read_bytes()
+                self._snapshot_bytes = len(snapshot)
+                self._processed_ids.update(snapshot.decode("utf-8").split())
+            self._log_bytes = 0
+            self._log_inode = None
+            if self._log_file.exists():
+                log = self._log_file.read_bytes()
+                complete = log.rfind(b"\n") + 1
+                if complete != len(log):
+                    logger.warning("Dropping partial entry left in history log by an interrupted write.")
+                    with self._log_file.open("r+b") as f:
+                        f.truncate(complete)
+                self._log_bytes = complete
+                self._log_inode = self._log_file.stat().st_ino
+                self._processed_ids.update(log[:complete].decode("utf-8").split())
+        except (OSError, UnicodeDecodeError) as e:
+            logger.error(f"Failed to read history log: {e}. Starting with loaded entries only.")
+
+    def _catch_up(self) -> None:
+        """Read entries other processes appended. Must be called with the lock held."""
+        try:
+            stat = self._log_file.stat()
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.error(f"Failed to read history log: {e}")
+            return
+
+        if (
+            stat.st_ino != self._log_inode
+            or stat.st_size < self._log_bytes
+            or self._stamp(self._snapshot_file) != self._snapshot_stamp
+        ):
+            # Another process compacted the log.
+            self._load_history()
+            return
+        if stat.st_size == self._log_bytes:
+            return
+
+        try:
+            with self._log_file.open("rb") as f:
+                f.seek(self._log_bytes)
+                tail = f.read()
+            if not tail.endswith(b"\n"):
+                self._load_history()
+                return
+            self._processed_ids.update(tail.decode("utf-8").split())
+            self._log_bytes += len(tail)
+        except (OSError, UnicodeDecodeError) as e:
+            logger.error(f"Failed to read history log: {e}")
+
+    @staticmethod
+    def _stamp(path: Path) -> Optional[Tuple[int, int]]:
+        """Identify a file version by inode and modification time, or None if missing."""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns
+
+    def __len__(self) -> int:
+        with self._locked():
+            self._catch_up()
+            return len(self._processed_ids)
+
+    def is_processed(self, paper_id: str) -> bool:
+        """
+        Check if a paper has been processed.
+
+        Args:
+            paper_id: arXiv paper ID to check.
+
+        Returns:
+            True if paper has been processed, False otherwise.
+        """
+        return paper_id in self.processed_among([paper_id])
+
+    def processed_among(self, paper_ids: list[str]) -> set[str]:
+        """
+        Find which of the given papers have been processed.
+
+        Args:
+            paper_ids: arXiv paper IDs to check.
+
+        Returns:
+            Set of the given IDs that have been processed.
+        """
+        with self._locked():
+            self._catch_up()
+            return self._processed_ids.intersection(paper_ids)
+
+    def processed_ids(self) -> list[str]:
+        """
+        Get all processed paper IDs.
+
+        Returns:
+            Sorted list of processed paper IDs.
+        """
+        with self._locked():
+            self._catch_up()
+            return sorted(self._processed_ids)
+
+    def mark_processed(self, paper_ids: list[str]) -> None:
+        """
+        Append papers not yet in the history to the log.
+
+        Logs error if the append fails but does not raise exception to prevent
+        disrupting main application flow.
+
+        Args:
+            paper_ids: List of arXiv paper IDs to mark as processed.
+        """
+        with self._locked():
+            self._catch_up()
+            new_ids = [pid for pid in dict.fromkeys(paper_ids) if pid not in self._processed_ids]
+            if not new_ids:
+                return
+
+            data = "".join(f"{paper_id}\n" for paper_id in new_ids).encode("utf-8")
+            try:
+                with self._log_file.open("ab") as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                    self._log_inode = os.fstat(f.fileno()).st_ino
+            except OSError as e:
+                logger.error(f"Failed to append to history log: {e}")
+                return
+
+            self._processed_ids.update(new_ids)
+            self._log_bytes += len(data)
+            logger.info(f"Appended {len(new_ids)} processed paper IDs to history log.")
+
+        if self._needs_compaction():
+            self.compact(wait=not self._background)
+
+    def _needs_compaction(self) -> bool:
+        """Check whether the log has outgrown the snapshot."""
+        if self._compaction is not None and self._compaction.is_alive():
+            return False
+        return (
+            self._log_bytes >= self._min_compaction_bytes
+            and self._log_bytes > self._compaction_ratio * self._snapshot_bytes
+        )
+
+    def compact(self, wait: bool = True) -> None:
+        """
+        Fold the log into a new sorted snapshot.
+
+        Args:
+            wait: Whether to block until compaction finishes; otherwise it
+                runs in a background thread.
+        """
+        if self._compaction is not None and self._compaction.is_alive():
+            if wait:
+                self._compaction.join()
+            return
+
+        self._compaction = threading.Thread(target=self._compact, name="history-compaction", daemon=True)
+        self._compaction.start()
+        if wait:
+            self._compaction.join()
+
+    def _compact(self) -> None:
+        """
+        Write the snapshot, then empty the log.
+
+        The IDs are copied under the lock and the snapshot is written to a
+        temporary file without it. The lock is then taken again to install
+        the snapshot and keep only the log entries appended meanwhile. If
+        another process compacted in between, this snapshot is discarded.
+        Logs error if compaction fails but does not raise exception; the
+        snapshot and log stay valid either way.
+        """
+        tmp_file = None
+        try:
+            with self._locked():
+                self._catch_up()
+                paper_ids = sorted(self._processed_ids)
+                log_bytes = self._log_bytes
+                log_inode = self._log_inode
+                snapshot_stamp = self._snapshot_stamp
+
+            snapshot = "".join(f"{paper_id}\n" for paper_id in paper_ids).encode("utf-8")
+            fd, tmp_name = tempfile.mkstemp(
+                dir=self._snapshot_file.parent, prefix=self._snapshot_file.name + ".", suffix=".tmp"
+            )
+            tmp_file = Path(tmp_name)
+            with os.fdopen(fd, "wb") as f:
+                f.write(snapshot)
+                f.flush()
+                os.fsync(f.fileno())
+
+            with self._locked():
+                try:
+                    stat = self._log_file.stat()
+                    current_inode, current_bytes = stat.st_ino, stat.st_size
+                except FileNotFoundError:
+                    current_inode, current_bytes = None, 0
+                if (
+                    current_inode != log_inode
+                    or current_bytes < log_bytes
+                    or self._stamp(self._snapshot_file) != snapshot_stamp
+                ):
+                    logger.info("History log was compacted by another process; discarding snapshot.")
+                    return
+                tail = b""
+                if current_inode is not None:
+                    with self._log_file.open("rb") as f:
+                        f.seek(log_bytes)
+                        tail = f.read()
+                os.replace(tmp_file, self._snapshot_file)
+                tmp_file = None
+                _atomic_write(self._log_file, tail)
+                self._processed_ids.update(tail.decode("utf-8").split())
+                self._snapshot_bytes = len(snapshot)
+                self._log_bytes = len(tail)
+                self._log_inode = self._log_file.stat().st_ino
+                self._snapshot_stamp = self._stamp(self._snapshot_file)
+            logger.info(f"Compacted history log into snapshot of {len(paper_ids)} IDs.")
+        except (OSError, UnicodeDecodeError) as e:
+            logger.error(f"Failed to compact history log: {e}")
+        finally:
+            if tmp_file is not None:
+                tmp_file.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        """Wait for a running compaction to finish."""
+        if self._compaction is not None:
+            self._compaction.join()
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Replace a file with new content via a synced temporary file."""
+    tmp_file = path.with_name(path.name + ".tmp")
+    with tmp_file.open("wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, path)
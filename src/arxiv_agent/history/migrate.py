@@ -0,0 +1,52 @@
+"""One-shot migration of JSON paper history to SQLite."""
+import logging
+import sys
+from .paper_history import PaperHistory
+from .sqlite_paper_history import SqlitePaperHistory
+
+logger = logging.getLogger(__name__)
+
+
+def migrate_json_history(json_file: str, db_file: str) -> int:
+    """
+    Copy processed paper IDs from a JSON history file into an SQLite database.
+
+    IDs already in the database are kept, so the migration can be re-run.
+
+    Args:
+        json_file: Path to the existing JSON history file.
+        db_file: Path to the SQLite database to create or extend.
+
+    Returns:
+        Number of IDs read from the JSON history.
+    """
+    paper_ids = PaperHistory(json_file).processed_ids()
+    history = SqlitePaperHistory(db_file)
+    try:
+        history.mark_processed(paper_ids)
+    finally:
+        history.close()
+    logger.info(f"Migrated {len(paper_ids)} paper IDs from {json_file} to {db_file}")
+    return len(paper_ids)
+
+
+def main() -> int:
+    """
+    Command line entry point.
+
+    Usage: python -m arxiv_agent.history.migrate <history.json> <history.db>
+
+    Returns:
+        Exit code (0 for success, 2 for invalid arguments)
+    """
+    if len(sys.argv) != 3:
+        print("Usage: python -m arxiv_agent.history.migrate <history.json> <history.db>", file=sys.stderr)
+        return 2
+
+    logging.basicConfig(level=logging.INFO)
+    migrate_json_history(sys.argv[1], sys.argv[2])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,227 @@
+"""Paper history of arXiv IDs packed into a sorted int64 array."""
+import logging
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Optional
+import numpy as np
+from .base_paper_history import BasePaperHistory
+
+logger = logging.getLogger(__name__)
+
+_NEW_STYLE_ID = re.compile(r"(\d{2}(?:0[1-9]|1[0-2]))\.(\d{4,5})(?:v([1-9]\d{0,2}))?")
+_VERSION_SPAN = 1000
+_EMPTY = np.zeros(0, dtype=np.int64)
+
+
+def encode_arxiv_id(paper_id: str) -> Optional[int]:
+    """
+    Pack a new-style arXiv ID into an integer.
+
+    ``YYMM.NNNNN[vN]`` (and the four-digit ``YYMM.NNNN`` form used before
+    2015) is encoded losslessly; codes sort by month, number and version.
+
+    Args:
+        paper_id: arXiv paper ID.
+
+    Returns:
+        Integer code, or None for old-style or malformed IDs.
+    """
+    match = _NEW_STYLE_ID.fullmatch(paper_id)
+    if match is None:
+        return None
+    yymm, number, version = match.groups()
+    five_digits = len(number) == 5
+    return ((int(yymm) * 100000 + int(number)) * 2 + five_digits) * _VERSION_SPAN + int(version or 0)
+
+
+def decode_arxiv_id(code: int) -> str:
+    """
+    Unpack an integer produced by ``encode_arxiv_id``.
+
+    Args:
+        code: Integer code.
+
+    Returns:
+        arXiv paper ID.
+    """
+    rest, version = divmod(int(code), _VERSION_SPAN)
+    rest, five_digits = divmod(rest, 2)
+    yymm, number = divmod(rest, 100000)
+    paper_id = f"{yymm:04d}.{number:05d}" if five_digits else f"{yymm:04d}.{number:04d}"
+    return f"{paper_id}v{version}" if version else paper_id
+
+
+class PackedPaperHistory(BasePaperHistory):
+    """
+    Manages history of processed papers as a sorted, memory-mapped int64 array.
+
+    New-style IDs take 8 bytes each instead of a Python string in a set, and
+    the array file is mapped rather than parsed, so startup does not depend on
+    the history size. Batch membership uses ``np.searchsorted`` and new IDs
+    are merged into the sorted array with a vectorized insert. Old-style IDs
+    such as ``hep-th/9901001`` are kept in a small text side table.
+    """
+
+    def __init__(self, history_file: str) -> None:
+        """
+        Initialize packed paper history.
+
+        Args:
+            history_file: Path to the int64 array file. The side table of
+                old-style IDs is stored next to it with a ``.legacy`` suffix.
+        """
+        self._ids_file = Path(history_file)
+        self._legacy_file = self._ids_file.with_suffix(".legacy")
+        self._lock = threading.Lock()
+        self._codes = self._map_codes()
+        self._legacy_ids = self._load_legacy()
+        logger.info(
+            f"Loaded {len(self._codes)} packed and {len(self._legacy_ids)} old-style paper IDs from history."
+        )
+
+    def _map_codes(self) -> np.ndarray:
+        """
+        Memory-map the sorted code array.
+
+        Returns:
+            Sorted codes (empty if the file is missing or unreadable).
+        """
+        try:
+            size = self._ids_file.stat().st_size
+        except FileNotFoundError:
+            return _EMPTY
+        except OSError as e:
+            logger.error(f"Failed to read history file: {e}. Starting with empty history.")
+            return _EMPTY
+
+        count = size // _EMPTY.itemsize
+        if count == 0:
+            return _EMPTY
+        return np.memmap(self._ids_file, dtype=np.int64, mode="r", shape=(count,))
+
+    def _load_legacy(self) -> set[str]:
+        """Load old-style IDs from the side table."""
+        try:
+            return set(self._legacy_file.read_text(encoding="utf-8").split())
+        except FileNotFoundError:
+            return set()
+        except OSError as e:
+            logger.error(f"Failed to read old-style history: {e}. Starting without it.")
+            return set()
+
+    def __len__(self) -> int:
+        return len(self._codes) + len(self._legacy_ids)
+
+    def contains_many(self, paper_ids: list[str]) -> np.ndarray:
+        """
+        Check which papers have been processed.
+
+        Args:
+            paper_ids: arXiv paper IDs to check.
+
+        Returns:
+            Boolean array aligned with paper_ids.
+        """
+        encoded = [encode_arxiv_id(pid) for pid in paper_ids]
+        codes = np.array([-1 if code is None else code for code in encoded], dtype=np.int64)
+        found = self.contains_codes(codes)
+        for i in np.flatnonzero(codes < 0):
+            found[i] = paper_ids[i] in self._legacy_ids
+        return found
+
+    def is_processed(self, paper_id: str) -> bool:
+        """
+        Check if a paper has been processed.
+
+        Args:
+            paper_id: arXiv paper ID to check.
+
+        Returns:
+            True if paper has been processed, False otherwise.
+        """
+        return bool(self.contains_many([paper_id])[0])
+
+    def processed_among(self, paper_ids: list[str]) -> set[str]:
+        """
+        Find which of the given papers have been processed.
+
+        Args:
+            paper_ids: arXiv paper IDs to check.
+
+        Returns:
+            Set of the given IDs that have been processed.
+        """
+        found = self.contains_many(paper_ids)
+        return {paper_id for paper_id, hit in zip(paper_ids, found.tolist()) if hit}
+
+    def processed_ids(self) -> list[str]:
+        """
+        Get all processed paper IDs.
+
+        Returns:
+            Sorted list of processed paper IDs.
+        """
+        return sorted([decode_arxiv_id(code) for code in self._codes.tolist()] + list(self._legacy_ids))
+
+    def mark_processed(self, paper_ids: list[str]) -> None:
+        """
+        Merge papers into the sorted array and save it.
+
+        Logs error if save fails but does not raise exception to prevent
+        disrupting main application flow.
+
+        Args:
+            paper_ids: List of arXiv paper IDs to mark as processed.
+        """
+        if not paper_ids:
+            return
+
+        with self._lock:
+            encoded = [(pid, encode_arxiv_id(pid)) for pid in paper_ids]
+            codes = np.unique(np.array([c for _, c in encoded if c is not None], dtype=np.int64))
+            if len(self._codes):
+                codes = codes[~self.contains_codes(codes)]
+            legacy = {pid for pid, c in encoded if c is None} - self._legacy_ids
+
+            try:
+                if codes.size:
+                    merged = np.insert(self._codes, np.searchsorted(self._codes, codes), codes)
+                    _atomic_write(self._ids_file, merged.tobytes())
+                    self._codes = self._map_codes()
+                if legacy:
+                    self._legacy_ids |= legacy
+                    data = "".join(f"{pid}\n" for pid in sorted(self._legacy_ids))
+                    _atomic_write(self._legacy_file, data.encode("utf-8"))
+            except OSError as e:
+                logger.error(f"Failed to save history file: {e}")
+                return
+
+        logger.info(f"Saved {codes.size + len(legacy)} new processed paper IDs to history.")
+
+    def contains_codes(self, codes: np.ndarray) -> np.ndarray:
+        """
+        Check which packed codes are in the history.
+
+        Args:
+            codes: Sorted or unsorted int64 codes.
+
+        Returns:
+            Boolean array aligned with codes.
+        """
+        if not len(self._codes):
+            return np.zeros(len(codes), dtype=bool)
+        positions = np.minimum(np.searchsorted(self._codes, codes), len(self._codes) - 1)
+        return self._codes[positions] == codes
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Replace a file with new content via a synced temporary file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = path.with_name(path.name + ".tmp")
+    with tmp_file.open("wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, path)
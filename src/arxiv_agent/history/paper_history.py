@@ -1,18 +1,31 @@
 """Paper history management for tracking processed papers."""
+import fcntl
 import json
 import logging
+import os
+import time
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+from .base_paper_history import BasePaperHistory
 
 logger = logging.getLogger(__name__)
 
 
-class PaperHistory:
+class PaperHistory(BasePaperHistory):
     """
     Manages history of processed papers.
 
     Stores processed paper IDs in a JSON file to prevent duplicate processing.
     Handles file I/O errors gracefully to ensure application continues even if
     history management fails.
+
+    Several processes may share one file. Every write holds an advisory lock
+    on a ``.lock`` file next to the history, re-reads the file, merges it with
+    this process's changes and commits through a temporary file and
+    ``os.replace``, so concurrent runs never corrupt the file or lose each
+    other's IDs. Workers can also claim papers with a time-limited lease so
+    that no two of them summarize the same paper.
     """
 
     def __init__(self, history_file: str) -> None:
@@ -23,6 +36,7 @@ class PaperHistory:
             history_file: Path to the JSON file storing processed paper IDs.
         """
         self._history_file = Path(history_file)
+        self._lock_file = self._history_file.with_name(self._history_file.name + ".lock")
         self._processed_ids: set[str] = self._load_history()
 
     def _load_history(self) -> set[str]:
@@ -37,21 +51,47 @@ class PaperHistory:
             logger.info(f"History file not found: {self._history_file}. Starting with empty history.")
             return set()
 
+        processed_ids, _ = self._read_state()
+        logger.info(f"Loaded {len(processed_ids)} processed paper IDs from history.")
+        return processed_ids
+
+    def _read_state(self) -> Tuple[set[str], Dict[str, dict]]:
+        """
+        Read processed IDs and active leases from file.
+
+        Returns:
+            Tuple of (processed paper IDs, lease by paper ID). Both are empty if
+            the file doesn't exist or cannot be read.
+        """
         try:
             with self._history_file.open("r", encoding="utf-8") as f:
                 data = json.load(f)
-                processed_papers = data.get("processed_papers", [])
-                if not isinstance(processed_papers, list):
-                    logger.warning("Invalid history format: 'processed_papers' is not a list. Starting with empty history.")
-                    return set()
-                logger.info(f"Loaded {len(processed_papers)} processed paper IDs from history.")
-                return set(processed_papers)
+        except FileNotFoundError:
+            return set(), {}
         except json.JSONDecodeError as e:
             logger.warning(f"Failed to parse history file: {e}. Starting with empty history.")
-            return set()
+            return set(), {}
         except OSError as e:
             logger.error(f"Failed to read history file: {e}. Starting with empty history.")
-            return set()
+            return set(), {}
+
+        processed_papers = data.get("processed_papers", [])
+        if not isinstance(processed_papers, list):
+            logger.warning("Invalid history format: 'processed_papers' is not a list. Starting with empty history.")
+            return set(), {}
+        leases = data.get("leases", {})
+        return set(processed_papers), leases if isinstance(leases, dict) else {}
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the exclusive advisory lock shared by all processes."""
+        self._history_file.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock_file.open("a") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
 
     def is_processed(self, paper_id: str) -> bool:
         """
@@ -65,10 +105,33 @@ class PaperHistory:
         """
         return paper_id in self._processed_ids
 
+    def processed_among(self, paper_ids: list[str]) -> set[str]:
+        """
+        Find which of the given papers have been processed.
+
+        Args:
+            paper_ids: arXiv paper IDs to check.
+
+        Returns:
+            Set of the given IDs that have been processed.
+        """
+        return self._processed_ids.intersection(paper_ids)
+
+    def processed_ids(self) -> list[str]:
+        """
+        Get all processed paper IDs.
+
+        Returns:
+            Sorted list of processed paper IDs.
+        """
+        return sorted(self._processed_ids)
+
     def mark_processed(self, paper_ids: list[str]) -> None:
         """
         Mark papers as processed and save to file.
 
+        Leases on the papers are released.
+
         Args:
             paper_ids: List of arXiv paper IDs to mark as processed.
         """
@@ -76,20 +139,97 @@ class PaperHistory:
             return
 
         self._processed_ids.update(paper_ids)
-        self._save_history()
+        try:
+            with self._locked():
+                processed_ids, leases = self._read_state()
+                self._processed_ids |= processed_ids
+                for paper_id in paper_ids:
+                    leases.pop(paper_id, None)
+                self._save_history(leases)
+        except OSError as e:
+            logger.error(f"Failed to lock history file: {e}")
 
-    def _save_history(self) -> None:
+    def claim(self, paper_ids: list[str], owner: str, lease_seconds: float, now: Optional[float] = None) -> list[str]:
         """
-        Save processed paper IDs to file.
+        Lease unprocessed papers to one worker.
 
-        Logs error if save fails but does not raise exception to prevent
-        disrupting main application flow.
+        A paper can be claimed when it is not processed and not leased to
+        another owner, or that owner's lease has expired. Claiming again
+        renews the caller's own leases.
+
+        Args:
+            paper_ids: arXiv paper IDs to claim.
+            owner: Identifier of the claiming worker.
+            lease_seconds: Lease duration in seconds.
+            now: Current UNIX time (defaults to time.time()).
+
+        Returns:
+            IDs claimed by the caller, in input order. Empty if the history
+            file cannot be locked.
+        """
+        now = time.time() if now is None else now
+        try:
+            with self._locked():
+                processed_ids, leases = self._read_state()
+                self._processed_ids |= processed_ids
+                leases = {pid: lease for pid, lease in leases.items() if lease.get("expires", 0) > now}
+                claimed = [
+                    pid for pid in dict.fromkeys(paper_ids)
+                    if pid not in self._processed_ids and leases.get(pid, {}).get("owner", owner) == owner
+                ]
+                for pid in claimed:
+                    leases[pid] = {"owner": owner, "expires": now + lease_seconds}
+                if claimed or leases:
+                    self._save_history(leases)
+        except OSError as e:
+            logger.error(f"Failed to lock history file: {e}")
+            return []
+
+        logger.info(f"Claimed {len(claimed)} of {len(paper_ids)} papers for {owner}")
+        return claimed
+
+    def release(self, paper_ids: list[str], owner: str) -> None:
+        """
+        Give up leases without marking the papers as processed.
+
+        Args:
+            paper_ids: arXiv paper IDs to release.
+            owner: Identifier of the worker holding the leases.
+        """
+        if not paper_ids:
+            return
+
+        try:
+            with self._locked():
+                processed_ids, leases = self._read_state()
+                self._processed_ids |= processed_ids
+                for pid in paper_ids:
+                    if leases.get(pid, {}).get("owner") == owner:
+                        del leases[pid]
+                self._save_history(leases)
+        except OSError as e:
+            logger.error(f"Failed to lock history file: {e}")
+
+    def _save_history(self, leases: Dict[str, dict]) -> None:
+        """
+        Save processed paper IDs and leases to file atomically.
+
+        Must be called while holding the lock. Logs error if save fails but
+        does not raise exception to prevent disrupting main application flow.
+
+        Args:
+            leases: Active leases by paper ID.
         """
+        tmp_file = self._history_file.with_name(self._history_file.name + ".tmp")
+        data: dict = {"processed_papers": sorted(self._processed_ids)}
+        if leases:
+            data["leases"] = leases
         try:
-            self._history_file.parent.mkdir(parents=True, exist_ok=True)
-            with self._history_file.open("w", encoding="utf-8") as f:
-                data = {"processed_papers": sorted(self._processed_ids)}
+            with tmp_file.open("w", encoding="utf-8") as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self._history_file)
             logger.info(f"Saved {len(self._processed_ids)} processed paper IDs to history.")
         except OSError as e:
             logger.error(f"Failed to save history file: {e}")
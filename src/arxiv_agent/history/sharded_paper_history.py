@@ -0,0 +1,256 @@
+"""Paper history sharded by submission month with retention."""
+import logging
+import os
+import re
+import shutil
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Optional
+from .base_paper_history import BasePaperHistory
+
+logger = logging.getLogger(__name__)
+
+_MONTH_PREFIX = re.compile(r"(?:[a-z-]+(?:\.[A-Z]{2})?/)?(\d{2})(0[1-9]|1[0-2])")
+_SHARD_KEY = re.compile(r"\d{2}(?:0[1-9]|1[0-2])|misc")
+_MISC_SHARD = "misc"
+
+
+def shard_of(paper_id: str) -> str:
+    """
+    Get the ``YYMM`` shard key of an arXiv ID.
+
+    Both ``2301.12345v1`` and old-style ``hep-th/9901001`` carry the month
+    of first submission; IDs without one go to a ``misc`` shard.
+
+    Args:
+        paper_id: arXiv paper ID.
+
+    Returns:
+        Shard key.
+    """
+    match = _MONTH_PREFIX.match(paper_id)
+    return match.group(1) + match.group(2) if match else _MISC_SHARD
+
+
+def _month_index(shard: str) -> int:
+    """Count months since January 1991 (the first arXiv month) for a YYMM key."""
+    yy, mm = int(shard[:2]), int(shard[2:])
+    year = 1900 + yy if yy >= 91 else 2000 + yy
+    return (year - 1991) * 12 + mm - 1
+
+
+class ShardedPaperHistory(BasePaperHistory):
+    """
+    Manages history of processed papers in one file per submission month.
+
+    arXiv IDs start with the month they were first submitted, so a
+    date-sorted search only ever returns IDs from the last few months. Each
+    ``YYMM`` shard is a newline-delimited, append-only file loaded the first
+    time an ID from that month is looked up; startup reads nothing, and a
+    run touches only the shards overlapping its query window.
+
+    With ``retention_months`` set, shards older than the horizon are expired
+    by ``expire()``: deleted, or moved to ``archive_dir`` with a rename.
+    """
+
+    def __init__(
+        self,
+        history_dir: str,
+        retention_months: Optional[int] = None,
+        archive_dir: Optional[str] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize sharded paper history.
+
+        Args:
+            history_dir: Directory holding the shard files.
+            retention_months: Number of months to keep, including the current
+                one, or None to keep everything.
+            archive_dir: Directory receiving expired shards, or None to delete them.
+            clock: Function returning the current UNIX time.
+
+        Raises:
+            ValueError: If retention_months is not positive.
+        """
+        if retention_months is not None and retention_months <= 0:
+            raise ValueError("retention_months must be positive")
+
+        self._history_dir = Path(history_dir)
+        self._retention_months = retention_months
+        self._archive_dir = Path(archive_dir) if archive_dir else None
+        self._clock = clock
+        self._shards: Dict[str, set[str]] = {}
+
+    def _shard_file(self, shard: str) -> Path:
+        return self._history_dir / f"{shard}.txt"
+
+    def _shard_keys(self) -> list[str]:
+        """
+        Get the keys of the shard files on disk.
+
+        Other files in the directory are ignored.
+
+        Returns:
+            Sorted shard keys.
+        """
+        if not self._history_dir.is_dir():
+            return []
+        return sorted(
+            shard_file.stem for shard_file in self._history_dir.glob("*.txt")
+            if _SHARD_KEY.fullmatch(shard_file.stem)
+        )
+
+    def _shard(self, shard: str) -> set[str]:
+        """
+        Get the IDs of a shard, loading it on first use.
+
+        Returns:
+            Set of processed paper IDs in the shard (empty if it cannot be read).
+        """
+        if shard not in self._shards:
+            try:
+                text = self._shard_file(shard).read_text(encoding="utf-8")
+                self._shards[shard] = set(text.split())
+            except FileNotFoundError:
+                self._shards[shard] = set()
+            except OSError as e:
+                logger.error(f"Failed to read history shard {shard}: {e}. Treating it as empty.")
+                self._shards[shard] = set()
+        return self._shards[shard]
+
+    def loaded_shards(self) -> list[str]:
+        """
+        Get the shards read so far.
+
+        Returns:
+            Sorted shard keys.
+        """
+        return sorted(self._shards)
+
+    def is_processed(self, paper_id: str) -> bool:
+        """
+        Check if a paper has been processed.
+
+        Args:
+            paper_id: arXiv paper ID to check.
+
+        Returns:
+            True if paper has been processed, False otherwise.
+        """
+        return paper_id in self._shard(shard_of(paper_id))
+
+    def processed_among(self, paper_ids: list[str]) -> set[str]:
+        """
+        Find which of the given papers have been processed.
+
+        Only the shards of the given IDs are loaded.
+
+        Args:
+            paper_ids: arXiv paper IDs to check.
+
+        Returns:
+            Set of the given IDs that have been processed.
+        """
+        return {paper_id for paper_id in paper_ids if paper_id in self._shard(shard_of(paper_id))}
+
+    def processed_ids(self) -> list[str]:
+        """
+        Get all processed paper IDs, loading every shard.
+
+        Returns:
+            Sorted list of processed paper IDs.
+        """
+        for shard in self._shard_keys():
+            self._shard(shard)
+        return sorted(set().union(*self._shards.values()))
+
+    def mark_processed(self, paper_ids: list[str]) -> None:
+        """
+        Append papers not yet in the history to their shards.
+
+        Logs error if the append fails but does not raise exception to prevent
+        disrupting main application flow.
+
+        Args:
+            paper_ids: List of arXiv paper IDs to mark as processed.
+        """
+        new_ids: Dict[str, list[str]] = {}
+        for paper_id in dict.fromkeys(paper_ids):
+            shard = shard_of(paper_id)
+            if paper_id not in self._shard(shard):
+                new_ids.setdefault(shard, []).append(paper_id)
+
+        for shard, ids in new_ids.items():
+            try:
+                self._history_dir.mkdir(parents=True, exist_ok=True)
+                with self._shard_file(shard).open("a", encoding="utf-8") as f:
+                    f.write("".join(f"{paper_id}\n" for paper_id in ids))
+            except OSError as e:
+                logger.error(f"Failed to append to history shard {shard}: {e}")
+                continue
+            self._shards[shard].update(ids)
+
+        if new_ids:
+            logger.info(f"Saved {sum(map(len, new_ids.values()))} processed paper IDs to {len(new_ids)} shards.")
+
+    def expire(self) -> list[str]:
+        """
+        Drop or archive shards older than the retention horizon.
+
+        Returns:
+            Keys of the expired shards.
+        """
+        if self._retention_months is None or not self._history_dir.is_dir():
+            return []
+
+        now = datetime.fromtimestamp(self._clock(), timezone.utc)
+        horizon = (now.year - 1991) * 12 + now.month - 1 - (self._retention_months - 1)
+        expired = [
+            shard for shard in self._shard_keys()
+            if shard != _MISC_SHARD and _month_index(shard) < horizon
+        ]
+
+        for shard in expired:
+            shard_file = self._shard_file(shard)
+            try:
+                if self._archive_dir is None:
+                    shard_file.unlink()
+                else:
+                    self._archive(shard_file)
+            except OSError as e:
+                logger.error(f"Failed to expire history shard {shard}: {e}")
+                continue
+            self._shards.pop(shard, None)
+
+        if expired:
+            action = "Archived" if self._archive_dir is not None else "Deleted"
+            logger.info(f"{action} {len(expired)} history shards older than {self._retention_months} months.")
+        return expired
+
+    def _archive(self, shard_file: Path) -> None:
+        """
+        Move a shard into the archive directory.
+
+        A shard expired before may be recreated by a late mark; its IDs are
+        then merged into the archived file instead of replacing it.
+
+        Raises:
+            OSError: If the shard cannot be archived.
+        """
+        self._archive_dir.mkdir(parents=True, exist_ok=True)
+        target = self._archive_dir / shard_file.name
+        if target.exists():
+            archived = target.read_text(encoding="utf-8").split()
+            merged = list(dict.fromkeys(archived + shard_file.read_text(encoding="utf-8").split()))
+            tmp_file = target.with_name(target.name + ".tmp")
+            tmp_file.write_text("".join(f"{paper_id}\n" for paper_id in merged), encoding="utf-8")
+            os.replace(tmp_file, target)
+            shard_file.unlink()
+            return
+        try:
+            os.replace(shard_file, target)
+        except OSError:
+            # Archive on another filesystem: rename is not possible.
+            shutil.move(str(shard_file), target)
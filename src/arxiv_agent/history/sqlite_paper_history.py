@@ -0,0 +1,248 @@
+"""SQLite-backed history of processed papers."""
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+from .base_paper_history import BasePaperHistory
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS processed_papers (
+    paper_id TEXT PRIMARY KEY,
+    processed_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS leases (
+    paper_id TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+class SqlitePaperHistory(BasePaperHistory):
+    """
+    Manages history of processed papers in an SQLite database.
+
+    Lookups use the primary key index instead of loading every ID at startup,
+    and marks are inserted in batched transactions instead of rewriting the
+    whole history. The database runs in WAL mode so readers are not blocked
+    by a writer. Workers sharing the database can claim papers with a
+    time-limited lease inside an immediate transaction. Like
+    ``PaperHistory``, database errors are logged rather than raised so the
+    application continues even if history management fails.
+    """
+
+    def __init__(self, db_file: str, batch_size: int = 500) -> None:
+        """
+        Initialize SQLite paper history.
+
+        Args:
+            db_file: Path to the SQLite database file.
+            batch_size: Maximum number of IDs inserted per statement batch.
+
+        Raises:
+            ValueError: If batch_size is not positive.
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+
+        self._db_file = Path(db_file)
+        self._batch_size = batch_size
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = self._connect()
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """
+        Open the database and create the schema.
+
+        Returns:
+            Connection, or None if the database cannot be opened.
+        """
+        try:
+            self._db_file.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self._db_file, timeout=30.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            return conn
+        except (OSError, sqlite3.Error) as e:
+            logger.error(f"Failed to open history database: {e}. History is disabled.")
+            return None
+
+    def __len__(self) -> int:
+        if self._conn is None:
+            return 0
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM processed_papers").fetchone()[0]
+
+    def is_processed(self, paper_id: str) -> bool:
+        """
+        Check if a paper has been processed.
+
+        Args:
+            paper_id: arXiv paper ID to check.
+
+        Returns:
+            True if paper has been processed, False otherwise.
+        """
+        if self._conn is None:
+            return False
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT 1 FROM processed_papers WHERE paper_id = ?", (paper_id,)
+                ).fetchone()
+            return row is not None
+        except sqlite3.Error as e:
+            logger.error(f"Failed to query history database: {e}")
+            return False
+
+    def processed_among(self, paper_ids: list[str]) -> set[str]:
+        """
+        Find which of the given papers have been processed.
+
+        IDs are looked up with one indexed query per batch.
+
+        Args:
+            paper_ids: arXiv paper IDs to check.
+
+        Returns:
+            Set of the given IDs that have been processed.
+        """
+        if self._conn is None or not paper_ids:
+            return set()
+        found = set()
+        try:
+            with self._lock:
+                for start in range(0, len(paper_ids), self._batch_size):
+                    batch = paper_ids[start:start + self._batch_size]
+                    placeholders = ",".join("?" * len(batch))
+                    rows = self._conn.execute(
+                        f"SELECT paper_id FROM processed_papers WHERE paper_id IN ({placeholders})", batch
+                    ).fetchall()
+                    found.update(row[0] for row in rows)
+            return found
+        except sqlite3.Error as e:
+            logger.error(f"Failed to query history database: {e}")
+            return set()
+
+    def processed_ids(self) -> list[str]:
+        """
+        Get all processed paper IDs.
+
+        Returns:
+            Sorted list of processed paper IDs.
+        """
+        if self._conn is None:
+            return []
+        try:
+            with self._lock:
+                rows = self._conn.execute("SELECT paper_id FROM processed_papers ORDER BY paper_id").fetchall()
+            return [row[0] for row in rows]
+        except sqlite3.Error as e:
+            logger.error(f"Failed to query history database: {e}")
+            return []
+
+    def mark_processed(self, paper_ids: list[str]) -> None:
+        """
+        Mark papers as processed in a single transaction.
+
+        Logs error if the write fails but does not raise exception to prevent
+        disrupting main application flow.
+
+        Args:
+            paper_ids: List of arXiv paper IDs to mark as processed.
+        """
+        if not paper_ids or self._conn is None:
+            return
+
+        now = time.time()
+        try:
+            with self._lock, self._conn:
+                for start in range(0, len(paper_ids), self._batch_size):
+                    batch = paper_ids[start:start + self._batch_size]
+                    self._conn.executemany(
+                        "INSERT OR IGNORE INTO processed_papers (paper_id, processed_at) VALUES (?, ?)",
+                        ((paper_id, now) for paper_id in batch),
+                    )
+                    self._conn.executemany("DELETE FROM leases WHERE paper_id = ?", ((pid,) for pid in batch))
+            logger.info(f"Marked {len(paper_ids)} papers as processed in history database.")
+        except sqlite3.Error as e:
+            logger.error(f"Failed to write history database: {e}")
+
+    def claim(self, paper_ids: list[str], owner: str, lease_seconds: float, now: Optional[float] = None) -> list[str]:
+        """
+        Lease unprocessed papers to one worker.
+
+        A paper can be claimed when it is not processed and not leased to
+        another owner, or that owner's lease has expired. Claiming again
+        renews the caller's own leases.
+
+        Args:
+            paper_ids: arXiv paper IDs to claim.
+            owner: Identifier of the claiming worker.
+            lease_seconds: Lease duration in seconds.
+            now: Current UNIX time (defaults to time.time()).
+
+        Returns:
+            IDs claimed by the caller, in input order. Empty if the database
+            cannot be written.
+        """
+        if self._conn is None or not paper_ids:
+            return []
+
+        now = time.time() if now is None else now
+        paper_ids = list(dict.fromkeys(paper_ids))
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("BEGIN IMMEDIATE")
+                self._conn.execute("DELETE FROM leases WHERE expires <= ?", (now,))
+                taken = set()
+                for start in range(0, len(paper_ids), self._batch_size):
+                    batch = paper_ids[start:start + self._batch_size]
+                    placeholders = ",".join("?" * len(batch))
+                    taken.update(row[0] for row in self._conn.execute(
+                        f"SELECT paper_id FROM processed_papers WHERE paper_id IN ({placeholders}) "
+                        f"UNION SELECT paper_id FROM leases WHERE paper_id IN ({placeholders}) AND owner != ?",
+                        [*batch, *batch, owner],
+                    ))
+                claimed = [pid for pid in paper_ids if pid not in taken]
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO leases (paper_id, owner, expires) VALUES (?, ?, ?)",
+                    ((pid, owner, now + lease_seconds) for pid in claimed),
+                )
+        except sqlite3.Error as e:
+            logger.error(f"Failed to claim papers in history database: {e}")
+            return []
+
+        logger.info(f"Claimed {len(claimed)} of {len(paper_ids)} papers for {owner}")
+        return claimed
+
+    def release(self, paper_ids: list[str], owner: str) -> None:
+        """
+        Give up leases without marking the papers as processed.
+
+        Args:
+            paper_ids: arXiv paper IDs to release.
+            owner: Identifier of the worker holding the leases.
+        """
+        if self._conn is None or not paper_ids:
+            return
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "DELETE FROM leases WHERE paper_id = ? AND owner = ?",
+                    ((pid, owner) for pid in paper_ids),
+                )
+        except sqlite3.Error as e:
+            logger.error(f"Failed to release papers in history database: {e}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,4 @@
+"""Summarization work journal module."""
+from arxiv_agent.journal.work_journal import WorkJournal, WorkState
+
+__all__ = ["WorkJournal", "WorkState"]
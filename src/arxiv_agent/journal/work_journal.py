@@ -0,0 +1,383 @@
+"""Write-ahead journal of per-paper summarization state."""
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, TextIO
+from arxiv_agent.collection.models import Paper
+from arxiv_agent.summarization.models import Summary
+
+logger = logging.getLogger(__name__)
+
+
+class WorkState(str, Enum):
+    """Summarization state of a paper."""
+    QUEUED = "queued"
+    IN_FLIGHT = "in_flight"
+    DONE = "done"
+    FAILED = "failed"
+    ACKED = "acked"
+
+
+@dataclass
+class _JournalEntry:
+    """Current state of a paper folded from journal records."""
+    paper: Paper
+    state: WorkState
+    attempts: int = 0
+    next_retry_at: float = 0.0
+    error: Optional[str] = None
+    summary: Optional[Summary] = None
+
+
+class WorkJournal:
+    """
+    Crash-safe journal of summarization work.
+
+    Every state transition is appended to a newline-delimited JSON file before
+    the run moves on, so a restarted run can reuse summaries that were already
+    paid for and resume papers that were queued or in flight. Failed papers are
+    parked in a dead-letter queue and retried with exponential backoff on later
+    runs until ``max_attempts`` is reached.
+
+    Records are buffered and written with a single fsync per batch, bounding
+    both the I/O cost on the hot loop and the work lost on a crash. Worker
+    threads may record transitions of different papers concurrently.
+    """
+
+    def __init__(
+        self,
+        journal_file: str,
+        flush_batch_size: int = 16,
+        flush_interval: float = 1.0,
+        max_attempts: int = 5,
+        retry_backoff: float = 3600.0,
+        max_retry_backoff: float = 7 * 24 * 3600.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize work journal and replay existing records.
+
+        Args:
+            journal_file: Path to the journal file.
+            flush_batch_size: Number of buffered records that triggers a flush.
+            flush_interval: Maximum seconds records stay buffered.
+            max_attempts: Attempts after which a failed paper is no longer retried.
+            retry_backoff: Base delay in seconds before the first retry.
+            max_retry_backoff: Upper bound for the retry delay in seconds.
+            clock: Function returning the current UNIX time.
+
+        Raises:
+            ValueError: If any limit is not positive.
+        """
+        if flush_batch_size <= 0:
+            raise ValueError("flush_batch_size must be positive")
+        if max_attempts <= 0:
+            raise ValueError("max_attempts must be positive")
+
+        self._journal_file = Path(journal_file)
+        self._flush_batch_size = flush_batch_size
+        self._flush_interval = flush_interval
+        self._max_attempts = max_attempts
+        self._retry_backoff = retry_backoff
+        self._max_retry_backoff = max_retry_backoff
+        self._clock = clock
+
+        self._buffer: List[str] = []
+        self._lock = threading.RLock()
+        self._last_flush = clock()
+        self._handle: Optional[TextIO] = None
+        self._entries: Dict[str, _JournalEntry] = self._replay()
+
+    def _replay(self) -> Dict[str, _JournalEntry]:
+        """
+        Fold journal records into the latest state per paper.
+
+        A torn final line left by a crash is skipped.
+
+        Returns:
+            Mapping of paper ID to journal entry.
+        """
+        entries: Dict[str, _JournalEntry] = {}
+        if not self._journal_file.exists():
+            return entries
+
+        try:
+            with self._journal_file.open("r", encoding="utf-8") as f:
+                for line_no, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning(f"Skipping corrupted journal record at line {line_no}")
+                        continue
+                    self._apply(entries, record)
+        except OSError as e:
+            logger.error(f"Failed to read journal file: {e}. Starting with empty journal.")
+            return {}
+
+        logger.info(f"Replayed {len(entries)} entries from journal {self._journal_file}")
+        return entries
+
+    @staticmethod
+    def _apply(entries: Dict[str, _JournalEntry], record: dict) -> None:
+        """Apply a single journal record to the folded state."""
+        paper_id = record["id"]
+        entry = entries.get(paper_id)
+        if "paper" in record:
+            paper = _paper_from_dict(record["paper"])
+            if entry is None:
+                entry = _JournalEntry(paper=paper, state=WorkState.QUEUED)
+                entries[paper_id] = entry
+            else:
+                entry.paper = paper
+        if entry is None:
+            return
+
+        entry.state = WorkState(record["state"])
+        entry.attempts = record.get("attempts", entry.attempts)
+        entry.next_retry_at = record.get("next_retry_at", entry.next_retry_at)
+        entry.error = record.get("error", entry.error)
+        if "summary" in record:
+            entry.summary = Summary(**record["summary"])
+
+    def plan(self, papers: List[Paper]) -> List[Paper]:
+        """
+        Build this run's work list and journal newly queued papers.
+
+        The work list starts with papers left over from an interrupted run and
+        dead-letter papers whose backoff has elapsed, followed by new papers.
+        Papers waiting in the dead-letter queue are excluded until due.
+
+        Args:
+            papers: Newly collected papers.
+
+        Returns:
+            Papers to process in this run.
+        """
+        now = self._clock()
+        work: List[Paper] = []
+        for entry in self._entries.values():
+            if entry.state in (WorkState.QUEUED, WorkState.IN_FLIGHT, WorkState.DONE):
+                work.append(entry.paper)
+            elif entry.state == WorkState.FAILED and self._is_retry_due(entry, now):
+                work.append(entry.paper)
+
+        resumed = len(work)
+        for paper in papers:
+            if paper.arxiv_id in self._entries:
+                continue
+            self._entries[paper.arxiv_id] = _JournalEntry(paper=paper, state=WorkState.QUEUED)
+            self._append({
+                "id": paper.arxiv_id,
+                "state": WorkState.QUEUED.value,
+                "paper": _paper_to_dict(paper),
+            })
+            work.append(paper)
+
+        if resumed:
+            logger.info(f"Resuming {resumed} papers from journal")
+        self.flush()
+        return work
+
+    def recovered_summary(self, paper_id: str) -> Optional[Summary]:
+        """
+        Get a summary completed by an earlier, unacknowledged run.
+
+        Args:
+            paper_id: arXiv paper ID.
+
+        Returns:
+            Recovered summary, or None if the paper still needs summarizing.
+        """
+        entry = self._entries.get(paper_id)
+        if entry is not None and entry.state == WorkState.DONE:
+            return entry.summary
+        return None
+
+    def start(self, paper_id: str) -> None:
+        """
+        Record that summarization of a paper has started.
+
+        Args:
+            paper_id: arXiv paper ID.
+        """
+        self._transition(paper_id, WorkState.IN_FLIGHT)
+
+    def complete(self, summary: Summary) -> None:
+        """
+        Record a finished summary.
+
+        Args:
+            summary: Generated summary.
+        """
+        entry = self._transition(summary.paper_id, WorkState.DONE, summary=asdict(summary))
+        if entry is not None:
+            entry.summary = summary
+            entry.error = None
+
+    def fail(self, paper_id: str, error: str) -> None:
+        """
+        Move a paper to the dead-letter queue.
+
+        Args:
+            paper_id: arXiv paper ID.
+            error: Error description.
+        """
+        entry = self._entries.get(paper_id)
+        if entry is None:
+            return
+
+        attempts = entry.attempts + 1
+        delay = min(self._retry_backoff * 2 ** (attempts - 1), self._max_retry_backoff)
+        next_retry_at = self._clock() + delay
+        self._transition(
+            paper_id,
+            WorkState.FAILED,
+            attempts=attempts,
+            next_retry_at=next_retry_at,
+            error=error,
+        )
+        entry.attempts = attempts
+        entry.next_retry_at = next_retry_at
+        entry.error = error
+
+        if attempts >= self._max_attempts:
+            logger.warning(f"Paper {paper_id} failed {attempts} times and will not be retried: {error}")
+        else:
+            logger.info(f"Paper {paper_id} moved to dead-letter queue (attempt {attempts})")
+
+    def acknowledge(self, paper_ids: List[str]) -> None:
+        """
+        Record that papers were delivered and can be dropped from the journal.
+
+        Args:
+            paper_ids: arXiv paper IDs that were delivered.
+        """
+        for paper_id in paper_ids:
+            self._transition(paper_id, WorkState.ACKED)
+        self.flush()
+
+    def dead_letters(self) -> List[str]:
+        """
+        Get papers that exhausted all retry attempts.
+
+        Returns:
+            List of arXiv paper IDs.
+        """
+        return [
+            paper_id for paper_id, entry in self._entries.items()
+            if entry.state == WorkState.FAILED and entry.attempts >= self._max_attempts
+        ]
+
+    def flush(self) -> None:
+        """
+        Write buffered records and fsync the journal.
+
+        Logs error if write fails but does not raise exception to prevent
+        disrupting main application flow.
+        """
+        with self._lock:
+            self._last_flush = self._clock()
+            if not self._buffer:
+                return
+
+            try:
+                if self._handle is None:
+                    self._journal_file.parent.mkdir(parents=True, exist_ok=True)
+                    self._handle = self._journal_file.open("a", encoding="utf-8")
+                self._handle.write("".join(self._buffer))
+                self._handle.flush()
+                os.fsync(self._handle.fileno())
+                self._buffer.clear()
+            except OSError as e:
+                logger.error(f"Failed to write journal file: {e}")
+
+    def close(self) -> None:
+        """Flush pending records and compact the journal."""
+        self.flush()
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        self._compact()
+
+    def _compact(self) -> None:
+        """
+        Rewrite the journal with one record per unacknowledged paper.
+
+        Uses a temporary file and atomic rename so a crash leaves either the
+        old or the new journal intact.
+        """
+        live = {pid: e for pid, e in self._entries.items() if e.state != WorkState.ACKED}
+        if not live and not self._journal_file.exists():
+            return
+
+        tmp_file = self._journal_file.with_name(self._journal_file.name + ".tmp")
+        try:
+            self._journal_file.parent.mkdir(parents=True, exist_ok=True)
+            with tmp_file.open("w", encoding="utf-8") as f:
+                for paper_id, entry in live.items():
+                    record = {
+                        "id": paper_id,
+                        "state": entry.state.value,
+                        "paper": _paper_to_dict(entry.paper),
+                        "attempts": entry.attempts,
+                        "next_retry_at": entry.next_retry_at,
+                    }
+                    if entry.error is not None:
+                        record["error"] = entry.error
+                    if entry.summary is not None:
+                        record["summary"] = asdict(entry.summary)
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self._journal_file)
+            self._entries = live
+            logger.info(f"Compacted journal to {len(live)} entries")
+        except OSError as e:
+            logger.error(f"Failed to compact journal file: {e}")
+
+    def _transition(self, paper_id: str, state: WorkState, **fields) -> Optional[_JournalEntry]:
+        """Update an entry's state and journal the transition."""
+        entry = self._entries.get(paper_id)
+        if entry is None:
+            logger.warning(f"Paper {paper_id} is not in the journal")
+            return None
+
+        entry.state = state
+        self._append({"id": paper_id, "state": state.value, **fields})
+        return entry
+
+    def _append(self, record: dict) -> None:
+        """Buffer a record and flush when the batch size or interval is reached."""
+        record["ts"] = self._clock()
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._buffer.append(line)
+            if (
+                len(self._buffer) >= self._flush_batch_size
+                or self._clock() - self._last_flush >= self._flush_interval
+            ):
+                self.flush()
+
+    def _is_retry_due(self, entry: _JournalEntry, now: float) -> bool:
+        """Check whether a dead-letter entry should be retried now."""
+        return entry.attempts < self._max_attempts and entry.next_retry_at <= now
+
+
+def _paper_to_dict(paper: Paper) -> dict:
+    """Serialize a paper to a JSON-compatible dict."""
+    data = asdict(paper)
+    data["published"] = paper.published.isoformat()
+    return data
+
+
+def _paper_from_dict(data: dict) -> Paper:
+    """Deserialize a paper from a JSON-compatible dict."""
+    return Paper(**{**data, "published": datetime.fromisoformat(data["published"])})
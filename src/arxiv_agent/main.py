@@ -1,65 +1,691 @@
 """Main entry point for arxiv agent."""
 import logging
+import os
+import socket
 import sys
+import time
+from contextlib import nullcontext
+from typing import Dict, List, Optional, Tuple
 from arxiv_agent.config.loader import load_config
+from arxiv_agent.config.models import Config, PipelineConfig
 from arxiv_agent.collection.arxiv_client import ArxivClient
+from arxiv_agent.collection.models import Paper
+from arxiv_agent.dedup import LSHIndex, MinHasher, NearDuplicateDetector
+from arxiv_agent.history import BasePaperHistory, open_history
+from arxiv_agent.journal import WorkJournal
+from arxiv_agent.pipeline import Pipeline, summarization_stage, summarize_paper
+from arxiv_agent.quota import QuotaLedger, RunPlan, RunPlanner
+from arxiv_agent.ranking import RelevanceRanker
+from arxiv_agent.scheduling import DeadlineScheduler, resolve_deadline
 from arxiv_agent.summarization.prompt_builder import PromptBuilder
+from arxiv_agent.summarization.api_key_pool import ApiKeyPool, api_keys_from_env
+from arxiv_agent.summarization.base_summarizer import BaseSummarizer
 from arxiv_agent.summarization.gemini_client import GeminiClient
+from arxiv_agent.summarization.extractive_summarizer import ExtractiveSummarizer
+from arxiv_agent.summarization.fallback_summarizer import FallbackSummarizer
+from arxiv_agent.summarization.models import Summary
+from arxiv_agent.summarization.summary_cache import CachingSummarizer, SummaryCache
 from arxiv_agent.notification.notifier import Notifier
+from arxiv_agent.notification.delivery_report import DeliveryReport
 from arxiv_agent.utils.logger import setup_logger
 
 logger = logging.getLogger(__name__)
 
 
-def main() -> int:
+def _build_key_pool(config: Config) -> Optional[ApiKeyPool]:
     """
-    Main application flow.
+    Build the Gemini API key pool if configured.
+
+    Args:
+        config: Application configuration
 
     Returns:
-        Exit code (0 for success, 1 for failure)
+        ApiKeyPool instance, or None to let GeminiClient use the environment
+        keys without known limits
     """
-    try:
-        setup_logger()
-        logger.info("Starting arxiv agent")
+    pool_config = config.gemini.key_pool
+    api_keys = api_keys_from_env()
+    if pool_config is None or not api_keys:
+        return None
 
-        config_path = sys.argv[1] if len(sys.argv) > 1 else "config/default.yaml"
-        logger.info(f"Loading config from: {config_path}")
-        config = load_config(config_path)
+    pool = ApiKeyPool(
+        api_keys,
+        requests_per_minute=pool_config.requests_per_minute,
+        requests_per_day=pool_config.requests_per_day,
+        cooldown=pool_config.cooldown_seconds,
+        state_file=pool_config.state_file,
+    )
+    logger.info(f"Using {len(pool)} Gemini API keys")
+    return pool
 
-        arxiv_client = ArxivClient(max_results=config.arxiv.max_results)
-        papers = arxiv_client.search_papers(
-            categories=config.arxiv.categories,
-            keywords=config.arxiv.keywords,
-        )
 
-        if not papers:
-            logger.warning("No papers found")
-            return 0
+def _build_summarizer(
+    config: Config,
+    ledger: Optional[QuotaLedger] = None,
+    key_pool: Optional[ApiKeyPool] = None,
+) -> BaseSummarizer:
+    """
+    Build the summarizer selected by configuration.
 
-        prompt_builder = PromptBuilder(config.gemini.prompt_template)
+    Args:
+        config: Application configuration
+        ledger: Quota ledger recording Gemini usage, if enabled
+        key_pool: Gemini API key pool, or None to use the environment keys
+
+    Returns:
+        Summarizer instance
+
+    Raises:
+        ValueError: If Gemini is unavailable and fallback is disabled
+    """
+    extractive = ExtractiveSummarizer(max_sentences=config.summarization.max_sentences)
+    if config.summarization.backend == 'extractive':
+        logger.info("Using local extractive summarizer")
+        return extractive
+
+    prompt_builder = PromptBuilder(config.gemini.prompt_template)
+    try:
         gemini_client = GeminiClient(
             prompt_builder=prompt_builder,
             model_name=config.gemini.model,
             temperature=config.gemini.temperature,
             max_tokens=config.gemini.max_tokens,
+            section_retries=config.gemini.section_retries,
+            key_pool=key_pool,
+            ledger=ledger,
         )
+    except ValueError as e:
+        if not config.summarization.fallback:
+            raise
+        logger.warning(f"Gemini summarizer unavailable: {e}. Using local extractive summarizer.")
+        return extractive
+
+    if config.summarization.fallback:
+        return FallbackSummarizer(gemini_client, extractive)
+    return gemini_client
+
+
+def _with_summary_cache(config: Config, summarizer: BaseSummarizer) -> BaseSummarizer:
+    """
+    Wrap a summarizer with the similarity-keyed summary cache if configured.
+
+    Args:
+        config: Application configuration
+        summarizer: Summarizer used on cache misses
+
+    Returns:
+        Caching summarizer, or the given summarizer when caching is disabled
+    """
+    if config.summary_cache is None:
+        return summarizer
+
+    return CachingSummarizer(
+        summarizer,
+        SummaryCache(config.summary_cache.dir, dimensions=config.summary_cache.dimensions),
+        reuse_threshold=config.summary_cache.reuse_threshold,
+        update_threshold=config.summary_cache.update_threshold,
+    )
+
+
+def _open_ledger(config: Config) -> Optional[QuotaLedger]:
+    """
+    Open the quota ledger if quota planning is configured for the Gemini backend.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        QuotaLedger instance, or None when quota planning is disabled
+    """
+    if config.quota is None or config.summarization.backend == 'extractive':
+        return None
+    return QuotaLedger(config.quota.ledger_file)
+
+
+def _plan_quota(config: Config, ledger: Optional[QuotaLedger], papers: List[Paper]) -> RunPlan:
+    """
+    Select the papers this run may summarize within the daily quota.
+
+    Args:
+        config: Application configuration
+        ledger: Quota ledger, or None when quota planning is disabled
+        papers: Papers in priority order
+
+    Returns:
+        Run plan; every paper is selected when quota planning is disabled
+    """
+    if ledger is None:
+        return RunPlan(selected=papers)
+
+    planner = RunPlanner(
+        ledger,
+        model=config.gemini.model,
+        requests_per_day=config.quota.requests_per_day,
+        tokens_per_day=config.quota.tokens_per_day,
+        runs_per_day=config.quota.runs_per_day,
+        headroom_requests=config.quota.headroom_requests,
+    )
+    return planner.plan(papers)
+
+
+def _summarize_deferred(
+    config: Config,
+    papers: List[Paper],
+    journal: Optional[WorkJournal],
+) -> List[Summary]:
+    """
+    Handle papers that did not fit the quota budget.
+
+    They are summarized locally when fallback is enabled; otherwise they are
+    left for a later run (queued in the journal when journaling is enabled).
 
-        summaries = []
-        for paper in papers:
-            try:
-                summary = gemini_client.summarize(paper)
-                summaries.append(summary)
-            except Exception as e:
-                logger.error(f"Failed to summarize paper {paper.arxiv_id}: {e}")
+    Args:
+        config: Application configuration
+        papers: Deferred papers
+        journal: Work journal, or None when journaling is disabled
+
+    Returns:
+        List of locally generated summaries
+    """
+    if not config.summarization.fallback:
+        logger.warning(f"Quota budget exhausted; deferring {len(papers)} papers to a later run")
+        return []
+
+    logger.warning(f"Quota budget exhausted; summarizing {len(papers)} papers locally")
+    extractive = ExtractiveSummarizer(max_sentences=config.summarization.max_sentences)
+    return _summarize_papers(extractive, papers, journal)
+
+
+def _rank_papers(config: Config, papers: List[Paper]) -> Tuple[List[Paper], Dict[str, float]]:
+    """
+    Keep only the most relevant papers when ranking is configured.
+
+    Every search keyword gets weight 1.0 unless overridden by
+    ``ranking.keyword_weights``.
+
+    Args:
+        config: Application configuration
+        papers: Collected papers
+
+    Returns:
+        Tuple of (selected papers, relevance score by paper ID)
+    """
+    if config.ranking is None or not papers:
+        return papers, {}
+
+    keyword_weights = {keyword: 1.0 for keyword in config.arxiv.keywords}
+    keyword_weights.update(config.ranking.keyword_weights)
+    ranker = RelevanceRanker(keyword_weights, exemplars=config.ranking.exemplars)
+    ranked = ranker.rank(papers, top_k=config.ranking.top_k, min_score=config.ranking.min_score)
+    return [paper for paper, _ in ranked], {paper.arxiv_id: score for paper, score in ranked}
+
+
+def _build_detector(config: Config) -> Optional[NearDuplicateDetector]:
+    """
+    Build the near-duplicate detector if configured.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        NearDuplicateDetector instance, or None when detection is disabled
+    """
+    if config.dedup is None:
+        return None
+
+    return NearDuplicateDetector(
+        hasher=MinHasher(num_perm=config.dedup.num_perm, shingle_size=config.dedup.shingle_size),
+        index=LSHIndex(config.dedup.index_dir, num_perm=config.dedup.num_perm, bands=config.dedup.bands),
+        threshold=config.dedup.threshold,
+    )
+
+
+def _deduplicate(
+    detector: Optional[NearDuplicateDetector],
+    papers: List[Paper],
+) -> Tuple[List[Paper], Dict[str, List[str]]]:
+    """
+    Keep one representative per near-duplicate cluster.
+
+    Clusters matching papers from earlier runs are dropped entirely.
+
+    Args:
+        detector: Near-duplicate detector, or None when detection is disabled
+        papers: Papers in priority order
+
+    Returns:
+        Tuple of (representative papers, duplicate IDs by representative ID)
+    """
+    if detector is None or not papers:
+        return papers, {}
+
+    representatives = []
+    related = {}
+    for cluster in detector.cluster(papers):
+        paper_id = cluster.representative.arxiv_id
+        if cluster.seen_before:
+            logger.info(f"Skipping {paper_id}: near-duplicate of {', '.join(cluster.previous_ids)}")
+            continue
+        representatives.append(cluster.representative)
+        related[paper_id] = [duplicate.arxiv_id for duplicate in cluster.duplicates]
+    return representatives, related
+
+
+def _open_history(config: Config) -> Optional[BasePaperHistory]:
+    """
+    Open the processed paper history if configured.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        Paper history backend, or None when history is disabled
+    """
+    if config.history is None:
+        return None
+
+    return open_history(
+        config.history.file,
+        bloom_false_positive_rate=config.history.bloom_false_positive_rate,
+        bloom_capacity=config.history.bloom_capacity,
+        retention_months=config.history.retention_months,
+        archive_dir=config.history.archive_dir,
+    )
+
+
+def _claim_papers(
+    config: Config,
+    history: Optional[BasePaperHistory],
+    papers: List[Paper],
+    owner: str,
+) -> List[Paper]:
+    """
+    Lease papers to this run so parallel workers do not summarize them twice.
+
+    Args:
+        config: Application configuration
+        history: Paper history, or None when history is disabled
+        papers: Papers this run intends to summarize
+        owner: Identifier of this worker
+
+    Returns:
+        Papers claimed by this run; all papers when leases are disabled
+    """
+    if history is None or config.history.lease_seconds is None or not papers:
+        return papers
 
-        if not summaries:
-            logger.warning("No summaries generated")
-            return 0
+    claimed = set(history.claim([paper.arxiv_id for paper in papers], owner, config.history.lease_seconds))
+    skipped = len(papers) - len(claimed)
+    if skipped:
+        logger.info(f"Skipping {skipped} papers claimed by other workers")
+    return [paper for paper in papers if paper.arxiv_id in claimed]
 
-        notifier = Notifier(config.notification)
-        notifier.send_all(summaries)
+
+def _open_journal(config: Config) -> Optional[WorkJournal]:
+    """
+    Open the summarization work journal if configured.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        WorkJournal instance, or None when journaling is disabled
+    """
+    if config.journal is None:
+        return None
+
+    return WorkJournal(
+        journal_file=config.journal.file,
+        flush_batch_size=config.journal.flush_batch_size,
+        flush_interval=config.journal.flush_interval_seconds,
+        max_attempts=config.journal.max_attempts,
+        retry_backoff=config.journal.retry_backoff_seconds,
+    )
+
+
+def _summarize_papers(
+    summarizer: BaseSummarizer,
+    papers: List[Paper],
+    journal: Optional[WorkJournal],
+) -> List[Summary]:
+    """
+    Summarize papers, recording progress in the journal when enabled.
+
+    Summaries recovered from an interrupted run are reused instead of being
+    generated again.
+
+    Args:
+        summarizer: Summarizer to use
+        papers: Papers to summarize
+        journal: Work journal, or None when journaling is disabled
+
+    Returns:
+        List of generated summaries
+    """
+    summaries = []
+    for paper in papers:
+        summaries.extend(summarize_paper(summarizer, paper, journal))
+    return summaries
+
+
+def _summarize_concurrently(
+    summarizer: BaseSummarizer,
+    papers: List[Paper],
+    journal: Optional[WorkJournal],
+    pipeline_config: PipelineConfig,
+) -> List[Summary]:
+    """
+    Summarize papers on a pool of pipeline workers.
+
+    Args:
+        summarizer: Summarizer to use
+        papers: Papers in priority order
+        journal: Work journal, or None when journaling is disabled
+        pipeline_config: Worker and queue limits
+
+    Returns:
+        List of generated summaries, in the order of their papers
+    """
+    pipeline = Pipeline([
+        summarization_stage(
+            summarizer,
+            journal,
+            workers=pipeline_config.summarize_workers,
+            queue_size=pipeline_config.queue_size,
+        ),
+    ])
+    summaries = pipeline.run(papers)
+    order = {paper.arxiv_id: i for i, paper in enumerate(papers)}
+    return sorted(summaries, key=lambda summary: order.get(summary.paper_id, len(order)))
+
+
+def _build_scheduler(config: Config) -> Optional[DeadlineScheduler]:
+    """
+    Build the deadline scheduler if a run deadline is configured.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        DeadlineScheduler instance, or None when the run has no deadline
+    """
+    if config.deadline is None:
+        return None
+
+    deadline = resolve_deadline(config.deadline.at, config.deadline.timezone, time.time())
+    logger.info(f"Digest deadline: {config.deadline.at} {config.deadline.timezone}")
+    return DeadlineScheduler(
+        deadline,
+        estimates={
+            'summarize': config.deadline.summarize_estimate_seconds,
+            'notify': config.deadline.notify_estimate_seconds,
+        },
+        safety_margin=config.deadline.safety_margin_seconds,
+    )
+
+
+def _summarize_until_deadline(
+    summarizer: BaseSummarizer,
+    papers: List[Paper],
+    journal: Optional[WorkJournal],
+    scheduler: Optional[DeadlineScheduler],
+) -> Tuple[List[Summary], List[Paper]]:
+    """
+    Summarize papers in priority order while the digest can still meet its deadline.
+
+    Args:
+        summarizer: Summarizer to use
+        papers: Papers in priority order
+        journal: Work journal, or None when journaling is disabled
+        scheduler: Deadline scheduler, or None when the run has no deadline
+
+    Returns:
+        Tuple of (summaries, papers left for the follow-up message)
+    """
+    if scheduler is None:
+        return _summarize_papers(summarizer, papers, journal), []
+
+    summaries = []
+    for i, paper in enumerate(papers):
+        if not scheduler.has_time_for('summarize', 'notify'):
+            logger.warning(
+                f"Stopping summarization {scheduler.remaining():.0f}s before the deadline; "
+                f"{len(papers) - i} papers will follow"
+            )
+            return summaries, papers[i:]
+        with scheduler.timed('summarize'):
+            summaries.extend(_summarize_papers(summarizer, [paper], journal))
+    return summaries, []
+
+
+def _annotate(summaries: List[Summary], scores: Dict[str, float], related: Dict[str, List[str]]) -> None:
+    """Attach relevance scores and near-duplicate IDs to summaries."""
+    for summary in summaries:
+        summary.relevance_score = scores.get(summary.paper_id, summary.relevance_score)
+        summary.related_ids = related.get(summary.paper_id, summary.related_ids)
+
+
+def _record_delivery(
+    report: DeliveryReport,
+    summaries: List[Summary],
+    journal: Optional[WorkJournal],
+    history: Optional[BasePaperHistory],
+) -> bool:
+    """
+    Acknowledge and mark summaries as processed once every channel has them.
+
+    Summaries that did not reach every channel stay in the journal and out
+    of the history, so the next run sends them again without re-summarizing.
+    Messages left in the notification outbox count as handed over: the
+    outbox delivers them on a later drain.
+
+    Args:
+        report: Delivery report of the message carrying the summaries
+        summaries: Delivered summaries
+        journal: Summarization work journal, or None when disabled
+        history: Paper history, or None when disabled
+
+    Returns:
+        Whether every channel received the summaries or holds them in the outbox
+    """
+    if not report.all_settled:
+        logger.error(
+            f"Delivery failed for {', '.join(report.failed_channels)}; "
+            f"keeping {len(summaries)} summaries for the next run"
+        )
+        return False
+    if not report.all_delivered:
+        logger.warning(f"Delivery to {', '.join(report.failed_channels)} left queued in the outbox")
+
+    paper_ids = [summary.paper_id for summary in summaries]
+    if journal is not None:
+        journal.acknowledge(paper_ids)
+    if history is not None:
+        history.mark_processed(paper_ids)
+    return True
+
+
+class AgentSession:
+    """
+    Clients and state shared by the collection cycles of one process.
+
+    A one-shot run uses a session for a single cycle. Serve mode keeps one
+    for the lifetime of the daemon, so the arXiv and Gemini clients, pooled
+    HTTP sessions, history, quota ledger and caches stay in memory between
+    cycles. The summarizer, ledger and notifier are built on first use, so a
+    cycle that finds no papers does not need them.
+    """
+
+    def __init__(self, config: Config) -> None:
+        """
+        Initialize agent session.
+
+        Args:
+            config: Application configuration
+        """
+        self.config = config
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+        self.history = _open_history(config)
+        self.journal = _open_journal(config)
+        self.arxiv_client = ArxivClient(
+            max_results=config.arxiv.max_results,
+            max_scan_results=config.arxiv.max_scan_results,
+        )
+        self._detector: Optional[NearDuplicateDetector] = None
+        self._ledger: Optional[QuotaLedger] = None
+        self._key_pool: Optional[ApiKeyPool] = None
+        self._summarizer: Optional[BaseSummarizer] = None
+        self._notifier: Optional[Notifier] = None
+
+    @property
+    def summarizer(self) -> BaseSummarizer:
+        """Summarizer, built with the quota ledger and key pool on first use."""
+        if self._summarizer is None:
+            self._ledger = _open_ledger(self.config)
+            if self.config.summarization.backend != 'extractive':
+                self._key_pool = _build_key_pool(self.config)
+            self._summarizer = _with_summary_cache(
+                self.config, _build_summarizer(self.config, self._ledger, self._key_pool)
+            )
+        return self._summarizer
+
+    @property
+    def notifier(self) -> Notifier:
+        """Notifier, built on first use."""
+        if self._notifier is None:
+            self._notifier = Notifier(self.config.notification)
+        return self._notifier
+
+    def drain_outbox(self) -> None:
+        """Deliver messages left in the notification outbox by earlier cycles."""
+        if self.config.notification.outbox is not None:
+            self.notifier.drain()
+
+    def run_cycle(self) -> int:
+        """
+        Collect, summarize and deliver new papers once.
+
+        Returns:
+            Number of papers summarized
+        """
+        config = self.config
+        history = self.history
+        journal = self.journal
+        scheduler = _build_scheduler(config)
+        self.drain_outbox()
+
+        claimed: List[Paper] = []
+        try:
+            papers = self.arxiv_client.search_papers(
+                categories=config.arxiv.categories,
+                keywords=config.arxiv.keywords,
+                history=history,
+            )
+            if history is not None:
+                papers = history.filter_unprocessed(papers)
+
+            papers, scores = _rank_papers(config, papers)
+            if self._detector is None:
+                self._detector = _build_detector(config)
+            detector = self._detector
+            papers, related = _deduplicate(detector, papers)
+
+            if journal is not None:
+                papers = journal.plan(papers)
+            papers = claimed = _claim_papers(config, history, papers, self.owner)
+
+            if not papers:
+                logger.warning("No papers found")
+                return 0
+
+            summarizer = self.summarizer
+            plan = _plan_quota(config, self._ledger, papers)
+            if config.pipeline is not None and scheduler is None:
+                summaries, late = _summarize_concurrently(summarizer, plan.selected, journal, config.pipeline), []
+            else:
+                summaries, late = _summarize_until_deadline(summarizer, plan.selected, journal, scheduler)
+            if plan.deferred:
+                summaries.extend(_summarize_deferred(config, plan.deferred, journal))
+            _annotate(summaries, scores, related)
+
+            if not summaries and not late:
+                logger.warning("No summaries generated")
+                return 0
+
+            notifier = self.notifier
+            pending = [
+                Summary(paper_id=paper.arxiv_id, title=paper.title, summary_text="", pending=True)
+                for paper in late
+            ]
+            _annotate(pending, scores, related)
+            with scheduler.timed('notify') if scheduler is not None else nullcontext():
+                report = notifier.send_all(summaries + pending)
+            delivered = _record_delivery(report, summaries, journal, history)
+
+            if late:
+                late_summaries = _summarize_papers(summarizer, late, journal)
+                _annotate(late_summaries, scores, related)
+                report = notifier.send_all(late_summaries, follow_up=True)
+                delivered = _record_delivery(report, late_summaries, journal, history) and delivered
+                summaries.extend(late_summaries)
+
+            if isinstance(summarizer, CachingSummarizer):
+                summarizer.close()
+            if self._ledger is not None:
+                self._ledger.save()
+            if self._key_pool is not None:
+                self._key_pool.close()
+            if detector is not None:
+                if delivered:
+                    detector.save()
+                else:
+                    # Papers that were not delivered must not count as seen next cycle.
+                    self._detector = None
+        finally:
+            if journal is not None:
+                # Compacts the journal; it is reopened on the next write.
+                journal.close()
+            if history is not None and claimed and config.history.lease_seconds is not None:
+                # Processed papers no longer hold leases; free the rest for other workers.
+                history.release([paper.arxiv_id for paper in claimed], self.owner)
 
         logger.info(f"Successfully processed {len(summaries)} papers")
+        return len(summaries)
+
+    def close(self) -> None:
+        """Flush the journal, history and key pool state and close pooled connections."""
+        try:
+            if self._notifier is not None:
+                self._notifier.close()
+        finally:
+            if self._key_pool is not None:
+                self._key_pool.close()
+            if self.journal is not None:
+                self.journal.flush()
+            if self.history is not None:
+                self.history.close()
+
+
+def main() -> int:
+    """
+    Main application flow.
+
+    Returns:
+        Exit code (0 for success, 1 for failure)
+    """
+    try:
+        setup_logger()
+        logger.info("Starting arxiv agent")
+
+        config_path = sys.argv[1] if len(sys.argv) > 1 else "config/default.yaml"
+        logger.info(f"Loading config from: {config_path}")
+        config = load_config(config_path)
+
+        session = AgentSession(config)
+        try:
+            session.run_cycle()
+        finally:
+            session.close()
         return 0
 
     except Exception as e:
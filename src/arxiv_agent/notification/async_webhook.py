@@ -0,0 +1,263 @@
+"""Asynchronous webhook delivery for high fan-out digests."""
+import asyncio
+import importlib.util
+import logging
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+import httpx
+from arxiv_agent.summarization.models import Summary
+from .base_webhook_notifier import BaseWebhookNotifier
+from .delivery_report import ChannelResult, DeliveryReport
+from .discord import DiscordNotifier
+from .http_session import RETRY_STATUSES
+from .rate_limiter import WebhookRateLimiter
+from .slack import SlackNotifier
+
+logger = logging.getLogger(__name__)
+
+# httpx speaks HTTP/2 only with the optional h2 package (httpx[http2]).
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Discord answers more than 50 requests per second from one address with a
+# global 429, so the default limiter stays below that across all webhooks.
+DEFAULT_REQUESTS_PER_SECOND = 50.0
+
+
+class AsyncWebhookClient:
+    """
+    Shared asynchronous HTTP client for webhook fan-out.
+
+    One ``httpx.AsyncClient`` pools keep-alive connections per host and,
+    when h2 is installed, multiplexes requests to a host over one HTTP/2
+    connection. A global semaphore bounds the requests in flight and a
+    semaphore per host bounds those to any one host, so hundreds of
+    webhooks on one platform share a few connections. Requests wait for the
+    shared rate limiter without blocking the event loop. Connection errors
+    and 502/503 responses are retried like the pooled session does; other
+    failures may have been delivered and are not.
+
+    Create, use and close the client within one event loop.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 100,
+        max_per_host: int = 20,
+        max_keepalive: int = 20,
+        timeout: float = 10.0,
+        http2: Optional[bool] = None,
+        max_retries: int = 2,
+        backoff_factor: float = 0.5,
+        rate_limiter: Optional[WebhookRateLimiter] = None,
+    ) -> None:
+        """
+        Initialize asynchronous webhook client.
+
+        Args:
+            max_concurrency: Maximum requests in flight across all hosts.
+            max_per_host: Maximum requests in flight to one host.
+            max_keepalive: Idle connections kept open. httpx inspects every
+                idle connection when it assigns a request, so a pool much
+                larger than the hosts need slows delivery down.
+            timeout: Request timeout in seconds.
+            http2: Whether to use HTTP/2; by default it is used when h2 is installed.
+            max_retries: Retries for connection errors and 502/503 responses.
+            backoff_factor: Exponential backoff factor between retries, in seconds.
+            rate_limiter: Rate limiter pacing requests; one allowing
+                DEFAULT_REQUESTS_PER_SECOND is created if None.
+
+        Raises:
+            ValueError: If a limit is out of range or HTTP/2 is requested without h2.
+        """
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
+        if max_per_host <= 0:
+            raise ValueError("max_per_host must be positive")
+        if max_keepalive < 0:
+            raise ValueError("max_keepalive must be non-negative")
+        if max_retries < 0:
+            raise ValueError("max_retries must be non-negative")
+        if http2 and not HTTP2_AVAILABLE:
+            raise ValueError("HTTP/2 requires the h2 package (pip install 'httpx[http2]')")
+
+        self.http2 = HTTP2_AVAILABLE if http2 is None else http2
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.rate_limiter = rate_limiter or WebhookRateLimiter(max_requests_per_second=DEFAULT_REQUESTS_PER_SECOND)
+        self._max_per_host = max_per_host
+        self._in_flight = asyncio.Semaphore(max_concurrency)
+        self._host_in_flight: Dict[str, asyncio.Semaphore] = {}
+        self._client = httpx.AsyncClient(
+            http2=self.http2,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_keepalive),
+        )
+
+    async def __aenter__(self) -> "AsyncWebhookClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def post(self, url: str, payload: dict) -> httpx.Response:
+        """
+        POST a payload, waiting for concurrency slots and rate limits.
+
+        Args:
+            url: Webhook URL.
+            payload: JSON payload.
+
+        Returns:
+            The last response; a 429 when the rate limiter gave up.
+
+        Raises:
+            httpx.HTTPError: If the request fails after its retries.
+        """
+        host_in_flight = self._host_in_flight.setdefault(
+            urlsplit(url).netloc, asyncio.Semaphore(self._max_per_host)
+        )
+        attempt = 0
+        retries = 0
+        while True:
+            await self._acquire(url)
+            # Wait for the host first, so requests queued for a busy host do
+            # not hold global slots that other hosts could use.
+            async with host_in_flight, self._in_flight:
+                try:
+                    response = await self._client.post(url, json=payload)
+                except (httpx.ConnectError, httpx.ConnectTimeout):
+                    # The request never reached the webhook.
+                    if retries >= self.max_retries:
+                        raise
+                    response = None
+
+            if response is None or (response.status_code in RETRY_STATUSES and retries < self.max_retries):
+                await asyncio.sleep(self.backoff_factor * 2 ** retries)
+                retries += 1
+                continue
+            if not self.rate_limiter.should_retry(url, response, attempt):
+                return response
+            attempt += 1
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        await self._client.aclose()
+
+    async def _acquire(self, url: str) -> None:
+        """Wait for the rate limiter to allow a request without blocking the event loop."""
+        while True:
+            wait = self.rate_limiter.try_acquire(url)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+
+class AsyncWebhookNotifier(BaseWebhookNotifier):
+    """
+    Webhook notifier that can also deliver over an AsyncWebhookClient.
+
+    ``send`` keeps working through the pooled ``requests`` session, so the
+    notifier plugs into ``Notifier`` unchanged; ``send_async`` posts the
+    same messages without blocking the event loop.
+    """
+
+    client: Optional[AsyncWebhookClient] = None
+
+    async def send_async(self, summaries: List[Summary], follow_up: bool = False) -> None:
+        """
+        Send summaries to the webhook over the asynchronous client.
+
+        Args:
+            summaries: List of summaries to send
+            follow_up: Whether this message follows up on an earlier digest
+
+        Raises:
+            ValueError: If the notifier has no asynchronous client
+            httpx.HTTPError: If a webhook request fails
+        """
+        if self.client is None:
+            raise ValueError(f"{self.service_name} notifier has no asynchronous client")
+        if not summaries:
+            logger.warning(f"No summaries to send to {self.service_name}")
+            return
+
+        for message in self.format_messages(summaries, follow_up):
+            response = await self.client.post(self.webhook_url, self._build_payload(message))
+            response.raise_for_status()
+
+
+class AsyncSlackNotifier(AsyncWebhookNotifier, SlackNotifier):
+    """Slack webhook notifier with asynchronous delivery."""
+
+    def __init__(self, client: AsyncWebhookClient, webhook_url: Optional[str] = None, timeout: float = 10):
+        """
+        Initialize asynchronous Slack notifier.
+
+        Args:
+            client: Shared asynchronous client
+            webhook_url: Webhook URL; read from SLACK_WEBHOOK_URL if None
+            timeout: Request timeout in seconds for synchronous sends
+
+        Raises:
+            ValueError: If no webhook URL is given and SLACK_WEBHOOK_URL is not set
+        """
+        super().__init__(timeout=timeout, webhook_url=webhook_url)
+        self.client = client
+
+
+class AsyncDiscordNotifier(AsyncWebhookNotifier, DiscordNotifier):
+    """Discord webhook notifier with asynchronous delivery."""
+
+    def __init__(self, client: AsyncWebhookClient, webhook_url: Optional[str] = None, timeout: float = 10):
+        """
+        Initialize asynchronous Discord notifier.
+
+        Args:
+            client: Shared asynchronous client
+            webhook_url: Webhook URL; read from DISCORD_WEBHOOK_URL if None
+            timeout: Request timeout in seconds for synchronous sends
+
+        Raises:
+            ValueError: If no webhook URL is given and DISCORD_WEBHOOK_URL is not set
+        """
+        super().__init__(timeout=timeout, webhook_url=webhook_url)
+        self.client = client
+
+
+async def send_digests(
+    digests: Sequence[Tuple[str, AsyncWebhookNotifier, List[Summary]]],
+    follow_up: bool = False,
+    timeout: Optional[float] = None,
+) -> DeliveryReport:
+    """
+    Deliver many digests concurrently, e.g. one per user webhook.
+
+    Each digest's messages are sent in order; digests run concurrently
+    within the limits of their notifiers' client, and failures stay
+    isolated.
+
+    Args:
+        digests: Tuples of (name, notifier, summaries)
+        follow_up: Whether the messages follow up on earlier digests
+        timeout: Seconds after which a digest still sending is cancelled, or None
+
+    Returns:
+        Delivery report with one result per digest, in order
+    """
+    async def deliver(name: str, notifier: AsyncWebhookNotifier, summaries: List[Summary]) -> ChannelResult:
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(notifier.send_async(summaries, follow_up=follow_up), timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"{name} notification timed out after {timeout:g}s")
+            return ChannelResult(name, delivered=False, elapsed_seconds=time.monotonic() - started, error="timed out")
+        except Exception as e:
+            logger.error(f"{name} notification failed: {e}")
+            return ChannelResult(name, delivered=False, elapsed_seconds=time.monotonic() - started, error=str(e))
+        return ChannelResult(name, delivered=True, elapsed_seconds=time.monotonic() - started)
+
+    results = await asyncio.gather(*(deliver(*digest) for digest in digests))
+    report = DeliveryReport(list(results))
+    logger.info(f"Delivered {len(report.results) - len(report.failed_channels)} of {len(report.results)} digests")
+    return report
@@ -2,40 +2,95 @@
 import os
 import requests
 import logging
-from typing import List
+from functools import partial
+from typing import List, Optional
 from abc import ABC, abstractmethod
 from arxiv_agent.summarization.models import Summary
+from .chunker import DISCORD_MESSAGE_LIMIT, chunk_messages
+from .http_session import create_session
+from .rate_limiter import WebhookRateLimiter
+from .rendering import SHARED_FRAGMENT_CACHE, Dialect, Fragment
 
 logger = logging.getLogger(__name__)
 
+PENDING_TEXT = "⏳ 要約は締め切りに間に合わなかったため、続報で配信します。"
+
+_default_session: Optional[requests.Session] = None
+_default_rate_limiter: Optional[WebhookRateLimiter] = None
+
+
+def _shared_session() -> requests.Session:
+    """Get the process-wide session used when none is injected."""
+    global _default_session
+    if _default_session is None:
+        _default_session = create_session()
+    return _default_session
+
+
+def _shared_rate_limiter() -> WebhookRateLimiter:
+    """Get the process-wide rate limiter used when none is injected."""
+    global _default_rate_limiter
+    if _default_rate_limiter is None:
+        _default_rate_limiter = WebhookRateLimiter()
+    return _default_rate_limiter
+
 
 class BaseWebhookNotifier(ABC):
     """Base class for webhook-based notifiers."""
 
-    def __init__(self, env_var_name: str, service_name: str):
+    session: Optional[requests.Session] = None
+    timeout: float = 10
+    rate_limiter: Optional[WebhookRateLimiter] = None
+    # Subclasses set their platform's limit; the smallest common one by default.
+    message_limit: int = DISCORD_MESSAGE_LIMIT
+    # Entries of notifiers with a dialect are rendered once and shared through
+    # SHARED_FRAGMENT_CACHE; without one they are formatted with _format_bold.
+    dialect: Optional[Dialect] = None
+
+    def __init__(
+        self,
+        env_var_name: str,
+        service_name: str,
+        session: Optional[requests.Session] = None,
+        timeout: float = 10,
+        rate_limiter: Optional[WebhookRateLimiter] = None,
+        webhook_url: Optional[str] = None,
+    ):
         """
         Initialize webhook notifier.
 
         Args:
             env_var_name: Environment variable name for webhook URL
             service_name: Name of the service (e.g., "Slack", "Discord")
+            session: Pooled HTTP session; a process-wide session is used if None
+            timeout: Request timeout in seconds
+            rate_limiter: Rate limiter pacing requests; a process-wide one is used if None
+            webhook_url: Webhook URL; read from env_var_name if None
 
         Raises:
             ValueError: If webhook URL environment variable is not set
         """
-        webhook_url = os.getenv(env_var_name)
+        webhook_url = webhook_url or os.getenv(env_var_name)
         if not webhook_url:
             raise ValueError(f"{env_var_name} environment variable is required")
 
         self.webhook_url = webhook_url
         self.service_name = service_name
+        self.session = session
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
 
-    def send(self, summaries: List[Summary]) -> None:
+    def send(self, summaries: List[Summary], follow_up: bool = False) -> None:
         """
         Send summaries to webhook.
 
+        Digests longer than ``message_limit`` are split into several
+        messages, sent in order. Requests wait for the webhook's rate limit
+        and 429 responses are retried after the delay the server asks for.
+
         Args:
             summaries: List of summaries to send
+            follow_up: Whether this message follows up on an earlier digest
 
         Raises:
             Exception: If webhook request fails
@@ -44,43 +99,83 @@ class BaseWebhookNotifier(ABC):
             logger.warning(f"No summaries to send to {self.service_name}")
             return
 
-        message = self._format_message(summaries)
-        payload = self._build_payload(message)
+        messages = self.format_messages(summaries, follow_up)
 
-        logger.info(f"Sending {len(summaries)} summaries to {self.service_name}")
+        logger.info(f"Sending {len(summaries)} summaries to {self.service_name} in {len(messages)} messages")
 
         try:
-            response = requests.post(
-                self.webhook_url,
-                json=payload,
-                timeout=10,
-            )
-            response.raise_for_status()
+            for message in messages:
+                self.post_message(message)
             logger.info(f"Summaries sent to {self.service_name} successfully")
 
         except requests.RequestException as e:
             logger.error(f"Failed to send to {self.service_name}: {e}")
             raise
 
-    def _format_message(self, summaries: List[Summary]) -> str:
+    def post_message(self, message: str) -> None:
+        """
+        Post one formatted message to the webhook.
+
+        Args:
+            message: Message from ``format_messages``
+
+        Raises:
+            requests.RequestException: If the webhook request fails
+        """
+        session = self.session or _shared_session()
+        rate_limiter = self.rate_limiter or _shared_rate_limiter()
+        response = rate_limiter.post(session, self.webhook_url, self._build_payload(message), self.timeout)
+        response.raise_for_status()
+
+    def _format_message(self, summaries: List[Summary], follow_up: bool = False) -> str:
         """
         Format summaries into message.
 
+        Summaries still pending are listed with a notice that they follow in
+        a later message.
+
         Args:
             summaries: List of summaries
+            follow_up: Whether this message follows up on an earlier digest
 
         Returns:
             Formatted message string
         """
-        lines = [f"📚 {self._format_bold(f'論文要約 ({len(summaries)}件)')}\n"]
+        return self._format_header(summaries, follow_up) + "\n".join(self._format_entries(summaries))
 
-        for i, summary in enumerate(summaries, 1):
-            lines.append(self._format_bold(f"{i}. {summary.title}"))
-            lines.append(f"ID: {summary.paper_id}")
-            lines.append(summary.summary_text)
-            lines.append("")
+    def format_messages(self, summaries: List[Summary], follow_up: bool = False) -> List[str]:
+        """
+        Format summaries into messages that fit the platform's limit.
 
-        return "\n".join(lines)
+        Papers are packed into as few messages as possible; a summary too
+        long for one message is split at paragraph or section boundaries.
+
+        Args:
+            summaries: List of summaries
+            follow_up: Whether this message follows up on an earlier digest
+
+        Returns:
+            Formatted messages in sending order
+        """
+        return chunk_messages(
+            self._format_entries(summaries),
+            self.message_limit,
+            header=self._format_header(summaries, follow_up),
+        )
+
+    def _format_header(self, summaries: List[Summary], follow_up: bool) -> str:
+        """Format the heading that opens a digest."""
+        heading = '論文要約・続報' if follow_up else '論文要約'
+        return f"📚 {self._format_bold(f'{heading} ({len(summaries)}件)')}\n\n"
+
+    def _format_entries(self, summaries: List[Summary]) -> List[str]:
+        """Format each summary as one entry of the digest."""
+        if self.dialect is None:
+            return [_fragment(summary).render(self._format_bold, i) for i, summary in enumerate(summaries, 1)]
+        return [
+            SHARED_FRAGMENT_CACHE.render(_fragment_key(summary), partial(_fragment, summary), self.dialect, i)
+            for i, summary in enumerate(summaries, 1)
+        ]
 
     @abstractmethod
     def _build_payload(self, message: str) -> dict:
@@ -107,3 +202,19 @@ class BaseWebhookNotifier(ABC):
             Bold-formatted text
         """
         pass
+
+
+def _fragment_key(summary: Summary) -> tuple:
+    """Get the key identifying the rendered content of a summary."""
+    return (
+        "summary", summary.paper_id, summary.title, summary.summary_text, tuple(summary.related_ids), summary.pending
+    )
+
+
+def _fragment(summary: Summary) -> Fragment:
+    """Build the platform-neutral digest entry of a summary."""
+    lines = [f"ID: {summary.paper_id}"]
+    if summary.related_ids:
+        lines.append(f"関連: {', '.join(summary.related_ids)}")
+    lines.append(PENDING_TEXT if summary.pending else summary.summary_text)
+    return Fragment(summary.title, tuple(lines))
@@ -0,0 +1,123 @@
+"""Splitting of digests into messages that fit a chat platform's limits."""
+import re
+from typing import Iterable, List
+
+# This module only depends on the standard library so the legacy notifier
+# in ``src/notifier.py`` can share it.
+
+DISCORD_MESSAGE_LIMIT = 2000
+# Slack accepts up to 4000 characters of message text, but a section block
+# holds at most 3000; staying under the smaller limit keeps every chunk valid
+# either way.
+SLACK_MESSAGE_LIMIT = 3000
+
+# Preferred cut points after Ochiai section headings, best first:
+# paragraphs, lines, sentences, then words.
+_BOUNDARIES = ("\n\n", "\n", "。", ". ", " ")
+# A line starting a numbered section, as in summarization.section_parser.
+_SECTION_START = re.compile(r"\n(?=[ \t>#*]*[1-6][.．)）])")
+
+
+def split_text(text: str, limit: int) -> List[str]:
+    """
+    Split text into pieces of at most ``limit`` characters.
+
+    Each piece ends at the best boundary found in the second half of its
+    window: before a numbered section heading, then at a paragraph, line,
+    sentence or word boundary. Text is cut mid-word only when the window has
+    no boundary at all.
+    Every window is scanned a bounded number of times, so splitting is linear
+    in the length of the text.
+
+    Args:
+        text: Text to split
+        limit: Maximum characters per piece
+
+    Returns:
+        List of pieces without surrounding blank lines
+
+    Raises:
+        ValueError: If limit is not positive
+    """
+    if limit <= 0:
+        raise ValueError("limit must be positive")
+
+    pieces: List[str] = []
+    start = 0
+    while len(text) - start > limit:
+        end = start + limit
+        cut = _last_section_start(text, start + limit // 2, end)
+        for boundary in _BOUNDARIES if cut == -1 else ():
+            found = text.rfind(boundary, start + limit // 2, end)
+            if found != -1:
+                cut = found + len(boundary)
+                break
+        if cut == -1:
+            cut = end
+        piece = text[start:cut].rstrip()
+        if piece:
+            pieces.append(piece)
+        start = cut
+        while start < len(text) and text[start] == "\n":
+            start += 1
+
+    if text[start:].strip():
+        pieces.append(text[start:])
+    return pieces
+
+
+def _last_section_start(text: str, lo: int, hi: int) -> int:
+    """Get the start of the last section heading line within text[lo:hi], or -1."""
+    cut = -1
+    for match in _SECTION_START.finditer(text, lo, hi):
+        cut = match.end()
+    return cut
+
+
+def chunk_messages(entries: Iterable[str], limit: int, header: str = "", separator: str = "\n") -> List[str]:
+    """
+    Pack entries into as few messages as possible, keeping their order.
+
+    The header opens the first message and entries are joined with the
+    separator. An entry too long for a message of its own is split with
+    ``split_text``. Messages are built from lists of parts and joined once,
+    so packing is linear in the total length.
+
+    Args:
+        entries: Formatted entries, e.g. one per paper
+        limit: Maximum characters per message
+        header: Text opening the first message
+        separator: Text between entries within a message
+
+    Returns:
+        List of messages, each at most ``limit`` characters
+
+    Raises:
+        ValueError: If the header and separator leave no room for entries
+    """
+    piece_limit = limit - len(header) - len(separator)
+    if piece_limit <= 0:
+        raise ValueError("limit must leave room for entries after the header")
+
+    messages: List[str] = []
+    parts: List[str] = [header] if header else []
+    size = len(header)
+    has_entry = False
+
+    for entry in entries:
+        pieces = split_text(entry, piece_limit) if len(entry) > piece_limit else [entry]
+        for piece in pieces:
+            extra = len(piece) + (len(separator) if has_entry else 0)
+            if has_entry and size + extra > limit:
+                messages.append("".join(parts))
+                parts, size = [piece], len(piece)
+                continue
+            if has_entry:
+                parts.append(separator)
+            parts.append(piece)
+            size += extra
+            has_entry = True
+
+    if parts:
+        messages.append("".join(parts))
+    return messages
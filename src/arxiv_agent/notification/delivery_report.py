@@ -0,0 +1,45 @@
+"""Per-channel results of a notification fan-out."""
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass
+class ChannelResult:
+    """Outcome of delivering one digest to one channel."""
+    channel: str
+    delivered: bool
+    elapsed_seconds: float
+    error: Optional[str] = None
+    # Undelivered messages wait in the outbox for a later drain.
+    queued: bool = False
+
+
+@dataclass
+class DeliveryReport:
+    """Outcome of delivering one digest to every channel."""
+    results: List[ChannelResult] = field(default_factory=list)
+
+    @property
+    def all_delivered(self) -> bool:
+        """Whether every channel received the digest."""
+        return all(result.delivered for result in self.results)
+
+    @property
+    def all_settled(self) -> bool:
+        """Whether every channel received the digest or holds it in the outbox."""
+        return all(result.delivered or result.queued for result in self.results)
+
+    @property
+    def failed_channels(self) -> List[str]:
+        """Names of channels that did not receive the digest."""
+        return [result.channel for result in self.results if not result.delivered]
+
+    def summary(self) -> str:
+        """Format the report as one line for logs."""
+        if not self.results:
+            return "no channels"
+        return ", ".join(
+            f"{r.channel}: {'ok' if r.delivered else f'failed ({r.error})'}"
+            f"{', queued' if r.queued else ''} in {r.elapsed_seconds:.2f}s"
+            for r in self.results
+        )
@@ -1,18 +1,45 @@
 """Discord notification adapter."""
+from typing import Optional
+import requests
 from .base_webhook_notifier import BaseWebhookNotifier
+from .chunker import DISCORD_MESSAGE_LIMIT
+from .rate_limiter import WebhookRateLimiter
+from .rendering import Dialect, emphasize
 
 
 class DiscordNotifier(BaseWebhookNotifier):
     """Discord webhook notifier."""
 
-    def __init__(self):
+    message_limit = DISCORD_MESSAGE_LIMIT
+    dialect = Dialect.DISCORD
+
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        timeout: float = 10,
+        rate_limiter: Optional[WebhookRateLimiter] = None,
+        webhook_url: Optional[str] = None,
+    ):
         """
         Initialize Discord notifier.
 
+        Args:
+            session: Pooled HTTP session; a process-wide session is used if None
+            timeout: Request timeout in seconds
+            rate_limiter: Rate limiter pacing requests; a process-wide one is used if None
+            webhook_url: Webhook URL; read from DISCORD_WEBHOOK_URL if None
+
         Raises:
-            ValueError: If DISCORD_WEBHOOK_URL environment variable is not set
+            ValueError: If no webhook URL is given and DISCORD_WEBHOOK_URL is not set
         """
-        super().__init__('DISCORD_WEBHOOK_URL', 'Discord')
+        super().__init__(
+            'DISCORD_WEBHOOK_URL',
+            'Discord',
+            session=session,
+            timeout=timeout,
+            rate_limiter=rate_limiter,
+            webhook_url=webhook_url,
+        )
 
     def _build_payload(self, message: str) -> dict:
         """
@@ -36,4 +63,4 @@ class DiscordNotifier(BaseWebhookNotifier):
         Returns:
             Bold-formatted text
         """
-        return f"**{text}**"
+        return emphasize(text, Dialect.DISCORD)
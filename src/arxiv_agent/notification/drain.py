@@ -0,0 +1,39 @@
+"""Command line delivery of the notification outbox."""
+import logging
+import sys
+from arxiv_agent.config.loader import load_config
+from .notifier import Notifier
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> int:
+    """
+    Command line entry point.
+
+    Usage: python -m arxiv_agent.notification.drain [config.yaml]
+
+    Returns:
+        Exit code (0 when every channel is drained, 1 when messages remain
+        queued, 2 for invalid arguments or no configured outbox)
+    """
+    if len(sys.argv) > 2:
+        print("Usage: python -m arxiv_agent.notification.drain [config.yaml]", file=sys.stderr)
+        return 2
+
+    logging.basicConfig(level=logging.INFO)
+    config = load_config(sys.argv[1] if len(sys.argv) > 1 else "config/default.yaml")
+    if config.notification.outbox is None:
+        print("notification.outbox is not configured", file=sys.stderr)
+        return 2
+
+    notifier = Notifier(config.notification)
+    try:
+        report = notifier.drain()
+    finally:
+        notifier.close()
+    return 0 if report.all_delivered else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+"""Pooled HTTP sessions shared by webhook notifiers."""
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# A 502 or 503 from the gateway means the webhook handler never ran. A 504
+# or a read timeout may come after the message was already posted, so those
+# are not retried.
+RETRY_STATUSES = (502, 503)
+
+
+def create_session(pool_size: int = 10, max_retries: int = 2, backoff_factor: float = 0.5) -> requests.Session:
+    """
+    Create a keep-alive session with a bounded connection pool.
+
+    Reusing one session across messages and notifiers keeps TCP and TLS
+    connections open, so only the first message to each host pays for the
+    handshake.
+
+    Args:
+        pool_size: Maximum number of connections kept per host
+        max_retries: Retries for connection errors and 502/503 responses
+        backoff_factor: Exponential backoff factor between retries, in seconds
+
+    Returns:
+        Configured session
+
+    Raises:
+        ValueError: If pool_size is not positive or max_retries is negative
+    """
+    if pool_size <= 0:
+        raise ValueError("pool_size must be positive")
+    if max_retries < 0:
+        raise ValueError("max_retries must be non-negative")
+
+    retry = Retry(
+        total=max_retries,
+        read=0,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"POST"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -1,16 +1,39 @@
 """Notification orchestrator."""
 import logging
-from typing import List
+import threading
+import time
+from typing import Any, Callable, Dict, List
+import requests
 from arxiv_agent.summarization.models import Summary
 from arxiv_agent.config.models import NotificationConfig
+from .delivery_report import ChannelResult, DeliveryReport
+from .http_session import create_session
+from .outbox import NotificationOutbox, OutboxItem
+from .rate_limiter import WebhookRateLimiter
 from .slack import SlackNotifier
 from .discord import DiscordNotifier
 
 logger = logging.getLogger(__name__)
 
+# Client errors worth retrying; any other 4xx rejects the message for good.
+_TRANSIENT_CLIENT_ERRORS = (408, 429)
+
 
 class Notifier:
-    """Orchestrates notifications to multiple channels."""
+    """
+    Orchestrates notifications to multiple channels.
+
+    Channels are delivered concurrently, one worker thread per channel, so a
+    slow webhook no longer delays the others. Each channel sends its messages
+    in order, failures stay isolated, and a channel still running after
+    ``channel_timeout_seconds`` is reported as timed out. Workers are daemon
+    threads, so an abandoned channel never keeps the process alive. All channels share
+    one pooled session and one rate limiter.
+
+    With an outbox configured, rendered messages are persisted before any
+    delivery and sent by ``drain``; messages a channel did not receive stay
+    queued for the next run.
+    """
 
     def __init__(self, config: NotificationConfig):
         """
@@ -21,38 +44,244 @@ class Notifier:
         """
         self.config = config
         self.notifiers = []
+        self._stragglers: List[threading.Thread] = []
+        self.session = create_session(
+            pool_size=config.http.pool_size,
+            max_retries=config.http.max_retries,
+            backoff_factor=config.http.backoff_factor,
+        )
+        timeout = config.http.timeout_seconds
+        self.rate_limiter = WebhookRateLimiter(
+            max_retries=config.rate_limit.max_retries,
+            max_retry_after=config.rate_limit.max_retry_after_seconds,
+            jitter=config.rate_limit.jitter,
+            max_requests_per_second=config.rate_limit.max_requests_per_second,
+        )
+        self.outbox = None
+        if config.outbox is not None:
+            self.outbox = NotificationOutbox(
+                config.outbox.file,
+                max_attempts=config.outbox.max_attempts,
+                retention=config.outbox.retention_days * 24 * 3600,
+            )
+        channel_options = dict(session=self.session, timeout=timeout, rate_limiter=self.rate_limiter)
 
         if config.slack.enabled:
             try:
-                self.notifiers.append(('Slack', SlackNotifier()))
+                self.notifiers.append(('Slack', SlackNotifier(**channel_options)))
                 logger.info("Slack notifier enabled")
             except ValueError as e:
                 logger.warning(f"Slack notifier disabled: {e}")
 
         if config.discord.enabled:
             try:
-                self.notifiers.append(('Discord', DiscordNotifier()))
+                self.notifiers.append(('Discord', DiscordNotifier(**channel_options)))
                 logger.info("Discord notifier enabled")
             except ValueError as e:
                 logger.warning(f"Discord notifier disabled: {e}")
 
-    def send_all(self, summaries: List[Summary]) -> None:
+    def send_all(self, summaries: List[Summary], follow_up: bool = False) -> DeliveryReport:
         """
-        Send summaries to all enabled notification channels.
+        Send summaries to all enabled notification channels concurrently.
+
+        Summaries with a relevance score are sent first, highest score first;
+        the rest keep their original order. With an outbox, every channel's
+        messages are persisted first and then delivered by ``drain``.
 
         Args:
             summaries: List of summaries to send
+            follow_up: Whether this message follows up on an earlier digest
+
+        Returns:
+            Delivery report with one result per channel
         """
         if not summaries:
             logger.warning("No summaries to send")
-            return
+            return DeliveryReport()
 
         if not self.notifiers:
             logger.warning("No notifiers enabled")
-            return
+            return DeliveryReport()
+
+        summaries = sorted(
+            summaries,
+            key=lambda s: (s.relevance_score is None, -(s.relevance_score or 0.0)),
+        )
+
+        if self.outbox is None:
+            return self._fan_out(lambda name, notifier: notifier.send(summaries, follow_up=follow_up))
 
+        paper_ids = [summary.paper_id for summary in summaries if not summary.pending]
         for name, notifier in self.notifiers:
+            self.outbox.enqueue(name, notifier.format_messages(summaries, follow_up), paper_ids)
+        return self.drain()
+
+    def drain(self) -> DeliveryReport:
+        """
+        Deliver the messages waiting in the outbox to all enabled channels.
+
+        Each channel sends its pending messages in order and stops at the
+        first transient failure, leaving the rest for a later drain. A
+        message the channel rejects with a client error is given up and the
+        channel moves on to the next one.
+
+        A channel that times out keeps sending in the background. The drain
+        lock is held until it finishes, so no other drain sends its messages
+        again; drains meanwhile report the outbox as busy.
+
+        Returns:
+            Delivery report with one result per channel; undelivered
+            channels are marked as queued
+        """
+        if self.outbox is None or not self.notifiers:
+            return DeliveryReport()
+
+        pending = self.outbox.begin_drain()
+        if pending is None:
+            logger.warning("Outbox is being drained elsewhere; leaving messages queued")
+            return DeliveryReport([
+                ChannelResult(name, delivered=False, elapsed_seconds=0.0, error="outbox busy", queued=True)
+                for name, _ in self.notifiers
+            ])
+
+        known_stragglers = len(self._stragglers)
+        try:
+            by_channel: Dict[str, List[OutboxItem]] = {name: [] for name, _ in self.notifiers}
+            for item in pending:
+                if item.channel in by_channel:
+                    by_channel[item.channel].append(item)
+                else:
+                    logger.warning(f"Keeping outbox message for disabled channel {item.channel}")
+            if any(by_channel.values()):
+                logger.info(f"Draining {sum(map(len, by_channel.values()))} messages from the outbox")
+            report = self._fan_out(lambda name, notifier: self._drain_channel(notifier, by_channel[name]))
+        finally:
+            sending = [worker for worker in self._stragglers[known_stragglers:] if worker.is_alive()]
+            if sending:
+                self._end_drain_after(sending)
+            else:
+                self.outbox.end_drain()
+
+        for result in report.results:
+            result.queued = not result.delivered
+        return report
+
+    def _drain_channel(self, notifier, items: List[OutboxItem]) -> None:
+        """
+        Post outbox messages to one channel in order, recording each outcome.
+
+        Raises:
+            Exception: The first transient failure, or else the first
+                rejection once the remaining messages were sent
+        """
+        rejection = None
+        for item in items:
             try:
-                notifier.send(summaries)
+                notifier.post_message(item.message)
             except Exception as e:
-                logger.error(f"{name} notification failed: {e}")
+                permanent = _is_rejection(e)
+                self.outbox.mark_failed(item.key, str(e), permanent=permanent)
+                if not permanent:
+                    raise
+                rejection = rejection or e
+                continue
+            self.outbox.mark_delivered(item.key)
+        if rejection is not None:
+            raise rejection
+
+    def _end_drain_after(self, workers: List[threading.Thread]) -> None:
+        """Release the outbox drain lock once timed-out channel workers finish."""
+        logger.warning(f"Holding the outbox drain lock until {len(workers)} timed-out channels finish")
+
+        def release() -> None:
+            for worker in workers:
+                worker.join()
+            self.outbox.end_drain()
+
+        threading.Thread(target=release, name="outbox-release", daemon=True).start()
+
+    def _fan_out(self, send: Callable[[str, Any], None]) -> DeliveryReport:
+        """
+        Run a delivery on every channel concurrently within the channel timeout.
+
+        Args:
+            send: Delivery to one channel, called with its name and notifier
+
+        Returns:
+            Delivery report with one result per channel
+        """
+        started = time.monotonic()
+        deadline = started + self.config.channel_timeout_seconds
+        results: Dict[str, ChannelResult] = {}
+        workers = []
+        for name, notifier in self.notifiers:
+            def deliver(name=name, notifier=notifier):
+                results[name] = self._deliver(name, lambda: send(name, notifier))
+
+            worker = threading.Thread(target=deliver, name=f"notify-{name}", daemon=True)
+            worker.start()
+            workers.append(worker)
+        for worker in workers:
+            worker.join(max(deadline - time.monotonic(), 0.0))
+
+        report = DeliveryReport()
+        for (name, _), worker in zip(self.notifiers, workers):
+            if not worker.is_alive():
+                report.results.append(results[name])
+            else:
+                # The worker is abandoned; close() keeps the session open for it.
+                self._stragglers.append(worker)
+                logger.error(f"{name} notification timed out after {self.config.channel_timeout_seconds:g}s")
+                report.results.append(ChannelResult(
+                    channel=name,
+                    delivered=False,
+                    elapsed_seconds=time.monotonic() - started,
+                    error="timed out",
+                ))
+
+        logger.info(f"Delivery report: {report.summary()}")
+        return report
+
+    @staticmethod
+    def _deliver(name: str, send: Callable[[], None]) -> ChannelResult:
+        """
+        Deliver to one channel, capturing its outcome.
+
+        Args:
+            name: Channel name
+            send: Delivery to the channel
+
+        Returns:
+            Result of the delivery
+        """
+        started = time.monotonic()
+        try:
+            send()
+        except Exception as e:
+            logger.error(f"{name} notification failed: {e}")
+            return ChannelResult(name, delivered=False, elapsed_seconds=time.monotonic() - started, error=str(e))
+        return ChannelResult(name, delivered=True, elapsed_seconds=time.monotonic() - started)
+
+    def close(self) -> None:
+        """
+        Close pooled connections shared by the channels.
+
+        The session stays open while a timed-out channel is still sending;
+        its connections are released when that thread ends or the process
+        exits.
+        """
+        self._stragglers = [worker for worker in self._stragglers if worker.is_alive()]
+        if self._stragglers:
+            logger.warning(f"Leaving HTTP session open for {len(self._stragglers)} timed-out channels")
+            return
+        self.session.close()
+
+
+def _is_rejection(error: Exception) -> bool:
+    """Check whether a delivery failed with a client error that retrying cannot fix."""
+    response = getattr(error, "response", None) if isinstance(error, requests.HTTPError) else None
+    return (
+        response is not None
+        and 400 <= response.status_code < 500
+        and response.status_code not in _TRANSIENT_CLIENT_ERRORS
+    )
@@ -0,0 +1,360 @@
+"""Durable outbox of rendered notification messages."""
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, TextIO
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxState(str, Enum):
+    """Delivery state of an outbox message."""
+    PENDING = "pending"
+    DELIVERED = "delivered"
+    DEAD = "dead"
+
+
+@dataclass
+class OutboxItem:
+    """One rendered message waiting for, or done with, delivery to one channel."""
+    key: str
+    channel: str
+    message: str
+    paper_ids: List[str] = field(default_factory=list)
+    state: OutboxState = OutboxState.PENDING
+    attempts: int = 0
+    error: Optional[str] = None
+    updated_at: float = 0.0
+
+
+def idempotency_key(channel: str, message: str) -> str:
+    """
+    Get the idempotency key of a message for a channel.
+
+    The same message rendered again for the same channel, e.g. by a re-run
+    of an interrupted digest, gets the same key and is not sent twice.
+
+    Args:
+        channel: Channel name
+        message: Rendered message
+
+    Returns:
+        Hex digest identifying the message
+    """
+    return hashlib.sha256(f"{channel}\n{message}".encode("utf-8")).hexdigest()
+
+
+class NotificationOutbox:
+    """
+    Crash-safe outbox of rendered messages, delivered per channel.
+
+    Messages are appended to a newline-delimited JSON file and fsynced
+    before any delivery is attempted, so summaries survive a webhook outage
+    and are sent by a later drain without being collected or summarized
+    again. Each message has an idempotency key per channel; a message whose
+    key is already in the outbox, pending or delivered, is not enqueued
+    again. Delivered keys are remembered for ``retention`` seconds.
+
+    Delivery is at least once: a crash between a successful POST and its
+    ``delivered`` record sends the message again on the next drain.
+
+    Only one process drains the outbox at a time, holding a drain lock
+    from ``begin_drain`` to ``end_drain``. Short updates take a separate
+    advisory lock and replay the state from the file, so several processes
+    may share one outbox and enqueue while another drains it.
+    """
+
+    def __init__(
+        self,
+        outbox_file: str,
+        max_attempts: int = 10,
+        retention: float = 7 * 24 * 3600.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize notification outbox.
+
+        Args:
+            outbox_file: Path to the outbox file.
+            max_attempts: Failed deliveries after which a message is given up.
+            retention: Seconds delivered and given-up messages are kept.
+            clock: Function returning the current UNIX time.
+
+        Raises:
+            ValueError: If a limit is not positive.
+        """
+        if max_attempts <= 0:
+            raise ValueError("max_attempts must be positive")
+        if retention <= 0:
+            raise ValueError("retention must be positive")
+
+        self._outbox_file = Path(outbox_file)
+        self._lock_file = self._outbox_file.with_name(self._outbox_file.name + ".lock")
+        self._drain_lock_file = self._outbox_file.with_name(self._outbox_file.name + ".drain.lock")
+        self._drain_handle: Optional[TextIO] = None
+        self._max_attempts = max_attempts
+        self._retention = retention
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._items: Dict[str, OutboxItem] = {}
+
+    def enqueue(self, channel: str, messages: List[str], paper_ids: List[str]) -> List[str]:
+        """
+        Persist messages for a channel before they are delivered.
+
+        Args:
+            channel: Channel name
+            messages: Rendered messages in sending order
+            paper_ids: IDs of the papers the messages carry
+
+        Returns:
+            Idempotency keys of the messages, in order
+        """
+        keys = [idempotency_key(channel, message) for message in messages]
+        with self._locked():
+            self._replay()
+            now = self._clock()
+            records = []
+            for key, message in zip(keys, messages):
+                if key in self._items:
+                    logger.info(f"Skipping {channel} message {key[:12]}: already in the outbox")
+                    continue
+                self._items[key] = OutboxItem(key, channel, message, list(paper_ids), updated_at=now)
+                records.append({
+                    "key": key,
+                    "state": OutboxState.PENDING.value,
+                    "channel": channel,
+                    "message": message,
+                    "paper_ids": list(paper_ids),
+                    "ts": now,
+                })
+            self._write(records)
+        return keys
+
+    @contextmanager
+    def draining(self) -> Iterator[Optional[List[OutboxItem]]]:
+        """
+        Hold the drain lock for the duration of a with block.
+
+        Yields:
+            Pending messages in enqueue order, or None if the outbox is busy
+        """
+        pending = self.begin_drain()
+        if pending is None:
+            yield None
+            return
+        try:
+            yield pending
+        finally:
+            self.end_drain()
+
+    def begin_drain(self) -> Optional[List[OutboxItem]]:
+        """
+        Take the drain lock without waiting and get the pending messages.
+
+        Deliveries are recorded with ``mark_delivered`` and ``mark_failed``
+        until ``end_drain`` releases the lock, possibly from another thread.
+
+        Returns:
+            Pending messages in enqueue order, or None if another drain
+            holds the lock
+        """
+        self._drain_lock_file.parent.mkdir(parents=True, exist_ok=True)
+        handle = self._drain_lock_file.open("a")
+        try:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            handle.close()
+            return None
+
+        self._drain_handle = handle
+        with self._locked():
+            self._replay()
+            return [item for item in self._items.values() if item.state == OutboxState.PENDING]
+
+    def end_drain(self) -> None:
+        """Compact the outbox and release the drain lock."""
+        handle, self._drain_handle = self._drain_handle, None
+        if handle is None:
+            return
+        try:
+            with self._locked():
+                # Pick up messages enqueued by other processes during the drain.
+                self._replay()
+                self._compact()
+        finally:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            handle.close()
+
+    def mark_delivered(self, key: str) -> None:
+        """
+        Record that a message reached its channel.
+
+        Args:
+            key: Idempotency key of the message
+        """
+        with self._locked():
+            item = self._items.get(key)
+            if item is None:
+                return
+            item.state = OutboxState.DELIVERED
+            item.updated_at = self._clock()
+            self._write([{"key": key, "state": item.state.value, "ts": item.updated_at}])
+
+    def mark_failed(self, key: str, error: str, permanent: bool = False) -> None:
+        """
+        Record a failed delivery, giving the message up after ``max_attempts``.
+
+        Args:
+            key: Idempotency key of the message
+            error: Error description
+            permanent: Whether the channel rejected the message for good,
+                e.g. as invalid; it is given up immediately
+        """
+        with self._locked():
+            item = self._items.get(key)
+            if item is None:
+                return
+            item.attempts += 1
+            item.error = error
+            item.updated_at = self._clock()
+            if permanent:
+                item.state = OutboxState.DEAD
+                logger.error(f"Giving up {item.channel} message {key[:12]} rejected by the channel: {error}")
+            elif item.attempts >= self._max_attempts:
+                item.state = OutboxState.DEAD
+                logger.error(f"Giving up {item.channel} message {key[:12]} after {item.attempts} attempts: {error}")
+            self._write([{
+                "key": key,
+                "state": item.state.value,
+                "attempts": item.attempts,
+                "error": error,
+                "ts": item.updated_at,
+            }])
+
+    def items(self) -> List[OutboxItem]:
+        """
+        Get every message in the outbox, re-read from disk.
+
+        Returns:
+            Messages in enqueue order
+        """
+        with self._locked():
+            self._replay()
+            return list(self._items.values())
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the thread lock and the update file lock for a short update."""
+        with self._lock:
+            self._lock_file.parent.mkdir(parents=True, exist_ok=True)
+            with self._lock_file.open("a") as f:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _replay(self) -> None:
+        """
+        Fold outbox records into the latest state per message.
+
+        A torn final line left by a crash is skipped. Must be called with
+        the locks held.
+        """
+        items: Dict[str, OutboxItem] = {}
+        if self._outbox_file.exists():
+            try:
+                with self._outbox_file.open("r", encoding="utf-8") as f:
+                    for line_no, line in enumerate(f, 1):
+                        if not line.strip():
+                            continue
+                        try:
+                            record = json.loads(line)
+                        except json.JSONDecodeError:
+                            logger.warning(f"Skipping corrupted outbox record at line {line_no}")
+                            continue
+                        self._apply(items, record)
+            except OSError as e:
+                logger.error(f"Failed to read outbox file: {e}")
+                return
+        self._items = items
+
+    @staticmethod
+    def _apply(items: Dict[str, OutboxItem], record: dict) -> None:
+        """Apply a single outbox record to the folded state."""
+        key = record["key"]
+        item = items.get(key)
+        if item is None:
+            if "channel" not in record:
+                return
+            item = OutboxItem(key, record["channel"], record.get("message", ""), record.get("paper_ids", []))
+            items[key] = item
+        item.state = OutboxState(record["state"])
+        item.attempts = record.get("attempts", item.attempts)
+        item.error = record.get("error", item.error)
+        item.updated_at = record.get("ts", item.updated_at)
+
+    def _write(self, records: List[dict]) -> None:
+        """
+        Append records to the outbox and fsync it.
+
+        Raises:
+            OSError: If the outbox cannot be written; an unpersisted message
+                must not be reported as queued.
+        """
+        if not records:
+            return
+        self._outbox_file.parent.mkdir(parents=True, exist_ok=True)
+        with self._outbox_file.open("a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _compact(self) -> None:
+        """
+        Rewrite the outbox without messages finished longer than ``retention`` ago.
+
+        Delivered messages keep only their key, so a re-render is still
+        recognized. Uses a temporary file and atomic rename so a crash
+        leaves either the old or the new outbox intact.
+        """
+        cutoff = self._clock() - self._retention
+        live = {
+            key: item for key, item in self._items.items()
+            if item.state == OutboxState.PENDING or item.updated_at >= cutoff
+        }
+        if not live and not self._outbox_file.exists():
+            return
+
+        tmp_file = self._outbox_file.with_name(self._outbox_file.name + ".tmp")
+        try:
+            with tmp_file.open("w", encoding="utf-8") as f:
+                for key, item in live.items():
+                    record = {
+                        "key": key,
+                        "state": item.state.value,
+                        "channel": item.channel,
+                        "paper_ids": item.paper_ids,
+                        "attempts": item.attempts,
+                        "ts": item.updated_at,
+                    }
+                    if item.state != OutboxState.DELIVERED:
+                        record["message"] = item.message
+                    if item.error is not None:
+                        record["error"] = item.error
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self._outbox_file)
+            self._items = live
+        except OSError as e:
+            logger.error(f"Failed to compact outbox file: {e}")
@@ -0,0 +1,281 @@
+"""Rate-limit-aware webhook delivery."""
+import email.utils
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+# This module only depends on the standard library so the legacy notifier
+# in ``src/notifier.py`` can share it.
+
+logger = logging.getLogger(__name__)
+
+TOO_MANY_REQUESTS = 429
+
+
+@dataclass
+class _Bucket:
+    """Rate limit bucket reported by a webhook."""
+    remaining: Optional[int] = None
+    reset_at: float = 0.0
+
+
+class WebhookRateLimiter:
+    """
+    Paces webhook requests by the limits the server reports.
+
+    Every response updates the bucket of its webhook from the
+    ``X-RateLimit-Remaining`` and ``X-RateLimit-Reset-After`` (or
+    ``X-RateLimit-Reset``) headers. Webhooks that share an
+    ``X-RateLimit-Bucket`` share one bucket. Once a bucket is used up,
+    requests wait for its reset instead of provoking a 429. All webhooks
+    together are also spaced to ``max_requests_per_second`` so that a global
+    limit is never reached.
+
+    A 429 still returned is retried after its ``Retry-After`` delay, or the
+    ``retry_after`` field of a Discord response body, plus random jitter. A
+    global 429 pauses every webhook. The limiter is thread-safe and meant to
+    be shared by all channels.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        max_retry_after: float = 60.0,
+        jitter: float = 0.1,
+        max_requests_per_second: Optional[float] = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        wall_clock: Callable[[], float] = time.time,
+        rand: Callable[[], float] = random.random,
+    ) -> None:
+        """
+        Initialize webhook rate limiter.
+
+        Args:
+            max_retries: Retries of a request answered with 429.
+            max_retry_after: Longest server-requested delay to wait for before giving up.
+            jitter: Fraction of each retry delay added at random.
+            max_requests_per_second: Limit across all webhooks, or None for no limit.
+            clock: Monotonic clock in seconds.
+            sleep: Function used to wait.
+            wall_clock: Function returning the current UNIX time.
+            rand: Function returning a random float in [0, 1).
+
+        Raises:
+            ValueError: If a setting is out of range.
+        """
+        if max_retries < 0:
+            raise ValueError("max_retries must be non-negative")
+        if max_retry_after <= 0:
+            raise ValueError("max_retry_after must be positive")
+        if jitter < 0:
+            raise ValueError("jitter must be non-negative")
+        if max_requests_per_second is not None and max_requests_per_second <= 0:
+            raise ValueError("max_requests_per_second must be positive")
+
+        self.max_retries = max_retries
+        self.max_retry_after = max_retry_after
+        self.jitter = jitter
+        self._interval = 1.0 / max_requests_per_second if max_requests_per_second else 0.0
+        self._clock = clock
+        self._sleep = sleep
+        self._wall_clock = wall_clock
+        self._rand = rand
+        self._lock = threading.Lock()
+        self._bucket_of: Dict[str, str] = {}
+        self._buckets: Dict[str, _Bucket] = {}
+        self._global_until = 0.0
+        self._next_slot = 0.0
+
+    def post(self, session: Any, url: str, payload: dict, timeout: float) -> Any:
+        """
+        POST a payload, waiting for rate limits and retrying 429 responses.
+
+        Args:
+            session: HTTP session with a requests-compatible ``post``.
+            url: Webhook URL.
+            payload: JSON payload.
+            timeout: Request timeout in seconds.
+
+        Returns:
+            The last response. It is still a 429 when retries run out or the
+            server asks for a longer delay than max_retry_after.
+        """
+        for attempt in range(self.max_retries + 1):
+            self.acquire(url)
+            response = session.post(url, json=payload, timeout=timeout)
+            if not self.should_retry(url, response, attempt):
+                return response
+        return response
+
+    def acquire(self, url: str) -> None:
+        """
+        Wait until a request to a webhook is allowed and reserve it.
+
+        Args:
+            url: Webhook URL.
+        """
+        while True:
+            wait = self.try_acquire(url)
+            if wait <= 0:
+                return
+            self._sleep(wait)
+
+    def try_acquire(self, url: str) -> float:
+        """
+        Reserve a request to a webhook if it is allowed now, without waiting.
+
+        Args:
+            url: Webhook URL.
+
+        Returns:
+            0.0 if the request was reserved, otherwise the seconds to wait
+            before trying again.
+        """
+        with self._lock:
+            now = self._clock()
+            bucket = self._bucket(url)
+            if bucket.remaining is not None and bucket.reset_at <= now:
+                bucket.remaining = None
+            ready_at = max(self._global_until, self._next_slot)
+            if bucket.remaining == 0:
+                ready_at = max(ready_at, bucket.reset_at)
+            if ready_at > now:
+                return ready_at - now
+            if bucket.remaining is not None:
+                bucket.remaining -= 1
+            self._next_slot = now + self._interval
+            return 0.0
+
+    def should_retry(self, url: str, response: Any, attempt: int) -> bool:
+        """
+        Record a response and decide whether its request should be retried.
+
+        The webhook's bucket is updated from the response headers. A 429 is
+        retried unless retries have run out or the server asks for a delay
+        longer than max_retry_after; its delay, plus jitter, is applied to
+        the bucket (or to every webhook for a global limit) so that the next
+        ``acquire`` waits for it.
+
+        Args:
+            url: Webhook URL.
+            response: Response with ``status_code``, ``headers`` and ``json()``.
+            attempt: Zero-based number of the attempt that got the response.
+
+        Returns:
+            Whether the request should be sent again.
+        """
+        headers = _headers_of(response)
+        self.update(url, headers)
+        if getattr(response, "status_code", None) != TOO_MANY_REQUESTS:
+            return False
+
+        delay, is_global = _retry_after(response, headers, self._wall_clock())
+        if attempt >= self.max_retries or delay > self.max_retry_after:
+            logger.error(f"Webhook still rate limited after {attempt + 1} attempts (retry after {delay:.1f}s)")
+            return False
+
+        delay *= 1 + self.jitter * self._rand()
+        logger.warning(
+            f"Webhook rate limited{' globally' if is_global else ''}; retrying in {delay:.2f}s"
+        )
+        with self._lock:
+            until = self._clock() + delay
+            if is_global:
+                self._global_until = max(self._global_until, until)
+            else:
+                bucket = self._bucket(url)
+                bucket.remaining = 0
+                bucket.reset_at = max(bucket.reset_at, until)
+        return True
+
+    def update(self, url: str, headers: Mapping[str, str]) -> None:
+        """
+        Update the bucket of a webhook from response headers.
+
+        Args:
+            url: Webhook URL.
+            headers: Response headers.
+        """
+        lowered = {name.lower(): value for name, value in headers.items()}
+        remaining = _number(lowered.get("x-ratelimit-remaining"))
+        reset_after = _number(lowered.get("x-ratelimit-reset-after"))
+        if reset_after is None:
+            reset = _number(lowered.get("x-ratelimit-reset"))
+            if reset is not None:
+                reset_after = max(reset - self._wall_clock(), 0.0)
+
+        with self._lock:
+            bucket_id = lowered.get("x-ratelimit-bucket")
+            if bucket_id and self._bucket_of.get(url) != bucket_id:
+                self._bucket_of[url] = bucket_id
+                self._buckets.setdefault(bucket_id, _Bucket())
+            if remaining is None or reset_after is None:
+                return
+            bucket = self._bucket(url)
+            bucket.remaining = int(remaining)
+            bucket.reset_at = self._clock() + reset_after
+
+    def _bucket(self, url: str) -> _Bucket:
+        """Get the bucket of a webhook. Must be called with the lock held."""
+        bucket_id = self._bucket_of.get(url, url)
+        return self._buckets.setdefault(bucket_id, _Bucket())
+
+
+def _headers_of(response: Any) -> Mapping[str, str]:
+    """Get the headers of a response, or an empty mapping if it has none."""
+    headers = getattr(response, "headers", None)
+    return headers if isinstance(headers, Mapping) else {}
+
+
+def _number(value: Optional[str]) -> Optional[float]:
+    """Parse a numeric header value."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _retry_after(response: Any, headers: Mapping[str, str], now: float) -> Tuple[float, bool]:
+    """
+    Get the delay requested by a 429 response.
+
+    Args:
+        response: 429 response.
+        headers: Its headers.
+        now: Current UNIX time, for a ``Retry-After`` given as an HTTP date.
+
+    Returns:
+        Tuple of (delay in seconds, whether the limit is global)
+    """
+    lowered = {name.lower(): value for name, value in headers.items()}
+    is_global = (
+        str(lowered.get("x-ratelimit-global", "")).lower() == "true"
+        or str(lowered.get("x-ratelimit-scope", "")).lower() == "global"
+    )
+
+    try:
+        body = response.json()
+    except Exception:
+        body = None
+    if isinstance(body, dict):
+        is_global = is_global or bool(body.get("global"))
+        delay = _number(body.get("retry_after"))
+        if delay is not None:
+            return max(delay, 0.0), is_global
+
+    value = lowered.get("retry-after")
+    delay = _number(value)
+    if delay is None and value:
+        try:
+            delay = email.utils.parsedate_to_datetime(value).timestamp() - now
+        except (TypeError, ValueError):
+            delay = None
+    if delay is None:
+        delay = _number(lowered.get("x-ratelimit-reset-after"))
+    return max(delay if delay is not None else 1.0, 0.0), is_global
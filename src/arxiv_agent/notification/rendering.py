@@ -0,0 +1,141 @@
+"""Render-once formatting of digest entries for chat platforms."""
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+# This module only depends on the standard library so the legacy notifier
+# in ``src/notifier.py`` can share it.
+
+
+class Dialect(str, Enum):
+    """Text formatting understood by a chat platform."""
+    SLACK = "slack"
+    DISCORD = "discord"
+    PLAIN = "plain"
+
+
+_BOLD_MARKERS = {Dialect.SLACK: "*", Dialect.DISCORD: "**", Dialect.PLAIN: ""}
+
+
+def emphasize(text: str, dialect: Dialect) -> str:
+    """
+    Format text as bold in a dialect.
+
+    Args:
+        text: Text to format
+        dialect: Target dialect
+
+    Returns:
+        Bold-formatted text; plain text is returned unchanged
+    """
+    marker = _BOLD_MARKERS[dialect]
+    return f"{marker}{text}{marker}"
+
+
+@dataclass(frozen=True)
+class Fragment:
+    """Platform-neutral digest entry: a bold heading followed by plain lines."""
+    heading: str
+    lines: Tuple[str, ...] = ()
+
+    def render(self, bold: Callable[[str], str], number: Optional[int] = None) -> str:
+        """
+        Render the entry.
+
+        Args:
+            bold: Function formatting the heading as bold
+            number: Position in the digest, prefixed to the heading if given
+
+        Returns:
+            Entry text ending with a newline
+        """
+        heading = self.heading if number is None else f"{number}. {self.heading}"
+        return "\n".join((bold(heading), *self.lines)) + "\n"
+
+
+@dataclass
+class _CachedFragment:
+    """A fragment and its rendered text by (dialect, number)."""
+    fragment: Fragment
+    texts: Dict[Tuple[Dialect, Optional[int]], str] = field(default_factory=dict)
+
+
+class FragmentCache:
+    """
+    Memoizes digest entries across channels and digests.
+
+    Each entry's fragment is built once per content key, and its text once
+    per dialect and position, so the same summaries sent to many channels
+    or digests are formatted only once. The least recently used entries are
+    evicted beyond ``max_entries``. The cache is thread-safe.
+    """
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        """
+        Initialize fragment cache.
+
+        Args:
+            max_entries: Maximum number of content keys kept.
+
+        Raises:
+            ValueError: If max_entries is not positive.
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, _CachedFragment]" = OrderedDict()
+
+    def render(
+        self,
+        key: Hashable,
+        build: Callable[[], Fragment],
+        dialect: Dialect,
+        number: Optional[int] = None,
+    ) -> str:
+        """
+        Get the text of an entry, building and rendering it on first use.
+
+        Args:
+            key: Key identifying the entry's content
+            build: Function building the fragment on a miss
+            dialect: Target dialect
+            number: Position in the digest, if numbered
+
+        Returns:
+            Entry text ending with a newline
+        """
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                text = cached.texts.get((dialect, number))
+                if text is not None:
+                    self.hits += 1
+                    return text
+
+        # Build outside the lock; a concurrent miss only renders twice.
+        fragment = cached.fragment if cached is not None else build()
+        text = fragment.render(lambda heading: emphasize(heading, dialect), number)
+        with self._lock:
+            self.misses += 1
+            cached = self._entries.setdefault(key, _CachedFragment(fragment))
+            cached.texts[(dialect, number)] = text
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return text
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Process-wide cache shared by every notifier.
+SHARED_FRAGMENT_CACHE = FragmentCache()
@@ -1,18 +1,45 @@
 """Slack notification adapter."""
+from typing import Optional
+import requests
 from .base_webhook_notifier import BaseWebhookNotifier
+from .chunker import SLACK_MESSAGE_LIMIT
+from .rate_limiter import WebhookRateLimiter
+from .rendering import Dialect, emphasize
 
 
 class SlackNotifier(BaseWebhookNotifier):
     """Slack webhook notifier."""
 
-    def __init__(self):
+    message_limit = SLACK_MESSAGE_LIMIT
+    dialect = Dialect.SLACK
+
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        timeout: float = 10,
+        rate_limiter: Optional[WebhookRateLimiter] = None,
+        webhook_url: Optional[str] = None,
+    ):
         """
         Initialize Slack notifier.
 
+        Args:
+            session: Pooled HTTP session; a process-wide session is used if None
+            timeout: Request timeout in seconds
+            rate_limiter: Rate limiter pacing requests; a process-wide one is used if None
+            webhook_url: Webhook URL; read from SLACK_WEBHOOK_URL if None
+
         Raises:
-            ValueError: If SLACK_WEBHOOK_URL environment variable is not set
+            ValueError: If no webhook URL is given and SLACK_WEBHOOK_URL is not set
         """
-        super().__init__('SLACK_WEBHOOK_URL', 'Slack')
+        super().__init__(
+            'SLACK_WEBHOOK_URL',
+            'Slack',
+            session=session,
+            timeout=timeout,
+            rate_limiter=rate_limiter,
+            webhook_url=webhook_url,
+        )
 
     def _build_payload(self, message: str) -> dict:
         """
@@ -36,4 +63,4 @@ class SlackNotifier(BaseWebhookNotifier):
         Returns:
             Bold-formatted text
         """
-        return f"*{text}*"
+        return emphasize(text, Dialect.SLACK)
@@ -0,0 +1,21 @@
+"""Staged pipeline module."""
+from arxiv_agent.pipeline.executor import Pipeline, PipelineCancelled, Stage, StageMetrics
+from arxiv_agent.pipeline.stages import (
+    collection_stage,
+    notification_stage,
+    ranking_stage,
+    summarization_stage,
+    summarize_paper,
+)
+
+__all__ = [
+    "Pipeline",
+    "PipelineCancelled",
+    "Stage",
+    "StageMetrics",
+    "collection_stage",
+    "notification_stage",
+    "ranking_stage",
+    "summarization_stage",
+    "summarize_paper",
+]
@@ -0,0 +1,311 @@
+"""Staged executor connecting pipeline stages with bounded queues."""
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of a stage's input; one is queued per downstream worker.
+_END = object()
+# How often blocked workers check for cancellation, in seconds.
+_POLL_INTERVAL = 0.05
+
+
+class PipelineCancelled(Exception):
+    """Raised by ``Pipeline.run`` when the pipeline was cancelled."""
+
+
+@dataclass
+class Stage:
+    """
+    One step of a pipeline.
+
+    ``fn`` maps one input to an iterable of outputs, so a stage may expand
+    (a search yields many papers), filter (yield nothing) or transform its
+    input. A ``collect`` stage instead waits for its whole input and is
+    called once with the list, e.g. to rank candidates or send a digest.
+
+    I/O-bound stages run ``fn`` on ``workers`` threads. With
+    ``processes=True`` the calls go to a process pool of that size instead,
+    for CPU-bound work; ``fn`` and its items must then be picklable.
+    """
+    name: str
+    fn: Callable[[Any], Iterable[Any]]
+    workers: int = 1
+    queue_size: int = 16
+    collect: bool = False
+    processes: bool = False
+    # Cancel the whole pipeline when fn raises, instead of skipping the item.
+    stop_on_error: bool = False
+
+    def __post_init__(self) -> None:
+        if self.workers <= 0:
+            raise ValueError(f"stage {self.name}: workers must be positive")
+        if self.queue_size <= 0:
+            raise ValueError(f"stage {self.name}: queue_size must be positive")
+        if self.collect and self.workers != 1:
+            raise ValueError(f"stage {self.name}: a collect stage runs on one worker")
+
+
+@dataclass
+class StageMetrics:
+    """Throughput and queue statistics of one stage."""
+    name: str
+    items_in: int = 0
+    items_out: int = 0
+    errors: int = 0
+    busy_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+
+    @property
+    def throughput(self) -> float:
+        """Inputs processed per second since the stage started."""
+        return self.items_in / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def report(self) -> str:
+        """Format the metrics as one line for logs."""
+        return (
+            f"{self.name}: {self.items_in} in, {self.items_out} out, {self.errors} errors, "
+            f"{self.throughput:.1f}/s, busy {self.busy_seconds:.2f}s, max queue {self.max_queue_depth}"
+        )
+
+
+class _StageRuntime:
+    """Queue, workers and metrics of a stage during one run."""
+
+    def __init__(self, stage: Stage) -> None:
+        self.stage = stage
+        self.inbox: "queue.Queue[Any]" = queue.Queue(maxsize=stage.queue_size)
+        self.metrics = StageMetrics(stage.name)
+        self.lock = threading.Lock()
+        self.running = stage.workers
+        self.started = 0.0
+        self.pool: Optional[Executor] = None
+
+
+class Pipeline:
+    """
+    Runs stages concurrently, connected by bounded queues.
+
+    Every stage has its own workers, and each stage's input queue holds at
+    most ``queue_size`` items, so a slow stage makes the stages before it
+    block instead of buffering without bound. ``cancel`` stops every stage
+    at its next item. Items that fail a stage are logged, counted and
+    skipped unless the stage has ``stop_on_error``.
+    """
+
+    def __init__(self, stages: List[Stage]) -> None:
+        """
+        Initialize pipeline.
+
+        Args:
+            stages: Stages in processing order
+
+        Raises:
+            ValueError: If no stages are given
+        """
+        if not stages:
+            raise ValueError("a pipeline needs at least one stage")
+
+        self.stages = stages
+        self._cancelled = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._runtimes: List[_StageRuntime] = []
+        self._results: "queue.Queue[Any]" = queue.Queue()
+
+    def cancel(self) -> None:
+        """Stop every stage; ``run`` then raises PipelineCancelled."""
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the pipeline was cancelled."""
+        return self._cancelled.is_set()
+
+    def metrics(self) -> List[StageMetrics]:
+        """
+        Get the metrics of every stage of the current or last run.
+
+        Returns:
+            Metrics in stage order
+        """
+        metrics = []
+        for runtime in self._runtimes:
+            with runtime.lock:
+                runtime.metrics.queue_depth = runtime.inbox.qsize()
+                if runtime.running:
+                    runtime.metrics.elapsed_seconds = time.monotonic() - runtime.started
+                metrics.append(StageMetrics(**vars(runtime.metrics)))
+        return metrics
+
+    def run(self, items: Iterable[Any]) -> List[Any]:
+        """
+        Feed items through every stage and collect the outputs of the last.
+
+        Items are fed from the calling thread, which blocks while the first
+        stage's queue is full.
+
+        Args:
+            items: Inputs of the first stage
+
+        Returns:
+            Outputs of the last stage, in completion order
+
+        Raises:
+            PipelineCancelled: If the pipeline was cancelled
+            Exception: The error of a stage with ``stop_on_error``
+        """
+        self._runtimes = [_StageRuntime(stage) for stage in self.stages]
+        self._results = queue.Queue()
+        threads = []
+        try:
+            for index, runtime in enumerate(self._runtimes):
+                runtime.started = time.monotonic()
+                if runtime.stage.processes:
+                    runtime.pool = ProcessPoolExecutor(max_workers=runtime.stage.workers)
+                for worker in range(runtime.stage.workers):
+                    thread = threading.Thread(
+                        target=self._work, args=(index,), name=f"{runtime.stage.name}-{worker}", daemon=True
+                    )
+                    thread.start()
+                    threads.append(thread)
+
+            first = self._runtimes[0]
+            for item in items:
+                if not self._put(first, item):
+                    break
+            for _ in range(first.stage.workers):
+                self._put(first, _END)
+
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(_POLL_INTERVAL)
+        except BaseException:
+            # Feeding failed or was interrupted; stop the workers too.
+            self.cancel()
+            raise
+        finally:
+            for runtime in self._runtimes:
+                if runtime.pool is not None:
+                    runtime.pool.shutdown(cancel_futures=True)
+
+        for metrics in self.metrics():
+            logger.info(f"Stage {metrics.report()}")
+        if self._error is not None:
+            raise self._error
+        if self.cancelled:
+            raise PipelineCancelled("pipeline was cancelled")
+
+        results = []
+        while not self._results.empty():
+            results.append(self._results.get_nowait())
+        return results
+
+    def _work(self, index: int) -> None:
+        """Worker loop of a stage."""
+        runtime = self._runtimes[index]
+        stage = runtime.stage
+        collected: List[Any] = []
+        while not self.cancelled:
+            try:
+                item = runtime.inbox.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+            if item is _END:
+                if stage.collect and not self._process(index, collected):
+                    return
+                self._finish(index)
+                return
+
+            with runtime.lock:
+                runtime.metrics.items_in += 1
+            if stage.collect:
+                collected.append(item)
+            elif not self._process(index, item):
+                return
+
+    def _process(self, index: int, item: Any) -> bool:
+        """
+        Apply a stage to one input and pass its outputs on.
+
+        Returns:
+            Whether the worker should keep running
+        """
+        runtime = self._runtimes[index]
+        stage = runtime.stage
+        started = time.monotonic()
+        try:
+            if runtime.pool is not None:
+                outputs = runtime.pool.submit(_call, stage.fn, item).result()
+            else:
+                outputs = stage.fn(item)
+            outputs = list(outputs) if outputs is not None else []
+        except Exception as e:
+            with runtime.lock:
+                runtime.metrics.errors += 1
+                runtime.metrics.busy_seconds += time.monotonic() - started
+            if stage.stop_on_error:
+                logger.error(f"Stage {stage.name} failed; cancelling pipeline: {e}")
+                self._error = self._error or e
+                self._cancelled.set()
+                return False
+            logger.error(f"Stage {stage.name} failed on an item: {e}")
+            return True
+
+        with runtime.lock:
+            runtime.metrics.busy_seconds += time.monotonic() - started
+            runtime.metrics.items_out += len(outputs)
+        for output in outputs:
+            if not self._emit(index, output):
+                return False
+        return True
+
+    def _finish(self, index: int) -> None:
+        """Record a finished worker; the last one ends the next stage's input."""
+        runtime = self._runtimes[index]
+        with runtime.lock:
+            runtime.running -= 1
+            last = runtime.running == 0
+            if last:
+                runtime.metrics.elapsed_seconds = time.monotonic() - runtime.started
+        if last and index + 1 < len(self._runtimes):
+            downstream = self._runtimes[index + 1]
+            for _ in range(downstream.stage.workers):
+                self._put(downstream, _END)
+
+    def _emit(self, index: int, output: Any) -> bool:
+        """Pass an output to the next stage, or to the results after the last."""
+        if index + 1 == len(self._runtimes):
+            self._results.put(output)
+            return True
+        return self._put(self._runtimes[index + 1], output)
+
+    def _put(self, runtime: _StageRuntime, item: Any) -> bool:
+        """
+        Block until a stage's queue has room, unless the pipeline is cancelled.
+
+        Returns:
+            Whether the item was queued
+        """
+        while not self.cancelled:
+            try:
+                runtime.inbox.put(item, timeout=_POLL_INTERVAL)
+            except queue.Full:
+                continue
+            if item is not _END:
+                with runtime.lock:
+                    runtime.metrics.max_queue_depth = max(runtime.metrics.max_queue_depth, runtime.inbox.qsize())
+            return True
+        return False
+
+
+def _call(fn: Callable[[Any], Iterable[Any]], item: Any) -> List[Any]:
+    """Call a stage function in a worker process and materialize its outputs."""
+    outputs = fn(item)
+    return list(outputs) if outputs is not None else []
@@ -0,0 +1,136 @@
+"""Pipeline stages wrapping the collection, ranking, summarization and notification steps."""
+import logging
+from typing import List, Optional
+from arxiv_agent.collection.arxiv_client import ArxivClient
+from arxiv_agent.collection.models import Paper
+from arxiv_agent.history import BasePaperHistory
+from arxiv_agent.journal import WorkJournal
+from arxiv_agent.notification.notifier import Notifier
+from arxiv_agent.ranking import RelevanceRanker
+from arxiv_agent.summarization.base_summarizer import BaseSummarizer
+from arxiv_agent.summarization.models import Summary
+from .executor import Stage
+
+logger = logging.getLogger(__name__)
+
+
+def summarize_paper(summarizer: BaseSummarizer, paper: Paper, journal: Optional[WorkJournal]) -> List[Summary]:
+    """
+    Summarize one paper, recording progress in the journal when enabled.
+
+    A summary recovered from an interrupted run is reused instead of being
+    generated again. Failures are logged and journaled, not raised.
+
+    Args:
+        summarizer: Summarizer to use
+        paper: Paper to summarize
+        journal: Work journal, or None when journaling is disabled
+
+    Returns:
+        The summary, or an empty list if summarization failed
+    """
+    if journal is not None:
+        recovered = journal.recovered_summary(paper.arxiv_id)
+        if recovered is not None:
+            logger.info(f"Reusing journaled summary for {paper.arxiv_id}")
+            return [recovered]
+        journal.start(paper.arxiv_id)
+
+    try:
+        summary = summarizer.summarize(paper)
+    except Exception as e:
+        logger.error(f"Failed to summarize paper {paper.arxiv_id}: {e}")
+        if journal is not None:
+            journal.fail(paper.arxiv_id, str(e))
+        return []
+
+    if journal is not None:
+        journal.complete(summary)
+    return [summary]
+
+
+def collection_stage(
+    client: ArxivClient,
+    keywords: List[str],
+    history: Optional[BasePaperHistory] = None,
+    workers: int = 1,
+) -> Stage:
+    """
+    Build a stage searching arXiv; each input is a list of categories.
+
+    Args:
+        client: arXiv client
+        keywords: Keywords to search for
+        history: History of processed papers to skip, if any
+        workers: Searches run concurrently
+
+    Returns:
+        Stage emitting the papers found
+    """
+    return Stage(
+        "collect",
+        lambda categories: client.search_papers(categories=categories, keywords=keywords, history=history),
+        workers=workers,
+    )
+
+
+def ranking_stage(ranker: RelevanceRanker, top_k: int, min_score: float = 0.0) -> Stage:
+    """
+    Build a stage ranking all collected papers at once.
+
+    Args:
+        ranker: Relevance ranker
+        top_k: Maximum papers kept
+        min_score: Minimum relevance score kept
+
+    Returns:
+        Stage emitting the kept papers, most relevant first
+    """
+    return Stage(
+        "rank",
+        lambda papers: [paper for paper, _ in ranker.rank(papers, top_k=top_k, min_score=min_score)],
+        collect=True,
+    )
+
+
+def summarization_stage(
+    summarizer: BaseSummarizer,
+    journal: Optional[WorkJournal] = None,
+    workers: int = 4,
+    queue_size: int = 16,
+) -> Stage:
+    """
+    Build a stage summarizing papers concurrently.
+
+    Summarization waits on the model API, so papers are summarized on
+    threads sharing the summarizer, its key pool and the journal.
+
+    Args:
+        summarizer: Summarizer to use
+        journal: Work journal, or None when journaling is disabled
+        workers: Papers summarized concurrently
+        queue_size: Papers waiting for a worker before collection blocks
+
+    Returns:
+        Stage emitting one summary per summarized paper
+    """
+    return Stage(
+        "summarize",
+        lambda paper: summarize_paper(summarizer, paper, journal),
+        workers=workers,
+        queue_size=queue_size,
+    )
+
+
+def notification_stage(notifier: Notifier, follow_up: bool = False) -> Stage:
+    """
+    Build a stage sending all summaries as one digest.
+
+    Args:
+        notifier: Notifier sending to the enabled channels
+        follow_up: Whether the digest follows up on an earlier one
+
+    Returns:
+        Stage emitting the delivery report
+    """
+    return Stage("notify", lambda summaries: [notifier.send_all(summaries, follow_up=follow_up)], collect=True)
@@ -0,0 +1,5 @@
+"""API quota accounting module."""
+from arxiv_agent.quota.quota_ledger import QuotaLedger, QuotaUsage
+from arxiv_agent.quota.run_planner import RunPlan, RunPlanner
+
+__all__ = ["QuotaLedger", "QuotaUsage", "RunPlan", "RunPlanner"]
@@ -0,0 +1,142 @@
+"""Persistent ledger of API usage per model and UTC day."""
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QuotaUsage:
+    """API usage of one model on one day."""
+    requests: int = 0
+    tokens: int = 0
+    summaries: int = 0
+
+    def add(self, other: "QuotaUsage") -> None:
+        """Accumulate another usage record."""
+        self.requests += other.requests
+        self.tokens += other.tokens
+        self.summaries += other.summaries
+
+
+class QuotaLedger:
+    """
+    Records requests and tokens consumed per model per UTC day.
+
+    Usage recorded by this process is kept as a delta and merged into the
+    ledger file on save, so runs that overlap do not overwrite each other's
+    counts. The file is replaced atomically and days older than
+    ``retention_days`` are dropped.
+    """
+
+    def __init__(
+        self,
+        ledger_file: str,
+        retention_days: int = 7,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize quota ledger.
+
+        Args:
+            ledger_file: Path to the ledger JSON file.
+            retention_days: Number of days of history to keep.
+            clock: Function returning the current UNIX time.
+        """
+        self._ledger_file = Path(ledger_file)
+        self._retention_days = retention_days
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._saved: Dict[str, Dict[str, QuotaUsage]] = self._read()
+        self._pending: Dict[Tuple[str, str], QuotaUsage] = {}
+
+    def today(self) -> str:
+        """Get the current UTC date."""
+        return datetime.fromtimestamp(self._clock(), timezone.utc).date().isoformat()
+
+    def record(self, model: str, requests: int = 1, tokens: int = 0, summaries: int = 0) -> None:
+        """
+        Record usage for the current UTC day.
+
+        Args:
+            model: Model name.
+            requests: Number of API requests.
+            tokens: Number of tokens consumed.
+            summaries: Number of summaries completed.
+        """
+        with self._lock:
+            usage = self._pending.setdefault((self.today(), model), QuotaUsage())
+            usage.add(QuotaUsage(requests=requests, tokens=tokens, summaries=summaries))
+
+    def usage(self, model: str) -> QuotaUsage:
+        """
+        Get today's usage of a model across all runs.
+
+        Args:
+            model: Model name.
+
+        Returns:
+            Usage recorded today, including this run's unsaved usage.
+        """
+        day = self.today()
+        with self._lock:
+            total = QuotaUsage()
+            total.add(self._saved.get(day, {}).get(model, QuotaUsage()))
+            total.add(self._pending.get((day, model), QuotaUsage()))
+            return total
+
+    def save(self) -> None:
+        """
+        Merge this run's usage into the ledger file.
+
+        Logs error if save fails but does not raise exception to prevent
+        disrupting main application flow.
+        """
+        with self._lock:
+            if not self._pending:
+                return
+            ledger = self._read()
+            for (day, model), usage in self._pending.items():
+                ledger.setdefault(day, {}).setdefault(model, QuotaUsage()).add(usage)
+
+            cutoff = (
+                datetime.fromtimestamp(self._clock(), timezone.utc).date()
+                - timedelta(days=self._retention_days)
+            ).isoformat()
+            ledger = {day: models for day, models in ledger.items() if day > cutoff}
+
+            data = {
+                day: {model: asdict(usage) for model, usage in models.items()}
+                for day, models in sorted(ledger.items())
+            }
+            tmp_file = self._ledger_file.with_name(self._ledger_file.name + ".tmp")
+            try:
+                self._ledger_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
+                os.replace(tmp_file, self._ledger_file)
+            except OSError as e:
+                logger.error(f"Failed to save quota ledger: {e}")
+                return
+            self._saved = ledger
+            self._pending = {}
+
+    def _read(self) -> Dict[str, Dict[str, QuotaUsage]]:
+        """Read the ledger file."""
+        if not self._ledger_file.exists():
+            return {}
+        try:
+            data = json.loads(self._ledger_file.read_text(encoding="utf-8"))
+            return {
+                day: {model: QuotaUsage(**usage) for model, usage in models.items()}
+                for day, models in data.items()
+            }
+        except (OSError, json.JSONDecodeError, TypeError, AttributeError) as e:
+            logger.error(f"Failed to read quota ledger: {e}. Starting with empty ledger.")
+            return {}
@@ -0,0 +1,112 @@
+"""Per-run summarization budget planning."""
+import logging
+import math
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, List, Optional
+from arxiv_agent.collection.models import Paper
+from .quota_ledger import QuotaLedger
+
+logger = logging.getLogger(__name__)
+
+_SECONDS_PER_DAY = 86400
+
+
+@dataclass
+class RunPlan:
+    """Papers this run may summarize with the API and papers that must wait."""
+    selected: List[Paper] = field(default_factory=list)
+    deferred: List[Paper] = field(default_factory=list)
+    budget_requests: int = 0
+
+
+class RunPlanner:
+    """
+    Decides how many papers a run may summarize within the daily quota.
+
+    The remaining daily budget is read from the quota ledger, minus a fixed
+    headroom, and split evenly between this run and the runs still scheduled
+    for the rest of the UTC day. The cost of a paper is estimated from today's
+    requests and tokens per summary, so section regeneration and long
+    abstracts are accounted for.
+    """
+
+    def __init__(
+        self,
+        ledger: QuotaLedger,
+        model: str,
+        requests_per_day: int,
+        tokens_per_day: Optional[int] = None,
+        runs_per_day: int = 1,
+        headroom_requests: int = 0,
+        default_tokens_per_summary: int = 2000,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize run planner.
+
+        Args:
+            ledger: Quota ledger
+            model: Model whose quota is planned
+            requests_per_day: Daily request limit
+            tokens_per_day: Daily token limit, if any
+            runs_per_day: Scheduled runs per UTC day, assumed evenly spaced
+            headroom_requests: Requests always left unused
+            default_tokens_per_summary: Token estimate before any usage is recorded
+            clock: Function returning the current UNIX time
+
+        Raises:
+            ValueError: If limits are not positive
+        """
+        if requests_per_day <= 0:
+            raise ValueError("requests_per_day must be positive")
+        if runs_per_day <= 0:
+            raise ValueError("runs_per_day must be positive")
+
+        self.ledger = ledger
+        self.model = model
+        self.requests_per_day = requests_per_day
+        self.tokens_per_day = tokens_per_day
+        self.runs_per_day = runs_per_day
+        self.headroom_requests = headroom_requests
+        self.default_tokens_per_summary = default_tokens_per_summary
+        self._clock = clock
+
+    def plan(self, papers: List[Paper]) -> RunPlan:
+        """
+        Select the papers to summarize in this run.
+
+        Args:
+            papers: Papers in priority order
+
+        Returns:
+            Run plan keeping the highest-priority papers that fit the budget
+        """
+        usage = self.ledger.usage(self.model)
+        shares = 1 + self._later_runs()
+
+        requests_per_summary = max(usage.requests / usage.summaries, 1.0) if usage.summaries else 1.0
+        remaining = self.requests_per_day - self.headroom_requests - usage.requests
+        budget_requests = max(remaining // shares, 0)
+        count = int(budget_requests // requests_per_summary)
+
+        if self.tokens_per_day is not None:
+            tokens_per_summary = usage.tokens / usage.summaries if usage.summaries else self.default_tokens_per_summary
+            token_budget = max((self.tokens_per_day - usage.tokens) // shares, 0)
+            count = min(count, int(token_budget // max(tokens_per_summary, 1)))
+
+        plan = RunPlan(selected=papers[:count], deferred=papers[count:], budget_requests=budget_requests)
+        logger.info(
+            f"Quota plan for {self.model}: {usage.requests}/{self.requests_per_day} requests used today, "
+            f"{budget_requests} budgeted for this run ({shares - 1} later runs), "
+            f"{len(plan.selected)} papers selected, {len(plan.deferred)} deferred"
+        )
+        return plan
+
+    def _later_runs(self) -> int:
+        """Count scheduled runs left in the current UTC day after this one."""
+        moment = datetime.fromtimestamp(self._clock(), timezone.utc)
+        elapsed = moment.hour * 3600 + moment.minute * 60 + moment.second
+        interval = _SECONDS_PER_DAY / self.runs_per_day
+        return max(self.runs_per_day - 1 - math.floor(elapsed / interval), 0)
@@ -0,0 +1,4 @@
+"""Relevance ranking module."""
+from arxiv_agent.ranking.relevance_ranker import RelevanceRanker
+
+__all__ = ["RelevanceRanker"]
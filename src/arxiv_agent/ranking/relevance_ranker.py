@@ -0,0 +1,228 @@
+"""BM25 relevance ranking of papers against an interest profile."""
+import logging
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from arxiv_agent.collection.models import Paper
+from arxiv_agent.utils.text import STOPWORDS
+
+logger = logging.getLogger(__name__)
+
+# Tokens are hashed from their first _HASH_WIDTH bytes plus their length.
+_HASH_WIDTH = 24
+_HASH_MIX = np.array(
+    [0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9], dtype=np.uint64
+)
+_BYTE_MASKS = np.ascontiguousarray(
+    (np.arange(_HASH_WIDTH)[None, :] < np.arange(_HASH_WIDTH + 1)[:, None]).astype(np.uint8) * np.uint8(255)
+).view(np.uint64)
+
+
+def _hash_tokens(texts: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Tokenize texts and hash every token, entirely with vectorized operations.
+
+    Tokens are maximal runs of lowercase ASCII letters, digits and non-ASCII
+    bytes, with hyphens and apostrophes allowed between them. This matches
+    ``arxiv_agent.utils.text.tokenize`` for Latin text; CJK runs are kept as
+    single tokens instead of being split into bigrams.
+
+    Args:
+        texts: Texts to tokenize
+
+    Returns:
+        Tuple of (token hashes, document index of each token)
+    """
+    corpus = "\x00".join(texts).lower().encode("utf-8")
+    # A leading separator guarantees token boundaries alternate start/end.
+    data = np.frombuffer(b"\x00" + corpus + bytes(_HASH_WIDTH), dtype=np.uint8)
+
+    word = (data >= 128) | ((data >= 97) & (data <= 122)) | ((data >= 48) & (data <= 57))
+    is_token = word.copy()
+    joiner = (data == 45) | (data == 39)
+    is_token[1:-1] |= joiner[1:-1] & word[:-2] & word[2:]
+
+    boundaries = np.flatnonzero(is_token[1:] != is_token[:-1]) + 1
+    starts = boundaries[0::2]
+    lengths = boundaries[1::2] - starts
+
+    words = sliding_window_view(data, _HASH_WIDTH)[starts].view(np.uint64)
+    words &= _BYTE_MASKS[np.minimum(lengths, _HASH_WIDTH)]
+    hashes = (words * _HASH_MIX).sum(axis=1, dtype=np.uint64) ^ lengths.astype(np.uint64)
+
+    separators = np.flatnonzero(data[1:len(corpus) + 1] == 0) + 1
+    counts = np.diff(np.searchsorted(starts, separators), prepend=0, append=len(starts))
+    doc_index = np.repeat(np.arange(len(texts)), counts)
+    return hashes, doc_index
+
+
+class RelevanceRanker:
+    """
+    Scores papers against weighted keywords and exemplar abstracts.
+
+    Each keyword becomes a feature: single-word keywords match a token and
+    multi-word keywords match the exact token sequence. Exemplar abstracts add
+    their frequent terms as lower-weight features. Papers are scored with BM25
+    over a sparse (document, feature, count) representation built with NumPy,
+    so scoring never leaves vectorized code after the text is encoded.
+    """
+
+    def __init__(
+        self,
+        keyword_weights: Dict[str, float],
+        exemplars: Optional[List[str]] = None,
+        exemplar_weight: float = 0.5,
+        k1: float = 1.5,
+        b: float = 0.75,
+    ):
+        """
+        Initialize relevance ranker.
+
+        Args:
+            keyword_weights: Mapping of keyword (or phrase) to weight
+            exemplars: Abstracts representative of papers of interest
+            exemplar_weight: Weight of the most frequent exemplar term
+            k1: BM25 term frequency saturation
+            b: BM25 document length normalization (0-1)
+
+        Raises:
+            ValueError: If the profile has no usable terms or parameters are invalid
+        """
+        if k1 < 0:
+            raise ValueError("k1 must be non-negative")
+        if not (0 <= b <= 1):
+            raise ValueError("b must be between 0 and 1")
+
+        self.k1 = k1
+        self.b = b
+
+        term_ids: Dict[int, int] = {}
+        weights: Dict[Tuple[int, ...], float] = {}
+
+        keywords = list(keyword_weights)
+        if keywords:
+            hashes, doc_index = _hash_tokens(keywords)
+            for i, keyword in enumerate(keywords):
+                terms = hashes[doc_index == i].tolist()
+                if terms:
+                    key = tuple(term_ids.setdefault(h, len(term_ids)) for h in terms)
+                    weights[key] = weights.get(key, 0.0) + float(keyword_weights[keyword])
+
+        if exemplars:
+            hashes, _ = _hash_tokens(exemplars)
+            stop_hashes, _ = _hash_tokens(sorted(STOPWORDS))
+            unique, counts = np.unique(hashes[~np.isin(hashes, stop_hashes)], return_counts=True)
+            for h, count in zip(unique.tolist(), counts.tolist()):
+                key = (term_ids.setdefault(h, len(term_ids)),)
+                weights[key] = weights.get(key, 0.0) + exemplar_weight * count / counts.max()
+
+        if not weights:
+            raise ValueError("interest profile must contain at least one term")
+
+        # Single-term features reuse the term ID; phrases get IDs after all terms.
+        self._phrases = [key for key in weights if len(key) > 1]
+        self._feature_weights = np.zeros(len(term_ids) + len(self._phrases))
+        for key, weight in weights.items():
+            if len(key) == 1:
+                self._feature_weights[key[0]] += weight
+        for offset, phrase in enumerate(self._phrases):
+            self._feature_weights[len(term_ids) + offset] = weights[phrase]
+
+        hashes = np.fromiter(term_ids, dtype=np.uint64, count=len(term_ids))
+        order = np.argsort(hashes)
+        self._term_hashes = hashes[order]
+        self._term_ids = np.fromiter(term_ids.values(), dtype=np.int64, count=len(term_ids))[order]
+
+    def score(self, papers: List[Paper]) -> np.ndarray:
+        """
+        Compute BM25 relevance scores.
+
+        Args:
+            papers: Papers to score
+
+        Returns:
+            Array of scores aligned with papers
+        """
+        n = len(papers)
+        if n == 0:
+            return np.zeros(0)
+
+        hashes, doc_index = _hash_tokens([f"{p.title} {p.abstract}" for p in papers])
+        lengths = np.bincount(doc_index, minlength=n)
+
+        positions = np.minimum(np.searchsorted(self._term_hashes, hashes), len(self._term_hashes) - 1)
+        token_ids = np.where(self._term_hashes[positions] == hashes, self._term_ids[positions], -1)
+
+        known = token_ids >= 0
+        hit_docs = [doc_index[known]]
+        hit_features = [token_ids[known]]
+        phrase_base = len(self._term_ids)
+        for offset, phrase in enumerate(self._phrases):
+            starts = self._match_phrase(token_ids, doc_index, phrase)
+            hit_docs.append(doc_index[starts])
+            hit_features.append(np.full(len(starts), phrase_base + offset, dtype=np.int64))
+
+        n_features = len(self._feature_weights)
+        keys = np.concatenate(hit_docs) * n_features + np.concatenate(hit_features)
+        if keys.size == 0:
+            return np.zeros(n)
+
+        pairs, tf = np.unique(keys, return_counts=True)
+        docs, features = np.divmod(pairs, n_features)
+
+        df = np.bincount(features, minlength=n_features)
+        idf = np.log1p((n - df + 0.5) / (df + 0.5))
+
+        avg_length = max(lengths.mean(), 1.0)
+        norm = self.k1 * (1 - self.b + self.b * lengths[docs] / avg_length)
+        contributions = self._feature_weights[features] * idf[features] * tf * (self.k1 + 1) / (tf + norm)
+        return np.bincount(docs, weights=contributions, minlength=n)
+
+    def rank(self, papers: List[Paper], top_k: int, min_score: float = 0.0) -> List[Tuple[Paper, float]]:
+        """
+        Select the most relevant papers.
+
+        Args:
+            papers: Candidate papers
+            top_k: Maximum number of papers to return
+            min_score: Papers scoring at or below this value are dropped
+
+        Returns:
+            List of (paper, score) tuples sorted by descending score; ties keep
+            the input order
+
+        Raises:
+            ValueError: If top_k is not positive
+        """
+        if top_k <= 0:
+            raise ValueError("top_k must be positive")
+
+        scores = self.score(papers)
+        order = np.argsort(-scores, kind='stable')[:top_k]
+        ranked = [(papers[i], float(scores[i])) for i in order if scores[i] > min_score]
+        logger.info(f"Selected {len(ranked)} of {len(papers)} papers by relevance")
+        return ranked
+
+    @staticmethod
+    def _match_phrase(token_ids: np.ndarray, doc_index: np.ndarray, phrase: Tuple[int, ...]) -> np.ndarray:
+        """
+        Find start positions of a token sequence within documents.
+
+        Args:
+            token_ids: Term IDs of all tokens (-1 for terms outside the profile)
+            doc_index: Document index of each token
+            phrase: Term IDs of the phrase
+
+        Returns:
+            Array of start positions
+        """
+        span = len(phrase)
+        if len(token_ids) < span:
+            return np.zeros(0, dtype=np.int64)
+
+        limit = len(token_ids) - span + 1
+        mask = token_ids[:limit] == phrase[0]
+        for offset in range(1, span):
+            mask &= token_ids[offset:limit + offset] == phrase[offset]
+        mask &= doc_index[:limit] == doc_index[span - 1:limit + span - 1]
+        return np.flatnonzero(mask)
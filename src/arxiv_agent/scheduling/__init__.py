@@ -0,0 +1,5 @@
+"""Run scheduling module."""
+from arxiv_agent.scheduling.cron import ARXIV_ANNOUNCEMENTS, CronSchedule, announced_since
+from arxiv_agent.scheduling.deadline_scheduler import DeadlineScheduler, resolve_deadline
+
+__all__ = ["ARXIV_ANNOUNCEMENTS", "CronSchedule", "DeadlineScheduler", "announced_since", "resolve_deadline"]
@@ -0,0 +1,135 @@
+"""Cron schedules and arXiv announcement times."""
+from datetime import datetime, timedelta
+from typing import FrozenSet, Tuple
+from zoneinfo import ZoneInfo
+
+# arXiv announces new submissions at 20:00 US Eastern time, Sunday to Thursday.
+ARXIV_TIMEZONE = "America/New_York"
+ARXIV_ANNOUNCEMENT_SCHEDULE = "0 20 * * 0-4"
+
+# Field ranges of a five-field cron expression; day of week 7 is also Sunday.
+_FIELDS: Tuple[Tuple[str, int, int], ...] = (
+    ("minute", 0, 59),
+    ("hour", 0, 23),
+    ("day of month", 1, 31),
+    ("month", 1, 12),
+    ("day of week", 0, 7),
+)
+# Far enough to find any valid date, including February 29.
+_MAX_SEARCH_DAYS = 8 * 366
+
+
+def _parse_field(text: str, name: str, low: int, high: int) -> FrozenSet[int]:
+    """Parse one cron field such as "*/15", "1-5" or "0,30" into its values."""
+    values = set()
+    for part in text.split(","):
+        spec, _, step_text = part.partition("/")
+        try:
+            step = int(step_text) if step_text else 1
+            if spec == "*":
+                start, end = low, high
+            elif "-" in spec:
+                start_text, end_text = spec.split("-", 1)
+                start, end = int(start_text), int(end_text)
+            else:
+                start = int(spec)
+                end = high if step_text else start
+        except ValueError:
+            raise ValueError(f"invalid cron {name} field: {text}")
+        if step <= 0 or not low <= start <= end <= high:
+            raise ValueError(f"invalid cron {name} field: {text}")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+class CronSchedule:
+    """
+    Five-field cron expression ("minute hour day month weekday") in a timezone.
+
+    Fields accept ``*``, numbers, ranges, lists and steps. As in cron, when
+    both day of month and day of week are restricted, a day matching either
+    one matches.
+    """
+
+    def __init__(self, expression: str, timezone: str = "UTC") -> None:
+        """
+        Initialize cron schedule.
+
+        Args:
+            expression: Cron expression, e.g. "15 20 * * 0-4"
+            timezone: IANA timezone name the expression is evaluated in
+
+        Raises:
+            ValueError: If the expression is invalid
+        """
+        fields = expression.split()
+        if len(fields) != len(_FIELDS):
+            raise ValueError(f"cron expression must have 5 fields: {expression}")
+
+        self.expression = expression
+        self.timezone = ZoneInfo(timezone)
+        self._minutes, self._hours, self._days, self._months, weekdays = (
+            _parse_field(text, name, low, high) for text, (name, low, high) in zip(fields, _FIELDS)
+        )
+        # Python numbers weekdays from Monday = 0; cron from Sunday = 0.
+        self._weekdays = frozenset((day - 1) % 7 for day in weekdays)
+        self._any_day = fields[2] == "*"
+        self._any_weekday = fields[4] == "*"
+
+    def next_after(self, now: float) -> float:
+        """
+        Get the first scheduled time after a moment.
+
+        Args:
+            now: UNIX time
+
+        Returns:
+            UNIX time of the next run, strictly after ``now``
+
+        Raises:
+            ValueError: If the expression never matches, e.g. "0 0 31 2 *"
+        """
+        local = datetime.fromtimestamp(now, self.timezone)
+        start = local.replace(second=0, microsecond=0).replace(tzinfo=None) + timedelta(minutes=1)
+        day = start.replace(hour=0, minute=0)
+        for _ in range(_MAX_SEARCH_DAYS):
+            if self._matches_day(day):
+                for hour in sorted(self._hours):
+                    for minute in sorted(self._minutes):
+                        candidate = day.replace(hour=hour, minute=minute)
+                        if candidate < start:
+                            continue
+                        timestamp = candidate.replace(tzinfo=self.timezone).timestamp()
+                        if timestamp > now:
+                            return timestamp
+            day += timedelta(days=1)
+        raise ValueError(f"cron expression never matches: {self.expression}")
+
+    def _matches_day(self, day: datetime) -> bool:
+        """Check the month, day of month and day of week fields."""
+        if day.month not in self._months:
+            return False
+        day_match = day.day in self._days
+        weekday_match = day.weekday() in self._weekdays
+        if self._any_day or self._any_weekday:
+            return day_match and weekday_match
+        return day_match or weekday_match
+
+
+ARXIV_ANNOUNCEMENTS = CronSchedule(ARXIV_ANNOUNCEMENT_SCHEDULE, ARXIV_TIMEZONE)
+
+
+def announced_since(since: float, now: float) -> bool:
+    """
+    Check whether arXiv announced new papers between two moments.
+
+    Holidays without a mailing are not known and count as announcements.
+
+    Args:
+        since: UNIX time of the previous collection
+        now: Current UNIX time
+
+    Returns:
+        Whether an announcement fell in (since, now]
+    """
+    return ARXIV_ANNOUNCEMENTS.next_after(since) <= now
@@ -0,0 +1,130 @@
+"""Deadline tracking for time-boxed runs."""
+import logging
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterator, Optional
+from zoneinfo import ZoneInfo
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_deadline(at: str, timezone: str, now: float) -> float:
+    """
+    Resolve a wall-clock deadline to a timestamp.
+
+    The occurrence of ``at`` closest to ``now`` is used, so a run starting
+    shortly before or after the deadline gets today's deadline and a run
+    starting late in the evening gets the next morning's.
+
+    Args:
+        at: Deadline time of day as "HH:MM"
+        timezone: IANA timezone name of the deadline, e.g. "Asia/Tokyo"
+        now: Current UNIX time
+
+    Returns:
+        Deadline as UNIX time
+    """
+    hour, minute = (int(part) for part in at.split(":"))
+    local_now = datetime.fromtimestamp(now, ZoneInfo(timezone))
+    candidate = local_now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    candidates = [candidate + timedelta(days=offset) for offset in (-1, 0, 1)]
+    return min(candidates, key=lambda c: abs(c.timestamp() - now)).timestamp()
+
+
+class DeadlineScheduler:
+    """
+    Decides whether there is time left for another unit of work.
+
+    Latency of each stage is tracked as an exponentially weighted moving
+    average of the durations observed in this run, starting from configured
+    estimates. Work may start only if it, the stages that must follow it and
+    a safety margin all fit before the deadline.
+    """
+
+    def __init__(
+        self,
+        deadline: float,
+        estimates: Optional[Dict[str, float]] = None,
+        safety_margin: float = 60.0,
+        smoothing: float = 0.5,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize deadline scheduler.
+
+        Args:
+            deadline: Deadline as UNIX time
+            estimates: Initial latency estimate in seconds per stage name
+            safety_margin: Seconds kept free before the deadline
+            smoothing: Weight of the latest observation in the moving average (0-1]
+            clock: Function returning the current UNIX time
+
+        Raises:
+            ValueError: If smoothing is out of range
+        """
+        if not (0 < smoothing <= 1):
+            raise ValueError("smoothing must be between 0 and 1")
+
+        self.deadline = deadline
+        self.safety_margin = safety_margin
+        self.smoothing = smoothing
+        self._estimates: Dict[str, float] = dict(estimates or {})
+        self._clock = clock
+
+    def remaining(self) -> float:
+        """Get seconds left until the deadline."""
+        return self.deadline - self._clock()
+
+    def estimate(self, stage: str) -> float:
+        """
+        Get the expected latency of a stage.
+
+        Args:
+            stage: Stage name
+
+        Returns:
+            Estimated seconds (0 for stages never observed or configured)
+        """
+        return self._estimates.get(stage, 0.0)
+
+    def record(self, stage: str, seconds: float) -> None:
+        """
+        Record an observed stage latency.
+
+        Args:
+            stage: Stage name
+            seconds: Observed duration
+        """
+        previous = self._estimates.get(stage)
+        if previous is None:
+            self._estimates[stage] = seconds
+        else:
+            self._estimates[stage] = previous + self.smoothing * (seconds - previous)
+
+    @contextmanager
+    def timed(self, stage: str) -> Iterator[None]:
+        """
+        Measure the duration of a block and record it for a stage.
+
+        Args:
+            stage: Stage name
+        """
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self.record(stage, self._clock() - start)
+
+    def has_time_for(self, *stages: str) -> bool:
+        """
+        Check whether the given stages can still finish before the deadline.
+
+        Args:
+            stages: Stage names that would run back to back
+
+        Returns:
+            True if their estimated latency plus the safety margin fits
+        """
+        needed = sum(self.estimate(stage) for stage in stages) + self.safety_margin
+        return self.remaining() >= needed
@@ -0,0 +1,123 @@
+"""Resident serve mode running collection cycles on a schedule."""
+import logging
+import signal
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Optional
+from arxiv_agent.config.loader import load_config
+from arxiv_agent.config.models import Config
+from arxiv_agent.main import AgentSession
+from arxiv_agent.scheduling import CronSchedule, announced_since
+from arxiv_agent.utils.logger import setup_logger
+
+logger = logging.getLogger(__name__)
+
+
+class AgentDaemon:
+    """
+    Runs collection cycles at the times of a cron schedule.
+
+    One AgentSession serves every cycle, so clients, connection pools,
+    history and caches are created once instead of on every run. With
+    ``skip_without_announcement`` a scheduled cycle is skipped when arXiv
+    has not announced new papers since the previous one. A failed cycle is
+    logged and the daemon waits for the next scheduled time.
+
+    ``stop`` ends the daemon after the cycle in progress; the session's
+    journal and history are then flushed and closed.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        session: Optional[AgentSession] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize agent daemon.
+
+        Args:
+            config: Application configuration
+            session: Session running the cycles; created from config if None
+            clock: Function returning the current UNIX time
+        """
+        self.config = config
+        self.schedule = CronSchedule(config.serve.schedule, config.serve.timezone)
+        self.session = session or AgentSession(config)
+        self._clock = clock
+        self._stopped = threading.Event()
+        self._last_cycle: Optional[float] = None
+
+    def stop(self) -> None:
+        """Stop after the cycle in progress; safe to call from a signal handler."""
+        self._stopped.set()
+
+    def run(self) -> None:
+        """Run cycles until stopped, then close the session."""
+        try:
+            while not self._stopped.is_set():
+                next_run = self.schedule.next_after(self._clock())
+                logger.info(f"Next collection cycle at {datetime.fromtimestamp(next_run, self.schedule.timezone)}")
+                if self._stopped.wait(max(next_run - self._clock(), 0.0)):
+                    break
+                self.run_cycle()
+        finally:
+            logger.info("Shutting down; flushing journal and history")
+            self.session.close()
+
+    def run_cycle(self) -> bool:
+        """
+        Run one collection cycle unless arXiv has announced nothing new.
+
+        Returns:
+            Whether the cycle ran
+        """
+        now = self._clock()
+        if (
+            self.config.serve.skip_without_announcement
+            and self._last_cycle is not None
+            and not announced_since(self._last_cycle, now)
+        ):
+            logger.info("Skipping collection cycle: no arXiv announcement since the last cycle")
+            return False
+
+        self._last_cycle = now
+        try:
+            self.session.run_cycle()
+        except Exception as e:
+            logger.error(f"Collection cycle failed: {e}", exc_info=True)
+        return True
+
+
+def main() -> int:
+    """
+    Command line entry point.
+
+    Usage: python -m arxiv_agent.serve [config.yaml]
+
+    Returns:
+        Exit code (0 after a graceful shutdown, 1 for startup errors,
+        2 for invalid arguments)
+    """
+    if len(sys.argv) > 2:
+        print("Usage: python -m arxiv_agent.serve [config.yaml]", file=sys.stderr)
+        return 2
+
+    setup_logger()
+    try:
+        daemon = AgentDaemon(load_config(sys.argv[1] if len(sys.argv) > 1 else "config/default.yaml"))
+    except Exception as e:
+        logger.error(f"Application error: {e}", exc_info=True)
+        return 1
+
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(signum, lambda *_: daemon.stop())
+    logger.info(f"Serving with schedule '{daemon.schedule.expression}' ({daemon.config.serve.timezone})")
+    daemon.run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,360 @@
+"""Pool of API keys with per-key rate limit and quota tracking."""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+_WINDOW_SECONDS = 60.0
+
+
+class NoAvailableKeyError(RuntimeError):
+    """Raised when every key is out of daily quota or cooling down for too long."""
+
+
+def api_keys_from_env() -> List[str]:
+    """
+    Read Gemini API keys from the environment.
+
+    ``GEMINI_API_KEYS`` holds a comma-separated pool; ``GEMINI_API_KEY`` is
+    used as a single-key pool when it is not set.
+
+    Returns:
+        List of API keys (empty if none are set)
+    """
+    pooled = os.getenv('GEMINI_API_KEYS', '')
+    keys = [key.strip() for key in pooled.split(',') if key.strip()]
+    if keys:
+        return keys
+    single = os.getenv('GEMINI_API_KEY', '').strip()
+    return [single] if single else []
+
+
+@dataclass
+class _KeyState:
+    """Usage of one key."""
+    key: str
+    fingerprint: str
+    day: str
+    used_today: int = 0
+    remaining_daily: Optional[int] = None
+    cooldown_until: float = 0.0
+    consecutive_limits: int = 0
+    in_flight: int = 0
+    recent: Deque[float] = field(default_factory=deque)
+
+
+class ApiKeyPool:
+    """
+    Dispatches requests across several API keys.
+
+    Each request goes to the least-loaded healthy key: the one with the fewest
+    requests in flight and in the last minute, preferring keys with more daily
+    quota left. Keys that are rate limited are cooled down, using the server's
+    retry delay when given and exponential backoff otherwise; keys that run
+    out of daily quota rest until the next UTC day.
+
+    The daily usage of each key is persisted by key fingerprint, never the key
+    itself, so later runs on the same day start from the remaining quota.
+    Usage is saved at most every ``save_interval`` seconds and on ``close``,
+    not after every request; an exhausted daily quota is saved at once.
+    """
+
+    def __init__(
+        self,
+        keys: List[str],
+        requests_per_minute: Optional[int] = None,
+        requests_per_day: Optional[int] = None,
+        cooldown: float = 60.0,
+        max_cooldown: float = 3600.0,
+        max_wait: float = 120.0,
+        state_file: Optional[str] = None,
+        save_interval: float = 30.0,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initialize API key pool and load persisted quota state.
+
+        Args:
+            keys: API keys, one per project.
+            requests_per_minute: Per-key request limit per minute, if known.
+            requests_per_day: Per-key request limit per UTC day, if known.
+            cooldown: Base cooldown in seconds after a rate limit error.
+            max_cooldown: Upper bound for the cooldown in seconds.
+            max_wait: Longest time acquire() waits for a key to become available.
+            state_file: Path to persist remaining daily quota, or None.
+            save_interval: Maximum seconds usage changes stay unsaved.
+            clock: Function returning the current UNIX time.
+            sleep: Function used to wait for a key.
+
+        Raises:
+            ValueError: If no keys are given or limits are not positive.
+        """
+        if not keys:
+            raise ValueError("at least one API key is required")
+        if requests_per_minute is not None and requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        if requests_per_day is not None and requests_per_day <= 0:
+            raise ValueError("requests_per_day must be positive")
+
+        self._requests_per_minute = requests_per_minute
+        self._requests_per_day = requests_per_day
+        self._cooldown = cooldown
+        self._max_cooldown = max_cooldown
+        self._max_wait = max_wait
+        self._state_file = Path(state_file) if state_file else None
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._save_interval = save_interval
+        self._last_save = clock()
+        self._dirty = False
+
+        today = self._utc_day(clock())
+        self._keys = list(dict.fromkeys(keys))
+        self._states: Dict[str, _KeyState] = {
+            key: _KeyState(key=key, fingerprint=_fingerprint(key), day=today, remaining_daily=requests_per_day)
+            for key in self._keys
+        }
+        self._load()
+
+    @property
+    def keys(self) -> List[str]:
+        """API keys in the pool."""
+        return list(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _load(self) -> None:
+        """Restore today's usage of each key from the state file."""
+        if self._state_file is None or not self._state_file.exists():
+            return
+
+        try:
+            data = json.loads(self._state_file.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error(f"Failed to read key pool state: {e}. Starting with full quota.")
+            return
+
+        for state in self._states.values():
+            saved = data.get(state.fingerprint)
+            if not isinstance(saved, dict) or saved.get("day") != state.day:
+                continue
+            state.used_today = saved.get("used_today", 0)
+            state.remaining_daily = saved.get("remaining_daily", state.remaining_daily)
+            state.cooldown_until = saved.get("cooldown_until", 0.0)
+
+    def save(self) -> None:
+        """
+        Persist each key's usage for the current day.
+
+        Logs error if save fails but does not raise exception to prevent
+        disrupting main application flow.
+        """
+        if self._state_file is None:
+            return
+
+        with self._lock:
+            self._last_save = self._clock()
+            self._dirty = False
+            data = {
+                state.fingerprint: {
+                    "day": state.day,
+                    "used_today": state.used_today,
+                    "remaining_daily": state.remaining_daily,
+                    "cooldown_until": state.cooldown_until,
+                }
+                for state in self._states.values()
+            }
+
+        tmp_file = self._state_file.with_name(self._state_file.name + ".tmp")
+        try:
+            self._state_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            os.replace(tmp_file, self._state_file)
+        except OSError as e:
+            logger.error(f"Failed to save key pool state: {e}")
+
+    def close(self) -> None:
+        """Save usage recorded since the last save."""
+        with self._lock:
+            dirty = self._dirty
+        if dirty:
+            self.save()
+
+    def remaining(self) -> Dict[str, Optional[int]]:
+        """
+        Get the remaining daily quota of each key.
+
+        Returns:
+            Mapping of key fingerprint to remaining requests (None if unknown).
+        """
+        with self._lock:
+            self._roll_day(self._clock())
+            return {state.fingerprint: state.remaining_daily for state in self._states.values()}
+
+    def acquire(self) -> str:
+        """
+        Reserve the least-loaded healthy key for one request.
+
+        Waits when every key is only briefly unavailable (per-minute limit or
+        short cooldown).
+
+        Returns:
+            API key to use.
+
+        Raises:
+            NoAvailableKeyError: If no key becomes available within max_wait.
+        """
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._roll_day(now)
+                available = [s for s in self._states.values() if self._available_at(s, now) <= now]
+                if available:
+                    state = min(available, key=lambda s: (
+                        s.in_flight,
+                        len(s.recent),
+                        -(s.remaining_daily if s.remaining_daily is not None else float("inf")),
+                    ))
+                    state.in_flight += 1
+                    state.used_today += 1
+                    self._dirty = True
+                    state.recent.append(now)
+                    if state.remaining_daily is not None:
+                        state.remaining_daily -= 1
+                    return state.key
+
+                wait = min(self._available_at(s, now) for s in self._states.values()) - now
+
+            if wait > self._max_wait:
+                raise NoAvailableKeyError(
+                    f"All {len(self._keys)} API keys are out of quota or cooling down"
+                )
+            logger.info(f"All API keys are busy; waiting {wait:.1f}s")
+            self._sleep(wait)
+
+    def release(self, key: str, headers: Optional[Mapping[str, str]] = None) -> None:
+        """
+        Record a successful request.
+
+        Args:
+            key: Key returned by acquire().
+            headers: Response headers; ``x-ratelimit-*`` values refine the
+                tracked limits when present.
+        """
+        with self._lock:
+            state = self._states[key]
+            state.in_flight = max(state.in_flight - 1, 0)
+            state.consecutive_limits = 0
+            if headers:
+                self._apply_headers(state, headers)
+                self._dirty = True
+            due = self._save_due()
+        if due:
+            self.save()
+
+    def release_failed(self, key: str) -> None:
+        """
+        Record a request that failed for reasons unrelated to quota.
+
+        Args:
+            key: Key returned by acquire().
+        """
+        with self._lock:
+            state = self._states[key]
+            state.in_flight = max(state.in_flight - 1, 0)
+
+    def release_rate_limited(self, key: str, retry_after: Optional[float] = None, daily: bool = False) -> None:
+        """
+        Record a rate limit error and cool the key down.
+
+        Args:
+            key: Key returned by acquire().
+            retry_after: Delay in seconds requested by the server, if any.
+            daily: Whether the daily quota was exhausted.
+        """
+        with self._lock:
+            now = self._clock()
+            state = self._states[key]
+            state.in_flight = max(state.in_flight - 1, 0)
+            state.consecutive_limits += 1
+            if daily:
+                state.remaining_daily = 0
+                state.cooldown_until = self._next_utc_day(now)
+                logger.warning(f"API key {state.fingerprint} exhausted its daily quota")
+            else:
+                delay = retry_after
+                if delay is None:
+                    delay = self._cooldown * 2 ** (state.consecutive_limits - 1)
+                state.cooldown_until = now + min(delay, self._max_cooldown)
+                logger.warning(f"API key {state.fingerprint} rate limited; cooling down for {delay:.0f}s")
+            self._dirty = True
+            due = daily or self._save_due()
+        if due:
+            self.save()
+
+    def _save_due(self) -> bool:
+        """Check whether unsaved usage has waited for the save interval; called with the lock held."""
+        return self._dirty and self._clock() - self._last_save >= self._save_interval
+
+    def _available_at(self, state: _KeyState, now: float) -> float:
+        """Get the earliest time a key may be used."""
+        while state.recent and state.recent[0] <= now - _WINDOW_SECONDS:
+            state.recent.popleft()
+
+        available_at = max(state.cooldown_until, now)
+        if state.remaining_daily is not None and state.remaining_daily <= 0:
+            available_at = max(available_at, self._next_utc_day(now))
+        if self._requests_per_minute is not None and len(state.recent) >= self._requests_per_minute:
+            available_at = max(available_at, state.recent[0] + _WINDOW_SECONDS)
+        return available_at
+
+    def _apply_headers(self, state: _KeyState, headers: Mapping[str, str]) -> None:
+        """Update limits from ``x-ratelimit-*`` response headers."""
+        lowered = {name.lower(): value for name, value in headers.items()}
+        remaining = lowered.get("x-ratelimit-remaining-requests-day")
+        if remaining is not None and remaining.isdigit():
+            state.remaining_daily = int(remaining)
+        retry_after = lowered.get("retry-after")
+        if retry_after is not None:
+            try:
+                state.cooldown_until = self._clock() + float(retry_after)
+            except ValueError:
+                pass
+
+    def _roll_day(self, now: float) -> None:
+        """Reset daily usage when the UTC day changes."""
+        today = self._utc_day(now)
+        for state in self._states.values():
+            if state.day != today:
+                state.day = today
+                state.used_today = 0
+                state.remaining_daily = self._requests_per_day
+                state.consecutive_limits = 0
+
+    @staticmethod
+    def _utc_day(now: float) -> str:
+        """Get the UTC date of a timestamp."""
+        return datetime.fromtimestamp(now, timezone.utc).date().isoformat()
+
+    @staticmethod
+    def _next_utc_day(now: float) -> float:
+        """Get the timestamp of the next UTC midnight."""
+        today = datetime.fromtimestamp(now, timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        return (today + timedelta(days=1)).timestamp()
+
+
+def _fingerprint(key: str) -> str:
+    """Get a short, non-reversible identifier of a key."""
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:12]
@@ -0,0 +1,45 @@
+"""Base summarizer interface."""
+from abc import ABC, abstractmethod
+from typing import List
+from arxiv_agent.collection.models import Paper
+from .models import Summary
+
+
+class BaseSummarizer(ABC):
+    """Base class for summarization backends."""
+
+    @abstractmethod
+    def summarize(self, paper: Paper) -> Summary:
+        """
+        Generate summary for a paper.
+
+        Args:
+            paper: Paper to summarize
+
+        Returns:
+            Summary object
+
+        Raises:
+            Exception: If summarization fails
+        """
+        pass
+
+    def update(self, paper: Paper, previous: Summary, changes: List[str]) -> Summary:
+        """
+        Revise the summary of an earlier version of a paper.
+
+        Backends that can revise a summary more cheaply than writing a new one
+        override this; the default generates a full summary.
+
+        Args:
+            paper: New version of the paper
+            previous: Summary of the earlier version
+            changes: Abstract sentences added or changed in the new version
+
+        Returns:
+            Summary object
+
+        Raises:
+            Exception: If summarization fails
+        """
+        return self.summarize(paper)
@@ -0,0 +1,76 @@
+"""Summarizer that degrades to a secondary backend on failure."""
+import logging
+from typing import List
+from arxiv_agent.collection.models import Paper
+from .base_summarizer import BaseSummarizer
+from .models import Summary
+
+logger = logging.getLogger(__name__)
+
+
+class FallbackSummarizer(BaseSummarizer):
+    """
+    Tries a primary summarizer and falls back to a secondary one.
+
+    Fallback summaries are flagged as ``degraded`` so they are not cached
+    in place of a primary summary.
+    """
+
+    def __init__(self, primary: BaseSummarizer, fallback: BaseSummarizer):
+        """
+        Initialize fallback summarizer.
+
+        Args:
+            primary: Summarizer tried first (e.g., Gemini)
+            fallback: Summarizer used when the primary one fails
+        """
+        self.primary = primary
+        self.fallback = fallback
+
+    def summarize(self, paper: Paper) -> Summary:
+        """
+        Generate summary, falling back on primary failure.
+
+        Args:
+            paper: Paper to summarize
+
+        Returns:
+            Summary object
+
+        Raises:
+            Exception: If both summarizers fail
+        """
+        try:
+            return self.primary.summarize(paper)
+        except Exception as e:
+            logger.warning(
+                f"Primary summarizer failed for {paper.arxiv_id}: {e}. Using fallback."
+            )
+            summary = self.fallback.summarize(paper)
+            summary.degraded = True
+            return summary
+
+    def update(self, paper: Paper, previous: Summary, changes: List[str]) -> Summary:
+        """
+        Revise a summary, falling back on primary failure.
+
+        Args:
+            paper: New version of the paper
+            previous: Summary of the earlier version
+            changes: Abstract sentences added or changed in the new version
+
+        Returns:
+            Summary object
+
+        Raises:
+            Exception: If both summarizers fail
+        """
+        try:
+            return self.primary.update(paper, previous, changes)
+        except Exception as e:
+            logger.warning(
+                f"Primary summarizer failed to update {paper.arxiv_id}: {e}. Using fallback."
+            )
+            summary = self.fallback.update(paper, previous, changes)
+            summary.degraded = True
+            return summary
@@ -1,16 +1,24 @@
 """Gemini API client for summarization."""
-import os
+import json
 import logging
+import re
+from typing import List, Optional, Tuple
 from google import genai
-from google.genai import types
+from google.genai import errors, types
 from arxiv_agent.collection.models import Paper
-from .models import Summary
+from arxiv_agent.quota import QuotaLedger
+from .api_key_pool import ApiKeyPool, api_keys_from_env
+from .base_summarizer import BaseSummarizer
+from .models import OchiaiSections, Summary
 from .prompt_builder import PromptBuilder
+from .section_parser import is_sectioned, parse_sections, render_sections
 
 logger = logging.getLogger(__name__)
 
+_RETRY_DELAY = re.compile(r'"retryDelay":\s*"(\d+(?:\.\d+)?)s"')
 
-class GeminiClient:
+
+class GeminiClient(BaseSummarizer):
     """Client for generating summaries using Gemini API."""
 
     def __init__(
@@ -19,6 +27,9 @@ class GeminiClient:
         model_name: str,
         temperature: float,
         max_tokens: int,
+        section_retries: int = 1,
+        key_pool: Optional[ApiKeyPool] = None,
+        ledger: Optional[QuotaLedger] = None,
     ):
         """
         Initialize Gemini client.
@@ -28,13 +39,19 @@ class GeminiClient:
             model_name: Gemini model name
             temperature: Generation temperature (0-2)
             max_tokens: Maximum tokens to generate
+            section_retries: Attempts to regenerate sections missing from a summary
+            key_pool: Pool of API keys; defaults to the keys in GEMINI_API_KEYS
+                or GEMINI_API_KEY without known limits
+            ledger: Ledger recording requests and tokens used, if any
 
         Raises:
             ValueError: If GEMINI_API_KEY environment variable is not set
         """
-        api_key = os.getenv('GEMINI_API_KEY')
-        if not api_key:
-            raise ValueError("GEMINI_API_KEY environment variable is required")
+        if key_pool is None:
+            api_keys = api_keys_from_env()
+            if not api_keys:
+                raise ValueError("GEMINI_API_KEY environment variable is required")
+            key_pool = ApiKeyPool(api_keys)
 
         if not (0 <= temperature <= 2):
             raise ValueError("temperature must be between 0 and 2")
@@ -42,11 +59,17 @@ class GeminiClient:
         if max_tokens <= 0:
             raise ValueError("max_tokens must be positive")
 
-        self.client = genai.Client(api_key=api_key)
+        if section_retries < 0:
+            raise ValueError("section_retries must be non-negative")
+
+        self.key_pool = key_pool
+        self.clients = {key: genai.Client(api_key=key) for key in key_pool.keys}
+        self.ledger = ledger
         self.prompt_builder = prompt_builder
         self.model_name = model_name
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.section_retries = section_retries
 
     def summarize(self, paper: Paper) -> Summary:
         """
@@ -63,26 +86,169 @@ class GeminiClient:
         """
         prompt = self.prompt_builder.build(paper)
         logger.info(f"Generating summary for paper: {paper.arxiv_id}")
+        return self._generate(paper, prompt)
+
+    def update(self, paper: Paper, previous: Summary, changes: List[str]) -> Summary:
+        """
+        Revise the summary of an earlier version of a paper.
+
+        Only the previous summary and the changed abstract sentences are sent,
+        which keeps the prompt shorter than a full summarization request.
+
+        Args:
+            paper: New version of the paper
+            previous: Summary of the earlier version
+            changes: Abstract sentences added or changed in the new version
+
+        Returns:
+            Summary object
+
+        Raises:
+            Exception: If API call fails
+        """
+        prompt = self.prompt_builder.build_update(paper, previous.summary_text, changes)
+        logger.info(f"Updating summary for paper: {paper.arxiv_id} (from {previous.paper_id})")
+        return self._generate(paper, prompt)
+
+    def _generate(self, paper: Paper, prompt: str) -> Summary:
+        """
+        Call the API and wrap the response in a Summary.
+
+        Responses following the six-section format are parsed into sections.
+        Sections that are missing or were cut off at the token limit are
+        regenerated with a prompt asking for those sections only.
+
+        Args:
+            paper: Paper being summarized
+            prompt: Prompt to send
+
+        Returns:
+            Summary object
 
+        Raises:
+            Exception: If API call fails
+        """
         try:
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    temperature=self.temperature,
-                    max_output_tokens=self.max_tokens,
-                ),
-            )
+            summary_text, truncated = self._call(prompt)
+            sections = None
+            if is_sectioned(summary_text):
+                sections = parse_sections(summary_text, truncated)
+            elif truncated:
+                # Custom prompt templates without sections cannot be repaired partially.
+                logger.warning(f"Summary for {paper.arxiv_id} was truncated at max_tokens")
+
+            if sections is not None and sections.missing() and self.section_retries:
+                self._regenerate_missing(paper, sections)
+                summary_text = render_sections(sections)
 
-            summary_text = response.text
             logger.info(f"Summary generated for {paper.arxiv_id}")
+            if self.ledger is not None:
+                self.ledger.record(self.model_name, requests=0, summaries=1)
 
             return Summary(
                 paper_id=paper.arxiv_id,
                 title=paper.title,
                 summary_text=summary_text,
+                sections=sections,
             )
 
         except Exception as e:
             logger.error(f"Failed to generate summary for {paper.arxiv_id}: {e}")
             raise
+
+    def _regenerate_missing(self, paper: Paper, sections: OchiaiSections) -> None:
+        """
+        Fill in missing sections with targeted requests.
+
+        Args:
+            paper: Paper being summarized
+            sections: Parsed sections, updated in place
+        """
+        for attempt in range(1, self.section_retries + 1):
+            missing = sections.missing()
+            if not missing:
+                return
+            logger.warning(
+                f"Summary for {paper.arxiv_id} is missing sections {missing}; "
+                f"regenerating them (attempt {attempt})"
+            )
+            text, truncated = self._call(self.prompt_builder.build_sections(paper, missing))
+            regenerated = parse_sections(text, truncated)
+            for number in missing:
+                sections.set(number, regenerated.get(number))
+
+        if sections.missing():
+            logger.warning(f"Summary for {paper.arxiv_id} still lacks sections {sections.missing()}")
+
+    def _call(self, prompt: str) -> Tuple[str, bool]:
+        """
+        Send a prompt to the API using the least-loaded key.
+
+        A request rejected for quota is retried on another key.
+
+        Args:
+            prompt: Prompt to send
+
+        Returns:
+            Tuple of (response text, whether output stopped at max_tokens)
+
+        Raises:
+            NoAvailableKeyError: If every key is out of quota
+            Exception: If API call fails
+        """
+        for attempt in range(len(self.key_pool)):
+            key = self.key_pool.acquire()
+            try:
+                response = self.clients[key].models.generate_content(
+                    model=self.model_name,
+                    contents=prompt,
+                    config=types.GenerateContentConfig(
+                        temperature=self.temperature,
+                        max_output_tokens=self.max_tokens,
+                    ),
+                )
+            except errors.APIError as e:
+                if e.code != 429:
+                    self.key_pool.release_failed(key)
+                    self._record_usage(None)
+                    raise
+                retry_after, daily = _parse_quota_error(e)
+                self.key_pool.release_rate_limited(key, retry_after=retry_after, daily=daily)
+                if attempt == len(self.key_pool) - 1:
+                    raise
+                continue
+            except Exception:
+                self.key_pool.release_failed(key)
+                raise
+
+            http_response = getattr(response, 'sdk_http_response', None)
+            headers = getattr(http_response, 'headers', None)
+            self.key_pool.release(key, headers if isinstance(headers, dict) else None)
+            self._record_usage(response)
+
+            candidates = response.candidates or []
+            truncated = bool(candidates) and candidates[0].finish_reason == types.FinishReason.MAX_TOKENS
+            return response.text or "", truncated
+
+    def _record_usage(self, response: Optional[types.GenerateContentResponse]) -> None:
+        """Record a request and its token usage in the ledger."""
+        if self.ledger is None:
+            return
+        usage = getattr(response, 'usage_metadata', None)
+        tokens = getattr(usage, 'total_token_count', None)
+        self.ledger.record(self.model_name, tokens=tokens if isinstance(tokens, int) else 0)
+
+
+def _parse_quota_error(error: errors.APIError) -> Tuple[Optional[float], bool]:
+    """
+    Extract the retry delay and quota scope from a 429 error.
+
+    Args:
+        error: Rate limit error returned by the API
+
+    Returns:
+        Tuple of (retry delay in seconds or None, whether a per-day quota was hit)
+    """
+    details = json.dumps(error.details, ensure_ascii=False) if error.details else str(error)
+    match = _RETRY_DELAY.search(details)
+    return (float(match.group(1)) if match else None), "PerDay" in details
@@ -1,5 +1,29 @@
 """Domain models for summarization."""
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
+from typing import List, Optional
+
+
+@dataclass
+class OchiaiSections:
+    """Summary split into the six sections of the Ochiai format."""
+    overview: Optional[str] = None
+    novelty: Optional[str] = None
+    method: Optional[str] = None
+    validation: Optional[str] = None
+    discussion: Optional[str] = None
+    next_papers: Optional[str] = None
+
+    def get(self, number: int) -> Optional[str]:
+        """Get a section by its 1-based number."""
+        return getattr(self, fields(self)[number - 1].name)
+
+    def set(self, number: int, text: Optional[str]) -> None:
+        """Set a section by its 1-based number."""
+        setattr(self, fields(self)[number - 1].name, text)
+
+    def missing(self) -> List[int]:
+        """Get the 1-based numbers of empty sections."""
+        return [number for number in range(1, len(fields(self)) + 1) if not self.get(number)]
 
 
 @dataclass
@@ -8,3 +32,14 @@ class Summary:
     paper_id: str
     title: str
     summary_text: str
+    relevance_score: Optional[float] = None
+    related_ids: List[str] = field(default_factory=list)
+    sections: Optional[OchiaiSections] = None
+    pending: bool = False
+    # Produced by a fallback backend after the primary one failed.
+    degraded: bool = False
+
+    def __post_init__(self) -> None:
+        # Summaries restored from JSON carry sections as a plain dict.
+        if isinstance(self.sections, dict):
+            self.sections = OchiaiSections(**self.sections)
@@ -1,16 +1,49 @@
 """Prompt builder for summarization."""
+from typing import List
 from arxiv_agent.collection.models import Paper
+from .section_parser import SECTION_HEADINGS
+
+UPDATE_TEMPLATE = """以下は論文の旧版の要約です。新版の概要で追加・変更された文を反映し、同じ形式で要約を更新してください。
+変更がない観点はそのまま残してください。
+
+タイトル: {title}
+
+旧版の要約:
+{previous_summary}
+
+新版で追加・変更された文:
+{changes}
+"""
+
+SECTIONS_TEMPLATE = """以下の論文について、指定した観点だけを日本語で要約してください。
+番号と見出しはそのまま使い、他の観点は書かないでください。
+
+タイトル: {title}
+著者: {authors}
+概要: {abstract}
+
+{sections}
+"""
 
 
 class PromptBuilder:
     """Builder for summarization prompts."""
 
-    def __init__(self, template: str):
+    def __init__(
+        self,
+        template: str,
+        update_template: str = UPDATE_TEMPLATE,
+        sections_template: str = SECTIONS_TEMPLATE,
+    ):
         """
         Initialize prompt builder.
 
         Args:
             template: Prompt template with placeholders {title}, {authors}, {abstract}
+            update_template: Template for revising a previous summary with
+                placeholders {title}, {previous_summary}, {changes}
+            sections_template: Template for regenerating selected sections with
+                placeholders {title}, {authors}, {abstract}, {sections}
         """
         if not template.strip():
             raise ValueError("template must not be empty")
@@ -20,6 +53,8 @@ class PromptBuilder:
             raise ValueError(f"template must contain all placeholders: {required_placeholders}")
 
         self.template = template
+        self.update_template = update_template
+        self.sections_template = sections_template
 
     def build(self, paper: Paper) -> str:
         """
@@ -37,3 +72,39 @@ class PromptBuilder:
             authors=authors_str,
             abstract=paper.abstract,
         )
+
+    def build_update(self, paper: Paper, previous_summary: str, changes: List[str]) -> str:
+        """
+        Build prompt for revising the summary of an earlier paper version.
+
+        Args:
+            paper: New version of the paper
+            previous_summary: Summary text of the earlier version
+            changes: Abstract sentences added or changed in the new version
+
+        Returns:
+            Formatted prompt string
+        """
+        return self.update_template.format(
+            title=paper.title,
+            previous_summary=previous_summary,
+            changes="\n".join(f"- {sentence}" for sentence in changes),
+        )
+
+    def build_sections(self, paper: Paper, numbers: List[int]) -> str:
+        """
+        Build prompt for regenerating selected summary sections.
+
+        Args:
+            paper: Paper to summarize
+            numbers: 1-based numbers of the sections to generate
+
+        Returns:
+            Formatted prompt string
+        """
+        return self.sections_template.format(
+            title=paper.title,
+            authors=", ".join(paper.authors),
+            abstract=paper.abstract,
+            sections="\n".join(f"{n}. **{SECTION_HEADINGS[n - 1]}**" for n in numbers),
+        )
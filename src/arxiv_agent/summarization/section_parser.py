@@ -0,0 +1,94 @@
+"""Parsing and rendering of six-section (Ochiai format) summaries."""
+import re
+from typing import List, Tuple
+from .models import OchiaiSections
+
+SECTION_HEADINGS = (
+    "どんなもの?",
+    "先行研究と比べてどこがすごい?",
+    "技術や手法のキモはどこ?",
+    "どうやって有効だと検証した?",
+    "議論はある?",
+    "次に読むべき論文は?",
+)
+
+# A section starts with its number at the beginning of a line, optionally
+# preceded by Markdown heading or bold markers, e.g. "1. **どんなもの?**".
+_SECTION_START = re.compile(r"^[ \t>#*]*([1-6])[.．)）]", re.MULTILINE)
+_MARKUP = re.compile(r"[*_#>`\s\-:：]+")
+
+
+def parse_sections(text: str, truncated: bool = False) -> OchiaiSections:
+    """
+    Split a generated summary into its six sections.
+
+    Section numbers must increase, so numbered lists nested inside a section
+    are not mistaken for section headings. A section holding only its heading
+    counts as missing.
+
+    Args:
+        text: Generated summary text
+        truncated: Whether generation stopped at the output token limit, in
+            which case the last section found is treated as incomplete
+
+    Returns:
+        Parsed sections; sections not found are None
+    """
+    starts = _section_starts(text)
+    sections = OchiaiSections()
+    for i, (number, start) in enumerate(starts):
+        end = starts[i + 1][1] if i + 1 < len(starts) else len(text)
+        block = text[start:end].strip()
+        if _has_body(number, block):
+            sections.set(number, block)
+
+    if truncated and starts:
+        sections.set(starts[-1][0], None)
+    return sections
+
+
+def is_sectioned(text: str) -> bool:
+    """
+    Check whether a text follows the numbered section format at all.
+
+    Args:
+        text: Generated summary text
+
+    Returns:
+        True if at least two section headings are found
+    """
+    return len(_section_starts(text)) >= 2
+
+
+def render_sections(sections: OchiaiSections) -> str:
+    """
+    Join present sections back into a single summary text.
+
+    Args:
+        sections: Parsed sections
+
+    Returns:
+        Summary text with sections in order
+    """
+    blocks = [sections.get(number) for number in range(1, len(SECTION_HEADINGS) + 1)]
+    return "\n\n".join(block for block in blocks if block)
+
+
+def _section_starts(text: str) -> List[Tuple[int, int]]:
+    """Find (section number, offset) of section headings with increasing numbers."""
+    starts: List[Tuple[int, int]] = []
+    for match in _SECTION_START.finditer(text):
+        number = int(match.group(1))
+        if not starts or number > starts[-1][0]:
+            starts.append((number, match.start()))
+    return starts
+
+
+def _has_body(number: int, block: str) -> bool:
+    """Check whether a section block has content besides its number and heading."""
+    body = _SECTION_START.sub("", block, count=1)
+    body = _MARKUP.sub(" ", body).replace("？", "?").strip()
+    heading = SECTION_HEADINGS[number - 1]
+    if body.startswith(heading):
+        body = body[len(heading):]
+    return bool(body.strip())
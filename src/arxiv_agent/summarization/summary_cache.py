@@ -0,0 +1,362 @@
+"""Similarity-keyed cache of summaries for near-identical abstracts."""
+import difflib
+import json
+import logging
+import os
+import threading
+import zlib
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from arxiv_agent.collection.models import Paper
+from arxiv_agent.utils.text import split_sentences, tokenize
+from .base_summarizer import BaseSummarizer
+from .models import Summary
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedSummary:
+    """Summary stored together with the abstract it was generated from."""
+    abstract: str
+    summary: Summary
+
+
+@dataclass
+class SummaryCacheStats:
+    """Per-run cache statistics."""
+    reuse_threshold: float
+    update_threshold: float
+    lookups: int = 0
+    reused: int = 0
+    updated: int = 0
+    abstract_chars_saved: int = 0
+
+    @property
+    def hits(self) -> int:
+        """Lookups answered by reusing or updating a cached summary."""
+        return self.reused + self.updated
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups that were hits."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def report(self) -> str:
+        """Format the statistics as a single log line."""
+        return (
+            f"Summary cache (reuse >= {self.reuse_threshold}, update >= {self.update_threshold}): "
+            f"{self.hits}/{self.lookups} hits ({self.hit_ratio:.1%}), "
+            f"{self.reused} reused, {self.updated} updated, "
+            f"{self.hits} full summarizations avoided, "
+            f"{self.abstract_chars_saved} abstract characters not resent"
+        )
+
+
+class SummaryCache:
+    """
+    Persistent store of summaries keyed by abstract embeddings.
+
+    Abstracts are embedded locally as signed hashed word unigrams and bigrams,
+    L2-normalized, so cosine similarity is a single matrix-vector product over
+    all cached abstracts. On disk, embeddings are a raw ``float32`` matrix and
+    entries are newline-delimited JSON, both append-only.
+    """
+
+    def __init__(self, cache_dir: str, dimensions: int = 1024) -> None:
+        """
+        Initialize summary cache and load persisted entries.
+
+        Args:
+            cache_dir: Directory storing the cache files.
+            dimensions: Embedding dimensionality.
+
+        Raises:
+            ValueError: If dimensions is not positive.
+        """
+        if dimensions <= 0:
+            raise ValueError("dimensions must be positive")
+
+        self._cache_dir = Path(cache_dir)
+        self._dimensions = dimensions
+        self._matrix = np.zeros((0, dimensions), dtype=np.float32)
+        self._size = 0
+        self._entries: List[CachedSummary] = []
+        self._row_of: Dict[str, int] = {}
+        self._saved_count = 0
+        self._load()
+
+    @property
+    def _embedding_file(self) -> Path:
+        return self._cache_dir / "embeddings.f32"
+
+    @property
+    def _entries_file(self) -> Path:
+        return self._cache_dir / "entries.jsonl"
+
+    @property
+    def _meta_file(self) -> Path:
+        return self._cache_dir / "meta.json"
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _load(self) -> None:
+        """
+        Load persisted entries.
+
+        Starts empty when the cache is missing, unreadable or was built with a
+        different dimensionality. Rows left incomplete by a crash are dropped.
+        """
+        if not self._meta_file.exists():
+            logger.info(f"Summary cache not found: {self._cache_dir}. Starting with empty cache.")
+            return
+
+        try:
+            meta = json.loads(self._meta_file.read_text(encoding="utf-8"))
+            if meta.get("dimensions") != self._dimensions:
+                logger.warning("Summary cache was built with different dimensions. Starting with empty cache.")
+                return
+            embeddings = np.fromfile(self._embedding_file, dtype=np.float32)
+            entries = []
+            with self._entries_file.open("r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.endswith("\n"):
+                        break
+                    record = json.loads(line)
+                    entries.append(CachedSummary(record["abstract"], Summary(**record["summary"])))
+        except (OSError, json.JSONDecodeError, TypeError, KeyError, ValueError) as e:
+            logger.error(f"Failed to read summary cache: {e}. Starting with empty cache.")
+            return
+
+        count = min(len(embeddings) // self._dimensions, len(entries))
+        if count * self._dimensions != len(embeddings) or count != len(entries):
+            self._truncate(entries[:count], count)
+        self._matrix = embeddings[:count * self._dimensions].reshape(count, self._dimensions).copy()
+        self._size = count
+        self._entries = entries[:count]
+        self._row_of = {entry.summary.paper_id: row for row, entry in enumerate(self._entries)}
+        self._saved_count = count
+        logger.info(f"Loaded {count} entries from summary cache.")
+
+    def embed(self, text: str) -> np.ndarray:
+        """
+        Embed a text as a normalized hashed n-gram vector.
+
+        Args:
+            text: Text to embed.
+
+        Returns:
+            ``float32`` vector of length ``dimensions`` (all zeros for empty text).
+        """
+        tokens = tokenize(text)
+        ngrams = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        vector = np.zeros(self._dimensions, dtype=np.float32)
+        if not ngrams:
+            return vector
+
+        hashes = np.fromiter(
+            (zlib.crc32(ngram.encode("utf-8")) for ngram in ngrams), dtype=np.uint32, count=len(ngrams)
+        )
+        signs = np.where(hashes & 0x80000000, -1.0, 1.0).astype(np.float32)
+        np.add.at(vector, hashes % self._dimensions, signs)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def nearest(self, embedding: np.ndarray) -> Optional[Tuple[CachedSummary, float]]:
+        """
+        Find the cached summary with the most similar abstract.
+
+        Args:
+            embedding: Embedding returned by ``embed``.
+
+        Returns:
+            Tuple of (cached summary, cosine similarity), or None if the cache is empty.
+        """
+        if self._size == 0:
+            return None
+        similarities = self._matrix[:self._size] @ embedding
+        row = int(np.argmax(similarities))
+        return self._entries[row], float(similarities[row])
+
+    def add(self, abstract: str, summary: Summary, embedding: np.ndarray) -> None:
+        """
+        Insert a summary. Papers already in the cache are ignored.
+
+        Args:
+            abstract: Abstract the summary was generated from.
+            summary: Generated summary.
+            embedding: Embedding of the abstract.
+        """
+        if summary.paper_id in self._row_of:
+            return
+        if self._size == len(self._matrix):
+            grown = np.zeros((max(16, 2 * len(self._matrix)), self._dimensions), dtype=np.float32)
+            grown[:self._size] = self._matrix[:self._size]
+            self._matrix = grown
+        self._matrix[self._size] = embedding
+        self._row_of[summary.paper_id] = self._size
+        self._entries.append(CachedSummary(abstract, summary))
+        self._size += 1
+
+    def save(self) -> None:
+        """
+        Append entries inserted since the last save.
+
+        Logs error if save fails but does not raise exception to prevent
+        disrupting main application flow.
+        """
+        new_rows = self._size - self._saved_count
+        if new_rows == 0:
+            return
+
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            if not self._meta_file.exists():
+                tmp_file = self._meta_file.with_name(self._meta_file.name + ".tmp")
+                tmp_file.write_text(json.dumps({"dimensions": self._dimensions}), encoding="utf-8")
+                os.replace(tmp_file, self._meta_file)
+            # Embeddings first: on a crash, rows without an entry are dropped on load.
+            with self._embedding_file.open("ab") as f:
+                f.write(self._matrix[self._saved_count:self._size].tobytes())
+            with self._entries_file.open("a", encoding="utf-8") as f:
+                f.write("".join(_entry_line(entry) for entry in self._entries[self._saved_count:]))
+            self._saved_count = self._size
+            logger.info(f"Saved {new_rows} new entries to summary cache.")
+        except OSError as e:
+            logger.error(f"Failed to save summary cache: {e}")
+
+    def _truncate(self, entries: List[CachedSummary], count: int) -> None:
+        """Drop rows left half-written by a crash so later appends stay aligned."""
+        logger.warning(f"Repairing summary cache truncated by an interrupted save ({count} rows kept).")
+        try:
+            with self._embedding_file.open("r+b") as f:
+                f.truncate(count * self._dimensions * np.dtype(np.float32).itemsize)
+            tmp_file = self._entries_file.with_name(self._entries_file.name + ".tmp")
+            tmp_file.write_text("".join(_entry_line(entry) for entry in entries), encoding="utf-8")
+            os.replace(tmp_file, self._entries_file)
+        except OSError as e:
+            logger.error(f"Failed to repair summary cache: {e}")
+
+
+class CachingSummarizer(BaseSummarizer):
+    """
+    Reuses summaries of near-identical abstracts instead of summarizing again.
+
+    A paper whose abstract is at least ``reuse_threshold`` similar to a cached
+    one gets the cached summary as is. Between ``update_threshold`` and
+    ``reuse_threshold`` the wrapped summarizer only revises the cached summary
+    with the changed sentences. Anything less similar is summarized in full.
+    Degraded summaries from a fallback backend are returned but not cached,
+    so later papers still reach the primary backend. Concurrent calls share
+    the cache safely; the wrapped summarizer runs outside the lock.
+    """
+
+    def __init__(
+        self,
+        summarizer: BaseSummarizer,
+        cache: SummaryCache,
+        reuse_threshold: float = 0.95,
+        update_threshold: float = 0.8,
+    ):
+        """
+        Initialize caching summarizer.
+
+        Args:
+            summarizer: Summarizer used on cache misses and for updates
+            cache: Summary cache
+            reuse_threshold: Minimum cosine similarity to reuse a summary as is
+            update_threshold: Minimum cosine similarity to update a summary
+
+        Raises:
+            ValueError: If thresholds are not 0 < update <= reuse <= 1
+        """
+        if not (0 < update_threshold <= reuse_threshold <= 1):
+            raise ValueError("thresholds must satisfy 0 < update_threshold <= reuse_threshold <= 1")
+
+        self.summarizer = summarizer
+        self.cache = cache
+        self.stats = SummaryCacheStats(reuse_threshold=reuse_threshold, update_threshold=update_threshold)
+        self._lock = threading.Lock()
+
+    def summarize(self, paper: Paper) -> Summary:
+        """
+        Generate summary, reusing or updating a cached one when possible.
+
+        Args:
+            paper: Paper to summarize
+
+        Returns:
+            Summary object
+
+        Raises:
+            Exception: If the wrapped summarizer fails
+        """
+        embedding = self.cache.embed(paper.abstract)
+        with self._lock:
+            match = self.cache.nearest(embedding)
+            self.stats.lookups += 1
+
+        if match is not None and match[1] >= self.stats.reuse_threshold:
+            cached, similarity = match
+            logger.info(
+                f"Reusing summary of {cached.summary.paper_id} for {paper.arxiv_id} (similarity {similarity:.3f})"
+            )
+            # Relevance and related papers belong to this run; the text and its
+            # parsed sections carry over.
+            summary = Summary(
+                paper_id=paper.arxiv_id,
+                title=paper.title,
+                summary_text=cached.summary.summary_text,
+                sections=replace(cached.summary.sections) if cached.summary.sections else None,
+            )
+            with self._lock:
+                self.stats.reused += 1
+                self.stats.abstract_chars_saved += len(paper.abstract)
+        elif match is not None and match[1] >= self.stats.update_threshold:
+            cached, similarity = match
+            changes = _changed_sentences(cached.abstract, paper.abstract)
+            logger.info(
+                f"Updating summary of {cached.summary.paper_id} for {paper.arxiv_id} "
+                f"(similarity {similarity:.3f}, {len(changes)} changed sentences)"
+            )
+            summary = self.summarizer.update(paper, cached.summary, changes)
+            with self._lock:
+                self.stats.updated += 1
+                self.stats.abstract_chars_saved += max(len(paper.abstract) - sum(map(len, changes)), 0)
+        else:
+            summary = self.summarizer.summarize(paper)
+
+        if not summary.degraded:
+            with self._lock:
+                self.cache.add(paper.abstract, summary, embedding)
+        return summary
+
+    def close(self) -> None:
+        """Persist new cache entries, log the run's cache statistics and reset them."""
+        self.cache.save()
+        with self._lock:
+            logger.info(self.stats.report())
+            self.stats = SummaryCacheStats(
+                reuse_threshold=self.stats.reuse_threshold,
+                update_threshold=self.stats.update_threshold,
+            )
+
+
+def _changed_sentences(old: str, new: str) -> List[str]:
+    """Get sentences of the new abstract that are not in the old one."""
+    old_sentences = split_sentences(old)
+    new_sentences = split_sentences(new)
+    matcher = difflib.SequenceMatcher(a=old_sentences, b=new_sentences, autojunk=False)
+    changes = []
+    for tag, _, _, j1, j2 in matcher.get_opcodes():
+        if tag in ("replace", "insert"):
+            changes.extend(new_sentences[j1:j2])
+    return changes
+
+
+def _entry_line(entry: CachedSummary) -> str:
+    """Serialize a cache entry as a JSON line."""
+    return json.dumps({"abstract": entry.abstract, "summary": asdict(entry.summary)}, ensure_ascii=False) + "\n"
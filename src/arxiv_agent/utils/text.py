@@ -0,0 +1,55 @@
+"""Text tokenization helpers shared by local text-processing components."""
+import re
+from typing import List
+
+_LATIN_TOKEN = re.compile(r"[a-z0-9]+(?:[-'][a-z0-9]+)*")
+_CJK_RUN = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff]+")
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+(?=[A-Z0-9"(\[])|(?<=[。！？])')
+
+STOPWORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has',
+    'have', 'in', 'is', 'it', 'its', 'of', 'on', 'or', 'that', 'the', 'their',
+    'this', 'to', 'we', 'which', 'with', 'our', 'these', 'can', 'such',
+})
+
+
+def tokenize(text: str, drop_stopwords: bool = True) -> List[str]:
+    """
+    Tokenize text into index terms.
+
+    Latin text is split into lowercase words in document order, while CJK runs
+    are appended as character bigrams since they have no word separators.
+
+    Args:
+        text: Text to tokenize
+        drop_stopwords: Whether to remove common English function words
+
+    Returns:
+        List of tokens
+    """
+    tokens = _LATIN_TOKEN.findall(text.lower())
+    if drop_stopwords:
+        tokens = [t for t in tokens if t not in STOPWORDS]
+    for run in _CJK_RUN.findall(text):
+        if len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    Split text into sentences.
+
+    Handles both Latin punctuation followed by whitespace and Japanese
+    full-width terminators, which are not followed by spaces.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        List of non-empty sentences
+    """
+    normalized = " ".join(text.split())
+    return [s.strip() for s in _SENTENCE_BOUNDARY.split(normalized) if s.strip()]
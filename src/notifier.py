@@ -2,87 +2,146 @@ import logging
 import os
 
 import requests
-
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.arxiv_agent.notification.chunker import (
+    DISCORD_MESSAGE_LIMIT,
+    SLACK_MESSAGE_LIMIT,
+    chunk_messages,
+)
+from src.arxiv_agent.notification.rate_limiter import WebhookRateLimiter
+from src.arxiv_agent.notification.rendering import SHARED_FRAGMENT_CACHE, Dialect, Fragment
 from src.config import NotificationConfig
 from src.models import SummarizedPaper
 
 logger = logging.getLogger(__name__)
 
-DISCORD_MESSAGE_LIMIT = 2000
+REQUEST_TIMEOUT = 30
+
+
+def _create_session(pool_size: int = 4, max_retries: int = 2) -> requests.Session:
+    # One keep-alive session per notify() call: split Discord messages and
+    # both channels reuse open connections instead of a handshake per POST.
+    # Only connection errors and 502/503 are retried since the webhook never
+    # saw those requests; a read timeout or 504 may follow a posted message.
+    retry = Retry(
+        total=max_retries,
+        read=0,
+        backoff_factor=0.5,
+        status_forcelist=(502, 503),
+        allowed_methods=frozenset({"POST"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 def _format_paper_text(paper: SummarizedPaper) -> str:
-    return (
-        f"*{paper.paper.title}*\n"
-        f"著者: {', '.join(paper.paper.authors)}\n"
-        f"URL: {paper.paper.url}\n\n"
-        f"{paper.summary}\n"
+    # Slack and Discord get the same text, so each paper is rendered once
+    # per process and the second channel reuses it.
+    key = (
+        "paper", paper.paper.arxiv_id, paper.paper.title, tuple(paper.paper.authors), paper.paper.url, paper.summary
     )
+    return SHARED_FRAGMENT_CACHE.render(key, lambda: _paper_fragment(paper), Dialect.SLACK)
 
 
-def _send_slack(webhook_url: str, papers: list[SummarizedPaper]) -> None:
-    header = ":newspaper: *本日のarXiv論文要約*\n\n"
-    body_parts = [_format_paper_text(p) for p in papers]
-    text = header + "\n---\n".join(body_parts)
-
-    payload = {"text": text}
-    response = requests.post(webhook_url, json=payload, timeout=30)
-    response.raise_for_status()
-    logger.info("Slack notification sent successfully")
-
-
-def _split_discord_messages(papers: list[SummarizedPaper]) -> list[str]:
-    header = "📰 **本日のarXiv論文要約**\n\n"
-    separator = "\n---\n"
+def _paper_fragment(paper: SummarizedPaper) -> Fragment:
+    return Fragment(
+        paper.paper.title,
+        (f"著者: {', '.join(paper.paper.authors)}", f"URL: {paper.paper.url}", "", paper.summary),
+    )
 
-    messages: list[str] = []
-    current = header
 
-    for paper in papers:
-        entry = _format_paper_text(paper)
+def _post(
+    session: requests.Session,
+    webhook_url: str,
+    payload: dict,
+    rate_limiter: WebhookRateLimiter | None,
+) -> None:
+    # Split messages are paced by the webhook's X-RateLimit-* bucket and 429s
+    # are retried after Retry-After instead of failing the whole digest.
+    if rate_limiter is None:
+        response = session.post(webhook_url, json=payload, timeout=REQUEST_TIMEOUT)
+    else:
+        response = rate_limiter.post(session, webhook_url, payload, REQUEST_TIMEOUT)
+    response.raise_for_status()
 
-        candidate = current + separator + entry if current != header else current + entry
 
-        if len(candidate) > DISCORD_MESSAGE_LIMIT:
-            if current != header:
-                messages.append(current)
-            current = entry
-        else:
-            current = candidate
+def _send_slack(
+    webhook_url: str,
+    papers: list[SummarizedPaper],
+    session: requests.Session,
+    rate_limiter: WebhookRateLimiter | None = None,
+) -> None:
+    messages = chunk_messages(
+        [_format_paper_text(p) for p in papers],
+        SLACK_MESSAGE_LIMIT,
+        header=":newspaper: *本日のarXiv論文要約*\n\n",
+        separator="\n---\n",
+    )
+    for message in messages:
+        _post(session, webhook_url, {"text": message}, rate_limiter)
+    logger.info("Slack notification sent successfully")
 
-    if current:
-        messages.append(current)
 
-    return messages
+def _split_discord_messages(papers: list[SummarizedPaper]) -> list[str]:
+    return chunk_messages(
+        [_format_paper_text(p) for p in papers],
+        DISCORD_MESSAGE_LIMIT,
+        header="📰 **本日のarXiv論文要約**\n\n",
+        separator="\n---\n",
+    )
 
 
-def _send_discord(webhook_url: str, papers: list[SummarizedPaper]) -> None:
+def _send_discord(
+    webhook_url: str,
+    papers: list[SummarizedPaper],
+    session: requests.Session,
+    rate_limiter: WebhookRateLimiter | None = None,
+) -> None:
     messages = _split_discord_messages(papers)
 
     for message in messages:
-        payload = {"content": message}
-        response = requests.post(webhook_url, json=payload, timeout=30)
-        response.raise_for_status()
+        _post(session, webhook_url, {"content": message}, rate_limiter)
 
     logger.info("Discord notification sent successfully (%d messages)", len(messages))
 
 
-def notify(config: NotificationConfig, papers: list[SummarizedPaper]) -> None:
+def notify(
+    config: NotificationConfig,
+    papers: list[SummarizedPaper],
+    session: requests.Session | None = None,
+    rate_limiter: WebhookRateLimiter | None = None,
+) -> None:
     if not papers:
         logger.info("No papers to notify")
         return
 
-    if config.slack_enabled:
-        slack_webhook_url = os.environ.get("SLACK_WEBHOOK_URL")
-        if not slack_webhook_url:
-            raise RuntimeError("SLACK_WEBHOOK_URL environment variable is not set")
-        _send_slack(slack_webhook_url, papers)
-
-    if config.discord_enabled:
-        discord_webhook_url = os.environ.get("DISCORD_WEBHOOK_URL")
-        if not discord_webhook_url:
-            raise RuntimeError("DISCORD_WEBHOOK_URL environment variable is not set")
-        _send_discord(discord_webhook_url, papers)
+    owns_session = session is None
+    if session is None:
+        session = _create_session()
+    if rate_limiter is None:
+        rate_limiter = WebhookRateLimiter()
+
+    try:
+        if config.slack_enabled:
+            slack_webhook_url = os.environ.get("SLACK_WEBHOOK_URL")
+            if not slack_webhook_url:
+                raise RuntimeError("SLACK_WEBHOOK_URL environment variable is not set")
+            _send_slack(slack_webhook_url, papers, session, rate_limiter)
+
+        if config.discord_enabled:
+            discord_webhook_url = os.environ.get("DISCORD_WEBHOOK_URL")
+            if not discord_webhook_url:
+                raise RuntimeError("DISCORD_WEBHOOK_URL environment variable is not set")
+            _send_discord(discord_webhook_url, papers, session, rate_limiter)
+    finally:
+        if owns_session:
+            session.close()
 
     if not config.slack_enabled and not config.discord_enabled:
         logger.info("No notification channels enabled")
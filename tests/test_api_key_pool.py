@@ -0,0 +1,162 @@
+"""Tests for API key pool."""
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from arxiv_agent.summarization.api_key_pool import ApiKeyPool, NoAvailableKeyError, api_keys_from_env
+
+NOON = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc).timestamp()
+
+
+class FakeClock:
+    """Manually advanced clock whose sleep advances time."""
+
+    def __init__(self, now: float = NOON) -> None:
+        self.now = now
+        self.slept = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def _make_pool(keys, clock, **kwargs) -> ApiKeyPool:
+    return ApiKeyPool(keys, clock=clock, sleep=clock.sleep, **kwargs)
+
+
+class TestApiKeyPool:
+    """Test cases for ApiKeyPool class."""
+
+    def test_dispatches_to_least_loaded_key(self) -> None:
+        """Test concurrent requests are spread across keys."""
+        pool = _make_pool(["key-a", "key-b"], FakeClock())
+
+        first = pool.acquire()
+        second = pool.acquire()
+
+        assert {first, second} == {"key-a", "key-b"}
+
+    def test_prefers_key_with_more_daily_quota(self) -> None:
+        """Test ties on load are broken by remaining daily quota."""
+        clock = FakeClock()
+        pool = _make_pool(["key-a", "key-b"], clock, requests_per_day=10)
+        pool.release(pool.acquire())
+        clock.now += 61
+
+        assert pool.acquire() == "key-b"
+
+    def test_rate_limited_key_cools_down(self) -> None:
+        """Test a rate limited key is skipped until its retry delay passes."""
+        clock = FakeClock()
+        pool = _make_pool(["key-a", "key-b"], clock)
+        pool.release_rate_limited("key-a", retry_after=30)
+
+        assert pool.acquire() == "key-b"
+        pool.release("key-b")
+        clock.now += 31
+        pool.release_rate_limited("key-b", retry_after=30)
+        assert pool.acquire() == "key-a"
+
+    def test_waits_for_per_minute_window(self) -> None:
+        """Test acquire waits when every key reached its per-minute limit."""
+        clock = FakeClock()
+        pool = _make_pool(["key-a"], clock, requests_per_minute=1)
+        pool.release(pool.acquire())
+
+        assert pool.acquire() == "key-a"
+        assert clock.slept == [60.0]
+
+    def test_raises_when_daily_quota_is_exhausted(self) -> None:
+        """Test exhausted keys are not used again on the same day."""
+        clock = FakeClock()
+        pool = _make_pool(["key-a"], clock, requests_per_day=1)
+        pool.release(pool.acquire())
+
+        with pytest.raises(NoAvailableKeyError):
+            pool.acquire()
+
+        clock.now += 12 * 3600
+        assert pool.acquire() == "key-a"
+
+    def test_daily_quota_error_rests_key_until_next_day(self) -> None:
+        """Test a per-day 429 marks the key exhausted."""
+        pool = _make_pool(["key-a"], FakeClock())
+        pool.release_rate_limited(pool.acquire(), daily=True)
+
+        assert list(pool.remaining().values()) == [0]
+        with pytest.raises(NoAvailableKeyError):
+            pool.acquire()
+
+    def test_persists_remaining_quota(self, tmp_path: Path) -> None:
+        """Test a later run on the same day resumes from the remaining quota."""
+        state_file = tmp_path / "pool.json"
+        pool = _make_pool(["key-a"], FakeClock(), requests_per_day=5, state_file=str(state_file))
+        pool.release(pool.acquire())
+        pool.release(pool.acquire())
+        pool.close()
+
+        reloaded = _make_pool(["key-a"], FakeClock(), requests_per_day=5, state_file=str(state_file))
+
+        assert list(reloaded.remaining().values()) == [3]
+        assert "key-a" not in state_file.read_text(encoding="utf-8")
+
+    def test_saved_quota_resets_next_day(self, tmp_path: Path) -> None:
+        """Test quota saved on an earlier day is ignored."""
+        state_file = tmp_path / "pool.json"
+        pool = _make_pool(["key-a"], FakeClock(), requests_per_day=5, state_file=str(state_file))
+        pool.release(pool.acquire())
+        pool.close()
+
+        reloaded = _make_pool(["key-a"], FakeClock(NOON + 86400), requests_per_day=5, state_file=str(state_file))
+
+        assert list(reloaded.remaining().values()) == [5]
+
+    def test_saves_state_in_batches(self, tmp_path: Path) -> None:
+        """Test usage is saved once per interval instead of after every request."""
+        state_file = tmp_path / "pool.json"
+        clock = FakeClock()
+        pool = _make_pool(["key-a"], clock, requests_per_day=100, state_file=str(state_file), save_interval=30.0)
+
+        for _ in range(10):
+            pool.release(pool.acquire())
+        assert not state_file.exists()
+
+        clock.now += 30
+        pool.release(pool.acquire())
+        reloaded = _make_pool(["key-a"], FakeClock(), requests_per_day=100, state_file=str(state_file))
+        assert list(reloaded.remaining().values()) == [89]
+
+    def test_saves_exhausted_daily_quota_at_once(self, tmp_path: Path) -> None:
+        """Test an exhausted daily quota is saved without waiting for the interval."""
+        state_file = tmp_path / "pool.json"
+        pool = _make_pool(["key-a"], FakeClock(), requests_per_day=100, state_file=str(state_file))
+
+        pool.release_rate_limited(pool.acquire(), daily=True)
+
+        reloaded = _make_pool(["key-a"], FakeClock(), requests_per_day=100, state_file=str(state_file))
+        assert list(reloaded.remaining().values()) == [0]
+
+    def test_headers_update_remaining_quota(self) -> None:
+        """Test rate limit headers override the tracked daily quota."""
+        pool = _make_pool(["key-a"], FakeClock(), requests_per_day=100)
+        pool.release(pool.acquire(), {"X-RateLimit-Remaining-Requests-Day": "7"})
+
+        assert list(pool.remaining().values()) == [7]
+
+    def test_requires_keys(self) -> None:
+        """Test an empty pool is rejected."""
+        with pytest.raises(ValueError, match="at least one API key is required"):
+            ApiKeyPool([])
+
+    def test_api_keys_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test GEMINI_API_KEYS takes precedence over GEMINI_API_KEY."""
+        monkeypatch.setenv("GEMINI_API_KEY", "single")
+        monkeypatch.delenv("GEMINI_API_KEYS", raising=False)
+        assert api_keys_from_env() == ["single"]
+
+        monkeypatch.setenv("GEMINI_API_KEYS", "a, b,")
+        assert api_keys_from_env() == ["a", "b"]
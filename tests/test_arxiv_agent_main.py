@@ -6,6 +6,7 @@ from datetime import datetime
 import pytest
 
 from arxiv_agent.collection.models import Paper
+from arxiv_agent.notification.delivery_report import ChannelResult, DeliveryReport
 from arxiv_agent.summarization.models import Summary
 from arxiv_agent.main import main
 
@@ -327,3 +328,640 @@ history_file: "{history_file}"
             "2301.00003v1",
         }
         assert "2301.00002v1" not in history_data["processed_papers"]
+
+    def test_falls_back_to_extractive_without_api_key(
+        self, tmp_path: pytest.fixture, mocker: pytest.fixture
+    ) -> None:
+        """Should summarize locally when Gemini is unavailable and fallback is on."""
+        # Setup
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            """
+arxiv:
+  max_results: 10
+  categories: ["cs.AI"]
+  keywords: ["LLM"]
+gemini:
+  model: gemini-1.5-pro
+  prompt_template: "Title: {title}, Authors: {authors}, Abstract: {abstract}"
+  temperature: 0.7
+  max_tokens: 1000
+notification:
+  slack:
+    enabled: false
+summarization:
+  backend: gemini
+  fallback: true
+""",
+            encoding="utf-8",
+        )
+
+        papers = [
+            Paper(
+                arxiv_id="2301.00001v1",
+                title="Paper 1",
+                authors=["Author A"],
+                abstract="We propose a method. The method works well.",
+                published=datetime(2023, 1, 1),
+                categories=["cs.AI"],
+                pdf_url="https://arxiv.org/pdf/2301.00001v1.pdf",
+            ),
+        ]
+
+        mocker.patch("sys.argv", ["main.py", str(config_file)])
+        mocker.patch.dict("os.environ", {}, clear=True)
+        mocker.patch(
+            "arxiv_agent.main.ArxivClient.search_papers", return_value=papers
+        )
+        mock_send_all = mocker.patch("arxiv_agent.main.Notifier.send_all")
+
+        # Execute
+        exit_code = main()
+
+        # Verify
+        assert exit_code == 0
+        sent = mock_send_all.call_args[0][0]
+        assert [s.paper_id for s in sent] == ["2301.00001v1"]
+        assert sent[0].summary_text.startswith("**要点（抽出型要約）**")
+
+    def test_resumes_summaries_from_journal(
+        self, tmp_path: pytest.fixture, mocker: pytest.fixture
+    ) -> None:
+        """Should deliver summaries journaled by a crashed run without re-summarizing."""
+        # Setup
+        config_file = tmp_path / "config.yaml"
+        journal_file = tmp_path / "journal.jsonl"
+        config_file.write_text(
+            f"""
+arxiv:
+  max_results: 10
+  categories: ["cs.AI"]
+  keywords: ["LLM"]
+gemini:
+  model: gemini-1.5-pro
+  prompt_template: "Title: {{title}}, Authors: {{authors}}, Abstract: {{abstract}}"
+  temperature: 0.7
+  max_tokens: 1000
+notification:
+  slack:
+    enabled: false
+journal:
+  file: "{journal_file}"
+""",
+            encoding="utf-8",
+        )
+        journal_file.write_text(
+            json.dumps({
+                "id": "2301.00001v1",
+                "state": "done",
+                "paper": {
+                    "arxiv_id": "2301.00001v1",
+                    "title": "Paper 1",
+                    "authors": ["Author A"],
+                    "abstract": "Abstract 1",
+                    "published": "2023-01-01T00:00:00",
+                    "categories": ["cs.AI"],
+                    "pdf_url": "https://arxiv.org/pdf/2301.00001v1.pdf",
+                },
+                "summary": {
+                    "paper_id": "2301.00001v1",
+                    "title": "Paper 1",
+                    "summary_text": "Summary 1",
+                },
+            }) + "\n",
+            encoding="utf-8",
+        )
+
+        mocker.patch("sys.argv", ["main.py", str(config_file)])
+        mocker.patch.dict("os.environ", {"GEMINI_API_KEY": "test-key"})
+        mocker.patch("arxiv_agent.main.ArxivClient.search_papers", return_value=[])
+        mock_summarize = mocker.patch("arxiv_agent.main.GeminiClient.summarize")
+        mock_send_all = mocker.patch("arxiv_agent.main.Notifier.send_all")
+
+        # Execute
+        exit_code = main()
+
+        # Verify
+        assert exit_code == 0
+        mock_summarize.assert_not_called()
+        sent = mock_send_all.call_args[0][0]
+        assert [s.summary_text for s in sent] == ["Summary 1"]
+        assert journal_file.read_text(encoding="utf-8") == ""
+
+    def test_failed_delivery_keeps_summaries_for_next_run(
+        self, tmp_path: pytest.fixture, mocker: pytest.fixture
+    ) -> None:
+        """Should not acknowledge or mark summaries no channel received."""
+        # Setup
+        config_file = tmp_path / "config.yaml"
+        history_file = tmp_path / "history.json"
+        journal_file = tmp_path / "journal.jsonl"
+        config_file.write_text(
+            f"""
+arxiv:
+  max_results: 10
+  categories: ["cs.AI"]
+  keywords: ["LLM"]
+gemini:
+  model: gemini-1.5-pro
+  prompt_template: "Title: {{title}}, Authors: {{authors}}, Abstract: {{abstract}}"
+  temperature: 0.7
+  max_tokens: 1000
+notification:
+  slack:
+    enabled: false
+history_file: "{history_file}"
+journal:
+  file: "{journal_file}"
+""",
+            encoding="utf-8",
+        )
+        paper = Paper(
+            arxiv_id="2301.00001v1",
+            title="Paper 1",
+            authors=["Author A"],
+            abstract="Abstract 1",
+            published=datetime(2023, 1, 1),
+            categories=["cs.AI"],
+            pdf_url="https://arxiv.org/pdf/2301.00001v1.pdf",
+        )
+        failed = DeliveryReport([ChannelResult("Slack", delivered=False, elapsed_seconds=0.1, error="boom")])
+        delivered = DeliveryReport([ChannelResult("Slack", delivered=True, elapsed_seconds=0.1)])
+
+        mocker.patch("sys.argv", ["main.py", str(config_file)])
+        mocker.patch.dict("os.environ", {"GEMINI_API_KEY": "test-key"})
+        mocker.patch("arxiv_agent.main.ArxivClient.search_papers", return_value=[paper])
+        mock_summarize = mocker.patch(
+            "arxiv_agent.main.GeminiClient.summarize",
+            return_value=Summary(paper_id="2301.00001v1", title="Paper 1", summary_text="Summary 1"),
+        )
+        mock_send_all = mocker.patch("arxiv_agent.main.Notifier.send_all", side_effect=[failed, delivered])
+
+        # Execute: the first delivery fails, the second run retries it
+        assert main() == 0
+        assert not history_file.exists()
+        assert '"done"' in journal_file.read_text(encoding="utf-8")
+
+        assert main() == 0
+
+        # Verify
+        assert mock_summarize.call_count == 1
+        assert mock_send_all.call_count == 2
+        history_data = json.loads(history_file.read_text(encoding="utf-8"))
+        assert history_data["processed_papers"] == ["2301.00001v1"]
+        assert journal_file.read_text(encoding="utf-8") == ""
+
+    def test_queued_delivery_marks_summaries_processed(
+        self, tmp_path: pytest.fixture, mocker: pytest.fixture
+    ) -> None:
+        """Should hand summaries over to the outbox instead of summarizing them again."""
+        # Setup
+        config_file = tmp_path / "config.yaml"
+        history_file = tmp_path / "history.json"
+        outbox_file = tmp_path / "outbox.jsonl"
+        config_file.write_text(
+            f"""
+arxiv:
+  max_results: 10
+  categories: ["cs.AI"]
+  keywords: ["LLM"]
+gemini:
+  model: gemini-1.5-pro
+  prompt_template: "Title: {{title}}, Authors: {{authors}}, Abstract: {{abstract}}"
+  temperature: 0.7
+  max_tokens: 1000
+notification:
+  slack:
+    enabled: false
+  outbox:
+    file: "{outbox_file}"
+history_file: "{history_file}"
+""",
+            encoding="utf-8",
+        )
+        paper = Paper(
+            arxiv_id="2301.00001v1",
+            title="Paper 1",
+            authors=["Author A"],
+            abstract="Abstract 1",
+            published=datetime(2023, 1, 1),
+            categories=["cs.AI"],
+            pdf_url="https://arxiv.org/pdf/2301.00001v1.pdf",
+        )
+        queued = DeliveryReport([
+            ChannelResult("Slack", delivered=False, elapsed_seconds=0.1, error="boom", queued=True)
+        ])
+
+        mocker.patch("sys.argv", ["main.py", str(config_file)])
+        mocker.patch.dict("os.environ", {"GEMINI_API_KEY": "test-key"})
+        mocker.patch("arxiv_agent.main.ArxivClient.search_papers", return_value=[paper])
+        mocker.patch(
+            "arxiv_agent.main.GeminiClient.summarize",
+            return_value=Summary(paper_id="2301.00001v1", title="Paper 1", summary_text="Summary 1"),
+        )
+        mock_drain = mocker.patch("arxiv_agent.main.Notifier.drain")
+        mocker.patch("arxiv_agent.main.Notifier.send_all", return_value=queued)
+
+        # Execute
+        assert main() == 0
+
+        # Verify: earlier messages are drained first, the new ones are left to the outbox
+        mock_drain.assert_called_once()
+        history_data = json.loads(history_file.read_text(encoding="utf-8"))
+        assert history_data["processed_papers"] == ["2301.00001v1"]
+
+    def test_summarizes_only_top_ranked_papers(
+        self, tmp_path: pytest.fixture, mocker: pytest.fixture
+    ) -> None:
+        """Should summarize only the top-K papers and pass their scores on."""
+        # Setup
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            """
+arxiv:
+  max_results: 10
+  categories: ["cs.AI"]
+  keywords: ["LLM", "Transformer"]
+gemini:
+  model: gemini-1.5-pro
+  prompt_template: "Title: {title}, Authors: {authors}, Abstract: {abstract}"
+  temperature: 0.7
+  max_tokens: 1000
+notification:
+  slack:
+    enabled: false
+ranking:
+  top_k: 1
+  keyword_weights:
+    LLM: 3.0
+""",
+            encoding="utf-8",
+        )
+
+        papers = [
+            Paper(
+                arxiv_id="2301.00001v1",
+                title="Transformer for vision",
+                authors=["Author A"],
+                abstract="A transformer.",
+                published=datetime(2023, 1, 1),
+                categories=["cs.AI"],
+                pdf_url="https://arxiv.org/pdf/2301.00001v1.pdf",
+            ),
+            Paper(
+                arxiv_id="2301.00002v1",
+                title="LLM agents",
+                authors=["Author B"],
+                abstract="An LLM agent.",
+                published=datetime(2023, 1, 2),
+                categories=["cs.AI"],
+                pdf_url="https://arxiv.org/pdf/2301.00002v1.pdf",
+            ),
+        ]
+
+        mocker.patch("sys.argv", ["main.py", str(config_file)])
+        mocker.patch.dict("os.environ", {"GEMINI_API_KEY": "test-key"})
+        mocker.patch(
+            "arxiv_agent.main.ArxivClient.search_papers", return_value=papers
+        )
+        mock_summarize = mocker.patch(
+            "arxiv_agent.main.GeminiClient.summarize",
+            return_value=Summary(paper_id="2301.00002v1", title="LLM agents", summary_text="Summary"),
+        )
+        mock_send_all = mocker.patch("arxiv_agent.main.Notifier.send_all")
+
+        # Execute
+        exit_code = main()
+
+        # Verify
+        assert exit_code == 0
+        assert mock_summarize.call_count == 1
+        assert mock_summarize.call_args[0][0].arxiv_id == "2301.00002v1"
+        sent = mock_send_all.call_args[0][0]
+        assert sent[0].relevance_score > 0
+
+    def test_summarizes_one_paper_per_near_duplicate_cluster(
+        self, tmp_path: pytest.fixture, mocker: pytest.fixture
+    ) -> None:
+        """Should summarize a cross-listed paper once and link its duplicate."""
+        # Setup
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            f"""
+arxiv:
+  max_results: 10
+  categories: ["cs.AI"]
+  keywords: ["LLM"]
+gemini:
+  model: gemini-1.5-pro
+  prompt_template: "Title: {{title}}, Authors: {{authors}}, Abstract: {{abstract}}"
+  temperature: 0.7
+  max_tokens: 1000
+notification:
+  slack:
+    enabled: false
+dedup:
+  index_dir: "{tmp_path / 'minhash'}"
+  threshold: 0.7
+""",
+            encoding="utf-8",
+        )
+
+        abstract = (
+            "We study how LLM agents plan multi-step tool calls and show that "
+            "self-verification reduces error rates on long-horizon benchmarks. "
+            "We release the planner, the evaluation harness and all prompts, and "
+            "analyse failure modes across web navigation and coding tasks."
+        )
+        papers = [
+            Paper(
+                arxiv_id=f"2301.0000{i}v1",
+                title=f"Paper {i}",
+                authors=["Author A"],
+                abstract=text,
+                published=datetime(2023, 1, i),
+                categories=["cs.AI"],
+                pdf_url=f"https://arxiv.org/pdf/2301.0000{i}v1.pdf",
+            )
+            for i, text in ((1, abstract), (2, abstract.replace("coding tasks", "coding tasks (v2)")))
+        ]
+
+        mocker.patch("sys.argv", ["main.py", str(config_file)])
+        mocker.patch.dict("os.environ", {"GEMINI_API_KEY": "test-key"})
+        mocker.patch(
+            "arxiv_agent.main.ArxivClient.search_papers", return_value=papers
+        )
+        mock_summarize = mocker.patch(
+            "arxiv_agent.main.GeminiClient.summarize",
+            return_value=Summary(paper_id="2301.00001v1", title="Paper 1", summary_text="Summary"),
+        )
+        mock_send_all = mocker.patch("arxiv_agent.main.Notifier.send_all")
+
+        # Execute
+        exit_code = main()
+
+        # Verify
+        assert exit_code == 0
+        assert mock_summarize.call_count == 1
+        sent = mock_send_all.call_args[0][0]
+        assert sent[0].related_ids == ["2301.00002v1"]
+        assert (tmp_path / "minhash" / "ids.txt").read_text(encoding="utf-8").split() == [
+            "2301.00001v1",
+            "2301.00002v1",
+        ]
+
+    def test_degrades_to_extractive_when_quota_is_exhausted(
+        self, tmp_path: pytest.fixture, mocker: pytest.fixture
+    ) -> None:
+        """Should summarize papers beyond the daily budget locally instead of calling Gemini."""
+        # Setup
+        config_file = tmp_path / "config.yaml"
+        ledger_file = tmp_path / "quota.json"
+        config_file.write_text(
+            f"""
+arxiv:
+  max_results: 10
+  categories: ["cs.AI"]
+  keywords: ["LLM"]
+gemini:
+  model: gemini-1.5-pro
+  prompt_template: "Title: {{title}}, Authors: {{authors}}, Abstract: {{abstract}}"
+  temperature: 0.7
+  max_tokens: 1000
+notification:
+  slack:
+    enabled: false
+summarization:
+  fallback: true
+quota:
+  ledger_file: "{ledger_file}"
+  requests_per_day: 1
+""",
+            encoding="utf-8",
+        )
+
+        papers = [
+            Paper(
+                arxiv_id=f"2301.0000{i}v1",
+                title=f"Paper {i}",
+                authors=["Author A"],
+                abstract=f"Abstract {i}. It has two sentences.",
+                published=datetime(2023, 1, i),
+                categories=["cs.AI"],
+                pdf_url=f"https://arxiv.org/pdf/2301.0000{i}v1.pdf",
+            )
+            for i in (1, 2)
+        ]
+
+        mocker.patch("sys.argv", ["main.py", str(config_file)])
+        mocker.patch.dict("os.environ", {"GEMINI_API_KEY": "test-key"})
+        mocker.patch(
+            "arxiv_agent.main.ArxivClient.search_papers", return_value=papers
+        )
+        mock_summarize = mocker.patch(
+            "arxiv_agent.main.GeminiClient.summarize",
+            return_value=Summary(paper_id="2301.00001v1", title="Paper 1", summary_text="Summary"),
+        )
+        mock_send_all = mocker.patch("arxiv_agent.main.Notifier.send_all")
+
+        # Execute
+        exit_code = main()
+
+        # Verify
+        assert exit_code == 0
+        assert mock_summarize.call_count == 1
+        sent = mock_send_all.call_args[0][0]
+        assert [s.paper_id for s in sent] == ["2301.00001v1", "2301.00002v1"]
+        assert "抽出型要約" in sent[1].summary_text
+
+    def test_sends_pending_digest_and_follow_up_after_deadline(
+        self, tmp_path: pytest.fixture, mocker: pytest.fixture
+    ) -> None:
+        """Should ship the digest with pending papers and deliver their summaries in a follow-up."""
+        # Setup
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            """
+arxiv:
+  max_results: 10
+  categories: ["cs.AI"]
+  keywords: ["LLM"]
+gemini:
+  model: gemini-1.5-pro
+  prompt_template: "Title: {title}, Authors: {authors}, Abstract: {abstract}"
+  temperature: 0.7
+  max_tokens: 1000
+notification:
+  slack:
+    enabled: false
+deadline:
+  at: "09:00"
+  timezone: Asia/Tokyo
+  summarize_estimate_seconds: 86400
+""",
+            encoding="utf-8",
+        )
+
+        paper = Paper(
+            arxiv_id="2301.00001v1",
+            title="Paper 1",
+            authors=["Author A"],
+            abstract="Abstract 1",
+            published=datetime(2023, 1, 1),
+            categories=["cs.AI"],
+            pdf_url="https://arxiv.org/pdf/2301.00001v1.pdf",
+        )
+
+        mocker.patch("sys.argv", ["main.py", str(config_file)])
+        mocker.patch.dict("os.environ", {"GEMINI_API_KEY": "test-key"})
+        mocker.patch(
+            "arxiv_agent.main.ArxivClient.search_papers", return_value=[paper]
+        )
+        mocker.patch(
+            "arxiv_agent.main.GeminiClient.summarize",
+            return_value=Summary(paper_id="2301.00001v1", title="Paper 1", summary_text="Summary"),
+        )
+        mock_send_all = mocker.patch("arxiv_agent.main.Notifier.send_all")
+
+        # Execute
+        exit_code = main()
+
+        # Verify
+        assert exit_code == 0
+        digest, follow_up = mock_send_all.call_args_list
+        assert digest[0][0][0].pending
+        assert follow_up[0][0][0].summary_text == "Summary"
+        assert follow_up[1] == {"follow_up": True}
+
+    def test_summarizes_concurrently_in_paper_order(
+        self, tmp_path: pytest.fixture, mocker: pytest.fixture
+    ) -> None:
+        """Should summarize on pipeline workers and keep the papers' order in the digest."""
+        # Setup
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            """
+arxiv:
+  max_results: 10
+  categories: ["cs.AI"]
+  keywords: ["LLM"]
+gemini:
+  model: gemini-1.5-pro
+  prompt_template: "Title: {title}, Authors: {authors}, Abstract: {abstract}"
+  temperature: 0.7
+  max_tokens: 1000
+notification:
+  slack:
+    enabled: false
+pipeline:
+  summarize_workers: 3
+  queue_size: 2
+""",
+            encoding="utf-8",
+        )
+
+        papers = [
+            Paper(
+                arxiv_id=f"2301.0000{i}v1",
+                title=f"Paper {i}",
+                authors=["Author A"],
+                abstract=f"Abstract {i}",
+                published=datetime(2023, 1, i),
+                categories=["cs.AI"],
+                pdf_url=f"https://arxiv.org/pdf/2301.0000{i}v1.pdf",
+            )
+            for i in range(1, 6)
+        ]
+
+        def summarize(paper: Paper) -> Summary:
+            if paper.arxiv_id == "2301.00003v1":
+                raise RuntimeError("API error")
+            return Summary(paper_id=paper.arxiv_id, title=paper.title, summary_text="Summary")
+
+        mocker.patch("sys.argv", ["main.py", str(config_file)])
+        mocker.patch.dict("os.environ", {"GEMINI_API_KEY": "test-key"})
+        mocker.patch(
+            "arxiv_agent.main.ArxivClient.search_papers", return_value=papers
+        )
+        mock_summarize = mocker.patch("arxiv_agent.main.GeminiClient.summarize", side_effect=summarize)
+        mock_send_all = mocker.patch("arxiv_agent.main.Notifier.send_all")
+
+        # Execute
+        exit_code = main()
+
+        # Verify
+        assert exit_code == 0
+        assert mock_summarize.call_count == 5
+        sent = mock_send_all.call_args[0][0]
+        assert [summary.paper_id for summary in sent] == [
+            "2301.00001v1", "2301.00002v1", "2301.00004v1", "2301.00005v1"
+        ]
+
+    def test_skips_papers_leased_by_another_worker(
+        self, tmp_path: pytest.fixture, mocker: pytest.fixture
+    ) -> None:
+        """Should summarize only papers this worker could claim and release its leases."""
+        # Setup
+        config_file = tmp_path / "config.yaml"
+        history_file = tmp_path / "history.json"
+        config_file.write_text(
+            f"""
+arxiv:
+  max_results: 10
+  categories: ["cs.AI"]
+  keywords: ["LLM"]
+gemini:
+  model: gemini-1.5-pro
+  prompt_template: "Title: {{title}}, Authors: {{authors}}, Abstract: {{abstract}}"
+  temperature: 0.7
+  max_tokens: 1000
+notification:
+  slack:
+    enabled: false
+history:
+  file: "{history_file}"
+  lease_seconds: 600
+""",
+            encoding="utf-8",
+        )
+        history_file.write_text(
+            json.dumps({
+                "processed_papers": [],
+                "leases": {"2301.00001v1": {"owner": "other-worker", "expires": 4102444800}},
+            }),
+            encoding="utf-8",
+        )
+
+        papers = [
+            Paper(
+                arxiv_id=f"2301.0000{i}v1",
+                title=f"Paper {i}",
+                authors=["Author A"],
+                abstract=f"Abstract {i}",
+                published=datetime(2023, 1, i),
+                categories=["cs.AI"],
+                pdf_url=f"https://arxiv.org/pdf/2301.0000{i}v1.pdf",
+            )
+            for i in (1, 2)
+        ]
+
+        mocker.patch("sys.argv", ["main.py", str(config_file)])
+        mocker.patch.dict("os.environ", {"GEMINI_API_KEY": "test-key"})
+        mocker.patch(
+            "arxiv_agent.main.ArxivClient.search_papers", return_value=papers
+        )
+        mock_summarize = mocker.patch(
+            "arxiv_agent.main.GeminiClient.summarize",
+            return_value=Summary(paper_id="2301.00002v1", title="Paper 2", summary_text="Summary"),
+        )
+        mocker.patch("arxiv_agent.main.Notifier.send_all")
+
+        # Execute
+        exit_code = main()
+
+        # Verify
+        assert exit_code == 0
+        assert [c[0][0].arxiv_id for c in mock_summarize.call_args_list] == ["2301.00002v1"]
+        history_data = json.loads(history_file.read_text(encoding="utf-8"))
+        assert history_data["processed_papers"] == ["2301.00002v1"]
+        assert list(history_data["leases"]) == ["2301.00001v1"]
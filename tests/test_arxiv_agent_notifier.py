@@ -0,0 +1,283 @@
+"""Tests for notification orchestrator."""
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+from pathlib import Path
+from unittest.mock import Mock, patch
+import requests
+from arxiv_agent.config.models import HttpConfig, NotificationConfig, NotificationTarget, OutboxConfig
+from arxiv_agent.notification.notifier import Notifier
+from arxiv_agent.summarization.models import Summary
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+
+def _make_notifier(*channels, channel_timeout_seconds=60.0, outbox=None):
+    notifier = Notifier(NotificationConfig(
+        slack=NotificationTarget(enabled=False),
+        discord=NotificationTarget(enabled=False),
+        channel_timeout_seconds=channel_timeout_seconds,
+        outbox=outbox,
+    ))
+    notifier.notifiers = list(channels)
+    return notifier
+
+
+class TestNotifier:
+    """Test cases for Notifier."""
+
+    def test_send_all_orders_by_relevance(self):
+        """Should send scored summaries first, highest score first."""
+        channel = Mock()
+        notifier = _make_notifier(("Test", channel))
+        summaries = [
+            Summary(paper_id="1", title="A", summary_text="a"),
+            Summary(paper_id="2", title="B", summary_text="b", relevance_score=0.5),
+            Summary(paper_id="3", title="C", summary_text="c", relevance_score=2.0),
+        ]
+
+        notifier.send_all(summaries)
+
+        sent = channel.send.call_args[0][0]
+        assert [s.paper_id for s in sent] == ["3", "2", "1"]
+
+    def test_send_all_isolates_channel_failures(self):
+        """Should keep sending to other channels when one fails."""
+        failing = Mock()
+        failing.send.side_effect = Exception("boom")
+        working = Mock()
+        notifier = _make_notifier(("Failing", failing), ("Working", working))
+
+        notifier.send_all([Summary(paper_id="1", title="A", summary_text="a")])
+
+        working.send.assert_called_once()
+
+    def test_send_all_reports_each_channel(self):
+        """Should report delivery results in channel order."""
+        failing = Mock()
+        failing.send.side_effect = Exception("boom")
+        working = Mock()
+        notifier = _make_notifier(("Failing", failing), ("Working", working))
+
+        report = notifier.send_all([Summary(paper_id="1", title="A", summary_text="a")])
+
+        assert [r.channel for r in report.results] == ["Failing", "Working"]
+        assert report.failed_channels == ["Failing"]
+        assert report.results[0].error == "boom"
+        assert not report.all_delivered
+
+    def test_send_all_delivers_channels_concurrently(self):
+        """Should not wait for one channel before starting the next."""
+        barrier = threading.Barrier(2, timeout=5)
+        first, second = Mock(), Mock()
+        first.send.side_effect = lambda *args, **kwargs: barrier.wait()
+        second.send.side_effect = lambda *args, **kwargs: barrier.wait()
+        notifier = _make_notifier(("First", first), ("Second", second))
+
+        report = notifier.send_all([Summary(paper_id="1", title="A", summary_text="a")])
+
+        assert report.all_delivered
+
+    def test_send_all_times_out_slow_channel(self):
+        """Should report a channel that exceeds its timeout without waiting for it."""
+        release = threading.Event()
+        slow = Mock()
+        slow.send.side_effect = lambda *args, **kwargs: release.wait(5)
+        fast = Mock()
+        notifier = _make_notifier(("Slow", slow), ("Fast", fast), channel_timeout_seconds=0.2)
+
+        started = time.monotonic()
+        report = notifier.send_all([Summary(paper_id="1", title="A", summary_text="a")])
+        release.set()
+
+        assert time.monotonic() - started < 2
+        assert report.failed_channels == ["Slow"]
+        assert report.results[0].error == "timed out"
+        fast.send.assert_called_once()
+
+    def test_timed_out_channel_does_not_delay_exit(self, tmp_path):
+        """Should let the process exit without waiting for an abandoned channel."""
+        script = textwrap.dedent("""
+            import time
+            from unittest.mock import Mock
+            from arxiv_agent.config.models import NotificationConfig, NotificationTarget
+            from arxiv_agent.notification.notifier import Notifier
+            from arxiv_agent.summarization.models import Summary
+
+            notifier = Notifier(NotificationConfig(
+                slack=NotificationTarget(enabled=False),
+                discord=NotificationTarget(enabled=False),
+                channel_timeout_seconds=0.2,
+            ))
+            slow = Mock()
+            slow.send.side_effect = lambda *args, **kwargs: time.sleep(5)
+            notifier.notifiers = [("Slow", slow)]
+            notifier.send_all([Summary(paper_id="1", title="A", summary_text="a")])
+            notifier.close()
+        """)
+        started = time.monotonic()
+        subprocess.run([sys.executable, "-c", script], check=True, env={"PYTHONPATH": str(SRC_DIR)}, timeout=10)
+
+        assert time.monotonic() - started < 3
+
+    def test_close_keeps_session_for_timed_out_channel(self):
+        """Should not close the shared session while a channel still uses it."""
+        release = threading.Event()
+        slow = Mock()
+        slow.send.side_effect = lambda *args, **kwargs: release.wait(5)
+        notifier = _make_notifier(("Slow", slow), channel_timeout_seconds=0.1)
+        notifier.session = Mock()
+
+        notifier.send_all([Summary(paper_id="1", title="A", summary_text="a")])
+        notifier.close()
+        notifier.session.close.assert_not_called()
+
+        release.set()
+        notifier._stragglers[0].join(5)
+        notifier.close()
+        notifier.session.close.assert_called_once()
+
+    def test_send_all_without_summaries_returns_empty_report(self):
+        """Should return an empty report when there is nothing to send."""
+        notifier = _make_notifier(("Test", Mock()))
+
+        report = notifier.send_all([])
+
+        assert report.results == []
+        assert report.all_delivered
+
+    def test_channels_share_one_pooled_session(self):
+        """Should inject a single configured session into every channel."""
+        config = NotificationConfig(
+            slack=NotificationTarget(enabled=True),
+            discord=NotificationTarget(enabled=True),
+            http=HttpConfig(pool_size=4, timeout_seconds=5.0),
+        )
+        with patch.dict('os.environ', {
+            'SLACK_WEBHOOK_URL': 'http://slack.test',
+            'DISCORD_WEBHOOK_URL': 'http://discord.test',
+        }):
+            notifier = Notifier(config)
+
+        (_, slack), (_, discord) = notifier.notifiers
+        assert slack.session is discord.session is notifier.session
+        assert slack.timeout == 5.0
+        assert notifier.session.get_adapter("https://hooks.slack.com")._pool_maxsize == 4
+        notifier.close()
+
+
+class TestNotifierOutbox:
+    """Test cases for Notifier with a durable outbox."""
+
+    @staticmethod
+    def _channel(posted, fail=False):
+        channel = Mock()
+        channel.format_messages.side_effect = lambda summaries, follow_up: [
+            f"{summary.paper_id}: {summary.summary_text}" for summary in summaries
+        ]
+
+        def post_message(message):
+            if fail:
+                raise ConnectionError("down")
+            posted.append(message)
+
+        channel.post_message.side_effect = post_message
+        return channel
+
+    def test_failed_channel_is_queued_and_retried_by_next_drain(self, tmp_path):
+        """Should keep undelivered messages and send only those on the next drain."""
+        outbox = OutboxConfig(file=str(tmp_path / "outbox.jsonl"))
+        slack_posted, discord_posted = [], []
+        notifier = _make_notifier(
+            ("Slack", self._channel(slack_posted, fail=True)),
+            ("Discord", self._channel(discord_posted)),
+            outbox=outbox,
+        )
+
+        report = notifier.send_all([
+            Summary(paper_id="1", title="A", summary_text="a"),
+            Summary(paper_id="2", title="B", summary_text="b"),
+        ])
+
+        assert report.failed_channels == ["Slack"]
+        assert report.results[0].queued
+        assert report.all_settled
+        assert discord_posted == ["1: a", "2: b"]
+
+        # A later run, e.g. the drain command, with Slack back up
+        slack_posted, discord_posted = [], []
+        retry = _make_notifier(
+            ("Slack", self._channel(slack_posted)),
+            ("Discord", self._channel(discord_posted)),
+            outbox=outbox,
+        )
+        assert retry.drain().all_delivered
+        assert slack_posted == ["1: a", "2: b"]
+        assert discord_posted == []
+
+    def test_resending_a_delivered_digest_is_a_no_op(self, tmp_path):
+        """Should not post a message whose idempotency key was delivered."""
+        posted = []
+        notifier = _make_notifier(
+            ("Slack", self._channel(posted)), outbox=OutboxConfig(file=str(tmp_path / "outbox.jsonl"))
+        )
+        summaries = [Summary(paper_id="1", title="A", summary_text="a")]
+
+        notifier.send_all(summaries)
+        report = notifier.send_all(summaries)
+
+        assert report.all_delivered
+        assert posted == ["1: a"]
+
+    def test_rejected_message_does_not_block_later_digests(self, tmp_path):
+        """Should give up a message the channel rejects and deliver the newer ones."""
+        posted = []
+        channel = self._channel(posted)
+
+        def post_message(message):
+            if message == "1: a":
+                response = requests.Response()
+                response.status_code = 400
+                raise requests.HTTPError("400 Bad Request", response=response)
+            posted.append(message)
+
+        channel.post_message.side_effect = post_message
+        notifier = _make_notifier(("Slack", channel), outbox=OutboxConfig(file=str(tmp_path / "outbox.jsonl")))
+
+        report = notifier.send_all([Summary(paper_id="1", title="A", summary_text="a")])
+        assert report.failed_channels == ["Slack"]
+        notifier.send_all([Summary(paper_id="2", title="B", summary_text="b")])
+
+        assert posted == ["2: b"]
+        assert [item.state.value for item in notifier.outbox.items()] == ["dead", "delivered"]
+
+    def test_timed_out_channel_keeps_the_drain_lock(self, tmp_path):
+        """Should not send a timed-out channel's messages again while it is still sending."""
+        release = threading.Event()
+        posted = []
+        channel = self._channel(posted)
+
+        def post_message(message):
+            release.wait(5)
+            posted.append(message)
+
+        channel.post_message.side_effect = post_message
+        notifier = _make_notifier(
+            ("Slack", channel),
+            channel_timeout_seconds=0.1,
+            outbox=OutboxConfig(file=str(tmp_path / "outbox.jsonl")),
+        )
+
+        report = notifier.send_all([Summary(paper_id="1", title="A", summary_text="a")])
+        assert report.results[0].error == "timed out"
+        assert notifier.drain().results[0].error == "outbox busy"
+
+        release.set()
+        deadline = time.monotonic() + 5
+        while notifier.drain().results[0].error == "outbox busy" and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        assert posted == ["1: a"]
+        assert notifier.drain().all_delivered
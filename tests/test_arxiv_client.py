@@ -1,7 +1,22 @@
 """Tests for arxiv client."""
 import pytest
 from datetime import datetime
+from unittest.mock import MagicMock
 from arxiv_agent.collection.arxiv_client import ArxivClient
+from arxiv_agent.history import PaperHistory
+
+
+def _result(arxiv_id):
+    """Build a fake arXiv search result."""
+    result = MagicMock()
+    result.entry_id = f"http://arxiv.org/abs/{arxiv_id}"
+    result.title = f"Title {arxiv_id}"
+    result.authors = []
+    result.summary = "Abstract"
+    result.published = datetime(2023, 1, 1)
+    result.categories = ["cs.AI"]
+    result.pdf_url = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
+    return result
 
 
 class TestArxivClient:
@@ -63,3 +78,41 @@ class TestArxivClient:
         assert 'all:"Test-Driven Development"' in query
         assert 'all:"Domain-Driven Design"' in query
         assert query.count(' OR ') == 7  # 3 for categories + 4 for keywords
+
+    def test_init_with_max_scan_results_below_max_results(self):
+        """Should raise ValueError when max_scan_results is smaller than max_results."""
+        with pytest.raises(ValueError, match="max_scan_results must be at least max_results"):
+            ArxivClient(max_results=10, max_scan_results=5)
+
+    def test_search_papers_pages_past_processed_papers(self, mocker, tmp_path):
+        """Should keep reading results until max_results unprocessed papers are found."""
+        ids = [f"2301.0000{i}v1" for i in range(1, 8)]
+        results = [_result(arxiv_id) for arxiv_id in ids]
+        read = []
+
+        def results_generator():
+            for result in results:
+                read.append(result)
+                yield result
+
+        search = mocker.patch("arxiv_agent.collection.arxiv_client.arxiv.Search")
+        search.return_value.results.side_effect = results_generator
+        history = PaperHistory(str(tmp_path / "history.json"))
+        history.mark_processed(ids[:3])
+
+        client = ArxivClient(max_results=2, max_scan_results=20)
+        papers = client.search_papers(["cs.AI"], ["LLM"], history=history)
+
+        assert [p.arxiv_id for p in papers] == ids[3:5]
+        assert len(read) == 5
+        assert search.call_args.kwargs["max_results"] == 20
+
+    def test_search_papers_without_history(self, mocker):
+        """Should request exactly max_results when no history is given."""
+        search = mocker.patch("arxiv_agent.collection.arxiv_client.arxiv.Search")
+        search.return_value.results.return_value = [_result("2301.00001v1")]
+
+        papers = ArxivClient(max_results=10).search_papers(["cs.AI"], ["LLM"])
+
+        assert [p.arxiv_id for p in papers] == ["2301.00001v1"]
+        assert search.call_args.kwargs["max_results"] == 10
@@ -0,0 +1,215 @@
+"""Tests for asynchronous webhook delivery."""
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from arxiv_agent.notification.async_webhook import (
+    HTTP2_AVAILABLE,
+    AsyncDiscordNotifier,
+    AsyncSlackNotifier,
+    AsyncWebhookClient,
+    send_digests,
+)
+from arxiv_agent.notification.rate_limiter import WebhookRateLimiter
+from arxiv_agent.summarization.models import Summary
+
+
+class MockWebhookServer(ThreadingHTTPServer):
+    """Local webhook server recording posts and the peak number in flight."""
+
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, delay=0.0, statuses=None):
+        super().__init__(("127.0.0.1", 0), _WebhookHandler)
+        self.delay = delay
+        self.statuses = list(statuses or [])
+        self.posts = []
+        self.in_flight = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def url(self, path="/hook"):
+        return f"http://127.0.0.1:{self.server_port}{path}"
+
+
+class _WebhookHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with server.lock:
+            server.posts.append((self.path, body))
+            server.in_flight += 1
+            server.peak = max(server.peak, server.in_flight)
+            status = server.statuses.pop(0) if server.statuses else 204
+        time.sleep(server.delay)
+        with server.lock:
+            server.in_flight -= 1
+        self.send_response(status)
+        if status == 429:
+            self.send_header("Retry-After", "0")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def webhook_server(request):
+    server = MockWebhookServer(**getattr(request, "param", {}))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _client(**kwargs):
+    kwargs.setdefault("rate_limiter", WebhookRateLimiter(max_requests_per_second=None, jitter=0))
+    kwargs.setdefault("backoff_factor", 0)
+    return AsyncWebhookClient(**kwargs)
+
+
+SUMMARIES = [Summary(paper_id="2401.00001", title="Paper", summary_text="Summary")]
+
+
+class TestAsyncWebhookClient:
+    """Test cases for AsyncWebhookClient and asynchronous notifiers."""
+
+    @pytest.mark.parametrize("webhook_server", [{"delay": 0.05}], indirect=True)
+    def test_fans_out_to_many_webhooks_concurrently(self, webhook_server):
+        """Should deliver 200 digests far faster than one at a time, within the cap."""
+        async def run():
+            async with _client(max_concurrency=50, max_per_host=50) as client:
+                digests = [
+                    (f"user-{i}", AsyncDiscordNotifier(client, webhook_url=webhook_server.url(f"/hook/{i}")), SUMMARIES)
+                    for i in range(200)
+                ]
+                return await send_digests(digests)
+
+        started = time.monotonic()
+        report = asyncio.run(run())
+        elapsed = time.monotonic() - started
+
+        assert report.all_delivered
+        assert len(webhook_server.posts) == 200
+        # Sequential delivery would take 200 * 0.05 = 10 seconds.
+        assert elapsed < 3
+        assert webhook_server.peak <= 50
+
+    @pytest.mark.parametrize("webhook_server", [{"delay": 0.05}], indirect=True)
+    def test_caps_requests_per_host(self, webhook_server):
+        """Should keep at most max_per_host requests in flight to one host."""
+        async def run():
+            async with _client(max_concurrency=50, max_per_host=3) as client:
+                notifiers = [AsyncSlackNotifier(client, webhook_url=webhook_server.url(f"/{i}")) for i in range(12)]
+                await asyncio.gather(*(notifier.send_async(SUMMARIES) for notifier in notifiers))
+
+        asyncio.run(run())
+
+        assert len(webhook_server.posts) == 12
+        assert webhook_server.peak <= 3
+
+    @pytest.mark.parametrize("webhook_server", [{"delay": 0.5}], indirect=True)
+    def test_busy_host_does_not_starve_other_hosts(self, webhook_server):
+        """Should deliver to an idle host while requests queue for a saturated one."""
+        fast_server = MockWebhookServer()
+        threading.Thread(target=fast_server.serve_forever, daemon=True).start()
+
+        async def run():
+            async with _client(max_concurrency=4, max_per_host=2) as client:
+                slow = [
+                    asyncio.create_task(
+                        AsyncDiscordNotifier(client, webhook_url=webhook_server.url(f"/{i}")).send_async(SUMMARIES)
+                    )
+                    for i in range(20)
+                ]
+                await asyncio.sleep(0.05)
+                started = time.monotonic()
+                await AsyncSlackNotifier(client, webhook_url=fast_server.url()).send_async(SUMMARIES)
+                elapsed = time.monotonic() - started
+                for task in slow:
+                    task.cancel()
+                await asyncio.gather(*slow, return_exceptions=True)
+                return elapsed
+
+        try:
+            elapsed = asyncio.run(run())
+        finally:
+            fast_server.shutdown()
+            fast_server.server_close()
+
+        assert len(fast_server.posts) == 1
+        # The saturated host's queue alone would take 20 / 2 * 0.5 = 5 seconds.
+        assert elapsed < 0.4
+
+    @pytest.mark.parametrize("webhook_server", [{"statuses": [429, 503]}], indirect=True)
+    def test_retries_rate_limits_and_gateway_errors(self, webhook_server):
+        """Should retry a 429 after its delay and a 503 that never reached the handler."""
+        async def run():
+            async with _client() as client:
+                await AsyncSlackNotifier(client, webhook_url=webhook_server.url()).send_async(SUMMARIES)
+
+        asyncio.run(run())
+
+        assert len(webhook_server.posts) == 3
+        assert "Paper" in webhook_server.posts[-1][1]["text"]
+
+    @pytest.mark.parametrize("webhook_server", [{"statuses": [404]}], indirect=True)
+    def test_send_digests_isolates_failures(self, webhook_server):
+        """Should report a failing webhook without affecting the others."""
+        async def run():
+            async with _client(max_per_host=1) as client:
+                return await send_digests([
+                    ("gone", AsyncSlackNotifier(client, webhook_url=webhook_server.url("/gone")), SUMMARIES),
+                    ("ok", AsyncSlackNotifier(client, webhook_url=webhook_server.url("/ok")), SUMMARIES),
+                ])
+
+        report = asyncio.run(run())
+
+        assert report.failed_channels == ["gone"]
+        assert "404" in report.results[0].error
+
+    def test_send_digests_times_out_slow_webhook(self):
+        """Should cancel a digest that exceeds the timeout."""
+        class SlowClient:
+            async def post(self, url, payload):
+                await asyncio.sleep(5)
+
+        notifier = AsyncSlackNotifier(SlowClient(), webhook_url="http://slack.test")
+
+        started = time.monotonic()
+        report = asyncio.run(send_digests([("slow", notifier, SUMMARIES)], timeout=0.1))
+
+        assert time.monotonic() - started < 2
+        assert report.results[0].error == "timed out"
+
+    def test_uses_platform_formatting(self):
+        """Should keep the platform's payload and message limit."""
+        client = _client()
+        slack = AsyncSlackNotifier(client, webhook_url="http://slack.test")
+        discord = AsyncDiscordNotifier(client, webhook_url="http://discord.test")
+
+        assert slack._build_payload("x") == {"text": "x"}
+        assert discord._build_payload("x") == {"content": "x"}
+        assert slack.message_limit == 3000
+        assert discord.message_limit == 2000
+        asyncio.run(client.aclose())
+
+    @pytest.mark.skipif(HTTP2_AVAILABLE, reason="h2 is installed")
+    def test_http2_requires_h2(self):
+        """Should refuse HTTP/2 when h2 is not installed."""
+        with pytest.raises(ValueError, match="HTTP/2 requires the h2 package"):
+            AsyncWebhookClient(http2=True)
+
+    def test_invalid_limits(self):
+        """Should raise ValueError for a non-positive per-host cap."""
+        with pytest.raises(ValueError, match="max_per_host must be positive"):
+            AsyncWebhookClient(max_per_host=0)
@@ -22,7 +22,7 @@ class ConcreteWebhookNotifier(BaseWebhookNotifier):
 class TestBaseWebhookNotifier:
     """Test cases for BaseWebhookNotifier."""
 
-    @patch('arxiv_agent.notification.base_webhook_notifier.requests.post')
+    @patch('arxiv_agent.notification.base_webhook_notifier.requests.Session.post')
     def test_send_successful_request(self, mock_post):
         """Should send HTTP POST request with correct parameters."""
         mock_response = Mock()
@@ -50,7 +50,7 @@ class TestBaseWebhookNotifier:
         # Should not raise, just return early
         notifier.send([])
 
-    @patch('arxiv_agent.notification.base_webhook_notifier.requests.post')
+    @patch('arxiv_agent.notification.base_webhook_notifier.requests.Session.post')
     def test_send_raises_on_request_exception(self, mock_post):
         """Should log error and re-raise RequestException."""
         import requests
@@ -64,7 +64,7 @@ class TestBaseWebhookNotifier:
         with pytest.raises(requests.RequestException, match="Connection error"):
             notifier.send(summaries)
 
-    @patch('arxiv_agent.notification.base_webhook_notifier.requests.post')
+    @patch('arxiv_agent.notification.base_webhook_notifier.requests.Session.post')
     def test_send_timeout_parameter(self, mock_post):
         """Should set timeout to 10 seconds."""
         mock_response = Mock()
@@ -80,3 +80,104 @@ class TestBaseWebhookNotifier:
 
         # Verify timeout parameter
         assert mock_post.call_args[1]['timeout'] == 10
+
+    def test_format_message_lists_related_papers(self):
+        """Should list near-duplicate papers merged into a summary."""
+        notifier = ConcreteWebhookNotifier("http://test.webhook")
+        summaries = [
+            Summary(paper_id="1", title="Test", summary_text="Summary", related_ids=["2", "3"])
+        ]
+
+        message = notifier._format_message(summaries)
+
+        assert "ID: 1\n関連: 2, 3\nSummary" in message
+
+    def test_format_message_marks_pending_and_follow_up(self):
+        """Should show pending summaries and a follow-up heading."""
+        notifier = ConcreteWebhookNotifier("http://test.webhook")
+        summaries = [
+            Summary(paper_id="1", title="Test", summary_text="", pending=True)
+        ]
+
+        digest = notifier._format_message(summaries)
+        follow_up = notifier._format_message(summaries[:0], follow_up=True)
+
+        assert "続報で配信します" in digest
+        assert follow_up.startswith("📚 **論文要約・続報 (0件)**")
+
+    def test_send_uses_injected_session(self):
+        """Should post through the injected pooled session with its timeout."""
+        session = Mock()
+        notifier = ConcreteWebhookNotifier("http://test.webhook")
+        notifier.session = session
+        notifier.timeout = 3
+
+        notifier.send([Summary(paper_id="1", title="Test", summary_text="Summary")])
+
+        session.post.assert_called_once()
+        assert session.post.call_args[1]['timeout'] == 3
+
+    def test_send_retries_rate_limited_request(self):
+        """Should retry a 429 through the injected rate limiter."""
+        from arxiv_agent.notification.rate_limiter import WebhookRateLimiter
+
+        limited = Mock(status_code=429, headers={"Retry-After": "1"})
+        limited.json.return_value = None
+        ok = Mock(status_code=204, headers={})
+        session = Mock()
+        session.post.side_effect = [limited, ok]
+        now = [0.0]
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        notifier = ConcreteWebhookNotifier("http://test.webhook")
+        notifier.session = session
+        notifier.rate_limiter = WebhookRateLimiter(
+            jitter=0.0, max_requests_per_second=None, clock=lambda: now[0], sleep=sleep
+        )
+
+        notifier.send([Summary(paper_id="1", title="Test", summary_text="Summary")])
+
+        assert session.post.call_count == 2
+        assert sleeps == [pytest.approx(1.0)]
+        ok.raise_for_status.assert_called_once()
+
+    def test_send_splits_long_digest_into_messages(self):
+        """Should send a digest over the message limit as several ordered messages."""
+        session = Mock()
+        notifier = ConcreteWebhookNotifier("http://test.webhook")
+        notifier.session = session
+        notifier.message_limit = 200
+        summaries = [
+            Summary(paper_id=str(i), title=f"Paper {i}", summary_text="要約" * 60) for i in range(3)
+        ]
+
+        notifier.send(summaries)
+
+        sent = [call[1]["json"]["text"] for call in session.post.call_args_list]
+        assert len(sent) == 3
+        assert all(len(text) <= 200 for text in sent)
+        assert sent[0].startswith("📚 **論文要約 (3件)**")
+        assert [text.split("\n")[0] for text in sent[1:]] == ["**2. Paper 1**", "**3. Paper 2**"]
+
+    def test_channels_share_rendered_entries(self):
+        """Should build each entry once for all notifiers with a dialect."""
+        from arxiv_agent.notification import base_webhook_notifier
+        from arxiv_agent.notification.discord import DiscordNotifier
+        from arxiv_agent.notification.slack import SlackNotifier
+
+        summaries = [Summary(paper_id="shared-1", title="Shared", summary_text="Summary")]
+        slack = SlackNotifier(webhook_url="http://slack.test")
+        discord = DiscordNotifier(webhook_url="http://discord.test")
+
+        with patch.object(base_webhook_notifier, "_fragment", wraps=base_webhook_notifier._fragment) as build:
+            slack_entry = slack._format_entries(summaries)
+            discord_entry = discord._format_entries(summaries)
+            assert slack._format_entries(summaries) == slack_entry
+
+        assert build.call_count == 1
+        assert slack_entry == ["*1. Shared*\nID: shared-1\nSummary\n"]
+        assert discord_entry == ["**1. Shared**\nID: shared-1\nSummary\n"]
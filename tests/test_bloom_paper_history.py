@@ -0,0 +1,141 @@
+"""Tests for the Bloom filter and Bloom-fronted paper history."""
+import multiprocessing
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from arxiv_agent.history import (
+    BloomFilter,
+    BloomPaperHistory,
+    SqlitePaperHistory,
+    open_history,
+)
+
+
+def _add_keys(filter_file: str, prefix: str) -> None:
+    bloom = BloomFilter(filter_file)
+    for start in range(0, 2000, 10):
+        bloom.add_many([f"{prefix}.{i:05d}" for i in range(start, start + 10)])
+    bloom.close()
+
+
+class TestBloomFilter:
+    """Test cases for BloomFilter class."""
+
+    def test_inserted_keys_are_found(self, tmp_path: Path) -> None:
+        """Test there are no false negatives."""
+        bloom = BloomFilter(str(tmp_path / "ids.bloom"), capacity=1000, false_positive_rate=0.01)
+        keys = [f"2301.{i:05d}" for i in range(1000)]
+        bloom.add_many(keys)
+
+        assert bloom.contains_many(keys).all()
+
+    def test_false_positive_rate(self, tmp_path: Path) -> None:
+        """Test the observed false positive rate is near the target."""
+        bloom = BloomFilter(str(tmp_path / "ids.bloom"), capacity=2000, false_positive_rate=0.01)
+        bloom.add_many([f"2301.{i:05d}" for i in range(2000)])
+
+        absent = [f"2402.{i:05d}" for i in range(10000)]
+        assert bloom.contains_many(absent).mean() < 0.03
+
+    def test_persists_across_reopen(self, tmp_path: Path) -> None:
+        """Test the filter file keeps its bits and size."""
+        filter_file = tmp_path / "ids.bloom"
+        bloom = BloomFilter(str(filter_file), capacity=100)
+        bloom.add_many(["2301.12345"])
+        bloom.close()
+
+        reopened = BloomFilter(str(filter_file), capacity=999999)
+
+        assert not reopened.created
+        assert reopened.num_bits == bloom.num_bits
+        assert "2301.12345" in reopened
+
+    def test_tracks_set_bits_incrementally(self, tmp_path: Path) -> None:
+        """Test the running count of set bits matches the bit array."""
+        bloom = BloomFilter(str(tmp_path / "ids.bloom"), capacity=100, false_positive_rate=0.01)
+        for i in range(300):
+            bloom.add_many([f"2301.{i:05d}", f"2301.{i:05d}"])
+
+        assert bloom._set_bits == round(bloom.fill_ratio() * bloom.num_bits)
+
+    def test_concurrent_writers_keep_all_bits(self, tmp_path: Path) -> None:
+        """Test processes inserting at once lose none of each other's keys."""
+        filter_file = str(tmp_path / "ids.bloom")
+        BloomFilter(filter_file, capacity=1000, false_positive_rate=0.01).close()
+        context = multiprocessing.get_context("fork")
+        processes = [context.Process(target=_add_keys, args=(filter_file, prefix)) for prefix in ("2301", "2302")]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        bloom = BloomFilter(filter_file)
+        assert bloom.contains_many([f"{prefix}.{i:05d}" for prefix in ("2301", "2302") for i in range(2000)]).all()
+
+    def test_invalid_parameters(self, tmp_path: Path) -> None:
+        """Test invalid sizing is rejected."""
+        with pytest.raises(ValueError, match="capacity"):
+            BloomFilter(str(tmp_path / "a.bloom"), capacity=0)
+        with pytest.raises(ValueError, match="false_positive_rate"):
+            BloomFilter(str(tmp_path / "b.bloom"), false_positive_rate=1.0)
+
+    def test_rejects_foreign_file(self, tmp_path: Path) -> None:
+        """Test a file without the filter header is rejected."""
+        filter_file = tmp_path / "ids.bloom"
+        filter_file.write_bytes(b"x" * 64)
+
+        with pytest.raises(ValueError, match="not a Bloom filter"):
+            BloomFilter(str(filter_file))
+
+
+class TestBloomPaperHistory:
+    """Test cases for BloomPaperHistory class."""
+
+    def test_negatives_skip_store(self, tmp_path: Path) -> None:
+        """Test IDs absent from the filter never reach the store."""
+        store = MagicMock()
+        store.processed_ids.return_value = ["2301.00001v1"]
+        store.is_processed.return_value = True
+        history = BloomPaperHistory(store, BloomFilter(str(tmp_path / "ids.bloom"), capacity=100))
+
+        assert not history.is_processed("2402.99999v1")
+        store.is_processed.assert_not_called()
+        assert history.is_processed("2301.00001v1")
+        store.is_processed.assert_called_once_with("2301.00001v1")
+
+    def test_processed_among_checks_only_candidates(self, tmp_path: Path) -> None:
+        """Test batch lookups send only probable positives to the store."""
+        store = MagicMock()
+        store.processed_ids.return_value = ["2301.00001v1"]
+        store.processed_among.return_value = {"2301.00001v1"}
+        history = BloomPaperHistory(store, BloomFilter(str(tmp_path / "ids.bloom"), capacity=100))
+
+        result = history.processed_among(["2402.99999v1", "2301.00001v1"])
+
+        assert result == {"2301.00001v1"}
+        store.processed_among.assert_called_once_with(["2301.00001v1"])
+
+    def test_marks_reach_store_and_filter(self, tmp_path: Path) -> None:
+        """Test marks are written to both the store and the filter."""
+        store = SqlitePaperHistory(str(tmp_path / "history.db"))
+        history = BloomPaperHistory(store, BloomFilter(str(tmp_path / "ids.bloom"), capacity=100))
+        history.mark_processed(["2301.12345v1"])
+
+        assert history.is_processed("2301.12345v1")
+        assert store.is_processed("2301.12345v1")
+        assert "2301.12345v1" in history.bloom
+
+    def test_open_history_builds_filter_from_store(self, tmp_path: Path) -> None:
+        """Test a new filter is populated from an existing store."""
+        history_file = tmp_path / "history.db"
+        store = SqlitePaperHistory(str(history_file))
+        store.mark_processed(["2301.12345v1"])
+        store.close()
+
+        history = open_history(str(history_file), bloom_false_positive_rate=0.01, bloom_capacity=100)
+
+        assert isinstance(history, BloomPaperHistory)
+        assert (tmp_path / "history.bloom").exists()
+        assert history.is_processed("2301.12345v1")
@@ -0,0 +1,66 @@
+"""Tests for platform-aware message chunking."""
+import pytest
+from arxiv_agent.notification.chunker import DISCORD_MESSAGE_LIMIT, chunk_messages, split_text
+
+
+class TestSplitText:
+    """Test cases for split_text."""
+
+    def test_short_text_is_one_piece(self):
+        """Should keep text within the limit unchanged."""
+        assert split_text("短い要約です。", 100) == ["短い要約です。"]
+
+    def test_prefers_paragraph_boundaries(self):
+        """Should cut between paragraphs before cutting inside one."""
+        text = "a" * 60 + "\n\n" + "b" * 30 + "\n" + "c" * 30
+
+        assert split_text(text, 100) == ["a" * 60, "b" * 30 + "\n" + "c" * 30]
+
+    def test_falls_back_to_lines_sentences_and_words(self):
+        """Should cut at the best boundary available in the window."""
+        lines = "1. どんなもの?\n" + "x" * 70 + "\n2. 先行研究と比べてどこがすごい?\n" + "y" * 70
+        sentences = "これは文です。" * 30
+        words = "word " * 50
+
+        assert split_text(lines, 100)[1].startswith("2. 先行研究")
+        assert all(piece.endswith("。") for piece in split_text(sentences, 100))
+        assert all(len(piece) <= 100 and not piece.endswith(" wor") for piece in split_text(words, 100))
+
+    def test_hard_cuts_text_without_boundaries(self):
+        """Should cut at the limit when the text has no boundary."""
+        assert split_text("x" * 250, 100) == ["x" * 100, "x" * 100, "x" * 50]
+
+    def test_invalid_limit(self):
+        """Should raise ValueError for a non-positive limit."""
+        with pytest.raises(ValueError, match="limit must be positive"):
+            split_text("text", 0)
+
+
+class TestChunkMessages:
+    """Test cases for chunk_messages."""
+
+    def test_packs_entries_in_order(self):
+        """Should fill each message before starting the next."""
+        messages = chunk_messages(["a" * 40, "b" * 40, "c" * 40], 100, header="H\n", separator="\n")
+
+        assert messages == ["H\n" + "a" * 40 + "\n" + "b" * 40, "c" * 40]
+
+    def test_every_message_fits_the_limit(self):
+        """Should split long summaries so no message exceeds the limit."""
+        entries = [f"*Paper {i}*\n" + ("段落の文です。" * 200 + "\n\n") * 3 for i in range(5)]
+
+        messages = chunk_messages(entries, DISCORD_MESSAGE_LIMIT, header="📰 **Digest**\n\n", separator="\n---\n")
+
+        assert len(messages) > 5
+        assert all(len(message) <= DISCORD_MESSAGE_LIMIT for message in messages)
+        assert messages[0].startswith("📰 **Digest**")
+        assert "".join(messages).count("段落の文です。") == 5 * 3 * 200
+
+    def test_header_only_without_entries(self):
+        """Should still send the header when there are no entries."""
+        assert chunk_messages([], 100, header="H\n") == ["H\n"]
+
+    def test_header_must_leave_room(self):
+        """Should raise ValueError when the header fills the message."""
+        with pytest.raises(ValueError, match="limit must leave room"):
+            chunk_messages(["a"], 10, header="x" * 10)
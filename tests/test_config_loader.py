@@ -5,6 +5,25 @@ from pathlib import Path
 from arxiv_agent.config.loader import load_config
 from arxiv_agent.config.models import Config
 
+BASE_CONFIG = """
+arxiv:
+  categories:
+    - cs.AI
+  keywords:
+    - LLM
+  max_results: 10
+gemini:
+  model: gemini-pro
+  temperature: 0.7
+  max_tokens: 1000
+  prompt_template: "{title} {authors} {abstract}"
+notification:
+  slack:
+    enabled: false
+  discord:
+    enabled: false
+"""
+
 
 class TestConfigLoader:
     """Test cases for configuration loader."""
@@ -208,3 +227,371 @@ notification:
         assert len(config.arxiv.keywords) == 26
 
         assert config.arxiv.max_results == 10
+
+    def test_load_config_summarization_defaults(self, tmp_path):
+        """Should use Gemini without fallback when summarization is omitted."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(BASE_CONFIG)
+
+        config = load_config(str(config_file))
+
+        assert config.summarization.backend == "gemini"
+        assert config.summarization.fallback is False
+        assert config.summarization.max_sentences == 3
+
+    def test_load_config_with_extractive_backend(self, tmp_path):
+        """Should load extractive summarization settings."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(BASE_CONFIG + """
+summarization:
+  backend: extractive
+  max_sentences: 5
+""")
+
+        config = load_config(str(config_file))
+
+        assert config.summarization.backend == "extractive"
+        assert config.summarization.max_sentences == 5
+
+    def test_load_config_invalid_summarization_backend(self, tmp_path):
+        """Should raise ValueError for unknown summarization backend."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(BASE_CONFIG + """
+summarization:
+  backend: openai
+""")
+
+        with pytest.raises(ValueError, match="summarization.backend must be one of"):
+            load_config(str(config_file))
+
+    def test_load_config_with_ranking(self, tmp_path):
+        """Should load ranking profile settings."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(BASE_CONFIG + """
+ranking:
+  top_k: 5
+  keyword_weights:
+    LLM: 2
+    Transformer: 0.5
+  exemplars:
+    - "We study code generation with language models."
+""")
+
+        config = load_config(str(config_file))
+
+        assert config.ranking.top_k == 5
+        assert config.ranking.keyword_weights == {"LLM": 2.0, "Transformer": 0.5}
+        assert len(config.ranking.exemplars) == 1
+
+    def test_load_config_invalid_ranking_top_k(self, tmp_path):
+        """Should raise ValueError when ranking.top_k is not positive."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(BASE_CONFIG + """
+ranking:
+  top_k: 0
+""")
+
+        with pytest.raises(ValueError, match="ranking.top_k must be a positive integer"):
+            load_config(str(config_file))
+
+    def test_load_config_with_dedup(self, tmp_path):
+        """Should load dedup section with defaults."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(BASE_CONFIG + """
+dedup:
+  index_dir: data/minhash
+  threshold: 0.9
+""")
+
+        config = load_config(str(config_file))
+
+        assert config.dedup.index_dir == "data/minhash"
+        assert config.dedup.threshold == 0.9
+        assert config.dedup.num_perm == 128
+        assert config.dedup.bands == 16
+
+    def test_load_config_invalid_dedup_bands(self, tmp_path):
+        """Should raise ValueError when num_perm is not divisible by bands."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(BASE_CONFIG + """
+dedup:
+  index_dir: data/minhash
+  num_perm: 100
+  bands: 16
+""")
+
+        with pytest.raises(ValueError, match="dedup.num_perm must be a positive multiple of dedup.bands"):
+            load_config(str(config_file))
+
+    def test_load_config_with_summary_cache(self, tmp_path):
+        """Should load summary_cache section with defaults."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(BASE_CONFIG + """
+summary_cache:
+  dir: data/summary_cache
+""")
+
+        config = load_config(str(config_file))
+
+        assert config.summary_cache.dir == "data/summary_cache"
+        assert config.summary_cache.reuse_threshold == 0.95
+        assert config.summary_cache.update_threshold == 0.8
+
+    def test_load_config_invalid_summary_cache_thresholds(self, tmp_path):
+        """Should raise ValueError when update_threshold exceeds reuse_threshold."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(BASE_CONFIG + """
+summary_cache:
+  dir: data/summary_cache
+  reuse_threshold: 0.8
+  update_threshold: 0.9
+""")
+
+        with pytest.raises(ValueError, match="summary_cache thresholds must satisfy"):
+            load_config(str(config_file))
+
+    def test_load_config_with_key_pool(self, tmp_path):
+        """Should load gemini.key_pool section."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(BASE_CONFIG.replace("gemini:\n", """gemini:
+  key_pool:
+    state_file: data/pool.json
+    requests_per_day: 1500
+"""))
+
+        config = load_config(str(config_file))
+
+        assert config.gemini.key_pool.state_file == "data/pool.json"
+        assert config.gemini.key_pool.requests_per_day == 1500
+        assert config.gemini.key_pool.requests_per_minute is None
+
+    def test_load_config_invalid_key_pool_limit(self, tmp_path):
+        """Should raise ValueError when a key pool limit is not positive."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(BASE_CONFIG.replace("gemini:\n", """gemini:
+  key_pool:
+    requests_per_minute: 0
+"""))
+
+        with pytest.raises(ValueError, match="gemini.key_pool.requests_per_minute must be a positive integer"):
+            load_config(str(config_file))
+
+    def test_load_config_with_quota(self, tmp_path):
+        """Should load quota section with defaults."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(BASE_CONFIG + """
+quota:
+  ledger_file: data/quota.json
+  requests_per_day: 1500
+""")
+
+        config = load_config(str(config_file))
+
+        assert config.quota.requests_per_day == 1500
+        assert config.quota.runs_per_day == 1
+        assert config.quota.tokens_per_day is None
+
+    def test_load_config_missing_quota_limit(self, tmp_path):
+        """Should raise ValueError when quota.requests_per_day is missing."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(BASE_CONFIG + """
+quota:
+  ledger_file: data/quota.json
+""")
+
+        with pytest.raises(ValueError, match="quota.requests_per_day must be a positive integer"):
+            load_config(str(config_file))
+
+    def test_load_config_with_deadline(self, tmp_path):
+        """Should load deadline section, accepting unquoted YAML times."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(BASE_CONFIG + """
+deadline:
+  at: 10:30
+  timezone: Asia/Tokyo
+""")
+
+        config = load_config(str(config_file))
+
+        assert config.deadline.at == "10:30"
+        assert config.deadline.timezone == "Asia/Tokyo"
+        assert config.deadline.safety_margin_seconds == 60.0
+
+    def test_load_config_invalid_deadline_timezone(self, tmp_path):
+        """Should raise ValueError for an unknown timezone."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(BASE_CONFIG + """
+deadline:
+  at: "09:00"
+  timezone: Mars/Olympus
+""")
+
+        with pytest.raises(ValueError, match="deadline.timezone is not a valid timezone"):
+            load_config(str(config_file))
+
+    def test_load_config_with_history_file(self, tmp_path):
+        """Should accept a top-level history_file as shorthand for the history section."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(BASE_CONFIG + """
+history_file: data/history.json
+""")
+
+        config = load_config(str(config_file))
+
+        assert config.history.file == "data/history.json"
+        assert config.history.bloom_false_positive_rate is None
+
+    def test_load_config_with_history_section(self, tmp_path):
+        """Should load the history section with Bloom filter settings."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(BASE_CONFIG + """
+history:
+  file: data/history.db
+  bloom_false_positive_rate: 0.001
+  lease_seconds: 600
+""")
+
+        config = load_config(str(config_file))
+
+        assert config.history.file == "data/history.db"
+        assert config.history.bloom_false_positive_rate == 0.001
+        assert config.history.lease_seconds == 600.0
+
+    @pytest.mark.parametrize("history_file", ["data/history.log", "data/history.i64", "data/history"])
+    def test_load_config_leases_require_claim_backend(self, tmp_path, history_file):
+        """Should reject leases for backends that cannot claim papers."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(BASE_CONFIG + f"""
+history:
+  file: {history_file}
+  lease_seconds: 600
+""")
+
+        with pytest.raises(ValueError, match="history.lease_seconds requires a JSON or SQLite history file"):
+            load_config(str(config_file))
+
+    def test_load_config_invalid_max_scan_results(self, tmp_path):
+        """Should raise ValueError when max_scan_results is below max_results."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(BASE_CONFIG.replace("max_results: 10", "max_results: 10\n  max_scan_results: 5"))
+
+        with pytest.raises(ValueError, match="arxiv.max_scan_results must be an integer"):
+            load_config(str(config_file))
+
+    def test_load_config_notification_http_defaults(self, tmp_path):
+        """Should default the pooled HTTP session settings."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(BASE_CONFIG)
+
+        config = load_config(str(config_file))
+
+        assert config.notification.http.pool_size == 10
+        assert config.notification.http.timeout_seconds == 10.0
+
+    def test_load_config_invalid_http_pool_size(self, tmp_path):
+        """Should raise ValueError for a non-positive pool size."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(BASE_CONFIG + """  http:
+    pool_size: 0
+""")
+
+        with pytest.raises(ValueError, match="notification.http.pool_size must be a positive integer"):
+            load_config(str(config_file))
+
+    def test_load_config_rate_limit_section(self, tmp_path):
+        """Should load webhook rate limit settings, allowing no global cap."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(BASE_CONFIG + """  rate_limit:
+    max_retries: 5
+    max_requests_per_second: null
+""")
+
+        config = load_config(str(config_file))
+
+        assert config.notification.rate_limit.max_retries == 5
+        assert config.notification.rate_limit.max_requests_per_second is None
+        assert config.notification.rate_limit.max_retry_after_seconds == 60.0
+
+    def test_load_config_invalid_rate_limit_jitter(self, tmp_path):
+        """Should raise ValueError for negative jitter."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(BASE_CONFIG + """  rate_limit:
+    jitter: -1
+""")
+
+        with pytest.raises(ValueError, match="notification.rate_limit.jitter must be a non-negative number"):
+            load_config(str(config_file))
+
+    def test_load_config_invalid_channel_timeout(self, tmp_path):
+        """Should raise ValueError for a non-positive channel timeout."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(BASE_CONFIG + "  channel_timeout_seconds: 0\n")
+
+        with pytest.raises(ValueError, match="notification.channel_timeout_seconds must be a positive number"):
+            load_config(str(config_file))
+
+    def test_load_config_outbox_section(self, tmp_path):
+        """Should load the notification outbox with defaults."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(BASE_CONFIG + """  outbox:
+    file: data/outbox.jsonl
+""")
+
+        config = load_config(str(config_file))
+
+        assert config.notification.outbox.file == "data/outbox.jsonl"
+        assert config.notification.outbox.max_attempts == 10
+        assert config.notification.outbox.retention_days == 7.0
+
+    def test_load_config_invalid_outbox_file(self, tmp_path):
+        """Should raise ValueError for an outbox without a file."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(BASE_CONFIG + """  outbox:
+    max_attempts: 3
+""")
+
+        with pytest.raises(ValueError, match="notification.outbox.file must be a non-empty string"):
+            load_config(str(config_file))
+
+    def test_load_config_pipeline_section(self, tmp_path):
+        """Should load the staged pipeline limits with defaults."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(BASE_CONFIG + """pipeline:
+  summarize_workers: 8
+""")
+
+        config = load_config(str(config_file))
+
+        assert config.pipeline.summarize_workers == 8
+        assert config.pipeline.queue_size == 16
+
+    def test_load_config_invalid_pipeline_workers(self, tmp_path):
+        """Should raise ValueError for a non-positive worker count."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(BASE_CONFIG + """pipeline:
+  summarize_workers: 0
+""")
+
+        with pytest.raises(ValueError, match="pipeline.summarize_workers must be a positive integer"):
+            load_config(str(config_file))
+
+    def test_load_config_serve_defaults(self, tmp_path):
+        """Should schedule serve mode after arXiv announcements by default."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(BASE_CONFIG)
+
+        config = load_config(str(config_file))
+
+        assert config.serve.schedule == "15 20 * * 0-4"
+        assert config.serve.timezone == "America/New_York"
+        assert config.serve.skip_without_announcement is True
+
+    def test_load_config_invalid_serve_schedule(self, tmp_path):
+        """Should raise ValueError for an invalid cron expression."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(BASE_CONFIG + """serve:
+  schedule: "0 25 * * *"
+""")
+
+        with pytest.raises(ValueError, match="serve.schedule is invalid"):
+            load_config(str(config_file))
@@ -0,0 +1,85 @@
+"""Tests for cron schedules and arXiv announcement times."""
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from arxiv_agent.scheduling import CronSchedule, announced_since
+
+NEW_YORK = ZoneInfo("America/New_York")
+
+
+def _ts(*args, tz=NEW_YORK) -> float:
+    return datetime(*args, tzinfo=tz).timestamp()
+
+
+class TestCronSchedule:
+    """Test cases for CronSchedule class."""
+
+    def test_next_after_skips_to_scheduled_weekday(self):
+        """Should skip Friday and Saturday for a Sunday-Thursday schedule."""
+        schedule = CronSchedule("15 20 * * 0-4", "America/New_York")
+
+        # Friday evening, after the schedule time
+        assert schedule.next_after(_ts(2024, 1, 5, 21, 0)) == _ts(2024, 1, 7, 20, 15)
+
+    def test_next_after_is_strictly_later(self):
+        """Should not return the current minute again."""
+        schedule = CronSchedule("*/15 * * * *")
+        now = _ts(2024, 1, 1, 10, 15, tz=ZoneInfo("UTC"))
+
+        assert schedule.next_after(now) == _ts(2024, 1, 1, 10, 30, tz=ZoneInfo("UTC"))
+
+    def test_lists_and_ranges(self):
+        """Should support lists, ranges and steps."""
+        schedule = CronSchedule("0,30 9-17/4 * * *")
+        now = _ts(2024, 1, 1, 13, 45, tz=ZoneInfo("UTC"))
+
+        assert schedule.next_after(now) == _ts(2024, 1, 1, 17, 0, tz=ZoneInfo("UTC"))
+
+    def test_day_of_month_or_day_of_week(self):
+        """Should match either restricted day field, as cron does."""
+        schedule = CronSchedule("0 0 13 * 5")
+
+        # Monday 2024-09-09: Friday the 13th matches both fields
+        assert schedule.next_after(_ts(2024, 9, 9, tz=ZoneInfo("UTC"))) == _ts(2024, 9, 13, tz=ZoneInfo("UTC"))
+        # Saturday 2024-09-14: Friday the 20th comes before October 13th
+        assert schedule.next_after(_ts(2024, 9, 14, tz=ZoneInfo("UTC"))) == _ts(2024, 9, 20, tz=ZoneInfo("UTC"))
+
+    def test_sunday_as_seven(self):
+        """Should accept 7 for Sunday."""
+        schedule = CronSchedule("0 12 * * 7")
+
+        assert schedule.next_after(_ts(2024, 1, 1, tz=ZoneInfo("UTC"))) == _ts(2024, 1, 7, 12, tz=ZoneInfo("UTC"))
+
+    def test_follows_daylight_saving_time(self):
+        """Should keep the local wall-clock time across a DST change."""
+        schedule = CronSchedule("0 20 * * *", "America/New_York")
+
+        # 2024-03-10: clocks move from EST (UTC-5) to EDT (UTC-4)
+        assert schedule.next_after(_ts(2024, 3, 10, 12, 0)) == _ts(2024, 3, 10, 20, 0)
+        assert _ts(2024, 3, 10, 20, 0) - _ts(2024, 3, 9, 20, 0) == 23 * 3600
+
+    @pytest.mark.parametrize("expression", ["* * * *", "60 * * * *", "* * 0 * *", "*/0 * * * *", "a * * * *"])
+    def test_invalid_expression(self, expression):
+        """Should reject malformed fields and out-of-range values."""
+        with pytest.raises(ValueError):
+            CronSchedule(expression)
+
+    def test_never_matching_expression(self):
+        """Should raise instead of searching forever."""
+        with pytest.raises(ValueError, match="never matches"):
+            CronSchedule("0 0 31 2 *").next_after(0.0)
+
+
+class TestAnnouncedSince:
+    """Test cases for arXiv announcement awareness."""
+
+    def test_announcement_between_cycles(self):
+        """Should report the 20:00 Eastern announcement between two moments."""
+        assert announced_since(_ts(2024, 1, 8, 19, 0), _ts(2024, 1, 8, 20, 30))
+        assert not announced_since(_ts(2024, 1, 8, 20, 30), _ts(2024, 1, 9, 19, 0))
+
+    def test_no_announcement_on_friday_and_saturday(self):
+        """Should report no announcement from Thursday night to Sunday afternoon."""
+        assert not announced_since(_ts(2024, 1, 11, 20, 30), _ts(2024, 1, 14, 12, 0))
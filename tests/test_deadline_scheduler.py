@@ -0,0 +1,77 @@
+"""Tests for deadline scheduler."""
+from datetime import datetime, timezone
+
+import pytest
+
+from arxiv_agent.scheduling import DeadlineScheduler, resolve_deadline
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestResolveDeadline:
+    """Test cases for resolve_deadline function."""
+
+    def test_same_day_deadline(self) -> None:
+        """Test a run shortly before the deadline gets today's deadline."""
+        now = datetime(2024, 5, 1, 23, 50, tzinfo=timezone.utc).timestamp()  # 08:50 JST
+
+        deadline = resolve_deadline("09:00", "Asia/Tokyo", now)
+
+        assert deadline - now == 600
+
+    def test_deadline_just_passed(self) -> None:
+        """Test a run just after the deadline does not wait for tomorrow's."""
+        now = datetime(2024, 5, 2, 0, 5, tzinfo=timezone.utc).timestamp()  # 09:05 JST
+
+        assert resolve_deadline("09:00", "Asia/Tokyo", now) - now == -300
+
+    def test_next_morning_deadline(self) -> None:
+        """Test an evening run targets the next morning."""
+        now = datetime(2024, 5, 1, 13, 0, tzinfo=timezone.utc).timestamp()  # 22:00 JST
+
+        assert resolve_deadline("09:00", "Asia/Tokyo", now) - now == 11 * 3600
+
+
+class TestDeadlineScheduler:
+    """Test cases for DeadlineScheduler class."""
+
+    def test_has_time_for_uses_estimates_and_margin(self) -> None:
+        """Test work is allowed only if it fits before the deadline."""
+        clock = FakeClock()
+        scheduler = DeadlineScheduler(
+            deadline=1100.0, estimates={"summarize": 30.0, "notify": 10.0}, safety_margin=20.0, clock=clock
+        )
+
+        assert scheduler.has_time_for("summarize", "notify")
+        clock.now = 1045.0
+        assert not scheduler.has_time_for("summarize", "notify")
+
+    def test_timed_updates_estimate(self) -> None:
+        """Test observed durations move the estimate."""
+        clock = FakeClock()
+        scheduler = DeadlineScheduler(deadline=2000.0, estimates={"summarize": 10.0}, smoothing=0.5, clock=clock)
+
+        with scheduler.timed("summarize"):
+            clock.now += 30.0
+
+        assert scheduler.estimate("summarize") == 20.0
+
+    def test_unknown_stage_takes_first_observation(self) -> None:
+        """Test a stage without an estimate adopts its first observation."""
+        scheduler = DeadlineScheduler(deadline=2000.0, clock=FakeClock())
+        scheduler.record("notify", 4.0)
+
+        assert scheduler.estimate("notify") == 4.0
+
+    def test_invalid_smoothing(self) -> None:
+        """Test smoothing must be in (0, 1]."""
+        with pytest.raises(ValueError, match="smoothing must be between 0 and 1"):
+            DeadlineScheduler(deadline=0.0, smoothing=0)
@@ -0,0 +1,98 @@
+"""Tests for extractive summarizer."""
+import pytest
+from datetime import datetime
+from arxiv_agent.collection.models import Paper
+from arxiv_agent.summarization.extractive_summarizer import ExtractiveSummarizer
+
+
+def _make_paper(abstract: str) -> Paper:
+    return Paper(
+        arxiv_id="2401.00001v1",
+        title="Test Paper",
+        authors=["Author A"],
+        abstract=abstract,
+        published=datetime(2024, 1, 1),
+        categories=["cs.AI"],
+        pdf_url="https://arxiv.org/pdf/2401.00001v1.pdf",
+    )
+
+
+class TestExtractiveSummarizer:
+    """Test cases for ExtractiveSummarizer."""
+
+    def test_init_with_invalid_max_sentences(self):
+        """Should raise ValueError when max_sentences is not positive."""
+        with pytest.raises(ValueError, match="max_sentences must be positive"):
+            ExtractiveSummarizer(max_sentences=0)
+
+    def test_init_with_unsupported_language(self):
+        """Should raise ValueError for unsupported language."""
+        with pytest.raises(ValueError, match="language must be one of"):
+            ExtractiveSummarizer(language="fr")
+
+    def test_summarize_fills_summary_model(self):
+        """Should return Summary with paper ID, title and Japanese heading."""
+        summarizer = ExtractiveSummarizer(max_sentences=2)
+        paper = _make_paper(
+            "Large language models are powerful. "
+            "We propose a new method for language models. "
+            "Experiments show the method improves language models."
+        )
+
+        summary = summarizer.summarize(paper)
+
+        assert summary.paper_id == "2401.00001v1"
+        assert summary.title == "Test Paper"
+        assert summary.summary_text.startswith("**要点（抽出型要約）**")
+        assert summary.summary_text.count("\n- ") == 2
+
+    def test_summarize_keeps_original_sentence_order(self):
+        """Should output extracted sentences in their original order."""
+        summarizer = ExtractiveSummarizer(max_sentences=3)
+        sentences = [
+            "Transformers dominate sequence modeling.",
+            "We study transformers for code generation.",
+            "Code generation with transformers improves accuracy.",
+        ]
+        summary = summarizer.summarize(_make_paper(" ".join(sentences)))
+
+        positions = [summary.summary_text.index(s) for s in sentences]
+        assert positions == sorted(positions)
+
+    def test_summarize_prefers_central_sentences(self):
+        """Should drop the sentence least similar to the rest."""
+        summarizer = ExtractiveSummarizer(max_sentences=2)
+        paper = _make_paper(
+            "Retrieval augmented generation improves language model accuracy. "
+            "The weather was sunny yesterday. "
+            "Language model accuracy benefits from retrieval augmented generation."
+        )
+
+        summary = summarizer.summarize(paper)
+
+        assert "weather" not in summary.summary_text
+
+    def test_summarize_japanese_abstract(self):
+        """Should split Japanese sentences on full-width terminators."""
+        summarizer = ExtractiveSummarizer(max_sentences=1)
+        paper = _make_paper("大規模言語模型を提案する。大規模言語模型は高精度である。天気は晴れ。")
+
+        summary = summarizer.summarize(paper)
+
+        assert summary.summary_text.count("\n- ") == 1
+        assert "大規模言語模型" in summary.summary_text
+
+    def test_summarize_with_english_heading(self):
+        """Should use English heading when language is 'en'."""
+        summarizer = ExtractiveSummarizer(language="en")
+
+        summary = summarizer.summarize(_make_paper("A single sentence."))
+
+        assert summary.summary_text == "**Key points (extractive summary)**\n- A single sentence."
+
+    def test_summarize_with_empty_abstract(self):
+        """Should raise ValueError when abstract has no sentences."""
+        summarizer = ExtractiveSummarizer()
+
+        with pytest.raises(ValueError, match="no sentences"):
+            summarizer.summarize(_make_paper("   "))
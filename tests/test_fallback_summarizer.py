@@ -0,0 +1,70 @@
+"""Tests for fallback summarizer."""
+import pytest
+from datetime import datetime
+from unittest.mock import Mock
+from arxiv_agent.collection.models import Paper
+from arxiv_agent.summarization.base_summarizer import BaseSummarizer
+from arxiv_agent.summarization.fallback_summarizer import FallbackSummarizer
+from arxiv_agent.summarization.models import Summary
+
+
+@pytest.fixture
+def paper():
+    return Paper(
+        arxiv_id="2401.00001v1",
+        title="Test Paper",
+        authors=["Author A"],
+        abstract="Abstract.",
+        published=datetime(2024, 1, 1),
+        categories=["cs.AI"],
+        pdf_url="https://arxiv.org/pdf/2401.00001v1.pdf",
+    )
+
+
+class TestFallbackSummarizer:
+    """Test cases for FallbackSummarizer."""
+
+    def test_uses_primary_when_successful(self, paper):
+        """Should return primary summary without calling fallback."""
+        primary = Mock()
+        primary.summarize.return_value = Summary("2401.00001v1", "Test Paper", "primary")
+        fallback = Mock()
+
+        summary = FallbackSummarizer(primary, fallback).summarize(paper)
+
+        assert summary.summary_text == "primary"
+        assert not summary.degraded
+        fallback.summarize.assert_not_called()
+
+    def test_uses_fallback_when_primary_fails(self, paper):
+        """Should return fallback summary when primary raises."""
+        primary = Mock()
+        primary.summarize.side_effect = Exception("quota exceeded")
+        fallback = Mock()
+        fallback.summarize.return_value = Summary("2401.00001v1", "Test Paper", "fallback")
+
+        summary = FallbackSummarizer(primary, fallback).summarize(paper)
+
+        assert summary.summary_text == "fallback"
+        assert summary.degraded
+
+    def test_raises_when_both_fail(self, paper):
+        """Should propagate fallback error when both summarizers fail."""
+        primary = Mock()
+        primary.summarize.side_effect = Exception("quota exceeded")
+        fallback = Mock()
+        fallback.summarize.side_effect = ValueError("no sentences")
+
+        with pytest.raises(ValueError, match="no sentences"):
+            FallbackSummarizer(primary, fallback).summarize(paper)
+
+    def test_update_falls_back_when_primary_fails(self, paper):
+        """Should update with the fallback summarizer when the primary fails."""
+        primary = Mock(spec=BaseSummarizer)
+        primary.update.side_effect = RuntimeError("API error")
+        fallback = Mock(spec=BaseSummarizer)
+        previous = Summary(paper_id="2401.00001v1", title="T", summary_text="Old")
+
+        FallbackSummarizer(primary, fallback).update(paper, previous, ["New sentence."])
+
+        fallback.update.assert_called_once_with(paper, previous, ["New sentence."])
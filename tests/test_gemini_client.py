@@ -1,6 +1,10 @@
 """Tests for Gemini client."""
 import pytest
-from unittest.mock import patch
+from datetime import datetime
+from unittest.mock import Mock, patch
+from google.genai import errors, types
+from arxiv_agent.collection.models import Paper
+from arxiv_agent.summarization.api_key_pool import ApiKeyPool
 from arxiv_agent.summarization.gemini_client import GeminiClient
 from arxiv_agent.summarization.prompt_builder import PromptBuilder
 
@@ -89,3 +93,109 @@ class TestGeminiClient:
             assert client.model_name == "gemini-pro"
             assert client.temperature == 0.7
             assert client.max_tokens == 1000
+
+
+def _response(text, finish_reason=types.FinishReason.STOP):
+    candidate = Mock(finish_reason=finish_reason)
+    return Mock(text=text, candidates=[candidate])
+
+
+SECTIONS = [
+    "1. **どんなもの?**\nベンチマーク。",
+    "2. **先行研究と比べてどこがすごい?**\n実環境。",
+    "3. **技術や手法のキモはどこ?**\nサンドボックス。",
+    "4. **どうやって有効だと検証した?**\n12モデルで比較。",
+    "5. **議論はある?**\nコスト。",
+    "6. **次に読むべき論文は?**\nToolBench。",
+]
+
+
+class TestGeminiClientSections:
+    """Test cases for section checking and partial regeneration."""
+
+    @pytest.fixture
+    def paper(self):
+        return Paper(
+            arxiv_id="2401.00001v1",
+            title="Test Paper",
+            authors=["Author A"],
+            abstract="Abstract.",
+            published=datetime(2024, 1, 1),
+            categories=["cs.AI"],
+            pdf_url="https://arxiv.org/pdf/2401.00001v1.pdf",
+        )
+
+    @pytest.fixture
+    def client(self):
+        prompt_builder = PromptBuilder(template="Test: {title} by {authors}. {abstract}")
+        with patch.dict('os.environ', {'GEMINI_API_KEY': 'test-key'}, clear=True), \
+                patch('arxiv_agent.summarization.gemini_client.genai.Client'):
+            yield GeminiClient(
+                prompt_builder=prompt_builder,
+                model_name="gemini-pro",
+                temperature=0.7,
+                max_tokens=1000,
+            )
+
+    def test_complete_summary_is_kept_verbatim(self, client, paper):
+        """Should keep a complete response as is and attach parsed sections."""
+        text = "\n\n".join(SECTIONS)
+        client.clients["test-key"].models.generate_content.return_value = _response(text)
+
+        summary = client.summarize(paper)
+
+        assert summary.summary_text == text
+        assert summary.sections.missing() == []
+        assert client.clients["test-key"].models.generate_content.call_count == 1
+
+    def test_regenerates_only_truncated_sections(self, client, paper):
+        """Should request only the sections cut off at max_tokens."""
+        truncated = "\n\n".join(SECTIONS[:4]) + "\n\n5. **議論はある?**\nコ"
+        client.clients["test-key"].models.generate_content.side_effect = [
+            _response(truncated, types.FinishReason.MAX_TOKENS),
+            _response("\n\n".join(SECTIONS[4:])),
+        ]
+
+        summary = client.summarize(paper)
+
+        retry_prompt = client.clients["test-key"].models.generate_content.call_args_list[1][1]['contents']
+        assert "5. **議論はある?**" in retry_prompt
+        assert "4. **" not in retry_prompt
+        assert summary.sections.missing() == []
+        assert summary.summary_text == "\n\n".join(SECTIONS)
+
+    def test_unsectioned_response_is_not_regenerated(self, client, paper):
+        """Should keep responses from templates without sections."""
+        client.clients["test-key"].models.generate_content.return_value = _response("Plain summary.")
+
+        summary = client.summarize(paper)
+
+        assert summary.summary_text == "Plain summary."
+        assert summary.sections is None
+        assert client.clients["test-key"].models.generate_content.call_count == 1
+
+    def test_fails_over_to_another_key_on_quota_error(self, paper):
+        """Should retry on the next key when one key is rate limited."""
+        prompt_builder = PromptBuilder(template="Test: {title} by {authors}. {abstract}")
+        quota_error = errors.APIError(429, {"error": {
+            "code": 429,
+            "status": "RESOURCE_EXHAUSTED",
+            "details": [{"@type": "type.googleapis.com/google.rpc.RetryInfo", "retryDelay": "30s"}],
+        }})
+        with patch('arxiv_agent.summarization.gemini_client.genai.Client'):
+            client = GeminiClient(
+                prompt_builder=prompt_builder,
+                model_name="gemini-pro",
+                temperature=0.7,
+                max_tokens=1000,
+                key_pool=ApiKeyPool(["key-a", "key-b"]),
+            )
+        client.clients = {"key-a": Mock(), "key-b": Mock()}
+        client.clients["key-a"].models.generate_content.side_effect = quota_error
+        client.clients["key-b"].models.generate_content.return_value = _response("Plain summary.")
+
+        summary = client.summarize(paper)
+
+        assert summary.summary_text == "Plain summary."
+        assert client.clients["key-a"].models.generate_content.call_count == 1
+        assert client.key_pool.acquire() == "key-b"
@@ -0,0 +1,67 @@
+"""Tests for pooled HTTP sessions."""
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+from arxiv_agent.notification.http_session import RETRY_STATUSES, create_session
+
+
+class TestCreateSession:
+    """Test cases for create_session."""
+
+    def test_mounts_pooled_adapter_with_retries(self):
+        """Should configure pool size and gateway-error retries for both schemes."""
+        session = create_session(pool_size=3, max_retries=4)
+
+        for url in ("https://hooks.slack.com", "http://localhost"):
+            adapter = session.get_adapter(url)
+            assert adapter._pool_maxsize == 3
+            assert adapter.max_retries.total == 4
+            assert set(adapter.max_retries.status_forcelist) == set(RETRY_STATUSES)
+            assert "POST" in adapter.max_retries.allowed_methods
+
+    def test_rate_limits_are_not_retried_blindly(self):
+        """Should leave 429 handling to the caller."""
+        assert 429 not in RETRY_STATUSES
+
+    def test_possibly_delivered_requests_are_not_retried(self):
+        """Should not retry read timeouts or 504s, which may follow a posted message."""
+        retry = create_session().get_adapter("https://hooks.slack.com").max_retries
+
+        assert retry.read == 0
+        assert 504 not in RETRY_STATUSES
+
+    def test_slow_webhook_is_posted_once(self):
+        """Should POST only once when the webhook answers after the timeout."""
+        posts = []
+
+        class SlowHandler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                posts.append(self.rfile.read(int(self.headers["Content-Length"])))
+                time.sleep(0.5)
+                self.send_response(204)
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), SlowHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            session = create_session(max_retries=2, backoff_factor=0)
+            with pytest.raises(requests.RequestException):
+                session.post(f"http://127.0.0.1:{server.server_port}/", json={"text": "x"}, timeout=0.2)
+            time.sleep(0.4)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert len(posts) == 1
+
+    def test_invalid_pool_size(self):
+        """Should raise ValueError for a non-positive pool size."""
+        with pytest.raises(ValueError, match="pool_size must be positive"):
+            create_session(pool_size=0)
@@ -0,0 +1,103 @@
+"""Tests for append-only log paper history."""
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from arxiv_agent.history import LogPaperHistory, open_history
+
+
+class TestLogPaperHistory:
+    """Test cases for LogPaperHistory class."""
+
+    def test_mark_appends_only_new_ids(self, tmp_path: Path) -> None:
+        """Test marks append new IDs without rewriting the log."""
+        log_file = tmp_path / "history.log"
+        history = LogPaperHistory(str(log_file))
+        history.mark_processed(["b", "a"])
+        history.mark_processed(["a", "c", "c"])
+
+        assert log_file.read_text(encoding="utf-8") == "b\na\nc\n"
+        assert history.is_processed("c")
+        assert not history.is_processed("d")
+
+    def test_replays_snapshot_and_log(self, tmp_path: Path) -> None:
+        """Test startup loads both the snapshot and the log tail."""
+        log_file = tmp_path / "history.log"
+        (tmp_path / "history.snapshot").write_text("a\nb\n", encoding="utf-8")
+        log_file.write_text("c\n", encoding="utf-8")
+
+        history = LogPaperHistory(str(log_file))
+
+        assert history.processed_ids() == ["a", "b", "c"]
+
+    def test_partial_line_is_dropped(self, tmp_path: Path) -> None:
+        """Test a half-written entry from a crash is discarded."""
+        log_file = tmp_path / "history.log"
+        log_file.write_text("a\nb\nc", encoding="utf-8")
+
+        history = LogPaperHistory(str(log_file))
+        history.mark_processed(["d"])
+
+        assert history.processed_ids() == ["a", "b", "d"]
+        assert log_file.read_text(encoding="utf-8") == "a\nb\nd\n"
+
+    def test_compaction_writes_sorted_snapshot(self, tmp_path: Path) -> None:
+        """Test a log exceeding the size ratio is folded into the snapshot."""
+        log_file = tmp_path / "history.log"
+        history = LogPaperHistory(str(log_file), min_compaction_bytes=1, background=False)
+        history.mark_processed(["c", "a", "b"])
+
+        assert (tmp_path / "history.snapshot").read_text(encoding="utf-8") == "a\nb\nc\n"
+        assert log_file.read_text(encoding="utf-8") == ""
+        assert LogPaperHistory(str(log_file)).processed_ids() == ["a", "b", "c"]
+
+    def test_compaction_waits_for_ratio(self, tmp_path: Path) -> None:
+        """Test small logs relative to the snapshot are not compacted."""
+        log_file = tmp_path / "history.log"
+        (tmp_path / "history.snapshot").write_text("".join(f"{i}\n" for i in range(100)), encoding="utf-8")
+        history = LogPaperHistory(str(log_file), compaction_ratio=0.5, min_compaction_bytes=1, background=False)
+        history.mark_processed(["new"])
+
+        assert log_file.read_text(encoding="utf-8") == "new\n"
+
+    def test_snapshot_is_written_without_the_lock(self, tmp_path: Path, monkeypatch) -> None:
+        """Test marks proceed while the snapshot is written and survive compaction."""
+        log_file = tmp_path / "history.log"
+        history = LogPaperHistory(str(log_file), min_compaction_bytes=1, background=False)
+        history.mark_processed(["a"])
+        other = LogPaperHistory(str(log_file))
+        mkstemp = tempfile.mkstemp
+
+        def mark_while_writing(*args, **kwargs):
+            history.mark_processed(["late"])
+            other.mark_processed(["other"])
+            return mkstemp(*args, **kwargs)
+
+        monkeypatch.setattr(tempfile, "mkstemp", mark_while_writing)
+        history.compact()
+
+        assert (tmp_path / "history.snapshot").read_text(encoding="utf-8") == "a\n"
+        assert log_file.read_text(encoding="utf-8") == "late\nother\n"
+        assert history.processed_ids() == ["a", "late", "other"]
+        assert LogPaperHistory(str(log_file)).processed_ids() == ["a", "late", "other"]
+
+    def test_background_compaction(self, tmp_path: Path) -> None:
+        """Test background compaction keeps every ID after close."""
+        log_file = tmp_path / "history.log"
+        history = LogPaperHistory(str(log_file), min_compaction_bytes=1)
+        for i in range(20):
+            history.mark_processed([f"2301.{i:05d}"])
+        history.close()
+
+        reopened = LogPaperHistory(str(log_file))
+        assert len(reopened) == 20
+
+    def test_invalid_ratio(self, tmp_path: Path) -> None:
+        """Test non-positive compaction ratio is rejected."""
+        with pytest.raises(ValueError, match="compaction_ratio"):
+            LogPaperHistory(str(tmp_path / "history.log"), compaction_ratio=0)
+
+    def test_open_history_selects_log(self, tmp_path: Path) -> None:
+        """Test .log files open the log backend."""
+        assert isinstance(open_history(str(tmp_path / "history.log")), LogPaperHistory)
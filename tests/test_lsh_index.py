@@ -0,0 +1,81 @@
+"""Tests for persistent LSH index."""
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from arxiv_agent.dedup import LSHIndex, MinHasher
+
+TEXT_A = "Scaling laws for neural language models trained on web scale corpora with compute budgets."
+TEXT_B = "Diffusion models generate high fidelity images by iteratively denoising gaussian noise."
+
+
+class TestLSHIndex:
+    """Test cases for LSHIndex class."""
+
+    def test_query_finds_similar_signature(self, tmp_path: Path) -> None:
+        """Test a matching signature is returned with its estimated similarity."""
+        hasher = MinHasher(num_perm=64)
+        index = LSHIndex(str(tmp_path / "index"), num_perm=64, bands=16)
+        index.add("2401.00001", hasher.signature(TEXT_A))
+        index.add("2401.00002", hasher.signature(TEXT_B))
+
+        results = dict(index.query(hasher.signature(TEXT_A)))
+
+        assert results["2401.00001"] == 1.0
+        assert results.get("2401.00002", 0.0) < 0.5
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        """Test saved signatures are found by a new index instance."""
+        hasher = MinHasher(num_perm=64)
+        index = LSHIndex(str(tmp_path / "index"), num_perm=64, bands=16)
+        index.add("2401.00001", hasher.signature(TEXT_A))
+        index.save()
+        index.add("2401.00002", hasher.signature(TEXT_B))
+        index.save()
+
+        reloaded = LSHIndex(str(tmp_path / "index"), num_perm=64, bands=16)
+
+        assert len(reloaded) == 2
+        assert "2401.00002" in reloaded
+        assert dict(reloaded.query(hasher.signature(TEXT_B)))["2401.00002"] == 1.0
+
+    def test_add_ignores_known_ids(self, tmp_path: Path) -> None:
+        """Test re-adding a paper does not duplicate it."""
+        index = LSHIndex(str(tmp_path / "index"), num_perm=8, bands=4)
+        signature = np.arange(8, dtype=np.uint32)
+        index.add("2401.00001", signature)
+        index.add("2401.00001", signature)
+
+        assert len(index) == 1
+
+    def test_repairs_interrupted_save(self, tmp_path: Path) -> None:
+        """Test a signature written without its ID is dropped and appends stay aligned."""
+        hasher = MinHasher(num_perm=64)
+        index_dir = tmp_path / "index"
+        index = LSHIndex(str(index_dir), num_perm=64, bands=16)
+        index.add("2401.00001", hasher.signature(TEXT_A))
+        index.save()
+        with (index_dir / "signatures.u32").open("ab") as f:
+            f.write(hasher.signature(TEXT_B).tobytes()[:100])
+
+        repaired = LSHIndex(str(index_dir), num_perm=64, bands=16)
+        repaired.add("2401.00002", hasher.signature(TEXT_B))
+        repaired.save()
+        reloaded = LSHIndex(str(index_dir), num_perm=64, bands=16)
+
+        assert len(reloaded) == 2
+        assert dict(reloaded.query(hasher.signature(TEXT_B)))["2401.00002"] == 1.0
+
+    def test_mismatched_parameters_start_empty(self, tmp_path: Path) -> None:
+        """Test an index built with another signature length is ignored."""
+        index = LSHIndex(str(tmp_path / "index"), num_perm=8, bands=4)
+        index.add("2401.00001", np.arange(8, dtype=np.uint32))
+        index.save()
+
+        assert len(LSHIndex(str(tmp_path / "index"), num_perm=16, bands=4)) == 0
+
+    def test_invalid_bands(self, tmp_path: Path) -> None:
+        """Test num_perm must be divisible by bands."""
+        with pytest.raises(ValueError, match="num_perm must be a positive multiple of bands"):
+            LSHIndex(str(tmp_path), num_perm=10, bands=3)
@@ -0,0 +1,57 @@
+"""Tests for MinHash signatures."""
+import numpy as np
+import pytest
+
+from arxiv_agent.dedup import MinHasher
+
+ABSTRACT = (
+    "We propose a retrieval augmented language model that grounds generation "
+    "in documents fetched from a large corpus and improves factual accuracy."
+)
+
+
+class TestMinHasher:
+    """Test cases for MinHasher class."""
+
+    def test_signature_shape_and_dtype(self) -> None:
+        """Test signatures are fixed-width uint32 arrays."""
+        signature = MinHasher(num_perm=64).signature(ABSTRACT)
+
+        assert signature.shape == (64,)
+        assert signature.dtype == np.uint32
+
+    def test_identical_texts_have_identical_signatures(self) -> None:
+        """Test signatures are deterministic for a given seed."""
+        assert np.array_equal(MinHasher().signature(ABSTRACT), MinHasher().signature(ABSTRACT))
+
+    def test_similarity_tracks_jaccard(self) -> None:
+        """Test near-identical texts agree on far more permutations than unrelated ones."""
+        hasher = MinHasher(num_perm=256)
+        base = hasher.signature(ABSTRACT)
+        revised = hasher.signature(ABSTRACT.replace("large corpus", "large text corpus"))
+        unrelated = hasher.signature("Graph neural networks for molecular property prediction.")
+
+        assert np.mean(base == revised) > 0.6
+        assert np.mean(base == unrelated) < 0.1
+
+    def test_empty_text(self) -> None:
+        """Test texts without words get the all-maximum signature."""
+        hasher = MinHasher(num_perm=8)
+
+        assert hasher.shingles("").size == 0
+        assert (hasher.signature("") == np.iinfo(np.uint32).max).all()
+
+    def test_signatures_batch(self) -> None:
+        """Test batch signatures match single signatures."""
+        hasher = MinHasher(num_perm=32)
+        batch = hasher.signatures([ABSTRACT, "short text"])
+
+        assert batch.shape == (2, 32)
+        assert np.array_equal(batch[0], hasher.signature(ABSTRACT))
+
+    def test_invalid_parameters(self) -> None:
+        """Test non-positive parameters are rejected."""
+        with pytest.raises(ValueError, match="num_perm must be positive"):
+            MinHasher(num_perm=0)
+        with pytest.raises(ValueError, match="shingle_size must be positive"):
+            MinHasher(shingle_size=0)
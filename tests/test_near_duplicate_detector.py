@@ -0,0 +1,82 @@
+"""Tests for near-duplicate detection."""
+from datetime import datetime
+from pathlib import Path
+
+from arxiv_agent.collection.models import Paper
+from arxiv_agent.dedup import LSHIndex, MinHasher, NearDuplicateDetector
+
+ABSTRACT = (
+    "We introduce a benchmark for evaluating tool use in large language model "
+    "agents across web browsing, code execution and database queries, and "
+    "report results for twelve open and proprietary models."
+)
+
+
+def _make_paper(arxiv_id: str, abstract: str) -> Paper:
+    return Paper(
+        arxiv_id=arxiv_id,
+        title=f"Title {arxiv_id}",
+        authors=["Author A"],
+        abstract=abstract,
+        published=datetime(2024, 1, 1),
+        categories=["cs.AI"],
+        pdf_url=f"https://arxiv.org/pdf/{arxiv_id}.pdf",
+    )
+
+
+def _make_detector(index_dir: Path) -> NearDuplicateDetector:
+    return NearDuplicateDetector(
+        hasher=MinHasher(num_perm=128),
+        index=LSHIndex(str(index_dir), num_perm=128, bands=32),
+        threshold=0.7,
+    )
+
+
+class TestNearDuplicateDetector:
+    """Test cases for NearDuplicateDetector class."""
+
+    def test_clusters_cross_listed_papers(self, tmp_path: Path) -> None:
+        """Test near-identical abstracts are grouped under the first paper."""
+        papers = [
+            _make_paper("2401.00001", ABSTRACT),
+            _make_paper("2401.00002", "Graph neural networks predict molecular properties from 3D structure."),
+            _make_paper("2401.00003", ABSTRACT.replace("twelve", "twelve recent")),
+        ]
+
+        clusters = _make_detector(tmp_path / "index").cluster(papers)
+
+        assert [c.representative.arxiv_id for c in clusters] == ["2401.00001", "2401.00002"]
+        assert [p.arxiv_id for p in clusters[0].duplicates] == ["2401.00003"]
+        assert not clusters[0].seen_before
+
+    def test_flags_papers_seen_in_earlier_runs(self, tmp_path: Path) -> None:
+        """Test a revised paper matching a saved signature is flagged."""
+        first = _make_detector(tmp_path / "index")
+        first.cluster([_make_paper("2401.00001", ABSTRACT)])
+        first.save()
+
+        clusters = _make_detector(tmp_path / "index").cluster([
+            _make_paper("2402.00009", ABSTRACT.replace("twelve", "twelve recent")),
+        ])
+
+        assert clusters[0].seen_before
+        assert clusters[0].previous_ids == ["2401.00001"]
+
+    def test_same_id_is_not_its_own_duplicate(self, tmp_path: Path) -> None:
+        """Test re-collecting the same paper does not mark it as seen."""
+        first = _make_detector(tmp_path / "index")
+        first.cluster([_make_paper("2401.00001", ABSTRACT)])
+        first.save()
+
+        clusters = _make_detector(tmp_path / "index").cluster([_make_paper("2401.00001", ABSTRACT)])
+
+        assert not clusters[0].seen_before
+
+    def test_empty_abstract_is_singleton(self, tmp_path: Path) -> None:
+        """Test papers without text are never clustered."""
+        clusters = _make_detector(tmp_path / "index").cluster([
+            _make_paper("2401.00001", ""),
+            _make_paper("2401.00002", ""),
+        ])
+
+        assert len(clusters) == 2
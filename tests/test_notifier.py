@@ -1,11 +1,14 @@
+import json
 import os
 from datetime import datetime, timezone
 
 import pytest
+import requests
 import responses
 
 from src.config import NotificationConfig
 from src.models import Paper, SummarizedPaper
+from src.arxiv_agent.notification.rate_limiter import WebhookRateLimiter
 from src.notifier import notify
 
 DISCORD_WEBHOOK_URL = "https://discord.com/api/webhooks/test"
@@ -134,3 +137,64 @@ class TestNotify:
         notify(config, papers)
 
         assert len(responses.calls) > 1
+
+    @responses.activate
+    def test_discord_messages_reuse_injected_session(
+        self, mocker: pytest.fixture
+    ) -> None:
+        mocker.patch.dict(os.environ, {"DISCORD_WEBHOOK_URL": DISCORD_WEBHOOK_URL})
+        responses.add(responses.POST, DISCORD_WEBHOOK_URL, status=200)
+        session = requests.Session()
+        post = mocker.spy(session, "post")
+
+        config = NotificationConfig(slack_enabled=False, discord_enabled=True)
+        papers = [
+            _make_summarized_paper(f"Paper {i}", "x" * 1500) for i in range(3)
+        ]
+        notify(config, papers, session=session)
+
+        assert post.call_count == len(responses.calls) > 1
+
+    @responses.activate
+    def test_discord_retries_after_rate_limit(self, mocker: pytest.fixture) -> None:
+        mocker.patch.dict(os.environ, {"DISCORD_WEBHOOK_URL": DISCORD_WEBHOOK_URL})
+        responses.add(
+            responses.POST,
+            DISCORD_WEBHOOK_URL,
+            status=429,
+            json={"retry_after": 0.25, "global": False},
+        )
+        responses.add(responses.POST, DISCORD_WEBHOOK_URL, status=204)
+        now = [0.0]
+        sleeps: list[float] = []
+
+        def sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        limiter = WebhookRateLimiter(
+            jitter=0.0, max_requests_per_second=None, clock=lambda: now[0], sleep=sleep
+        )
+
+        config = NotificationConfig(slack_enabled=False, discord_enabled=True)
+        papers = [_make_summarized_paper("Test Paper", "Test summary")]
+        notify(config, papers, rate_limiter=limiter)
+
+        assert len(responses.calls) == 2
+        assert sleeps == [pytest.approx(0.25)]
+
+    @responses.activate
+    def test_discord_splits_one_long_summary_within_limit(
+        self, mocker: pytest.fixture
+    ) -> None:
+        mocker.patch.dict(os.environ, {"DISCORD_WEBHOOK_URL": DISCORD_WEBHOOK_URL})
+        responses.add(responses.POST, DISCORD_WEBHOOK_URL, status=200)
+
+        long_summary = "\n\n".join("段落" * 400 for _ in range(4))
+        config = NotificationConfig(slack_enabled=False, discord_enabled=True)
+        notify(config, [_make_summarized_paper("Long Paper", long_summary)])
+
+        contents = [json.loads(call.request.body)["content"] for call in responses.calls]
+        assert len(contents) > 1
+        assert all(len(content) <= 2000 for content in contents)
+        assert contents[0].startswith("📰 **本日のarXiv論文要約**")
@@ -0,0 +1,138 @@
+"""Tests for durable notification outbox."""
+import json
+
+import pytest
+
+from arxiv_agent.notification.outbox import NotificationOutbox, OutboxState, idempotency_key
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestNotificationOutbox:
+    """Test cases for NotificationOutbox class."""
+
+    def test_enqueued_messages_survive_restart(self, tmp_path):
+        """Should persist messages before delivery and keep their order."""
+        outbox_file = tmp_path / "outbox.jsonl"
+        NotificationOutbox(str(outbox_file)).enqueue("Slack", ["first", "second"], ["2401.00001"])
+
+        with NotificationOutbox(str(outbox_file)).draining() as pending:
+            assert [item.message for item in pending] == ["first", "second"]
+            assert pending[0].paper_ids == ["2401.00001"]
+            assert pending[0].key == idempotency_key("Slack", "first")
+
+    def test_enqueue_skips_known_keys(self, tmp_path):
+        """Should not queue a message again once it is pending or delivered."""
+        outbox = NotificationOutbox(str(tmp_path / "outbox.jsonl"))
+        [key] = outbox.enqueue("Slack", ["digest"], [])
+        with outbox.draining():
+            outbox.mark_delivered(key)
+
+        outbox.enqueue("Slack", ["digest"], [])
+        outbox.enqueue("Discord", ["digest"], [])
+
+        states = {(item.channel, item.state) for item in outbox.items()}
+        assert states == {("Slack", OutboxState.DELIVERED), ("Discord", OutboxState.PENDING)}
+
+    def test_delivered_messages_are_not_drained_again(self, tmp_path):
+        """Should only hand out messages that have not been delivered."""
+        outbox_file = tmp_path / "outbox.jsonl"
+        outbox = NotificationOutbox(str(outbox_file))
+        first, _ = outbox.enqueue("Slack", ["first", "second"], [])
+        with outbox.draining():
+            outbox.mark_delivered(first)
+
+        with NotificationOutbox(str(outbox_file)).draining() as pending:
+            assert [item.message for item in pending] == ["second"]
+
+    def test_gives_up_after_max_attempts(self, tmp_path):
+        """Should stop handing out a message that keeps failing."""
+        outbox = NotificationOutbox(str(tmp_path / "outbox.jsonl"), max_attempts=2)
+        [key] = outbox.enqueue("Slack", ["digest"], [])
+
+        for _ in range(2):
+            with outbox.draining() as pending:
+                assert len(pending) == 1
+                outbox.mark_failed(key, "503")
+
+        with outbox.draining() as pending:
+            assert pending == []
+        [item] = outbox.items()
+        assert item.state == OutboxState.DEAD
+        assert item.attempts == 2
+        assert item.error == "503"
+
+    def test_rejected_message_is_given_up_immediately(self, tmp_path):
+        """Should dead-letter a permanently rejected message on its first failure."""
+        outbox = NotificationOutbox(str(tmp_path / "outbox.jsonl"), max_attempts=5)
+        [key] = outbox.enqueue("Slack", ["digest"], [])
+
+        with outbox.draining():
+            outbox.mark_failed(key, "400 Bad Request", permanent=True)
+
+        [item] = outbox.items()
+        assert item.state == OutboxState.DEAD
+        assert item.attempts == 1
+
+    def test_enqueue_during_drain_survives_compaction(self, tmp_path):
+        """Should not wait for a drain and keep messages enqueued meanwhile."""
+        outbox_file = tmp_path / "outbox.jsonl"
+        draining = NotificationOutbox(str(outbox_file))
+        [first] = draining.enqueue("Slack", ["first"], [])
+
+        with draining.draining():
+            NotificationOutbox(str(outbox_file)).enqueue("Slack", ["second"], [])
+            draining.mark_delivered(first)
+
+        states = {item.message or item.key: item.state for item in NotificationOutbox(str(outbox_file)).items()}
+        assert states == {first: OutboxState.DELIVERED, "second": OutboxState.PENDING}
+
+    def test_only_one_drain_at_a_time(self, tmp_path):
+        """Should report a busy outbox while another drain holds it."""
+        outbox_file = tmp_path / "outbox.jsonl"
+        NotificationOutbox(str(outbox_file)).enqueue("Slack", ["digest"], [])
+
+        with NotificationOutbox(str(outbox_file)).draining() as pending:
+            with NotificationOutbox(str(outbox_file)).draining() as other:
+                assert len(pending) == 1
+                assert other is None
+
+    def test_compaction_forgets_old_deliveries(self, tmp_path):
+        """Should drop message bodies on delivery and keys after the retention period."""
+        clock = FakeClock()
+        outbox_file = tmp_path / "outbox.jsonl"
+        outbox = NotificationOutbox(str(outbox_file), retention=100.0, clock=clock)
+        old, new = outbox.enqueue("Slack", ["old", "new"], [])
+        with outbox.draining():
+            outbox.mark_delivered(old)
+        records = [json.loads(line) for line in outbox_file.read_text(encoding="utf-8").splitlines()]
+        assert [record.get("message") for record in records] == [None, "new"]
+
+        clock.now += 150
+        with outbox.draining():
+            outbox.mark_delivered(new)
+
+        assert [item.key for item in outbox.items()] == [new]
+
+    def test_skips_torn_final_record(self, tmp_path):
+        """Should ignore a partial line left by a crash."""
+        outbox_file = tmp_path / "outbox.jsonl"
+        outbox = NotificationOutbox(str(outbox_file))
+        outbox.enqueue("Slack", ["digest"], [])
+        with outbox_file.open("a", encoding="utf-8") as f:
+            f.write('{"key": "abc", "sta')
+
+        assert [item.message for item in outbox.items()] == ["digest"]
+
+    def test_rejects_invalid_limits(self, tmp_path):
+        """Should validate limits."""
+        with pytest.raises(ValueError, match="max_attempts must be positive"):
+            NotificationOutbox(str(tmp_path / "outbox.jsonl"), max_attempts=0)
@@ -0,0 +1,86 @@
+"""Tests for packed int64 paper history."""
+from pathlib import Path
+
+import pytest
+
+from arxiv_agent.history import (
+    PackedPaperHistory,
+    decode_arxiv_id,
+    encode_arxiv_id,
+    open_history,
+)
+
+
+class TestArxivIdCodec:
+    """Test cases for arXiv ID packing."""
+
+    @pytest.mark.parametrize(
+        "paper_id",
+        ["2301.12345", "2301.12345v1", "2301.12345v12", "0704.0001", "0704.0001v3", "1412.9999", "9912.00001v999"],
+    )
+    def test_round_trip(self, paper_id: str) -> None:
+        """Test new-style IDs decode to the same string."""
+        code = encode_arxiv_id(paper_id)
+
+        assert code is not None
+        assert decode_arxiv_id(code) == paper_id
+
+    @pytest.mark.parametrize("paper_id", ["hep-th/9901001", "2313.12345", "2301.123", "2301.12345v0", "abc"])
+    def test_unencodable_ids(self, paper_id: str) -> None:
+        """Test old-style and malformed IDs are not encoded."""
+        assert encode_arxiv_id(paper_id) is None
+
+    def test_four_and_five_digit_forms_differ(self) -> None:
+        """Test zero-padded numbers keep their width."""
+        assert encode_arxiv_id("1501.0001") != encode_arxiv_id("1501.00001")
+
+    def test_codes_sort_by_month_number_version(self) -> None:
+        """Test code order follows ID order."""
+        ids = ["2301.00002v1", "2301.00001v2", "2212.99999", "2301.00001v1"]
+        assert sorted(ids, key=encode_arxiv_id) == ["2212.99999", "2301.00001v1", "2301.00001v2", "2301.00002v1"]
+
+
+class TestPackedPaperHistory:
+    """Test cases for PackedPaperHistory class."""
+
+    def test_mark_and_persist(self, tmp_path: Path) -> None:
+        """Test packed and old-style IDs survive reopening."""
+        history_file = tmp_path / "data" / "history.i64"
+        history = PackedPaperHistory(str(history_file))
+        history.mark_processed(["2301.12345v1", "hep-th/9901001", "2212.00001v2"])
+
+        reopened = PackedPaperHistory(str(history_file))
+
+        assert reopened.is_processed("2301.12345v1")
+        assert reopened.is_processed("hep-th/9901001")
+        assert not reopened.is_processed("2301.12345v2")
+        assert len(reopened) == 3
+        assert history_file.stat().st_size == 16
+
+    def test_merge_keeps_array_sorted_and_unique(self, tmp_path: Path) -> None:
+        """Test repeated marks merge into one sorted array."""
+        history = PackedPaperHistory(str(tmp_path / "history.i64"))
+        history.mark_processed(["2301.00003", "2301.00001"])
+        history.mark_processed(["2301.00002", "2301.00001", "2301.00002"])
+
+        assert history.processed_ids() == ["2301.00001", "2301.00002", "2301.00003"]
+
+    def test_contains_many(self, tmp_path: Path) -> None:
+        """Test batch membership checks."""
+        history = PackedPaperHistory(str(tmp_path / "history.i64"))
+        history.mark_processed(["2301.00001", "astro-ph/0101001"])
+
+        result = history.contains_many(["2401.00001", "2301.00001", "astro-ph/0101001", "cs/0101001"])
+
+        assert result.tolist() == [False, True, True, False]
+
+    def test_empty_history(self, tmp_path: Path) -> None:
+        """Test a missing file behaves as empty history."""
+        history = PackedPaperHistory(str(tmp_path / "history.i64"))
+
+        assert not history.is_processed("2301.00001")
+        assert history.contains_many([]).tolist() == []
+
+    def test_open_history_selects_packed(self, tmp_path: Path) -> None:
+        """Test .i64 files open the packed backend."""
+        assert isinstance(open_history(str(tmp_path / "history.i64")), PackedPaperHistory)
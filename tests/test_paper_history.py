@@ -1,9 +1,11 @@
 """Tests for paper history management."""
 import json
+from datetime import datetime
 from pathlib import Path
 
 import pytest
 
+from arxiv_agent.collection.models import Paper
 from arxiv_agent.history import PaperHistory
 
 
@@ -180,3 +182,24 @@ class TestPaperHistory:
 
         assert history_file.exists()
         assert history_file.parent.is_dir()
+
+    def test_filter_unprocessed_keeps_order(self, tmp_path: Path) -> None:
+        """Test batch filtering drops processed papers and keeps order."""
+        history = PaperHistory(str(tmp_path / "history.json"))
+        history.mark_processed(["2301.00002v1"])
+        papers = [
+            Paper(
+                arxiv_id=f"2301.0000{i}v1",
+                title=f"Paper {i}",
+                authors=["Author"],
+                abstract="Abstract",
+                published=datetime(2023, 1, i),
+                categories=["cs.AI"],
+                pdf_url=f"https://arxiv.org/pdf/2301.0000{i}v1.pdf",
+            )
+            for i in (3, 2, 1)
+        ]
+
+        result = history.filter_unprocessed(papers)
+
+        assert [p.arxiv_id for p in result] == ["2301.00003v1", "2301.00001v1"]
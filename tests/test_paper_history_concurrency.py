@@ -0,0 +1,117 @@
+"""Multi-process stress tests for shared paper history files."""
+import json
+import multiprocessing
+from pathlib import Path
+
+import pytest
+
+from arxiv_agent.history import LogPaperHistory, PaperHistory, SqlitePaperHistory
+
+WORKERS = 8
+PAPERS_PER_WORKER = 25
+
+
+def _mark_worker(history_file: str, worker: int) -> None:
+    """Mark this worker's papers one call at a time."""
+    history = PaperHistory(history_file)
+    for i in range(PAPERS_PER_WORKER):
+        history.mark_processed([f"2301.{worker:02d}{i:03d}v1"])
+
+
+def _log_mark_worker(history_file: str, worker: int) -> None:
+    """Mark this worker's papers while compacting the shared log often."""
+    history = LogPaperHistory(history_file, min_compaction_bytes=64, background=False)
+    for i in range(PAPERS_PER_WORKER):
+        history.mark_processed([f"2301.{worker:02d}{i:03d}v1"])
+    history.close()
+
+
+def _claim_worker(backend: str, history_file: str, worker: int, paper_ids: list, claims) -> None:
+    """Claim overlapping papers and record what was won."""
+    if backend == "sqlite":
+        history = SqlitePaperHistory(history_file)
+    else:
+        history = PaperHistory(history_file)
+    owner = f"worker-{worker}"
+    # Each worker starts at a different offset so claims interleave.
+    offset = worker * 3 % len(paper_ids)
+    for start in range(0, len(paper_ids), 5):
+        rotated = paper_ids[offset:] + paper_ids[:offset]
+        for paper_id in history.claim(rotated[start:start + 5], owner, lease_seconds=60):
+            claims.put((paper_id, owner))
+    history.close()
+
+
+def _run(target, args_list) -> None:
+    """Run one process per argument tuple and wait for all of them."""
+    context = multiprocessing.get_context("fork")
+    processes = [context.Process(target=target, args=args) for args in args_list]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+
+class TestPaperHistoryConcurrency:
+    """Concurrent writers sharing one history."""
+
+    def test_concurrent_marks_lose_nothing(self, tmp_path: Path) -> None:
+        """Test every ID marked by every process survives."""
+        history_file = str(tmp_path / "history.json")
+
+        _run(_mark_worker, [(history_file, worker) for worker in range(WORKERS)])
+
+        saved = json.loads(Path(history_file).read_text(encoding="utf-8"))
+        assert len(saved["processed_papers"]) == WORKERS * PAPERS_PER_WORKER
+
+    def test_concurrent_log_marks_survive_compaction(self, tmp_path: Path) -> None:
+        """Test compactions by one process never drop IDs appended by another."""
+        history_file = str(tmp_path / "history.log")
+
+        _run(_log_mark_worker, [(history_file, worker) for worker in range(WORKERS)])
+
+        history = LogPaperHistory(history_file)
+        assert len(history) == WORKERS * PAPERS_PER_WORKER
+        assert history.is_processed("2301.07024v1")
+
+    @pytest.mark.parametrize("backend,name", [("json", "history.json"), ("sqlite", "history.db")])
+    def test_concurrent_claims_are_exclusive(self, tmp_path: Path, backend: str, name: str) -> None:
+        """Test each paper is claimed by exactly one worker."""
+        history_file = str(tmp_path / name)
+        paper_ids = [f"2301.{i:05d}v1" for i in range(40)]
+        claims = multiprocessing.get_context("fork").Queue()
+
+        _run(_claim_worker, [(backend, history_file, worker, paper_ids, claims) for worker in range(WORKERS)])
+
+        won = [claims.get(timeout=5) for _ in range(len(paper_ids))]
+        assert claims.empty()
+        assert sorted(paper_id for paper_id, _ in won) == paper_ids
+
+
+class TestPaperHistoryLeases:
+    """Lease semantics of the JSON history."""
+
+    def test_claim_skips_processed_and_foreign_leases(self, tmp_path: Path) -> None:
+        """Test claims exclude processed papers and other owners' live leases."""
+        history_file = str(tmp_path / "history.json")
+        first = PaperHistory(history_file)
+        first.mark_processed(["a"])
+        assert first.claim(["a", "b", "c"], "w1", lease_seconds=60, now=1000) == ["b", "c"]
+
+        second = PaperHistory(history_file)
+
+        assert second.claim(["b", "c", "d"], "w2", lease_seconds=60, now=1010) == ["d"]
+        assert second.claim(["b"], "w2", lease_seconds=60, now=1061) == ["b"]
+
+    def test_mark_and_release_free_leases(self, tmp_path: Path) -> None:
+        """Test processed and released papers drop their leases."""
+        history_file = tmp_path / "history.json"
+        history = PaperHistory(str(history_file))
+        history.claim(["a", "b"], "w1", lease_seconds=60, now=1000)
+
+        history.mark_processed(["a"])
+        history.release(["b"], "w1")
+
+        assert json.loads(history_file.read_text(encoding="utf-8")) == {"processed_papers": ["a"]}
+        assert PaperHistory(str(history_file)).claim(["a", "b"], "w2", lease_seconds=60, now=1001) == ["b"]
@@ -0,0 +1,204 @@
+"""Tests for the staged pipeline runtime."""
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from arxiv_agent.collection.models import Paper
+from arxiv_agent.pipeline import (
+    Pipeline,
+    PipelineCancelled,
+    Stage,
+    collection_stage,
+    notification_stage,
+    summarization_stage,
+)
+from arxiv_agent.summarization.models import Summary
+
+
+def _double(item: int) -> list:
+    """Picklable stage function for process pools."""
+    return [item * 2]
+
+
+def _make_paper(arxiv_id: str) -> Paper:
+    return Paper(
+        arxiv_id=arxiv_id,
+        title=f"Title {arxiv_id}",
+        authors=["Author"],
+        abstract="Abstract",
+        published=datetime(2024, 1, 1),
+        categories=["cs.AI"],
+        pdf_url=f"https://arxiv.org/pdf/{arxiv_id}",
+    )
+
+
+class TestPipeline:
+    """Test cases for Pipeline class."""
+
+    def test_stages_transform_expand_and_filter(self):
+        """Should pass every output of a stage on to the next."""
+        pipeline = Pipeline([
+            Stage("expand", lambda n: range(n)),
+            Stage("even", lambda n: [n] if n % 2 == 0 else [], workers=3),
+            Stage("square", lambda n: [n * n], workers=2),
+        ])
+
+        results = pipeline.run([3, 4])
+
+        assert sorted(results) == [0, 0, 4, 4]
+
+    def test_collect_stage_receives_whole_stream(self):
+        """Should call a collect stage once with every input."""
+        calls = []
+
+        def rank(items):
+            calls.append(list(items))
+            return sorted(items, reverse=True)
+
+        pipeline = Pipeline([
+            Stage("identity", lambda n: [n], workers=4),
+            Stage("rank", rank, collect=True),
+        ])
+
+        assert pipeline.run([2, 5, 1]) == [5, 2, 1]
+        assert len(calls) == 1
+
+    def test_stages_overlap(self):
+        """Should run the workers of a stage concurrently."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def wait(n):
+            barrier.wait()
+            return [n]
+
+        pipeline = Pipeline([Stage("wait", wait, workers=3)])
+
+        assert sorted(pipeline.run([1, 2, 3])) == [1, 2, 3]
+
+    def test_bounded_queue_applies_backpressure(self):
+        """Should block upstream while a slow stage's queue is full."""
+        release = threading.Event()
+        fed = []
+
+        def produce():
+            for i in range(10):
+                fed.append(i)
+                yield i
+
+        def slow(n):
+            release.wait(5)
+            return [n]
+
+        pipeline = Pipeline([Stage("slow", slow, queue_size=2)])
+        runner = threading.Thread(target=pipeline.run, args=(produce(),))
+        runner.start()
+        time.sleep(0.3)
+
+        # One item in the worker, two in the queue and one waiting to be put.
+        assert len(fed) <= 4
+        assert pipeline.metrics()[0].max_queue_depth == 2
+        release.set()
+        runner.join(5)
+        assert len(fed) == 10
+
+    def test_failed_items_are_counted_and_skipped(self):
+        """Should drop items whose stage raises and keep processing the rest."""
+        def fail_on_two(n):
+            if n == 2:
+                raise RuntimeError("boom")
+            return [n]
+
+        pipeline = Pipeline([Stage("check", fail_on_two, workers=2)])
+
+        assert sorted(pipeline.run([1, 2, 3])) == [1, 3]
+        metrics = pipeline.metrics()[0]
+        assert metrics.errors == 1
+        assert metrics.items_in == 3
+        assert metrics.items_out == 2
+
+    def test_stop_on_error_cancels_pipeline(self):
+        """Should stop every stage and re-raise the first error."""
+        def fail(n):
+            raise RuntimeError("boom")
+
+        pipeline = Pipeline([
+            Stage("fail", fail, stop_on_error=True),
+            Stage("never", lambda n: [n]),
+        ])
+
+        with pytest.raises(RuntimeError, match="boom"):
+            pipeline.run(range(100))
+        assert pipeline.cancelled
+
+    def test_cancel_stops_run(self):
+        """Should raise PipelineCancelled once cancelled from another thread."""
+        pipeline = Pipeline([Stage("sleep", lambda n: time.sleep(0.05) or [n])])
+        threading.Timer(0.2, pipeline.cancel).start()
+
+        started = time.monotonic()
+        with pytest.raises(PipelineCancelled):
+            pipeline.run(range(1000))
+        assert time.monotonic() - started < 5
+
+    def test_metrics_report_throughput(self):
+        """Should record per-stage counts and throughput."""
+        pipeline = Pipeline([Stage("identity", lambda n: [n]), Stage("drop", lambda n: [])])
+
+        pipeline.run(range(5))
+
+        identity, drop = pipeline.metrics()
+        assert (identity.items_in, identity.items_out) == (5, 5)
+        assert (drop.items_in, drop.items_out) == (5, 0)
+        assert identity.throughput > 0
+        assert "identity: 5 in, 5 out, 0 errors" in identity.report()
+
+    def test_process_stage(self):
+        """Should run a CPU stage on a process pool."""
+        pipeline = Pipeline([Stage("double", _double, workers=2, processes=True)])
+
+        assert sorted(pipeline.run([1, 2, 3])) == [2, 4, 6]
+
+    def test_invalid_stage(self):
+        """Should reject collect stages with several workers."""
+        with pytest.raises(ValueError, match="collect stage runs on one worker"):
+            Stage("rank", sorted, workers=2, collect=True)
+        with pytest.raises(ValueError, match="at least one stage"):
+            Pipeline([])
+
+
+class TestStages:
+    """Test cases for the application stage adapters."""
+
+    def test_collect_summarize_notify(self, mocker):
+        """Should chain the arXiv client, summarizer and notifier."""
+        client = mocker.Mock()
+        client.search_papers.return_value = [_make_paper("2401.00001"), _make_paper("2401.00002")]
+        summarizer = mocker.Mock()
+        summarizer.summarize.side_effect = lambda paper: Summary(paper.arxiv_id, paper.title, "Summary")
+        notifier = mocker.Mock()
+        notifier.send_all.return_value = "report"
+
+        pipeline = Pipeline([
+            collection_stage(client, ["LLM"]),
+            summarization_stage(summarizer, workers=2),
+            notification_stage(notifier),
+        ])
+
+        assert pipeline.run([["cs.AI"]]) == ["report"]
+        client.search_papers.assert_called_once_with(categories=["cs.AI"], keywords=["LLM"], history=None)
+        sent = notifier.send_all.call_args[0][0]
+        assert sorted(summary.paper_id for summary in sent) == ["2401.00001", "2401.00002"]
+
+    def test_summarization_stage_journals_failures(self, mocker):
+        """Should journal failed papers and drop them from the stream."""
+        summarizer = mocker.Mock()
+        summarizer.summarize.side_effect = RuntimeError("API error")
+        journal = mocker.Mock()
+        journal.recovered_summary.return_value = None
+
+        pipeline = Pipeline([summarization_stage(summarizer, journal)])
+
+        assert pipeline.run([_make_paper("2401.00001")]) == []
+        journal.fail.assert_called_once_with("2401.00001", "API error")
@@ -79,3 +79,43 @@ class TestPromptBuilder:
         result = builder.build(paper)
         expected = "Test Paper by John Doe, Jane Smith, Bob Johnson: Abstract text."
         assert result == expected
+
+    def test_build_update(self):
+        """Should include the previous summary and the changed sentences."""
+        builder = PromptBuilder(
+            "{title} {authors} {abstract}",
+            update_template="{title}|{previous_summary}|{changes}",
+        )
+
+        paper = Paper(
+            arxiv_id="2101.00001v2",
+            title="Test Paper",
+            authors=["John Doe"],
+            abstract="Abstract text.",
+            published=datetime.now(),
+            categories=["cs.AI"],
+            pdf_url="http://example.com/paper.pdf",
+        )
+
+        result = builder.build_update(paper, "Old summary", ["New result.", "New limitation."])
+        assert result == "Test Paper|Old summary|- New result.\n- New limitation."
+
+    def test_build_sections(self):
+        """Should ask only for the requested sections."""
+        builder = PromptBuilder(
+            "{title} {authors} {abstract}",
+            sections_template="{title}|{sections}",
+        )
+
+        paper = Paper(
+            arxiv_id="2101.00001",
+            title="Test Paper",
+            authors=["John Doe"],
+            abstract="Abstract text.",
+            published=datetime.now(),
+            categories=["cs.AI"],
+            pdf_url="http://example.com/paper.pdf",
+        )
+
+        result = builder.build_sections(paper, [2, 5])
+        assert result == "Test Paper|2. **先行研究と比べてどこがすごい?**\n5. **議論はある?**"
@@ -0,0 +1,156 @@
+"""Tests for quota ledger and run planner."""
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from arxiv_agent.collection.models import Paper
+from arxiv_agent.quota import QuotaLedger, RunPlanner
+
+MIDNIGHT = datetime(2024, 5, 1, tzinfo=timezone.utc).timestamp()
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self, now: float = MIDNIGHT + 3600) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _make_papers(count: int):
+    return [
+        Paper(
+            arxiv_id=f"2405.0000{i}",
+            title=f"Paper {i}",
+            authors=["Author A"],
+            abstract="Abstract.",
+            published=datetime(2024, 5, 1),
+            categories=["cs.AI"],
+            pdf_url=f"https://arxiv.org/pdf/2405.0000{i}.pdf",
+        )
+        for i in range(count)
+    ]
+
+
+class TestQuotaLedger:
+    """Test cases for QuotaLedger class."""
+
+    def test_records_usage_per_model_and_day(self, tmp_path: Path) -> None:
+        """Test usage is accumulated per model and persisted."""
+        clock = FakeClock()
+        ledger = QuotaLedger(str(tmp_path / "ledger.json"), clock=clock)
+        ledger.record("gemini-pro", tokens=100)
+        ledger.record("gemini-pro", tokens=50, summaries=1)
+        ledger.record("gemini-flash")
+        ledger.save()
+
+        reloaded = QuotaLedger(str(tmp_path / "ledger.json"), clock=clock)
+
+        usage = reloaded.usage("gemini-pro")
+        assert (usage.requests, usage.tokens, usage.summaries) == (2, 150, 1)
+        assert reloaded.usage("gemini-flash").requests == 1
+
+    def test_new_day_starts_empty(self, tmp_path: Path) -> None:
+        """Test usage is counted per UTC day."""
+        clock = FakeClock()
+        ledger = QuotaLedger(str(tmp_path / "ledger.json"), clock=clock)
+        ledger.record("gemini-pro")
+        ledger.save()
+
+        clock.now += 86400
+
+        assert QuotaLedger(str(tmp_path / "ledger.json"), clock=clock).usage("gemini-pro").requests == 0
+
+    def test_overlapping_runs_merge(self, tmp_path: Path) -> None:
+        """Test two ledgers saving the same file do not lose each other's usage."""
+        clock = FakeClock()
+        first = QuotaLedger(str(tmp_path / "ledger.json"), clock=clock)
+        second = QuotaLedger(str(tmp_path / "ledger.json"), clock=clock)
+        first.record("gemini-pro")
+        second.record("gemini-pro", requests=2)
+        first.save()
+        second.save()
+
+        assert QuotaLedger(str(tmp_path / "ledger.json"), clock=clock).usage("gemini-pro").requests == 3
+
+    def test_old_days_are_pruned(self, tmp_path: Path) -> None:
+        """Test days beyond the retention period are dropped on save."""
+        clock = FakeClock()
+        ledger = QuotaLedger(str(tmp_path / "ledger.json"), retention_days=2, clock=clock)
+        ledger.record("gemini-pro")
+        ledger.save()
+        clock.now += 3 * 86400
+        ledger.record("gemini-pro")
+        ledger.save()
+
+        assert len(json.loads((tmp_path / "ledger.json").read_text())) == 1
+
+
+class TestRunPlanner:
+    """Test cases for RunPlanner class."""
+
+    def test_selects_papers_within_budget(self, tmp_path: Path) -> None:
+        """Test the highest-priority papers that fit the remaining quota are selected."""
+        clock = FakeClock()
+        ledger = QuotaLedger(str(tmp_path / "ledger.json"), clock=clock)
+        ledger.record("gemini-pro", requests=7)
+        planner = RunPlanner(ledger, "gemini-pro", requests_per_day=10, clock=clock)
+        papers = _make_papers(5)
+
+        plan = planner.plan(papers)
+
+        assert plan.selected == papers[:3]
+        assert plan.deferred == papers[3:]
+
+    def test_leaves_headroom_for_later_runs(self, tmp_path: Path) -> None:
+        """Test the remaining budget is shared with runs later in the day."""
+        clock = FakeClock(MIDNIGHT + 3600)
+        ledger = QuotaLedger(str(tmp_path / "ledger.json"), clock=clock)
+        planner = RunPlanner(
+            ledger, "gemini-pro", requests_per_day=12, runs_per_day=4, headroom_requests=4, clock=clock
+        )
+
+        plan = planner.plan(_make_papers(10))
+
+        # (12 - 4) requests split between this run and 3 later runs.
+        assert len(plan.selected) == 2
+
+    def test_accounts_for_requests_per_summary(self, tmp_path: Path) -> None:
+        """Test section regeneration observed today raises the cost per paper."""
+        clock = FakeClock()
+        ledger = QuotaLedger(str(tmp_path / "ledger.json"), clock=clock)
+        ledger.record("gemini-pro", requests=4, summaries=2)
+        planner = RunPlanner(ledger, "gemini-pro", requests_per_day=10, clock=clock)
+
+        assert len(planner.plan(_make_papers(10)).selected) == 3
+
+    def test_token_budget(self, tmp_path: Path) -> None:
+        """Test the daily token limit caps the number of papers."""
+        clock = FakeClock()
+        ledger = QuotaLedger(str(tmp_path / "ledger.json"), clock=clock)
+        ledger.record("gemini-pro", tokens=3000, summaries=1)
+        planner = RunPlanner(ledger, "gemini-pro", requests_per_day=100, tokens_per_day=10000, clock=clock)
+
+        assert len(planner.plan(_make_papers(10)).selected) == 2
+
+    def test_exhausted_budget_defers_everything(self, tmp_path: Path) -> None:
+        """Test nothing is selected once the daily quota is used up."""
+        clock = FakeClock()
+        ledger = QuotaLedger(str(tmp_path / "ledger.json"), clock=clock)
+        ledger.record("gemini-pro", requests=20)
+        planner = RunPlanner(ledger, "gemini-pro", requests_per_day=10, clock=clock)
+
+        plan = planner.plan(_make_papers(3))
+
+        assert plan.selected == []
+        assert len(plan.deferred) == 3
+
+    def test_invalid_limits(self, tmp_path: Path) -> None:
+        """Test non-positive limits are rejected."""
+        ledger = QuotaLedger(str(tmp_path / "ledger.json"))
+        with pytest.raises(ValueError, match="requests_per_day must be positive"):
+            RunPlanner(ledger, "gemini-pro", requests_per_day=0)
@@ -0,0 +1,179 @@
+"""Tests for WebhookRateLimiter."""
+import pytest
+from unittest.mock import Mock
+from arxiv_agent.notification.rate_limiter import WebhookRateLimiter
+
+
+class FakeClock:
+    """Clock advanced only by sleeping."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _response(status=200, headers=None, body=None):
+    response = Mock()
+    response.status_code = status
+    response.headers = headers or {}
+    response.json.return_value = body
+    return response
+
+
+def _limiter(clock, **kwargs):
+    kwargs.setdefault("max_requests_per_second", None)
+    return WebhookRateLimiter(clock=clock, sleep=clock.sleep, wall_clock=lambda: 1000.0 + clock.now,
+                              rand=lambda: 0.5, **kwargs)
+
+
+class TestWebhookRateLimiter:
+    """Test cases for WebhookRateLimiter."""
+
+    def test_retries_after_retry_after_header(self):
+        """Should wait for Retry-After plus jitter and retry a 429."""
+        clock = FakeClock()
+        session = Mock()
+        session.post.side_effect = [_response(429, {"Retry-After": "2"}), _response(200)]
+
+        response = _limiter(clock, jitter=0.1).post(session, "http://hook", {"content": "x"}, 5)
+
+        assert response.status_code == 200
+        assert session.post.call_count == 2
+        assert clock.sleeps == [pytest.approx(2.1)]
+
+    def test_uses_discord_body_retry_after(self):
+        """Should prefer the retry_after field of a Discord 429 body."""
+        clock = FakeClock()
+        session = Mock()
+        session.post.side_effect = [_response(429, {"Retry-After": "9"}, {"retry_after": 0.5}), _response(204)]
+
+        _limiter(clock, jitter=0.0).post(session, "http://hook", {}, 5)
+
+        assert clock.sleeps == [pytest.approx(0.5)]
+
+    def test_paces_requests_by_bucket_headers(self):
+        """Should wait for the bucket reset once no requests remain."""
+        clock = FakeClock()
+        session = Mock()
+        session.post.side_effect = [
+            _response(204, {"X-RateLimit-Remaining": "1", "X-RateLimit-Reset-After": "2"}),
+            _response(204, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": "2"}),
+            _response(204, {"X-RateLimit-Remaining": "4", "X-RateLimit-Reset-After": "2"}),
+        ]
+        limiter = _limiter(clock)
+
+        for _ in range(3):
+            limiter.post(session, "http://hook", {}, 5)
+
+        assert clock.sleeps == [pytest.approx(2.0)]
+        assert session.post.call_count == 3
+
+    def test_absolute_reset_header(self):
+        """Should convert an epoch X-RateLimit-Reset into a delay."""
+        clock = FakeClock()
+        limiter = _limiter(clock)
+
+        limiter.update("http://hook", {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1003"})
+        limiter.acquire("http://hook")
+
+        assert clock.sleeps == [pytest.approx(3.0)]
+
+    def test_webhooks_sharing_a_bucket_share_limits(self):
+        """Should apply one bucket to every webhook reporting it."""
+        clock = FakeClock()
+        limiter = _limiter(clock)
+        headers = {"X-RateLimit-Bucket": "abc", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": "1"}
+
+        limiter.update("http://hook/1", headers)
+        limiter.update("http://hook/2", {"X-RateLimit-Bucket": "abc"})
+        limiter.acquire("http://hook/2")
+
+        assert clock.sleeps == [pytest.approx(1.0)]
+
+    def test_global_rate_limit_pauses_every_webhook(self):
+        """Should hold requests to other webhooks after a global 429."""
+        clock = FakeClock()
+        session = Mock()
+        session.post.side_effect = [
+            _response(429, {"X-RateLimit-Global": "true", "Retry-After": "3"}),
+            _response(204),
+        ]
+        limiter = _limiter(clock, jitter=0.0)
+
+        limiter.post(session, "http://hook/1", {}, 5)
+        clock.now, clock.sleeps = 0.0, []  # Rewind to just after the 429.
+        limiter.acquire("http://hook/2")
+
+        assert clock.sleeps == [pytest.approx(3.0)]
+
+    def test_spaces_requests_across_webhooks(self):
+        """Should keep all webhooks under max_requests_per_second."""
+        clock = FakeClock()
+        limiter = _limiter(clock, max_requests_per_second=4)
+
+        for url in ("http://hook/1", "http://hook/2", "http://hook/3"):
+            limiter.acquire(url)
+
+        assert clock.now == pytest.approx(0.5)
+
+    def test_retry_after_http_date(self):
+        """Should convert an HTTP-date Retry-After with the injected wall clock."""
+        clock = FakeClock()
+        session = Mock()
+        # The fake wall clock reads 1000.0 at start; the date is 4 seconds later.
+        session.post.side_effect = [
+            _response(429, {"Retry-After": "Thu, 01 Jan 1970 00:16:44 GMT"}),
+            _response(204),
+        ]
+
+        _limiter(clock, jitter=0.0).post(session, "http://hook", {}, 5)
+
+        assert clock.sleeps == [pytest.approx(4.0)]
+
+    def test_gives_up_after_max_retries(self):
+        """Should return the last 429 when retries run out."""
+        clock = FakeClock()
+        session = Mock()
+        session.post.return_value = _response(429, {"Retry-After": "1"})
+
+        response = _limiter(clock, max_retries=2).post(session, "http://hook", {}, 5)
+
+        assert response.status_code == 429
+        assert session.post.call_count == 3
+
+    def test_does_not_wait_beyond_max_retry_after(self):
+        """Should fail fast when the server asks for a long delay."""
+        clock = FakeClock()
+        session = Mock()
+        session.post.return_value = _response(429, {"Retry-After": "600"})
+
+        response = _limiter(clock, max_retry_after=60).post(session, "http://hook", {}, 5)
+
+        assert response.status_code == 429
+        assert session.post.call_count == 1
+        assert clock.sleeps == []
+
+    def test_try_acquire_reports_wait_without_sleeping(self):
+        """Should return the remaining wait instead of sleeping, for asynchronous callers."""
+        clock = FakeClock()
+        limiter = _limiter(clock, jitter=0.0)
+
+        assert limiter.should_retry("http://hook", _response(429, {"Retry-After": "3"}), attempt=0)
+        assert limiter.try_acquire("http://hook") == pytest.approx(3.0)
+        clock.now += 3
+        assert limiter.try_acquire("http://hook") == 0.0
+        assert clock.sleeps == []
+
+    def test_invalid_settings(self):
+        """Should raise ValueError for out-of-range settings."""
+        with pytest.raises(ValueError, match="max_retries must be non-negative"):
+            WebhookRateLimiter(max_retries=-1)
+        with pytest.raises(ValueError, match="max_requests_per_second must be positive"):
+            WebhookRateLimiter(max_requests_per_second=0)
@@ -0,0 +1,118 @@
+"""Tests for relevance ranker."""
+import pytest
+from datetime import datetime
+from arxiv_agent.collection.models import Paper
+from arxiv_agent.ranking import RelevanceRanker
+
+
+def _make_paper(arxiv_id: str, title: str, abstract: str) -> Paper:
+    return Paper(
+        arxiv_id=arxiv_id,
+        title=title,
+        authors=["Author A"],
+        abstract=abstract,
+        published=datetime(2024, 1, 1),
+        categories=["cs.AI"],
+        pdf_url=f"https://arxiv.org/pdf/{arxiv_id}.pdf",
+    )
+
+
+@pytest.fixture
+def papers():
+    return [
+        _make_paper("1", "Vision Transformer", "A transformer for image classification."),
+        _make_paper("2", "Large Language Models for Refactoring",
+                    "We apply a large language model to refactoring legacy code."),
+        _make_paper("3", "Protein folding", "We predict protein structures."),
+    ]
+
+
+class TestRelevanceRanker:
+    """Test cases for RelevanceRanker."""
+
+    def test_init_with_empty_profile(self):
+        """Should raise ValueError when profile has no terms."""
+        with pytest.raises(ValueError, match="interest profile must contain at least one term"):
+            RelevanceRanker({})
+
+    def test_init_with_invalid_b(self):
+        """Should raise ValueError when b is out of range."""
+        with pytest.raises(ValueError, match="b must be between 0 and 1"):
+            RelevanceRanker({"LLM": 1.0}, b=1.5)
+
+    def test_score_weights_keywords(self, papers):
+        """Should score papers by weighted keyword matches."""
+        ranker = RelevanceRanker({"Large Language Model": 2.0, "Transformer": 0.5})
+
+        scores = ranker.score(papers)
+
+        assert scores[1] > scores[0] > 0
+        assert scores[2] == 0
+
+    def test_phrase_requires_contiguous_terms(self):
+        """Should match multi-word keywords only as contiguous sequences."""
+        ranker = RelevanceRanker({"Language Model": 1.0})
+        papers = [
+            _make_paper("1", "A", "A language model."),
+            _make_paper("2", "B", "Model of language."),
+        ]
+
+        scores = ranker.score(papers)
+
+        assert scores[0] > 0
+        assert scores[1] == 0
+
+    def test_phrase_does_not_span_documents(self):
+        """Should not match a phrase across the boundary of two papers."""
+        ranker = RelevanceRanker({"Language Model": 1.0})
+        papers = [
+            _make_paper("1", "A", "about language"),
+            _make_paper("2", "model", "nothing else"),
+        ]
+
+        assert ranker.score(papers).tolist() == [0.0, 0.0]
+
+    def test_matching_is_case_insensitive(self):
+        """Should match keywords regardless of case."""
+        ranker = RelevanceRanker({"llm": 1.0})
+
+        scores = ranker.score([_make_paper("1", "LLM agents", "Agents.")])
+
+        assert scores[0] > 0
+
+    def test_exemplars_add_terms(self, papers):
+        """Should score papers similar to exemplar abstracts."""
+        ranker = RelevanceRanker({}, exemplars=["Predicting protein structures with deep models."])
+
+        scores = ranker.score(papers)
+
+        assert scores.argmax() == 2
+
+    def test_rank_selects_top_k(self, papers):
+        """Should return at most top_k papers sorted by score."""
+        ranker = RelevanceRanker({"Large Language Model": 2.0, "Transformer": 0.5})
+
+        ranked = ranker.rank(papers, top_k=1)
+
+        assert [(p.arxiv_id) for p, _ in ranked] == ["2"]
+
+    def test_rank_drops_papers_at_min_score(self, papers):
+        """Should drop papers not exceeding min_score."""
+        ranker = RelevanceRanker({"Large Language Model": 2.0, "Transformer": 0.5})
+
+        ranked = ranker.rank(papers, top_k=10)
+
+        assert [p.arxiv_id for p, _ in ranked] == ["2", "1"]
+
+    def test_rank_with_invalid_top_k(self, papers):
+        """Should raise ValueError when top_k is not positive."""
+        ranker = RelevanceRanker({"LLM": 1.0})
+
+        with pytest.raises(ValueError, match="top_k must be positive"):
+            ranker.rank(papers, top_k=0)
+
+    def test_score_empty_list(self):
+        """Should return empty array for no papers."""
+        ranker = RelevanceRanker({"LLM": 1.0})
+
+        assert ranker.score([]).size == 0
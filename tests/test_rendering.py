@@ -0,0 +1,66 @@
+"""Tests for render-once digest formatting."""
+from unittest.mock import Mock
+
+import pytest
+
+from arxiv_agent.notification.rendering import Dialect, Fragment, FragmentCache, emphasize
+
+
+FRAGMENT = Fragment("Paper", ("ID: 1", "Summary"))
+
+
+class TestFragment:
+    """Test cases for Fragment rendering."""
+
+    @pytest.mark.parametrize("dialect, heading", [
+        (Dialect.SLACK, "*1. Paper*"),
+        (Dialect.DISCORD, "**1. Paper**"),
+        (Dialect.PLAIN, "1. Paper"),
+    ])
+    def test_renders_each_dialect(self, dialect, heading):
+        """Should emphasize the numbered heading in the dialect's markup."""
+        text = FRAGMENT.render(lambda text: emphasize(text, dialect), number=1)
+
+        assert text == f"{heading}\nID: 1\nSummary\n"
+
+    def test_renders_without_number(self):
+        """Should leave the heading unnumbered when no position is given."""
+        assert FRAGMENT.render(lambda text: text) == "Paper\nID: 1\nSummary\n"
+
+
+class TestFragmentCache:
+    """Test cases for FragmentCache class."""
+
+    def test_builds_each_fragment_once(self):
+        """Should build a fragment once and render it once per dialect and position."""
+        cache = FragmentCache()
+        build = Mock(return_value=FRAGMENT)
+
+        slack = [cache.render("1", build, Dialect.SLACK, 1) for _ in range(3)]
+        discord = cache.render("1", build, Dialect.DISCORD, 1)
+        moved = cache.render("1", build, Dialect.SLACK, 2)
+
+        assert build.call_count == 1
+        assert slack == ["*1. Paper*\nID: 1\nSummary\n"] * 3
+        assert discord.startswith("**1. Paper**")
+        assert moved.startswith("*2. Paper*")
+        assert (cache.hits, cache.misses) == (2, 3)
+
+    def test_evicts_least_recently_used(self):
+        """Should keep at most max_entries content keys."""
+        cache = FragmentCache(max_entries=2)
+        build = Mock(return_value=FRAGMENT)
+
+        cache.render("a", build, Dialect.PLAIN)
+        cache.render("b", build, Dialect.PLAIN)
+        cache.render("a", build, Dialect.PLAIN)
+        cache.render("c", build, Dialect.PLAIN)
+        cache.render("a", build, Dialect.PLAIN)
+        cache.render("b", build, Dialect.PLAIN)
+
+        assert build.call_count == 4
+
+    def test_invalid_size(self):
+        """Should raise ValueError for a non-positive size."""
+        with pytest.raises(ValueError, match="max_entries must be positive"):
+            FragmentCache(max_entries=0)
@@ -0,0 +1,71 @@
+"""Tests for Ochiai-format section parsing."""
+from arxiv_agent.summarization.models import OchiaiSections, Summary
+from arxiv_agent.summarization.section_parser import is_sectioned, parse_sections, render_sections
+
+FULL_SUMMARY = """1. **どんなもの?**
+LLMエージェントの評価ベンチマーク。
+
+2. **先行研究と比べてどこがすごい?**
+実環境のツールを使う。
+
+3. **技術や手法のキモはどこ?**
+以下の2点:
+1. サンドボックス
+2. 自動採点
+
+4. **どうやって有効だと検証した?**
+12モデルで比較。
+
+5. **議論はある?**
+コストが高い。
+
+6. **次に読むべき論文は?**
+ToolBench。"""
+
+
+class TestSectionParser:
+    """Test cases for section parsing functions."""
+
+    def test_parses_all_sections(self):
+        """Should split a complete summary into six sections."""
+        sections = parse_sections(FULL_SUMMARY)
+
+        assert sections.missing() == []
+        assert sections.overview.startswith("1. **どんなもの?**")
+        assert "2. 自動採点" in sections.method
+
+    def test_heading_without_body_is_missing(self):
+        """Should treat a section holding only its heading as missing."""
+        text = FULL_SUMMARY.replace("コストが高い。", "")
+
+        assert parse_sections(text).missing() == [5]
+
+    def test_skipped_section_is_missing(self):
+        """Should report sections the model skipped."""
+        text = FULL_SUMMARY.replace("4. **どうやって有効だと検証した?**\n12モデルで比較。\n\n", "")
+
+        assert parse_sections(text).missing() == [4]
+
+    def test_truncated_last_section_is_missing(self):
+        """Should treat the last section as incomplete when output was truncated."""
+        text = FULL_SUMMARY.split("4. **")[0] + "4. **どうやって有効だと"
+
+        assert parse_sections(text, truncated=True).missing() == [4, 5, 6]
+
+    def test_is_sectioned(self):
+        """Should detect whether a text uses numbered sections."""
+        assert is_sectioned(FULL_SUMMARY)
+        assert not is_sectioned("A plain summary without sections.")
+
+    def test_render_round_trip(self):
+        """Should render present sections in order."""
+        sections = parse_sections(FULL_SUMMARY)
+
+        assert render_sections(sections) == FULL_SUMMARY
+
+    def test_summary_restores_sections_from_dict(self):
+        """Should rebuild sections when a summary is restored from JSON."""
+        summary = Summary(paper_id="1", title="T", summary_text="S", sections={"overview": "1. x"})
+
+        assert isinstance(summary.sections, OchiaiSections)
+        assert summary.sections.get(1) == "1. x"
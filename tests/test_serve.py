@@ -0,0 +1,136 @@
+"""Tests for the resident serve mode."""
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+import arxiv_agent.main
+from arxiv_agent.collection.models import Paper
+from arxiv_agent.config.loader import load_config
+from arxiv_agent.main import AgentSession
+from arxiv_agent.serve import AgentDaemon
+from arxiv_agent.summarization.models import Summary
+
+CONFIG = """
+arxiv:
+  max_results: 10
+  categories: ["cs.AI"]
+  keywords: ["LLM"]
+gemini:
+  model: gemini-1.5-pro
+  prompt_template: "Title: {{title}}, Authors: {{authors}}, Abstract: {{abstract}}"
+  temperature: 0.7
+  max_tokens: 1000
+notification:
+  slack:
+    enabled: false
+history_file: "{history_file}"
+journal:
+  file: "{journal_file}"
+"""
+
+
+def _ts(*args) -> float:
+    return datetime(*args, tzinfo=ZoneInfo("America/New_York")).timestamp()
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def config(tmp_path):
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        CONFIG.format(history_file=tmp_path / "history.json", journal_file=tmp_path / "journal.jsonl"),
+        encoding="utf-8",
+    )
+    return load_config(str(config_file))
+
+
+class TestAgentSession:
+    """Test cases for AgentSession class."""
+
+    def test_cycles_share_warm_clients(self, config, mocker):
+        """Should build the summarizer once and skip papers an earlier cycle processed."""
+        paper = Paper(
+            arxiv_id="2301.00001v1",
+            title="Paper 1",
+            authors=["Author A"],
+            abstract="Abstract 1",
+            published=datetime(2023, 1, 1),
+            categories=["cs.AI"],
+            pdf_url="https://arxiv.org/pdf/2301.00001v1.pdf",
+        )
+        mocker.patch.dict("os.environ", {"GEMINI_API_KEY": "test-key"})
+        mocker.patch("arxiv_agent.main.ArxivClient.search_papers", return_value=[paper])
+        mock_summarize = mocker.patch(
+            "arxiv_agent.main.GeminiClient.summarize",
+            return_value=Summary(paper_id="2301.00001v1", title="Paper 1", summary_text="Summary 1"),
+        )
+        mocker.patch("arxiv_agent.main.Notifier.send_all")
+        build_summarizer = mocker.spy(arxiv_agent.main, "_build_summarizer")
+
+        session = AgentSession(config)
+        try:
+            assert session.run_cycle() == 1
+            assert session.run_cycle() == 0
+        finally:
+            session.close()
+
+        assert mock_summarize.call_count == 1
+        assert build_summarizer.call_count == 1
+
+
+class TestAgentDaemon:
+    """Test cases for AgentDaemon class."""
+
+    def test_runs_cycles_until_stopped(self, config, mocker):
+        """Should survive a failed cycle and close the session on stop."""
+        session = mocker.Mock()
+        # A millisecond before the default schedule, Monday 20:15 Eastern
+        daemon = AgentDaemon(config, session=session, clock=FakeClock(_ts(2024, 1, 8, 20, 14, 59, 999000)))
+        def run_cycle():
+            if session.run_cycle.call_count == 2:
+                daemon.stop()
+                return 0
+            raise RuntimeError("arXiv unavailable")
+
+        session.run_cycle.side_effect = run_cycle
+        config.serve.skip_without_announcement = False
+
+        daemon.run()
+
+        assert session.run_cycle.call_count == 2
+        session.close.assert_called_once()
+
+    def test_skips_cycle_without_announcement(self, config, mocker):
+        """Should run only when arXiv announced new papers since the last cycle."""
+        session = mocker.Mock()
+        clock = FakeClock(_ts(2024, 1, 11, 20, 15))
+        daemon = AgentDaemon(config, session=session, clock=clock)
+
+        assert daemon.run_cycle()  # Thursday, after the announcement
+        clock.now = _ts(2024, 1, 12, 20, 15)
+        assert not daemon.run_cycle()  # Friday: nothing announced
+        clock.now = _ts(2024, 1, 14, 20, 15)
+        assert daemon.run_cycle()  # Sunday, after the announcement
+
+        assert session.run_cycle.call_count == 2
+
+    def test_stop_before_schedule(self, config, mocker):
+        """Should exit without a cycle when stopped while waiting."""
+        session = mocker.Mock()
+        daemon = AgentDaemon(config, session=session, clock=FakeClock(_ts(2024, 1, 8, 12, 0)))
+        daemon.stop()
+
+        daemon.run()
+
+        session.run_cycle.assert_not_called()
+        session.close.assert_called_once()
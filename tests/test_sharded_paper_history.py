@@ -0,0 +1,103 @@
+"""Tests for month-sharded paper history with retention."""
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from arxiv_agent.history import ShardedPaperHistory, open_history, shard_of
+
+NOW = datetime(2024, 3, 15, tzinfo=timezone.utc).timestamp()
+
+
+class TestShardOf:
+    """Test cases for shard key extraction."""
+
+    @pytest.mark.parametrize(
+        "paper_id,shard",
+        [
+            ("2301.12345v1", "2301"),
+            ("0704.0001", "0704"),
+            ("hep-th/9901001v2", "9901"),
+            ("math.GT/0309136", "0309"),
+            ("not-an-id", "misc"),
+        ],
+    )
+    def test_shard_keys(self, paper_id: str, shard: str) -> None:
+        """Test IDs map to their submission month."""
+        assert shard_of(paper_id) == shard
+
+
+class TestShardedPaperHistory:
+    """Test cases for ShardedPaperHistory class."""
+
+    def test_mark_writes_monthly_shards(self, tmp_path: Path) -> None:
+        """Test IDs are appended to the shard of their month."""
+        history = ShardedPaperHistory(str(tmp_path))
+        history.mark_processed(["2301.00001v1", "2402.00001v1", "2301.00002v1", "2301.00001v1"])
+
+        assert (tmp_path / "2301.txt").read_text(encoding="utf-8") == "2301.00001v1\n2301.00002v1\n"
+        assert (tmp_path / "2402.txt").read_text(encoding="utf-8") == "2402.00001v1\n"
+
+    def test_loads_only_queried_shards(self, tmp_path: Path) -> None:
+        """Test lookups read only the shards of the requested IDs."""
+        ShardedPaperHistory(str(tmp_path)).mark_processed(["2301.00001v1", "2402.00001v1"])
+
+        history = ShardedPaperHistory(str(tmp_path))
+
+        assert history.loaded_shards() == []
+        assert history.processed_among(["2402.00001v1", "2402.00002v1"]) == {"2402.00001v1"}
+        assert history.loaded_shards() == ["2402"]
+        assert history.processed_ids() == ["2301.00001v1", "2402.00001v1"]
+
+    def test_expire_deletes_old_shards(self, tmp_path: Path) -> None:
+        """Test shards older than the horizon are deleted."""
+        history = ShardedPaperHistory(str(tmp_path), retention_months=3, clock=lambda: NOW)
+        history.mark_processed(["2312.00001", "2401.00001", "2403.00001", "hep-th/9901001", "odd"])
+
+        assert history.expire() == ["2312", "9901"]
+        assert sorted(p.stem for p in tmp_path.glob("*.txt")) == ["2401", "2403", "misc"]
+        assert not history.is_processed("2312.00001")
+        assert history.is_processed("2401.00001")
+
+    def test_expire_archives_old_shards(self, tmp_path: Path) -> None:
+        """Test expired shards are moved to the archive directory."""
+        archive = tmp_path / "archive"
+        history = ShardedPaperHistory(
+            str(tmp_path / "shards"), retention_months=1, archive_dir=str(archive), clock=lambda: NOW
+        )
+        history.mark_processed(["2402.00001"])
+
+        assert history.expire() == ["2402"]
+        assert (archive / "2402.txt").read_text(encoding="utf-8") == "2402.00001\n"
+
+    def test_expire_merges_into_existing_archive(self, tmp_path: Path) -> None:
+        """Test a recreated old shard is merged into its archived copy."""
+        archive = tmp_path / "archive"
+        history = ShardedPaperHistory(
+            str(tmp_path / "shards"), retention_months=1, archive_dir=str(archive), clock=lambda: NOW
+        )
+        history.mark_processed(["2402.00001"])
+        history.expire()
+        history.mark_processed(["2402.00002", "2402.00001"])
+
+        assert history.expire() == ["2402"]
+        assert (archive / "2402.txt").read_text(encoding="utf-8") == "2402.00001\n2402.00002\n"
+
+    def test_ignores_unrelated_text_files(self, tmp_path: Path) -> None:
+        """Test files that are not shards are neither loaded nor expired."""
+        (tmp_path / "README.txt").write_text("notes\n", encoding="utf-8")
+        history = ShardedPaperHistory(str(tmp_path), retention_months=1, clock=lambda: NOW)
+        history.mark_processed(["2301.00001"])
+
+        assert history.expire() == ["2301"]
+        assert history.processed_ids() == []
+        assert (tmp_path / "README.txt").exists()
+
+    def test_invalid_retention(self, tmp_path: Path) -> None:
+        """Test non-positive retention is rejected."""
+        with pytest.raises(ValueError, match="retention_months"):
+            ShardedPaperHistory(str(tmp_path), retention_months=0)
+
+    def test_open_history_selects_shards_for_directories(self, tmp_path: Path) -> None:
+        """Test paths without an extension open the sharded backend."""
+        assert isinstance(open_history(str(tmp_path / "history")), ShardedPaperHistory)
@@ -0,0 +1,106 @@
+"""Tests for SQLite paper history and JSON migration."""
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from arxiv_agent.history import (
+    PaperHistory,
+    SqlitePaperHistory,
+    migrate_json_history,
+    open_history,
+)
+
+
+class TestSqlitePaperHistory:
+    """Test cases for SqlitePaperHistory class."""
+
+    def test_empty_database(self, tmp_path: Path) -> None:
+        """Test a new database has no processed papers."""
+        history = SqlitePaperHistory(str(tmp_path / "history.db"))
+
+        assert not history.is_processed("2301.12345v1")
+        assert len(history) == 0
+
+    def test_mark_and_persist(self, tmp_path: Path) -> None:
+        """Test marks survive reopening the database."""
+        db_file = tmp_path / "data" / "history.db"
+        history = SqlitePaperHistory(str(db_file))
+        history.mark_processed(["2301.12345v1", "2301.67890v2"])
+        history.close()
+
+        reopened = SqlitePaperHistory(str(db_file))
+
+        assert reopened.is_processed("2301.12345v1")
+        assert reopened.is_processed("2301.67890v2")
+        assert not reopened.is_processed("2301.99999v1")
+
+    def test_duplicates_are_ignored(self, tmp_path: Path) -> None:
+        """Test marking an ID twice stores it once."""
+        history = SqlitePaperHistory(str(tmp_path / "history.db"), batch_size=2)
+        history.mark_processed(["a", "b", "c", "a"])
+        history.mark_processed(["b", "d"])
+
+        assert len(history) == 4
+
+    def test_processed_among_batches(self, tmp_path: Path) -> None:
+        """Test batch lookups across several query batches."""
+        history = SqlitePaperHistory(str(tmp_path / "history.db"), batch_size=2)
+        history.mark_processed(["a", "c", "e"])
+
+        assert history.processed_among(["a", "b", "c", "d", "e"]) == {"a", "c", "e"}
+        assert history.processed_ids() == ["a", "c", "e"]
+
+    def test_uses_wal_mode(self, tmp_path: Path) -> None:
+        """Test the database is switched to write-ahead logging."""
+        db_file = tmp_path / "history.db"
+        SqlitePaperHistory(str(db_file)).close()
+
+        with sqlite3.connect(db_file) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_invalid_batch_size(self, tmp_path: Path) -> None:
+        """Test non-positive batch size is rejected."""
+        with pytest.raises(ValueError, match="batch_size"):
+            SqlitePaperHistory(str(tmp_path / "history.db"), batch_size=0)
+
+    def test_unopenable_database_is_disabled(self, tmp_path: Path) -> None:
+        """Test an unusable path disables history instead of raising."""
+        directory = tmp_path / "history.db"
+        directory.mkdir()
+
+        history = SqlitePaperHistory(str(directory))
+        history.mark_processed(["2301.12345v1"])
+
+        assert not history.is_processed("2301.12345v1")
+
+
+class TestMigrateJsonHistory:
+    """Test cases for the JSON to SQLite migration."""
+
+    def test_migrates_all_ids(self, tmp_path: Path) -> None:
+        """Test every JSON ID is copied and re-running is harmless."""
+        json_file = tmp_path / "history.json"
+        json_file.write_text(json.dumps({"processed_papers": ["a", "b", "c"]}), encoding="utf-8")
+        db_file = tmp_path / "history.db"
+
+        assert migrate_json_history(str(json_file), str(db_file)) == 3
+        assert migrate_json_history(str(json_file), str(db_file)) == 3
+
+        history = SqlitePaperHistory(str(db_file))
+        assert len(history) == 3
+        assert all(history.is_processed(paper_id) for paper_id in ["a", "b", "c"])
+
+
+class TestOpenHistory:
+    """Test cases for backend selection."""
+
+    @pytest.mark.parametrize("name", ["history.db", "history.sqlite", "history.sqlite3"])
+    def test_sqlite_suffixes(self, tmp_path: Path, name: str) -> None:
+        """Test SQLite is chosen by file extension."""
+        assert isinstance(open_history(str(tmp_path / name)), SqlitePaperHistory)
+
+    def test_json_default(self, tmp_path: Path) -> None:
+        """Test JSON is used for other files."""
+        assert isinstance(open_history(str(tmp_path / "history.json")), PaperHistory)
@@ -0,0 +1,196 @@
+"""Tests for similarity-keyed summary cache."""
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from arxiv_agent.collection.models import Paper
+from arxiv_agent.summarization.base_summarizer import BaseSummarizer
+from arxiv_agent.summarization.models import OchiaiSections, Summary
+from arxiv_agent.summarization.summary_cache import CachingSummarizer, SummaryCache
+
+ABSTRACT = (
+    "We present a method for compressing key-value caches in transformer inference. "
+    "Our approach quantizes rarely attended tokens to two bits. "
+    "Experiments on long-context benchmarks show a fourfold memory reduction. "
+    "Accuracy drops by less than one point on average. "
+    "We also analyse the interaction with speculative decoding and batching. "
+    "Code and models are publicly available."
+)
+
+
+def _make_paper(arxiv_id: str, abstract: str) -> Paper:
+    return Paper(
+        arxiv_id=arxiv_id,
+        title=f"Title {arxiv_id}",
+        authors=["Author A"],
+        abstract=abstract,
+        published=datetime(2024, 1, 1),
+        categories=["cs.LG"],
+        pdf_url=f"https://arxiv.org/pdf/{arxiv_id}.pdf",
+    )
+
+
+def _make_inner() -> Mock:
+    inner = Mock(spec=BaseSummarizer)
+    inner.summarize.side_effect = lambda paper: Summary(
+        paper_id=paper.arxiv_id, title=paper.title, summary_text=f"Full {paper.arxiv_id}"
+    )
+    inner.update.side_effect = lambda paper, previous, changes: Summary(
+        paper_id=paper.arxiv_id, title=paper.title, summary_text=f"Updated {previous.paper_id}"
+    )
+    return inner
+
+
+class TestSummaryCache:
+    """Test cases for SummaryCache class."""
+
+    def test_embed_is_normalized(self, tmp_path: Path) -> None:
+        """Test embeddings have unit length so dot products are cosines."""
+        embedding = SummaryCache(str(tmp_path), dimensions=256).embed(ABSTRACT)
+
+        assert embedding.dtype == np.float32
+        assert np.linalg.norm(embedding) == pytest.approx(1.0)
+
+    def test_nearest_and_persistence(self, tmp_path: Path) -> None:
+        """Test saved entries are found by a new cache instance."""
+        cache = SummaryCache(str(tmp_path / "cache"), dimensions=256)
+        cache.add(ABSTRACT, Summary("2401.00001v1", "T", "S"), cache.embed(ABSTRACT))
+        cache.save()
+
+        reloaded = SummaryCache(str(tmp_path / "cache"), dimensions=256)
+        cached, similarity = reloaded.nearest(reloaded.embed(ABSTRACT))
+
+        assert len(reloaded) == 1
+        assert cached.summary.paper_id == "2401.00001v1"
+        assert similarity == pytest.approx(1.0)
+
+    def test_nearest_on_empty_cache(self, tmp_path: Path) -> None:
+        """Test an empty cache has no nearest entry."""
+        cache = SummaryCache(str(tmp_path), dimensions=64)
+
+        assert cache.nearest(cache.embed(ABSTRACT)) is None
+
+    def test_repairs_interrupted_save(self, tmp_path: Path) -> None:
+        """Test an embedding written without its entry is dropped."""
+        cache_dir = tmp_path / "cache"
+        cache = SummaryCache(str(cache_dir), dimensions=64)
+        cache.add(ABSTRACT, Summary("2401.00001v1", "T", "S"), cache.embed(ABSTRACT))
+        cache.save()
+        with (cache_dir / "embeddings.f32").open("ab") as f:
+            f.write(cache.embed("other text").tobytes())
+
+        repaired = SummaryCache(str(cache_dir), dimensions=64)
+        repaired.add("other text", Summary("2401.00002v1", "T", "S"), repaired.embed("other text"))
+        repaired.save()
+
+        assert len(SummaryCache(str(cache_dir), dimensions=64)) == 2
+
+
+class TestCachingSummarizer:
+    """Test cases for CachingSummarizer class."""
+
+    def test_reuses_summary_of_identical_abstract(self, tmp_path: Path) -> None:
+        """Test a new version with the same abstract reuses the summary."""
+        inner = _make_inner()
+        summarizer = CachingSummarizer(inner, SummaryCache(str(tmp_path)))
+
+        summarizer.summarize(_make_paper("2401.00001v1", ABSTRACT))
+        summary = summarizer.summarize(_make_paper("2401.00001v2", ABSTRACT))
+
+        assert inner.summarize.call_count == 1
+        assert summary.paper_id == "2401.00001v2"
+        assert summary.summary_text == "Full 2401.00001v1"
+        assert summarizer.stats.reused == 1
+
+    def test_reused_summary_keeps_sections(self, tmp_path: Path) -> None:
+        """Test a reused summary carries over the parsed Ochiai sections."""
+        inner = _make_inner()
+        inner.summarize.side_effect = lambda paper: Summary(
+            paper_id=paper.arxiv_id,
+            title=paper.title,
+            summary_text="Full",
+            sections=OchiaiSections(overview="概要", method="手法"),
+        )
+        summarizer = CachingSummarizer(inner, SummaryCache(str(tmp_path)))
+
+        summarizer.summarize(_make_paper("2401.00001v1", ABSTRACT))
+        summary = summarizer.summarize(_make_paper("2401.00001v2", ABSTRACT))
+
+        assert summary.sections == OchiaiSections(overview="概要", method="手法")
+
+    def test_updates_summary_of_revised_abstract(self, tmp_path: Path) -> None:
+        """Test a one-sentence revision triggers an update with the changed sentence."""
+        inner = _make_inner()
+        summarizer = CachingSummarizer(
+            inner, SummaryCache(str(tmp_path)), reuse_threshold=0.99, update_threshold=0.7
+        )
+        revised = ABSTRACT.replace(
+            "Code and models are publicly available.",
+            "We additionally evaluate on multilingual retrieval tasks.",
+        )
+
+        summarizer.summarize(_make_paper("2401.00001v1", ABSTRACT))
+        summary = summarizer.summarize(_make_paper("2401.00001v2", revised))
+
+        assert summary.summary_text == "Updated 2401.00001v1"
+        paper, previous, changes = inner.update.call_args[0]
+        assert previous.paper_id == "2401.00001v1"
+        assert changes == ["We additionally evaluate on multilingual retrieval tasks."]
+        assert summarizer.stats.updated == 1
+
+    def test_summarizes_unrelated_abstract(self, tmp_path: Path) -> None:
+        """Test dissimilar abstracts are summarized in full."""
+        inner = _make_inner()
+        summarizer = CachingSummarizer(inner, SummaryCache(str(tmp_path)))
+
+        summarizer.summarize(_make_paper("2401.00001v1", ABSTRACT))
+        summarizer.summarize(_make_paper("2401.00002v1", "Graph neural networks for protein folding."))
+
+        assert inner.summarize.call_count == 2
+        assert summarizer.stats.hits == 0
+
+    def test_stats_report(self, tmp_path: Path) -> None:
+        """Test the report includes thresholds, hit ratio and savings."""
+        summarizer = CachingSummarizer(_make_inner(), SummaryCache(str(tmp_path)))
+        summarizer.summarize(_make_paper("2401.00001v1", ABSTRACT))
+        summarizer.summarize(_make_paper("2401.00001v2", ABSTRACT))
+
+        report = summarizer.stats.report()
+
+        assert summarizer.stats.hit_ratio == 0.5
+        assert "reuse >= 0.95" in report
+        assert "1/2 hits (50.0%)" in report
+        assert f"{len(ABSTRACT)} abstract characters" in report
+
+    def test_does_not_cache_degraded_summaries(self, tmp_path: Path) -> None:
+        """Test a fallback summary is returned but not reused for later papers."""
+        inner = _make_inner()
+        inner.summarize.side_effect = [
+            Summary(paper_id="2401.00001v1", title="T", summary_text="Extractive", degraded=True),
+            Summary(paper_id="2401.00001v2", title="T", summary_text="Gemini"),
+        ]
+        summarizer = CachingSummarizer(inner, SummaryCache(str(tmp_path)))
+
+        assert summarizer.summarize(_make_paper("2401.00001v1", ABSTRACT)).summary_text == "Extractive"
+        summary = summarizer.summarize(_make_paper("2401.00001v2", ABSTRACT))
+
+        assert summary.summary_text == "Gemini"
+        assert inner.summarize.call_count == 2
+
+    def test_close_resets_stats(self, tmp_path: Path) -> None:
+        """Test each close reports only the lookups since the previous one."""
+        summarizer = CachingSummarizer(_make_inner(), SummaryCache(str(tmp_path)))
+        summarizer.summarize(_make_paper("2401.00001v1", ABSTRACT))
+
+        summarizer.close()
+
+        assert summarizer.stats.lookups == 0
+        assert summarizer.stats.reuse_threshold == 0.95
+
+    def test_invalid_thresholds(self, tmp_path: Path) -> None:
+        """Test update_threshold must not exceed reuse_threshold."""
+        with pytest.raises(ValueError, match="thresholds must satisfy"):
+            CachingSummarizer(_make_inner(), SummaryCache(str(tmp_path)), reuse_threshold=0.5, update_threshold=0.9)
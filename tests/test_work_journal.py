@@ -0,0 +1,161 @@
+"""Tests for summarization work journal."""
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from arxiv_agent.collection.models import Paper
+from arxiv_agent.journal import WorkJournal
+from arxiv_agent.summarization.models import Summary
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _make_paper(arxiv_id: str) -> Paper:
+    return Paper(
+        arxiv_id=arxiv_id,
+        title=f"Title {arxiv_id}",
+        authors=["Author A"],
+        abstract="Abstract.",
+        published=datetime(2024, 1, 1),
+        categories=["cs.AI"],
+        pdf_url=f"https://arxiv.org/pdf/{arxiv_id}.pdf",
+    )
+
+
+def _make_summary(arxiv_id: str) -> Summary:
+    return Summary(paper_id=arxiv_id, title=f"Title {arxiv_id}", summary_text="Summary")
+
+
+class TestWorkJournal:
+    """Test cases for WorkJournal class."""
+
+    def test_plan_returns_new_papers(self, tmp_path: Path) -> None:
+        """Test new papers are queued and returned in order."""
+        journal = WorkJournal(str(tmp_path / "journal.jsonl"))
+
+        work = journal.plan([_make_paper("2401.00001v1"), _make_paper("2401.00002v1")])
+
+        assert [p.arxiv_id for p in work] == ["2401.00001v1", "2401.00002v1"]
+
+    def test_resume_after_crash(self, tmp_path: Path) -> None:
+        """Test a restarted run resumes unfinished papers and reuses summaries."""
+        journal_file = tmp_path / "journal.jsonl"
+        journal = WorkJournal(str(journal_file), flush_batch_size=1)
+        journal.plan([_make_paper("2401.00001v1"), _make_paper("2401.00002v1")])
+        journal.start("2401.00001v1")
+        journal.complete(_make_summary("2401.00001v1"))
+        journal.start("2401.00002v1")
+        # Simulated crash: no close()
+
+        restarted = WorkJournal(str(journal_file))
+        work = restarted.plan([])
+
+        assert [p.arxiv_id for p in work] == ["2401.00001v1", "2401.00002v1"]
+        assert restarted.recovered_summary("2401.00001v1") == _make_summary("2401.00001v1")
+        assert restarted.recovered_summary("2401.00002v1") is None
+
+    def test_failed_paper_waits_for_backoff(self, tmp_path: Path) -> None:
+        """Test failed papers are retried only after the backoff elapses."""
+        journal_file = tmp_path / "journal.jsonl"
+        clock = FakeClock()
+        journal = WorkJournal(str(journal_file), retry_backoff=100.0, clock=clock)
+        journal.plan([_make_paper("2401.00001v1")])
+        journal.start("2401.00001v1")
+        journal.fail("2401.00001v1", "quota exceeded")
+        journal.close()
+
+        clock.now += 50
+        assert WorkJournal(str(journal_file), clock=clock).plan([_make_paper("2401.00001v1")]) == []
+
+        clock.now += 50
+        work = WorkJournal(str(journal_file), clock=clock).plan([])
+        assert [p.arxiv_id for p in work] == ["2401.00001v1"]
+
+    def test_backoff_grows_exponentially(self, tmp_path: Path) -> None:
+        """Test retry delay doubles with each failed attempt."""
+        clock = FakeClock()
+        journal = WorkJournal(str(tmp_path / "journal.jsonl"), retry_backoff=10.0, clock=clock)
+        journal.plan([_make_paper("2401.00001v1")])
+
+        journal.fail("2401.00001v1", "error")
+        journal.fail("2401.00001v1", "error")
+
+        clock.now += 19
+        assert journal.plan([]) == []
+        clock.now += 1
+        assert len(journal.plan([])) == 1
+
+    def test_dead_letter_after_max_attempts(self, tmp_path: Path) -> None:
+        """Test papers exceeding max attempts are no longer retried."""
+        clock = FakeClock()
+        journal = WorkJournal(
+            str(tmp_path / "journal.jsonl"), max_attempts=2, retry_backoff=1.0, clock=clock
+        )
+        journal.plan([_make_paper("2401.00001v1")])
+        journal.fail("2401.00001v1", "error")
+        journal.fail("2401.00001v1", "error")
+
+        clock.now += 1000
+        assert journal.plan([]) == []
+        assert journal.dead_letters() == ["2401.00001v1"]
+
+    def test_acknowledge_and_close_compacts_journal(self, tmp_path: Path) -> None:
+        """Test delivered papers are dropped when the journal is compacted."""
+        journal_file = tmp_path / "journal.jsonl"
+        journal = WorkJournal(str(journal_file))
+        journal.plan([_make_paper("2401.00001v1"), _make_paper("2401.00002v1")])
+        journal.complete(_make_summary("2401.00001v1"))
+        journal.fail("2401.00002v1", "error")
+
+        journal.acknowledge(["2401.00001v1"])
+        journal.close()
+
+        lines = journal_file.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 1
+        record = json.loads(lines[0])
+        assert record["id"] == "2401.00002v1"
+        assert record["state"] == "failed"
+        assert record["attempts"] == 1
+
+    def test_records_are_batched(self, tmp_path: Path) -> None:
+        """Test records stay buffered until the batch size is reached."""
+        journal_file = tmp_path / "journal.jsonl"
+        clock = FakeClock()
+        journal = WorkJournal(
+            str(journal_file), flush_batch_size=2, flush_interval=60.0, clock=clock
+        )
+        journal.plan([_make_paper("2401.00001v1")])
+        size_after_plan = journal_file.stat().st_size
+
+        journal.start("2401.00001v1")
+        assert journal_file.stat().st_size == size_after_plan
+
+        journal.complete(_make_summary("2401.00001v1"))
+        assert journal_file.stat().st_size > size_after_plan
+
+    def test_skips_torn_record(self, tmp_path: Path) -> None:
+        """Test a partially written final record is ignored on replay."""
+        journal_file = tmp_path / "journal.jsonl"
+        journal = WorkJournal(str(journal_file))
+        journal.plan([_make_paper("2401.00001v1")])
+        with journal_file.open("a", encoding="utf-8") as f:
+            f.write('{"id": "2401.00001v1", "sta')
+
+        work = WorkJournal(str(journal_file)).plan([])
+
+        assert [p.arxiv_id for p in work] == ["2401.00001v1"]
+
+    def test_invalid_batch_size(self, tmp_path: Path) -> None:
+        """Test non-positive batch size is rejected."""
+        with pytest.raises(ValueError, match="flush_batch_size must be positive"):
+            WorkJournal(str(tmp_path / "journal.jsonl"), flush_batch_size=0)